@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Benchmark agents-inc CLI cold start with ``python -X importtime``.
+
+Runs each command in a fresh interpreter against a throwaway HOME and reports
+wall time, total import time, how many agents_inc modules were loaded, whether
+PyYAML was, and the slowest top-level imports, as JSON.
+
+    PYTHONPATH=src python benchmarks/cli_startup.py --repeat 10 --output startup.json
+    PYTHONPATH=src python benchmarks/cli_startup.py --repeat 10 --compare startup.json
+
+``dispatch`` is measured with ``--help``: argparse exits right after the
+command module is imported, which isolates its import cost. With ``--compare``
+the run exits non-zero when any command's median wall or import time regresses
+by more than ``--tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+BENCHMARK_SCHEMA_VERSION = "1.0"
+ROOT = Path(__file__).resolve().parents[1]
+
+COMMANDS: Dict[str, List[str]] = {
+    "version": ["--version"],
+    "help": ["--help"],
+    "list": ["list", "--json", "--project-index", "{home}/index.yaml", "--scan-root", "{home}/p"],
+    "dispatch": ["dispatch", "--help"],
+}
+COMPARED_METRICS = ("wall_ms", "import_ms")
+
+
+def parse_importtime(stderr: str) -> Tuple[List[Tuple[str, int, int, int]], int]:
+    """``(module, self_us, cumulative_us, depth)`` rows and the summed self time."""
+    rows: List[Tuple[str, int, int, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line[len("import time:") :].split("|", 2)
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue
+        name = parts[2].rstrip()
+        # One space after the bar, then two per nesting level.
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((name.strip(), self_us, cumulative_us, depth))
+    return rows, sum(row[1] for row in rows)
+
+
+def run_command(name: str, home: Path) -> dict:
+    argv = [part.format(home=home) for part in COMMANDS[name]]
+    env = dict(os.environ)
+    env["HOME"] = str(home)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(ROOT / "src"), *filter(None, [env.get("PYTHONPATH", "")])]
+    )
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "agents_inc.cli.main", *argv],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=str(home),
+        check=False,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000.0
+    if completed.returncode != 0:
+        raise RuntimeError(f"{name} exited {completed.returncode}: {completed.stdout[-400:]}")
+    rows, import_us = parse_importtime(completed.stderr)
+    modules = {row[0] for row in rows}
+    top = sorted((row for row in rows if row[3] == 0), key=lambda row: row[2], reverse=True)
+    return {
+        "wall_ms": round(wall_ms, 3),
+        "import_ms": round(import_us / 1000.0, 3),
+        "modules": len(modules),
+        "agents_inc_modules": sorted(m for m in modules if m.startswith("agents_inc")),
+        "yaml_imported": "yaml" in modules,
+        "top_imports": [
+            {"module": row[0], "cumulative_ms": round(row[2] / 1000.0, 3)} for row in top[:8]
+        ],
+    }
+
+
+def summarize(runs: List[dict]) -> dict:
+    first = runs[0]
+    return {
+        "wall_ms": round(statistics.median(run["wall_ms"] for run in runs), 3),
+        "import_ms": round(statistics.median(run["import_ms"] for run in runs), 3),
+        "modules": first["modules"],
+        "agents_inc_modules": len(first["agents_inc_modules"]),
+        "yaml_imported": first["yaml_imported"],
+        "top_imports": first["top_imports"],
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> List[str]:
+    regressions: List[str] = []
+    for command, row in sorted(current.items()):
+        before = baseline.get(command, {})
+        for metric in COMPARED_METRICS:
+            now, prev = float(row.get(metric, 0)), float(before.get(metric, 0))
+            if prev <= 0 or now - prev < min_delta_ms:
+                continue
+            if now > prev * (1.0 + tolerance):
+                regressions.append(
+                    f"{command}.{metric}: {prev:g} -> {now:g} (+{(now / prev - 1.0):.0%})"
+                )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--commands",
+        default=",".join(COMMANDS),
+        help=f"comma-separated subset of: {', '.join(COMMANDS)}",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=None, help="write the JSON report here")
+    parser.add_argument("--compare", type=Path, default=None, help="baseline JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=5.0,
+        help="ignore regressions smaller than this many milliseconds",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    names = [name.strip() for name in args.commands.split(",") if name.strip()]
+    unknown = [name for name in names if name not in COMMANDS]
+    if unknown:
+        sys.stderr.write(f"unknown commands: {', '.join(unknown)}\n")
+        return 2
+
+    summary: Dict[str, dict] = {}
+    with tempfile.TemporaryDirectory(prefix="agents-inc-startup-") as td:
+        home = Path(td)
+        (home / "p").mkdir()
+        for name in names:
+            run_command(name, home)  # warm the filesystem cache and bytecode
+            runs = [run_command(name, home) for _ in range(max(1, args.repeat))]
+            summary[name] = summarize(runs)
+
+    report = {
+        "schema_version": BENCHMARK_SCHEMA_VERSION,
+        "python": sys.version.split()[0],
+        "repeat": max(1, args.repeat),
+        "summary": summary,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(
+            summary, baseline.get("summary", {}), args.tolerance, args.min_delta_ms
+        )
+        for line in regressions:
+            sys.stderr.write(f"REGRESSION {line}\n")
+        if regressions:
+            return 1
+        sys.stderr.write("no regressions against baseline\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark consensus clustering and the head-meeting similarity matrix.
+
+Compares the indexed implementations against the all-pairs set formulation
+they replaced, on synthetic groups whose claims paraphrase shared findings.
+
+    PYTHONPATH=src python benchmarks/consensus_similarity.py --groups 60 --claims 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Dict, List, Tuple
+
+from agents_inc.core.orchestrator_reply import (
+    CONSENSUS_CLUSTER_SIMILARITY,
+    _cluster_consensus_signals,
+)
+from agents_inc.core.util.similarity import jaccard_matrix
+
+
+def _reference_jaccard(left: set, right: set) -> float:
+    if not left and not right:
+        return 1.0
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+def _reference_clusters(signals: List[dict]) -> List[Tuple[str, ...]]:
+    clusters: List[dict] = []
+    for signal in signals:
+        best_index = -1
+        best_similarity = 0.0
+        for index, cluster in enumerate(clusters):
+            similarity = _reference_jaccard(signal["tokens"], cluster["tokens"])
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_index = index
+        if best_index >= 0 and best_similarity >= CONSENSUS_CLUSTER_SIMILARITY:
+            clusters[best_index]["groups"].add(signal["group_id"])
+        else:
+            clusters.append({"tokens": set(signal["tokens"]), "groups": {signal["group_id"]}})
+    # Same cluster membership as the reply synthesizer; it also sorts by support.
+    return [tuple(sorted(cluster["groups"])) for cluster in clusters]
+
+
+def _reference_matrix(token_map: Dict[str, set], groups: List[str]) -> Dict[tuple, float]:
+    matrix = {(group, group): 1.0 for group in groups}
+    for index, left in enumerate(groups):
+        for right in groups[index + 1 :]:
+            value = _reference_jaccard(token_map[left], token_map[right])
+            matrix[(left, right)] = value
+            matrix[(right, left)] = value
+    return matrix
+
+
+def build_signals(groups: int, claims: int, seed: int) -> List[dict]:
+    rng = random.Random(seed)
+    vocabulary = [f"term{index:05d}" for index in range(20000)]
+    findings = [rng.sample(vocabulary, 12) for _ in range(max(1, groups * claims // 4))]
+    signals: List[dict] = []
+    for group_index in range(groups):
+        for _ in range(claims):
+            base = rng.choice(findings)
+            kept = rng.sample(base, rng.randint(7, 12))
+            tokens = set(kept + rng.sample(vocabulary, rng.randint(0, 4)))
+            signals.append(
+                {
+                    "group_id": f"group-{group_index:03d}",
+                    "text": " ".join(sorted(tokens)),
+                    "tokens": tokens,
+                    "citations": [],
+                    "coverage": 0.5,
+                }
+            )
+    return signals
+
+
+def _timed(fn, *args):  # type: ignore[no-untyped-def]
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=60)
+    parser.add_argument("--claims", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    signals = build_signals(args.groups, args.claims, args.seed)
+    reference, reference_sec = _timed(_reference_clusters, signals)
+    indexed, indexed_sec = _timed(_cluster_consensus_signals, signals)
+    same = sorted(reference) == sorted(tuple(row["support_groups"]) for row in indexed)
+    print(
+        f"clusters: signals={len(signals)} clusters={len(indexed)} "
+        f"all-pairs={reference_sec:.3f}s indexed={indexed_sec:.3f}s identical={same}"
+    )
+
+    groups = sorted({signal["group_id"] for signal in signals})
+    token_map: Dict[str, set] = {group: set() for group in groups}
+    for signal in signals:
+        token_map[signal["group_id"]] |= signal["tokens"]
+    ref_matrix, ref_sec = _timed(_reference_matrix, token_map, groups)
+    new_matrix, new_sec = _timed(jaccard_matrix, token_map, groups)
+    print(
+        f"matrix: groups={len(groups)} all-pairs={ref_sec:.3f}s indexed={new_sec:.3f}s "
+        f"identical={ref_matrix == new_matrix}"
+    )
+    return 0 if same and ref_matrix == new_matrix else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""End-to-end benchmark of orchestrator overhead on the mock backend.
+
+Builds a throwaway fabric with synthetic groups, runs ``run_orchestrator_reply``
+against the network-free mock agent runner and reports wall time, per-stage
+timings, peak RSS and file I/O as JSON. Every repeat runs in a fresh child
+process so peak RSS and I/O counters belong to that run alone.
+
+    PYTHONPATH=src python benchmarks/orchestration_e2e.py --groups 8 --specialists 4 \\
+        --depth 2 --cycles 2 --handoff-bytes 20000 --output bench.json
+    PYTHONPATH=src python benchmarks/orchestration_e2e.py ... --compare bench.json
+
+With ``--compare`` the run exits non-zero when wall time, orchestrator-only
+time, any stage total or peak RSS regress by more than ``--tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import functools
+import importlib
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+import yaml
+
+BENCHMARK_SCHEMA_VERSION = "1.1"
+TEMPLATE_GROUP = "developer"
+MESSAGE = (
+    "Build a reusable research orchestration package with clear evidence-backed gate checks."
+)
+
+# Stage -> "module:attribute" call sites timed by wrapping. Stages nest: agent
+# sessions and codex-home prep run inside the runtime stage.
+STAGE_HOOKS: Dict[str, List[str]] = {
+    "runtime": ["agents_inc.core.orchestrator_reply:run_layered_runtime"],
+    "dispatch": ["agents_inc.core.layered_runtime:build_dispatch_plan"],
+    "codex_home_prep": ["agents_inc.core.layered_runtime:_prepare_agent_codex_home"],
+    "agent_sessions": ["agents_inc.core.agent_session_runner:AgentSessionRunner.run"],
+    "gating": ["agents_inc.core.layered_runtime:gate_specialist_output"],
+    # Timed inside run_worker's cycle-forcing wrapper, which replaces run_head_meeting.
+    "meeting": [],
+    "synthesis": [
+        "agents_inc.core.orchestrator_reply:_collect_group_contributions",
+        "agents_inc.core.orchestrator_reply:_render_group_mode_answer",
+        "agents_inc.core.orchestrator_reply:_build_consensus_report",
+    ],
+    "report_writing": [
+        "agents_inc.core.orchestrator_reply:write_turn_token_usage_report",
+        "agents_inc.core.orchestration.report:render_key_points",
+        "agents_inc.core.orchestration.report:render_blocked_report",
+    ],
+}
+# Regression checks look at these aggregates besides every stage total.
+COMPARED_METRICS = ("wall_sec", "orchestrator_only_sec", "peak_rss_kb")
+
+
+class StageClock:
+    """Accumulates busy time per stage across threads, plus agent-session intervals."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.totals: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.agent_intervals: List[Tuple[float, float]] = []
+
+    def wrap(self, stage: str, fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def _timed(*args, **kwargs):  # type: ignore[no-untyped-def]
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                finished = time.perf_counter()
+                with self._lock:
+                    self.totals[stage] = self.totals.get(stage, 0.0) + finished - started
+                    self.calls[stage] = self.calls.get(stage, 0) + 1
+                    if stage == "agent_sessions":
+                        self.agent_intervals.append((started, finished))
+
+        return _timed
+
+    def agent_busy_sec(self) -> float:
+        """Wall time during which at least one agent session was running."""
+        busy = 0.0
+        current_start: Optional[float] = None
+        current_end = 0.0
+        for start, end in sorted(self.agent_intervals):
+            if current_start is None or start > current_end:
+                if current_start is not None:
+                    busy += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_start is not None:
+            busy += current_end - current_start
+        return busy
+
+
+def _resolve_hook(spec: str) -> Tuple[object, str]:
+    """Owner object and attribute name for a ``module:attr[.attr]`` spec."""
+    module_name, _, attr_path = spec.partition(":")
+    owner: object = importlib.import_module(module_name)
+    *parents, attr = attr_path.split(".")
+    for name in parents:
+        owner = getattr(owner, name)
+    return owner, attr
+
+
+def synthetic_group_manifest(template: dict, group_id: str, specialists: int, depth: int) -> dict:
+    """Clone ``template`` as ``group_id`` with ``specialists`` agents chained ``depth`` deep."""
+    manifest = copy.deepcopy(template)
+    manifest["group_id"] = group_id
+    manifest["display_name"] = group_id
+    head = manifest.get("head") if isinstance(manifest.get("head"), dict) else {}
+    head["agent_id"] = f"{group_id}-head"
+    head["skill_name"] = f"grp-{group_id}-head"
+    persona = head.get("persona")
+    if isinstance(persona, dict):
+        persona["persona_id"] = f"persona-{group_id}-head"
+    base_specialists = [row for row in manifest.get("specialists", []) if isinstance(row, dict)]
+    rows: List[dict] = []
+    for index in range(max(1, specialists)):
+        row = copy.deepcopy(base_specialists[index % len(base_specialists)])
+        role = str(row.get("role") or "specialist")
+        row["agent_id"] = f"{role}-{index:02d}-specialist"
+        row["skill_name"] = f"grp-{group_id}-{role}-{index:02d}"
+        # Specialists below ``depth`` form a chain; the rest run independently.
+        if 0 < index < max(1, depth):
+            row["depends_on"] = [rows[index - 1]["agent_id"]]
+        else:
+            row["depends_on"] = []
+        rows.append(row)
+    manifest["specialists"] = rows
+    return manifest
+
+
+def _prepare_fabric(root: Path, args: argparse.Namespace) -> Tuple[Path, str, List[str]]:
+    from agents_inc.cli import new_project as new_project_cli
+    from agents_inc.core.fabric_lib import ensure_fabric_root_initialized
+
+    fabric_root = root / "fabric"
+    ensure_fabric_root_initialized(fabric_root)
+    groups_dir = fabric_root / "catalog" / "groups"
+    template = yaml.safe_load((groups_dir / f"{TEMPLATE_GROUP}.yaml").read_text(encoding="utf-8"))
+    group_ids = [f"bench-g{index:02d}" for index in range(args.groups)]
+    for group_id in group_ids:
+        manifest = synthetic_group_manifest(template, group_id, args.specialists, args.depth)
+        (groups_dir / f"{group_id}.yaml").write_text(
+            yaml.safe_dump(manifest, sort_keys=False), encoding="utf-8"
+        )
+    project_id = "bench-project"
+    argv = [
+        "agents-inc new-project",
+        "--fabric-root",
+        str(fabric_root),
+        "--project-id",
+        project_id,
+        "--groups",
+        ",".join(group_ids),
+        "--execution-mode",
+        args.execution_mode,
+        "--force",
+    ]
+    with patch.object(sys, "argv", argv), open(os.devnull, "w") as devnull:
+        with patch.object(sys, "stdout", devnull):
+            code = new_project_cli.main()
+    if code != 0:
+        raise SystemExit(f"new-project failed with exit code {code}")
+    return fabric_root, project_id, group_ids
+
+
+def _read_proc_io() -> Dict[str, int]:
+    out: Dict[str, int] = {}
+    try:
+        text = Path("/proc/self/io").read_text(encoding="utf-8")
+    except OSError:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return {"block_reads": int(usage.ru_inblock), "block_writes": int(usage.ru_oublock)}
+    for line in text.splitlines():
+        key, _, value = line.partition(":")
+        if key in {"syscr", "syscw", "rchar", "wchar"}:
+            out[key] = int(value.strip())
+    return out
+
+
+def _tree_stats(path: Path) -> Dict[str, int]:
+    files = 0
+    size = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                size += (Path(dirpath) / name).lstat().st_size
+            except OSError:
+                continue
+            files += 1
+    return {"files": files, "bytes": size}
+
+
+def run_worker(args: argparse.Namespace) -> dict:
+    """One benchmark repeat, in this process."""
+    from agents_inc.core import orchestrator_reply as reply_module
+    from agents_inc.core.orchestrator_reply import OrchestratorReplyConfig, run_orchestrator_reply
+    from agents_inc.core.util.errors import FabricError
+
+    clock = StageClock()
+    meetings = {"count": 0}
+    with tempfile.TemporaryDirectory(prefix="agents-inc-bench-") as td:
+        root = Path(td)
+        fabric_root, project_id, group_ids = _prepare_fabric(root, args)
+        timed_meeting = clock.wrap("meeting", reply_module.run_head_meeting)
+
+        def _meeting(meeting_config):  # type: ignore[no-untyped-def]
+            result = timed_meeting(meeting_config)
+            meetings["count"] += 1
+            if meetings["count"] < args.cycles:
+                # Force another cycle: every head is reported unsatisfied.
+                result = dict(result)
+                result["all_satisfied"] = False
+                result["decisions"] = {}
+                result["matrix"] = {"all_satisfied": False, "unsatisfied_groups": list(group_ids)}
+            return result
+
+        patches = [patch.object(reply_module, "run_head_meeting", _meeting)]
+        for stage, specs in STAGE_HOOKS.items():
+            for spec in specs:
+                owner, attr = _resolve_hook(spec)
+                patches.append(patch.object(owner, attr, clock.wrap(stage, getattr(owner, attr))))
+        env = {
+            "AGENTS_INC_AGENT_RUNNER": "mock",
+            "AGENTS_INC_MOCK_OUTPUT_BYTES": str(args.handoff_bytes),
+            "AGENTS_INC_MOCK_PROFILE": str(args.mock_profile or ""),
+            "AGENTS_INC_MOCK_SEED": str(args.mock_seed),
+        }
+        io_before = _read_proc_io()
+        with patch.dict(os.environ, env):
+            for item in patches:
+                item.start()
+            try:
+                started = time.perf_counter()
+                try:
+                    result = run_orchestrator_reply(
+                        OrchestratorReplyConfig(
+                            fabric_root=fabric_root,
+                            project_id=project_id,
+                            message=MESSAGE,
+                            group="auto",
+                            output_dir=root / "turn",
+                            max_parallel=args.max_parallel,
+                            max_cycles=args.cycles,
+                            require_negotiation=False,
+                            incremental_cycles=not args.full_cycles,
+                        )
+                    )
+                except FabricError as exc:
+                    # Injected mock failures can legitimately block the turn.
+                    result = {"status": str(exc).split(" ", 1)[0]}
+                    blocked = True
+                else:
+                    blocked = False
+                wall = time.perf_counter() - started
+            finally:
+                for item in reversed(patches):
+                    item.stop()
+        io_after = _read_proc_io()
+        turn_tree = _tree_stats(root / "turn")
+
+    if not blocked and meetings["count"] != args.cycles:
+        raise SystemExit(f"forced {args.cycles} cycles but {meetings['count']} meetings ran")
+    agent_busy = clock.agent_busy_sec()
+    return {
+        "wall_sec": round(wall, 4),
+        "agent_busy_wall_sec": round(agent_busy, 4),
+        "orchestrator_only_sec": round(max(0.0, wall - agent_busy), 4),
+        "stages": {
+            stage: {
+                "total_sec": round(clock.totals.get(stage, 0.0), 4),
+                "calls": clock.calls.get(stage, 0),
+            }
+            for stage in STAGE_HOOKS
+        },
+        "cycles_run": meetings["count"],
+        "status": str(result.get("status") or ""),
+        "peak_rss_kb": int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss),
+        "io": {key: io_after.get(key, 0) - io_before.get(key, 0) for key in io_after},
+        "turn_output": turn_tree,
+    }
+
+
+def _scenario(args: argparse.Namespace) -> dict:
+    return {
+        "groups": args.groups,
+        "specialists": args.specialists,
+        "depth": args.depth,
+        "cycles": args.cycles,
+        "handoff_bytes": args.handoff_bytes,
+        "max_parallel": args.max_parallel,
+        "execution_mode": args.execution_mode,
+        "incremental_cycles": not args.full_cycles,
+        "mock_profile": str(args.mock_profile or ""),
+        "mock_seed": args.mock_seed,
+    }
+
+
+def _worker_argv(args: argparse.Namespace) -> List[str]:
+    argv = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--worker",
+        "--groups",
+        str(args.groups),
+        "--specialists",
+        str(args.specialists),
+        "--depth",
+        str(args.depth),
+        "--cycles",
+        str(args.cycles),
+        "--handoff-bytes",
+        str(args.handoff_bytes),
+        "--max-parallel",
+        str(args.max_parallel),
+        "--execution-mode",
+        args.execution_mode,
+        "--mock-seed",
+        str(args.mock_seed),
+    ]
+    if args.mock_profile:
+        argv.extend(["--mock-profile", str(args.mock_profile)])
+    if args.full_cycles:
+        argv.append("--full-cycles")
+    return argv
+
+
+def summarize(runs: List[dict]) -> dict:
+    """Median of each numeric metric across repeats."""
+
+    def _median(values: List[float]) -> float:
+        return round(statistics.median(values), 4)
+
+    stages = sorted({stage for run in runs for stage in run["stages"]})
+    io_keys = sorted({key for run in runs for key in run["io"]})
+    return {
+        "wall_sec": _median([run["wall_sec"] for run in runs]),
+        "agent_busy_wall_sec": _median([run["agent_busy_wall_sec"] for run in runs]),
+        "orchestrator_only_sec": _median([run["orchestrator_only_sec"] for run in runs]),
+        "peak_rss_kb": int(_median([run["peak_rss_kb"] for run in runs])),
+        "stages": {
+            stage: {
+                "total_sec": _median([run["stages"][stage]["total_sec"] for run in runs]),
+                "calls": runs[0]["stages"][stage]["calls"],
+            }
+            for stage in stages
+        },
+        "io": {key: int(_median([run["io"].get(key, 0) for run in runs])) for key in io_keys},
+        "turn_output": runs[0]["turn_output"],
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float, min_delta_sec: float) -> List[str]:
+    """Human-readable regressions of ``current`` against ``baseline`` summaries."""
+    regressions: List[str] = []
+
+    def _check(name: str, now: float, before: float, is_seconds: bool) -> None:
+        if before <= 0:
+            return
+        if is_seconds and now - before < min_delta_sec:
+            return
+        if now > before * (1.0 + tolerance):
+            regressions.append(f"{name}: {before:g} -> {now:g} (+{(now / before - 1.0):.0%})")
+
+    for metric in COMPARED_METRICS:
+        _check(
+            metric,
+            float(current.get(metric, 0)),
+            float(baseline.get(metric, 0)),
+            metric.endswith("_sec"),
+        )
+    for stage, row in sorted(current.get("stages", {}).items()):
+        before = baseline.get("stages", {}).get(stage, {})
+        _check(
+            f"stages.{stage}.total_sec",
+            float(row.get("total_sec", 0)),
+            float(before.get("total_sec", 0)),
+            True,
+        )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=4)
+    parser.add_argument("--specialists", type=int, default=3, help="specialists per group")
+    parser.add_argument(
+        "--depth", type=int, default=1, help="length of the specialist dependency chain"
+    )
+    parser.add_argument("--cycles", type=int, default=1, help="negotiation cycles to force")
+    parser.add_argument(
+        "--handoff-bytes", type=int, default=0, help="extra output per mock agent session"
+    )
+    parser.add_argument("--max-parallel", type=int, default=0)
+    parser.add_argument(
+        "--execution-mode",
+        choices=["full", "light"],
+        default="full",
+        help="full runs specialists under each head; light runs heads only",
+    )
+    parser.add_argument(
+        "--full-cycles", action="store_true", help="re-run every group in later cycles"
+    )
+    parser.add_argument(
+        "--mock-profile",
+        default="",
+        help="mock latency/failure profile: YAML/JSON path or inline JSON",
+    )
+    parser.add_argument("--mock-seed", type=int, default=0, help="seed for mock draws")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None, help="write the JSON report here")
+    parser.add_argument("--compare", type=Path, default=None, help="baseline JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    parser.add_argument(
+        "--min-delta-sec",
+        type=float,
+        default=0.05,
+        help="ignore timing regressions smaller than this many seconds",
+    )
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.worker:
+        print(json.dumps(run_worker(args)))
+        return 0
+
+    runs: List[dict] = []
+    for _ in range(max(1, args.repeat)):
+        completed = subprocess.run(
+            _worker_argv(args), capture_output=True, text=True, check=False
+        )
+        if completed.returncode != 0:
+            sys.stderr.write(completed.stderr)
+            return completed.returncode
+        runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    report = {
+        "schema_version": BENCHMARK_SCHEMA_VERSION,
+        "scenario": _scenario(args),
+        "python": sys.version.split()[0],
+        "summary": summarize(runs),
+        "runs": runs,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if baseline.get("schema_version") != BENCHMARK_SCHEMA_VERSION:
+            sys.stderr.write("warning: baseline was recorded with another benchmark version\n")
+        if baseline.get("scenario") != report["scenario"]:
+            sys.stderr.write("warning: baseline was recorded for a different scenario\n")
+        regressions = compare(
+            report["summary"], baseline.get("summary", {}), args.tolerance, args.min_delta_sec
+        )
+        for line in regressions:
+            sys.stderr.write(f"REGRESSION {line}\n")
+        if regressions:
+            return 1
+        sys.stderr.write("no regressions against baseline\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import re
-from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 
@@ -22,12 +21,21 @@ def get_version() -> str:
     fallback = _fallback_version()
     if fallback != "0+unknown":
         return fallback
+    # importlib.metadata costs tens of milliseconds to import; only installed copies need it.
+    from importlib.metadata import PackageNotFoundError, version
+
     try:
         return version("agents-inc")
     except PackageNotFoundError:
         return fallback
 
 
-__version__ = get_version()
+def __getattr__(name: str) -> str:
+    # Resolved on first use so importing a CLI entrypoint does not read package metadata.
+    if name == "__version__":
+        value = get_version()
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = ["__version__", "get_version"]
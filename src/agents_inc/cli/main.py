@@ -1,23 +1,32 @@
 from __future__ import annotations
 
+import importlib
 import sys
 from typing import Callable, Dict, List
 
-from agents_inc import __version__
-from agents_inc.cli import (
-    create_project,
-    deactivate_project,
-    delete_project,
-    dispatch_dry_run,
-    group_list,
-    init_session,
-    list_sessions,
-    new_group,
-    orchestrator_reply,
-    project_groups,
-    resume,
-    save_project,
-)
+# Command -> module under agents_inc.cli providing ``main()``. Modules are imported only
+# when their command runs, so `--help`, `--version` and light commands such as `list`
+# do not pay for the orchestration stack.
+COMMANDS: Dict[str, str] = {
+    "init": "init_session",
+    "group-list": "group_list",
+    "create": "create_project",
+    "save": "save_project",
+    "list": "list_sessions",
+    "resume": "resume",
+    "dispatch": "dispatch_dry_run",
+    "orchestrator-reply": "orchestrator_reply",
+    "deactivate": "deactivate_project",
+    "delete": "delete_project",
+    "project-groups": "project_groups",
+    "new-group": "new_group",
+    "token-ledger": "token_ledger",
+}
+
+
+def _load_command(cmd: str) -> Callable[[], int]:
+    module = importlib.import_module(f"agents_inc.cli.{COMMANDS[cmd]}")
+    return module.main
 
 
 def _invoke(entry: Callable[[], int], cmd: str, argv: List[str]) -> int:
@@ -49,40 +58,28 @@ def _print_help() -> None:
     print("  project-groups          list/add/remove groups for a project")
     print("  delete <project-id>     delete project data (requires confirmation)")
     print("  new-group               launch group creation flow")
+    print("  token-ledger            query project token usage by group/agent/model")
     print("")
     print("Run 'agents-inc <command> --help' for command-specific options.")
 
 
 def main() -> int:
-    commands: Dict[str, Callable[[], int]] = {
-        "init": init_session.main,
-        "group-list": group_list.main,
-        "create": create_project.main,
-        "save": save_project.main,
-        "list": list_sessions.main,
-        "resume": resume.main,
-        "dispatch": dispatch_dry_run.main,
-        "orchestrator-reply": orchestrator_reply.main,
-        "deactivate": deactivate_project.main,
-        "delete": delete_project.main,
-        "project-groups": project_groups.main,
-        "new-group": new_group.main,
-    }
-
     if len(sys.argv) < 2 or sys.argv[1] in {"-h", "--help", "help"}:
         _print_help()
         return 0
 
     if sys.argv[1] in {"--version", "-V", "version"}:
+        from agents_inc import __version__
+
         print(__version__)
         return 0
 
     cmd = str(sys.argv[1]).strip().lower()
-    if cmd not in commands:
+    if cmd not in COMMANDS:
         print(f"error: unknown command '{cmd}'")
         _print_help()
         return 2
-    return _invoke(commands[cmd], cmd, sys.argv[2:])
+    return _invoke(_load_command(cmd), cmd, sys.argv[2:])
 
 
 if __name__ == "__main__":
@@ -42,6 +42,7 @@ from agents_inc.core.model_profiles import (
 )
 from agents_inc.core.orchestrator_reply import OrchestratorReplyConfig, run_orchestrator_reply
 from agents_inc.core.progress_notes import format_progress_event
+from agents_inc.core.retry_policy import parse_retry_policy_overrides
 from agents_inc.core.session_state import default_project_index_path, find_resume_project
 
 _DOUBLE_ESC_WINDOW_SEC = 0.7
@@ -101,6 +102,16 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="retry backoff seconds between attempts",
     )
+    parser.add_argument(
+        "--retry-policy",
+        action="append",
+        default=[],
+        metavar="CLASS:KEY=VALUE[,KEY=VALUE]",
+        help=(
+            "override backoff for one failure class (timeout, exit, parse, other); keys: "
+            "base_delay_sec, max_delay_sec, multiplier, max_retries (repeatable)"
+        ),
+    )
     parser.add_argument(
         "--agent-timeout-sec",
         type=int,
@@ -166,6 +177,24 @@ def parse_args() -> argparse.Namespace:
         action="store_false",
         help="disable inter-group head meeting phase",
     )
+    parser.add_argument(
+        "--no-specialist-reuse",
+        dest="reuse_unchanged_specialists",
+        action="store_false",
+        help="re-run specialists even when their prompt, inputs and model settings are unchanged",
+    )
+    parser.add_argument(
+        "--continue-threads",
+        dest="continue_agent_threads",
+        action="store_true",
+        help="resume each agent's thread from the previous cycle with a compact delta prompt",
+    )
+    parser.add_argument(
+        "--full-cycles",
+        dest="incremental_cycles",
+        action="store_false",
+        help="re-run every group each cycle instead of only unsatisfied or changed groups",
+    )
     parser.add_argument(
         "--stop-rule",
         default="unanimous-head-satisfied",
@@ -582,6 +611,10 @@ def main() -> int:
             web_search_policy=str(args.web_search_policy or "web-role-only"),
             progress_callback=(_print_live_event_stderr if args.json else _print_live_event_stdout),
             project_index_path=default_project_index_path(args.project_index),
+            reuse_unchanged_specialists=bool(args.reuse_unchanged_specialists),
+            continue_agent_threads=bool(args.continue_agent_threads),
+            incremental_cycles=bool(args.incremental_cycles),
+            retry_policies=parse_retry_policy_overrides(args.retry_policy),
         )
         def _request_abort() -> None:
             if abort_file is None or abort_file.exists():
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from agents_inc.cli._project_context import resolve_project_context
+from agents_inc.core.fabric_lib import ensure_json_serializable, slugify
+from agents_inc.core.token_ledger import (
+    LEDGER_BREAKDOWNS,
+    load_token_ledger,
+    summarize_token_ledger,
+    token_ledger_path,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Query the project token usage ledger")
+    parser.add_argument("project_id", nargs="?", default="", help="project identifier")
+    parser.add_argument("--project-root", default=None, help="project root (skips project lookup)")
+    parser.add_argument("--fabric-root", default=None, help="fabric root path")
+    parser.add_argument("--project-index", default=None, help="project index path")
+    parser.add_argument("--scan-root", default=None, help="projects scan root")
+    parser.add_argument("--config-path", default=None, help="config path")
+    parser.add_argument("--since", default="", help="only rows recorded at/after this ISO time or date")
+    parser.add_argument("--until", default="", help="only rows recorded at/before this ISO time or date")
+    parser.add_argument("--group", action="append", default=[], help="restrict to group id (repeatable)")
+    parser.add_argument(
+        "--by",
+        default="group",
+        choices=list(LEDGER_BREAKDOWNS),
+        help="breakdown dimension (default: group)",
+    )
+    parser.add_argument("--top", type=int, default=0, help="show only the N most expensive rows")
+    parser.add_argument("--json", action="store_true", help="emit JSON output")
+    return parser.parse_args()
+
+
+def _resolve_project_root(args: argparse.Namespace) -> Path:
+    if args.project_root:
+        return Path(args.project_root).expanduser().resolve()
+    if not str(args.project_id or "").strip():
+        raise ValueError("project id or --project-root is required")
+    _, project_root, _, _, _ = resolve_project_context(
+        project_id=slugify(args.project_id),
+        fabric_root=args.fabric_root,
+        project_index=args.project_index,
+        scan_root=args.scan_root,
+        config_path=args.config_path,
+    )
+    return project_root
+
+
+def _print_table(by: str, rows: list[dict]) -> None:
+    if not rows:
+        print("no token usage recorded")
+        return
+    print(f"{by} | sessions | input | cached | output | billable | claims | billable/claim")
+    print("--- | ---: | ---: | ---: | ---: | ---: | ---: | ---:")
+    for row in rows:
+        per_claim = row.get("billable_tokens_per_claim")
+        print(
+            "{0} | {1} | {2} | {3} | {4} | {5} | {6} | {7}".format(
+                row.get(by, "") or "-",
+                row.get("sessions", 0),
+                row.get("input_tokens", 0),
+                row.get("cached_input_tokens", 0),
+                row.get("output_tokens", 0),
+                row.get("billable_token_estimate", 0),
+                row.get("accepted_claims", "-"),
+                "-" if per_claim is None else per_claim,
+            )
+        )
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        project_root = _resolve_project_root(args)
+        rows = load_token_ledger(
+            project_root,
+            since=args.since,
+            until=args.until,
+            group_ids=args.group,
+        )
+        summary = summarize_token_ledger(rows, by=args.by, top=args.top)
+        payload = {
+            "ledger_path": str(token_ledger_path(project_root)),
+            "by": args.by,
+            "since": args.since,
+            "until": args.until,
+            "groups": args.group,
+            "rows": summary,
+        }
+        if args.json:
+            print(json.dumps(ensure_json_serializable(payload), indent=2, sort_keys=True))
+        else:
+            _print_table(args.by, summary)
+        return 0
+    except Exception as exc:  # noqa: BLE001
+        print(f"error: {exc}")
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
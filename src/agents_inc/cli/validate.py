@@ -6,12 +6,12 @@ from typing import List
 
 from agents_inc.core.fabric_lib import (
     build_dispatch_plan,
+    check_group_catalog,
     execution_mode_from_manifest,
     ensure_fabric_root_initialized,
     ensure_group_shape,
     ensure_project_shape,
     ensure_tool_policy_shape,
-    load_group_catalog,
     load_profiles,
     load_project_registry,
     load_yaml,
@@ -93,13 +93,13 @@ def validate_lock_dependency(fabric_root: Path) -> List[str]:
 
 def validate_catalog(fabric_root: Path) -> List[str]:
     errors: List[str] = []
-    groups = load_group_catalog(fabric_root)
+    groups, shape_errors = check_group_catalog(fabric_root)
     profiles = load_profiles(fabric_root)
+    errors.extend(shape_errors)
 
     known_groups = set(groups.keys())
 
     for group_id, manifest in groups.items():
-        errors.extend(ensure_group_shape(manifest, source=f"catalog/groups/{group_id}.yaml"))
         interaction = manifest.get("interaction", {})
         if isinstance(interaction, dict):
             linked = interaction.get("linked_groups", [])
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+AGENT_HOME_TEMPLATE_SCHEMA_VERSION = "1.0"
+TEMPLATE_MANIFEST_FILE = ".template.json"
+
+_BUILD_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class AgentHomeTemplate:
+    """Immutable, content-keyed CODEX_HOME layout shared by agent homes.
+
+    ``modes`` maps each linked entry to ``"symlink"``, ``"copy"`` or ``"error"``;
+    ``errors`` holds the reason for the entries that could not be linked.
+    """
+
+    key: str
+    path: Path
+    modes: Dict[str, str] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    built: bool = False
+
+
+def symlink_or_copy(src: Path, dst: Path) -> None:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists() or dst.is_symlink():
+        _remove_path(dst)
+    try:
+        dst.symlink_to(src)
+    except Exception:
+        if src.is_file():
+            shutil.copy2(src, dst)
+        else:
+            shutil.copytree(src, dst)
+
+
+def source_fingerprint(path: Path) -> str:
+    """Stat-based digest of a file or tree: (relative path, size, mtime) of every file."""
+    digest = hashlib.sha256()
+    try:
+        stat = path.stat()
+    except OSError:
+        return ""
+    if not path.is_dir():
+        digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+        return digest.hexdigest()
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames.sort()
+        base = Path(dirpath)
+        for name in sorted(filenames):
+            file_path = base / name
+            try:
+                file_stat = file_path.stat()
+            except OSError:
+                continue
+            rel = file_path.relative_to(path).as_posix()
+            digest.update(f"{rel}\0{file_stat.st_size}:{file_stat.st_mtime_ns}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def ensure_agent_home_template(
+    template_root: Path, entries: Sequence[Tuple[str, Path]]
+) -> AgentHomeTemplate:
+    """Return the template holding ``entries`` (home-relative path -> source), building it once.
+
+    The key covers each source's path and fingerprint, so a changed skill or
+    reference tree yields a new template; older templates for the same entry
+    layout are pruned once the new one is published.
+    """
+    ordered = sorted((str(rel), Path(src)) for rel, src in entries)
+    layout = hashlib.sha256()
+    content = hashlib.sha256()
+    for rel, src in ordered:
+        layout.update(f"{rel}\0{src}\0".encode("utf-8"))
+        content.update(f"{rel}\0{src}\0{source_fingerprint(src)}\0".encode("utf-8"))
+    layout_id = layout.hexdigest()[:16]
+    key = f"{layout_id}-{content.hexdigest()[:16]}"
+    target = template_root / key
+
+    loaded = _load_template(target, key)
+    if loaded is not None:
+        return loaded
+    with _BUILD_LOCK:
+        loaded = _load_template(target, key)
+        if loaded is not None:
+            return loaded
+        template_root.mkdir(parents=True, exist_ok=True)
+        staging = template_root / f".staging-{key}-{os.getpid()}"
+        _remove_path(staging)
+        staging.mkdir(parents=True)
+        modes: Dict[str, str] = {}
+        errors: Dict[str, str] = {}
+        for rel, src in ordered:
+            dst = staging / rel
+            try:
+                symlink_or_copy(src, dst)
+            except Exception as exc:  # noqa: BLE001
+                _remove_path(dst)
+                modes[rel] = "error"
+                errors[rel] = str(exc)
+                continue
+            modes[rel] = "symlink" if dst.is_symlink() else "copy"
+        manifest = {
+            "schema_version": AGENT_HOME_TEMPLATE_SCHEMA_VERSION,
+            "key": key,
+            "entries": {rel: str(src) for rel, src in ordered},
+            "modes": modes,
+            "errors": errors,
+        }
+        (staging / TEMPLATE_MANIFEST_FILE).write_text(
+            json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        try:
+            staging.rename(target)
+        except OSError:
+            # Another process published the same template first.
+            _remove_path(staging)
+            loaded = _load_template(target, key)
+            if loaded is not None:
+                return loaded
+            raise
+        for stale in template_root.glob(f"{layout_id}-*"):
+            if stale != target:
+                _remove_path(stale)
+        return AgentHomeTemplate(key=key, path=target, modes=modes, errors=errors, built=True)
+
+
+def instantiate_agent_home(template: AgentHomeTemplate, agent_home: Path) -> Dict[str, int]:
+    """Make ``agent_home`` mirror the template, touching only what differs.
+
+    Symlinks are recreated with the template's target and copied files are
+    hard-linked (copied when the filesystem refuses), so per-agent setup never
+    duplicates a reference tree; agents must treat linked entries as read-only.
+    Anything else under the home, such as session rollouts from an earlier run
+    in the same directory, is removed.
+    """
+    counts = {"kept": 0, "created": 0, "removed": 0}
+    agent_home.mkdir(parents=True, exist_ok=True)
+    _reconcile_dir(template.path, agent_home, counts, top_level=True)
+    return counts
+
+
+def _reconcile_dir(
+    src_dir: Path, dst_dir: Path, counts: Dict[str, int], *, top_level: bool
+) -> None:
+    expected: List[str] = []
+    for src in sorted(src_dir.iterdir()):
+        if top_level and src.name == TEMPLATE_MANIFEST_FILE:
+            continue
+        expected.append(src.name)
+        dst = dst_dir / src.name
+        if src.is_symlink():
+            target = os.readlink(src)
+            if dst.is_symlink() and os.readlink(dst) == target:
+                counts["kept"] += 1
+                continue
+            _remove_path(dst)
+            os.symlink(target, dst)
+            counts["created"] += 1
+        elif src.is_dir():
+            if dst.is_symlink() or (dst.exists() and not dst.is_dir()):
+                _remove_path(dst)
+            dst.mkdir(exist_ok=True)
+            _reconcile_dir(src, dst, counts, top_level=False)
+        else:
+            if _same_file(src, dst):
+                counts["kept"] += 1
+                continue
+            _remove_path(dst)
+            try:
+                os.link(src, dst)
+            except OSError:
+                shutil.copy2(src, dst)
+            counts["created"] += 1
+    for dst in dst_dir.iterdir():
+        if dst.name not in expected:
+            _remove_path(dst)
+            counts["removed"] += 1
+
+
+def _same_file(src: Path, dst: Path) -> bool:
+    if dst.is_symlink() or not dst.is_file():
+        return False
+    try:
+        if os.path.samefile(src, dst):
+            return True
+        src_stat = src.stat()
+        dst_stat = dst.stat()
+    except OSError:
+        return False
+    return (src_stat.st_size, src_stat.st_mtime_ns) == (dst_stat.st_size, dst_stat.st_mtime_ns)
+
+
+def _load_template(path: Path, key: str) -> Optional[AgentHomeTemplate]:
+    try:
+        manifest = json.loads((path / TEMPLATE_MANIFEST_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("key") != key:
+        return None
+    modes = manifest.get("modes")
+    errors = manifest.get("errors")
+    return AgentHomeTemplate(
+        key=key,
+        path=path,
+        modes=dict(modes) if isinstance(modes, dict) else {},
+        errors=dict(errors) if isinstance(errors, dict) else {},
+    )
+
+
+def _remove_path(path: Path) -> None:
+    if not path.exists() and not path.is_symlink():
+        return
+    if path.is_file() or path.is_symlink():
+        path.unlink()
+        return
+    shutil.rmtree(path)
@@ -1,20 +1,37 @@
 from __future__ import annotations
 
+import bisect
 import json
 import os
 import re
 import shutil
 import subprocess
+import sys
+import tempfile
 import threading
+import time
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict, List
-
+from typing import Callable, Deque, Dict, Iterator, List
+
+from agents_inc.core.backends.mock_model import (
+    OUTCOME_ESCALATION,
+    OUTCOME_EXIT,
+    OUTCOME_PARSE,
+    OUTCOME_TIMEOUT,
+    MockOutcome,
+    active_mock_model,
+    mock_session_role,
+)
 from agents_inc.core.backends.registry import resolve_backend
 from agents_inc.core.codex_app_client import CodexAppClient, CodexAppServerError
 from agents_inc.core.codex_home import codex_launch_env
+from agents_inc.core.escalation import ESCALATION_REQUEST_FILE
 from agents_inc.core.fabric_lib import now_iso, write_text
-from agents_inc.core.transcript_capture import redact_text
+from agents_inc.core.tracing import NullSpan, Span, current_span, trace_span
+from agents_inc.core.transcript_capture import TailBuffer, TranscriptLog, redact_text
 
 WORK_BLOCK_RE = re.compile(r"BEGIN_WORK\s*(.*?)\s*END_WORK", re.DOTALL | re.IGNORECASE)
 HANDOFF_BLOCK_RE = re.compile(
@@ -22,6 +39,21 @@ HANDOFF_BLOCK_RE = re.compile(
     re.DOTALL | re.IGNORECASE,
 )
 JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
+JSON_SCAN_TOKEN_RE = re.compile(r'[{}"\\\n]')
+WORK_BEGIN_RE = re.compile(r"BEGIN_WORK", re.IGNORECASE)
+WORK_END_RE = re.compile(r"END_WORK", re.IGNORECASE)
+HANDOFF_BEGIN_RE = re.compile(r"BEGIN_HANDOFF_JSON", re.IGNORECASE)
+HANDOFF_END_RE = re.compile(r"END_HANDOFF_JSON", re.IGNORECASE)
+# Sleeps, replays a prepared transcript and exits with the requested status.
+_MOCK_CHILD_SCRIPT = (
+    "import sys, time\n"
+    "time.sleep(float(sys.argv[1]))\n"
+    "with open(sys.argv[2], encoding='utf-8') as handle:\n"
+    "    sys.stdout.write(handle.read())\n"
+    "sys.exit(int(sys.argv[3]))\n"
+)
+# Longest marker minus one: a marker split across two chunks is still found.
+MARKER_OVERLAP_CHARS = len("BEGIN_HANDOFF_JSON") - 1
 
 
 @dataclass
@@ -33,6 +65,8 @@ class AgentRunConfig:
     work_dir: Path | None = None
     codex_home: Path | None = None
     thread_id: str | None = None
+    # Prompt for a fresh thread when resuming ``thread_id`` fails; defaults to ``prompt``.
+    fallback_prompt: str | None = None
     timeout_sec: int = 0
     web_search: bool = True
     session_label: str = ""
@@ -44,12 +78,15 @@ class AgentRunConfig:
     sandbox_cd_dir: Path | None = None
     sandbox_network_access: bool | None = None
     stream_callback: Callable[[Dict[str, object]], None] | None = None
+    handoff_callback: Callable[[Dict[str, object]], None] | None = None
 
 
 @dataclass
 class AgentRunResult:
     success: bool
     return_code: int
+    # Codex sessions keep only a bounded tail of their output here; the full
+    # transcript is in the raw and redacted logs.
     stdout: str
     stderr: str
     raw_text: str
@@ -65,6 +102,23 @@ class AgentRunResult:
     parse_mode: str
 
 
+@dataclass
+class ProcessCapture:
+    returncode: int
+    stdout: str
+    stderr: str
+    output_tail: str
+    thread_id: str
+    # Bounded tail of the agent messages; agent_result is their strict parse.
+    agent_text: str
+    agent_result: tuple[str, Dict[str, object], str, str] | None = None
+    agent_text_complete: bool = True
+    output_complete: bool = True
+    # Offsets of this process's output in the transcript's raw log.
+    transcript_start: int = 0
+    transcript_end: int = 0
+
+
 class AgentSessionRunner:
     """Run specialist/head sessions in isolated Codex executions."""
 
@@ -79,7 +133,15 @@ class AgentSessionRunner:
         self.backend = self._backend_adapter.name
 
     def run(self, config: AgentRunConfig) -> AgentRunResult:
-        return self._backend_adapter.run(self, config)
+        with trace_span(
+            "agent_session",
+            category="agent",
+            label=config.session_label,
+            backend=self.backend,
+        ) as span:
+            result = self._backend_adapter.run(self, config)
+            span.set(success=result.success, return_code=result.return_code)
+            return result
 
     def _run_codex(self, config: AgentRunConfig) -> AgentRunResult:
         started = now_iso()
@@ -126,105 +188,109 @@ class AgentSessionRunner:
             sandbox_network_access=config.sandbox_network_access,
         )
 
-        try:
-            primary_proc = self._run_process(config=config, cmd=primary_cmd)
-            primary_raw = (primary_proc.stdout or "") + "\n" + (primary_proc.stderr or "")
-            thread_id, agent_text = _extract_exec_json(primary_raw)
-            parse_input = agent_text if agent_text else primary_raw
-            parsed_work, parsed_handoff, parse_error, parse_mode = _parse_session_output(parse_input)
-            success = primary_proc.returncode == 0 and not parse_error
-            rotated = False
-            final_proc = primary_proc
-            final_raw = primary_raw
-            final_thread_id = thread_id
-            final_agent_text = agent_text
-
-            if not success and used_resume:
-                # Resume may fail due stale/missing thread. Rotate to a fresh thread once.
-                rotate_cmd = self._build_codex_cmd(
-                    codex_bin=codex_bin,
-                    prompt=self._prompt_with_web_mode(config.prompt, config.web_search),
-                    thread_id=None,
-                    model=config.model,
-                    model_reasoning_effort=config.model_reasoning_effort,
-                    disable_mcp=bool(config.disable_mcp),
-                    approval_policy=config.approval_policy,
-                    sandbox_mode=config.sandbox_mode,
-                    sandbox_cd_dir=config.sandbox_cd_dir,
-                    sandbox_network_access=config.sandbox_network_access,
+        with TranscriptLog(config.raw_log_path, config.redacted_log_path) as transcript:
+            try:
+                primary_parser = self._session_parser(config)
+                primary_proc = self._run_process(
+                    config=config, cmd=primary_cmd, parser=primary_parser, transcript=transcript
                 )
-                rotate_proc = self._run_process(config=config, cmd=rotate_cmd)
-                rotate_raw = (rotate_proc.stdout or "") + "\n" + (rotate_proc.stderr or "")
-                rotate_thread_id, rotate_agent_text = _extract_exec_json(rotate_raw)
-                rotate_parse_input = rotate_agent_text if rotate_agent_text else rotate_raw
-                rotate_work, rotate_handoff, rotate_error, rotate_parse_mode = _parse_session_output(
-                    rotate_parse_input
+                thread_id = primary_proc.thread_id
+                agent_text = primary_proc.agent_text
+                parsed_work, parsed_handoff, parse_error, parse_mode = _parse_process_output(
+                    primary_parser, primary_proc, transcript
+                )
+                success = primary_proc.returncode == 0 and not parse_error
+                rotated = False
+                final_proc = primary_proc
+                final_thread_id = thread_id
+                final_agent_text = agent_text
+
+                if not success and used_resume:
+                    # Resume may fail due stale/missing thread. Rotate to a fresh thread once.
+                    rotate_cmd = self._build_codex_cmd(
+                        codex_bin=codex_bin,
+                        prompt=self._prompt_with_web_mode(
+                            config.fallback_prompt or config.prompt, config.web_search
+                        ),
+                        thread_id=None,
+                        model=config.model,
+                        model_reasoning_effort=config.model_reasoning_effort,
+                        disable_mcp=bool(config.disable_mcp),
+                        approval_policy=config.approval_policy,
+                        sandbox_mode=config.sandbox_mode,
+                        sandbox_cd_dir=config.sandbox_cd_dir,
+                        sandbox_network_access=config.sandbox_network_access,
+                    )
+                    transcript.write("\n--- THREAD_ROTATION ---\n")
+                    rotate_parser = self._session_parser(config)
+                    rotate_proc = self._run_process(
+                        config=config, cmd=rotate_cmd, parser=rotate_parser, transcript=transcript
+                    )
+                    rotate_thread_id = rotate_proc.thread_id
+                    rotate_agent_text = rotate_proc.agent_text
+                    rotate_work, rotate_handoff, rotate_error, rotate_parse_mode = (
+                        _parse_process_output(rotate_parser, rotate_proc, transcript)
+                    )
+                    if rotate_proc.returncode == 0 and not rotate_error:
+                        success = True
+                        parse_error = ""
+                        parse_mode = rotate_parse_mode
+                        parsed_work = rotate_work
+                        parsed_handoff = rotate_handoff
+                        final_proc = rotate_proc
+                        final_thread_id = rotate_thread_id
+                        final_agent_text = rotate_agent_text
+                        rotated = True
+                        transcript.write("\n--- THREAD_ROTATION_FALLBACK ---\n")
+                    else:
+                        parse_error = parse_error or rotate_error or "agent failed"
+                        final_proc = rotate_proc if rotate_proc.returncode != 0 else primary_proc
+                        final_thread_id = rotate_thread_id or thread_id
+                        transcript.write("\n--- THREAD_ROTATION_FAILED ---\n")
+
+                if parse_mode:
+                    transcript.write(f"\n--- PARSE_MODE:{parse_mode} ---\n")
+                finished = now_iso()
+                if not parse_error and success and not parsed_work and final_agent_text:
+                    parse_error = "missing BEGIN_WORK/END_WORK block"
+                    success = False
+                return AgentRunResult(
+                    success=success,
+                    return_code=int(final_proc.returncode),
+                    stdout=final_proc.stdout,
+                    stderr=final_proc.stderr,
+                    raw_text=transcript.tail(),
+                    parsed_work=parsed_work,
+                    parsed_handoff=parsed_handoff,
+                    error=parse_error,
+                    started_at=started,
+                    finished_at=finished,
+                    backend=self.backend,
+                    thread_id=str(final_thread_id or ""),
+                    used_resume=used_resume,
+                    rotated_thread=rotated,
+                    parse_mode=parse_mode,
+                )
+            except subprocess.TimeoutExpired as exc:
+                transcript.write("\nTIMEOUT\n")
+                finished = now_iso()
+                return AgentRunResult(
+                    success=False,
+                    return_code=124,
+                    stdout=self._coerce_text(exc.stdout),
+                    stderr=self._coerce_text(exc.stderr),
+                    raw_text=transcript.tail(),
+                    parsed_work="",
+                    parsed_handoff={},
+                    error="agent session timeout",
+                    started_at=started,
+                    finished_at=finished,
+                    backend=self.backend,
+                    thread_id=str(config.thread_id or ""),
+                    used_resume=used_resume,
+                    rotated_thread=False,
+                    parse_mode="",
                 )
-                if rotate_proc.returncode == 0 and not rotate_error:
-                    success = True
-                    parse_error = ""
-                    parse_mode = rotate_parse_mode
-                    parsed_work = rotate_work
-                    parsed_handoff = rotate_handoff
-                    final_proc = rotate_proc
-                    final_raw = primary_raw + "\n--- THREAD_ROTATION_FALLBACK ---\n" + rotate_raw
-                    final_thread_id = rotate_thread_id
-                    final_agent_text = rotate_agent_text
-                    rotated = True
-                else:
-                    final_raw = primary_raw + "\n--- THREAD_ROTATION_FAILED ---\n" + rotate_raw
-                    parse_error = parse_error or rotate_error or "agent failed"
-                    final_proc = rotate_proc if rotate_proc.returncode != 0 else primary_proc
-                    final_thread_id = rotate_thread_id or thread_id
-
-            if parse_mode:
-                final_raw = final_raw.rstrip() + f"\n--- PARSE_MODE:{parse_mode} ---\n"
-            self._write_logs(config, raw_text=final_raw)
-            finished = now_iso()
-            if not parse_error and success and not parsed_work and final_agent_text:
-                parse_error = "missing BEGIN_WORK/END_WORK block"
-                success = False
-            return AgentRunResult(
-                success=success,
-                return_code=int(final_proc.returncode),
-                stdout=final_proc.stdout or "",
-                stderr=final_proc.stderr or "",
-                raw_text=final_raw,
-                parsed_work=parsed_work,
-                parsed_handoff=parsed_handoff,
-                error=parse_error,
-                started_at=started,
-                finished_at=finished,
-                backend=self.backend,
-                thread_id=str(final_thread_id or ""),
-                used_resume=used_resume,
-                rotated_thread=rotated,
-                parse_mode=parse_mode,
-            )
-        except subprocess.TimeoutExpired as exc:
-            stdout = self._coerce_text(exc.stdout)
-            stderr = self._coerce_text(exc.stderr)
-            raw_text = stdout + "\n" + stderr
-            raw_text = raw_text.strip() + "\nTIMEOUT"
-            self._write_logs(config, raw_text=raw_text)
-            finished = now_iso()
-            return AgentRunResult(
-                success=False,
-                return_code=124,
-                stdout=stdout,
-                stderr=stderr,
-                raw_text=raw_text,
-                parsed_work="",
-                parsed_handoff={},
-                error="agent session timeout",
-                started_at=started,
-                finished_at=finished,
-                backend=self.backend,
-                thread_id=str(config.thread_id or ""),
-                used_resume=used_resume,
-                rotated_thread=False,
-                parse_mode="",
-            )
 
     def _run_codex_via_app_server(
         self, *, config: AgentRunConfig, started: str
@@ -235,50 +301,46 @@ class AgentSessionRunner:
         session_cwd = Path(
             config.sandbox_cd_dir or config.work_dir or config.project_root
         ).expanduser().resolve()
-        event_lines: List[str] = []
-        client = CodexAppClient(
-            cwd=session_cwd,
-            env=self._launch_env(config),
-            approval_policy=str(config.approval_policy or "never"),
-            sandbox_mode=str(config.sandbox_mode or "workspace-write"),
-            network_access=(
-                bool(config.sandbox_network_access)
-                if config.sandbox_network_access is not None
-                else True
-            ),
-        )
+        parser = SessionOutputParser(on_handoff=config.handoff_callback)
+        transcript = TranscriptLog(config.raw_log_path, config.redacted_log_path)
+        first_output = _FirstOutput(current_span())
 
         def _forward_event(event: Dict[str, object]) -> None:
-            event_lines.append(json.dumps(event, ensure_ascii=False))
+            if event.get("event") != "thread_started":
+                first_output.seen()
+            transcript.write(json.dumps(event, ensure_ascii=False) + "\n")
+            parser.feed_stream_event(event)
             self._emit_stream_event(config, event)
 
         try:
-            client.start()
-            try:
-                active_thread_id = (
-                    client.resume_thread(thread_id) if thread_id else client.start_thread()
+            with self._app_server_client(config=config, cwd=session_cwd) as client:
+                try:
+                    active_thread_id = (
+                        client.resume_thread(thread_id) if thread_id else client.start_thread()
+                    )
+                except CodexAppServerError:
+                    if used_resume:
+                        active_thread_id = client.start_thread()
+                        rotated = True
+                    else:
+                        raise
+                prompt = config.prompt
+                if rotated and config.fallback_prompt:
+                    prompt = config.fallback_prompt
+                turn = client.run_turn(
+                    thread_id=active_thread_id,
+                    text=self._prompt_with_web_mode(prompt, config.web_search),
+                    timeout_sec=float(max(0, int(config.timeout_sec or 0))),
+                    event_callback=_forward_event,
                 )
-            except CodexAppServerError:
-                if used_resume:
-                    active_thread_id = client.start_thread()
-                    rotated = True
-                else:
-                    raise
-            turn = client.run_turn(
-                thread_id=active_thread_id,
-                text=self._prompt_with_web_mode(config.prompt, config.web_search),
-                timeout_sec=float(max(0, int(config.timeout_sec or 0))),
-                event_callback=_forward_event,
-            )
             parse_input = str(turn.text or "")
-            parsed_work, parsed_handoff, parse_error, parse_mode = _parse_session_output(parse_input)
+            parsed_work, parsed_handoff, parse_error, parse_mode = _streamed_or_parsed(
+                parser, parse_input
+            )
             success = not parse_error
-            raw_parts = list(event_lines)
             if parse_mode:
-                raw_parts.append(f"--- PARSE_MODE:{parse_mode} ---")
-            raw_parts.append(parse_input)
-            raw_text = "\n".join(part for part in raw_parts if str(part).strip()).rstrip() + "\n"
-            self._write_logs(config, raw_text=raw_text)
+                transcript.write(f"--- PARSE_MODE:{parse_mode} ---\n")
+            transcript.write(parse_input)
             finished = now_iso()
             if success and not parsed_work and parse_input:
                 parse_error = "missing BEGIN_WORK/END_WORK block"
@@ -288,7 +350,7 @@ class AgentSessionRunner:
                 return_code=0 if success else 1,
                 stdout=parse_input,
                 stderr="",
-                raw_text=raw_text,
+                raw_text=transcript.tail(),
                 parsed_work=parsed_work,
                 parsed_handoff=parsed_handoff,
                 error=parse_error,
@@ -301,15 +363,14 @@ class AgentSessionRunner:
                 parse_mode=parse_mode,
             )
         except CodexAppServerError as exc:
-            raw_text = "\n".join(event_lines + [str(exc).strip()]).rstrip() + "\n"
-            self._write_logs(config, raw_text=raw_text)
+            transcript.write(str(exc).strip() + "\n")
             finished = now_iso()
             return AgentRunResult(
                 success=False,
                 return_code=1,
                 stdout="",
                 stderr=str(exc),
-                raw_text=raw_text,
+                raw_text=transcript.tail(),
                 parsed_work="",
                 parsed_handoff={},
                 error=str(exc),
@@ -321,6 +382,26 @@ class AgentSessionRunner:
                 rotated_thread=rotated,
                 parse_mode="",
             )
+        finally:
+            transcript.close()
+
+    @contextmanager
+    def _app_server_client(self, *, config: AgentRunConfig, cwd: Path) -> Iterator[CodexAppClient]:
+        network_access = (
+            bool(config.sandbox_network_access)
+            if config.sandbox_network_access is not None
+            else True
+        )
+        client = CodexAppClient(
+            cwd=cwd,
+            env=self._launch_env(config),
+            approval_policy=str(config.approval_policy or "never"),
+            sandbox_mode=str(config.sandbox_mode or "workspace-write"),
+            network_access=network_access,
+        )
+        try:
+            client.start()
+            yield client
         finally:
             client.close()
 
@@ -333,6 +414,8 @@ class AgentSessionRunner:
             thread_id = f"mock-{safe}-{int(datetime_from_iso(started).timestamp())}"
         role_match = re.search(r"^Role:\s*(.+)$", str(config.prompt), re.MULTILINE)
         role = str(role_match.group(1)).strip().lower() if role_match else ""
+        model = active_mock_model()
+        outcome = model.draw(label=label, role=mock_session_role(role, label))
         citation = "https://example.org/mock-evidence"
         if role in {"domain-core", "domain_core", "domain"}:
             citation = "local:references/domain-core.md"
@@ -409,6 +492,18 @@ class AgentSessionRunner:
             "cross-check assumptions, and concrete next actions for downstream validation. "
             "Quality gates were evaluated for coverage, evidence sufficiency, and integration readiness.\n"
         )
+        output_bytes = outcome.output_bytes
+        if output_bytes:
+            # Split the requested size between the work notes and extra cited claims.
+            evidence_id = str(handoff["evidence_refs"][0]["evidence_id"])  # type: ignore[index]
+            filler = " ".join(["supporting", "observation", "detail"] * 8)
+            claim_count = max(1, output_bytes // 2 // (len(filler) + 64))
+            handoff["claims"] = list(handoff["claims"]) + [  # type: ignore[arg-type]
+                {"claim": f"{label} {filler} {index:05d}", "evidence_ids": [evidence_id]}
+                for index in range(claim_count)
+            ]
+            line = f"- {label} {filler}\n"
+            work += "\n" + line * max(1, output_bytes // 2 // len(line))
         mock_live_notes = [
             f"LIVE_NOTE: {label} opened the objective and established the working frame.",
             f"LIVE_NOTE: {label} checked evidence sufficiency and narrowed the leading path.",
@@ -430,26 +525,151 @@ class AgentSessionRunner:
             + json.dumps(handoff, indent=2)
             + "\nEND_HANDOFF_JSON\n"
         )
-        self._write_logs(config, raw_text=raw_text)
+        parsed_work = work
+        parse_error = ""
+        if outcome.kind == OUTCOME_PARSE:
+            # The agent broke the output contract: its handoff block never arrives.
+            raw_text = raw_text[: raw_text.index("BEGIN_HANDOFF_JSON")]
+            parsed_work, handoff, parse_error, _ = _parse_session_output(raw_text)
+        elif outcome.kind == OUTCOME_ESCALATION and config.work_dir is not None:
+            write_text(
+                Path(config.work_dir) / ESCALATION_REQUEST_FILE,
+                json.dumps(
+                    {
+                        "type": "custom",
+                        "reason": f"mock escalation injected for {label}",
+                        "fields_needed": ["details"],
+                        "urgency": "blocking",
+                    },
+                    indent=2,
+                )
+                + "\n",
+            )
+        return_code = 1 if outcome.kind == OUTCOME_EXIT else 0
+        if model.spawn_process:
+            return_code, output_tail = self._run_mock_process(
+                config, raw_text=raw_text, outcome=outcome, return_code=return_code
+            )
+        else:
+            return_code, output_tail = self._run_mock_in_process(
+                config, raw_text=raw_text, outcome=outcome, return_code=return_code
+            )
         finished = now_iso()
+        if return_code != 0:
+            return AgentRunResult(
+                success=False,
+                return_code=return_code,
+                stdout=output_tail,
+                stderr="",
+                raw_text=output_tail,
+                parsed_work="",
+                parsed_handoff={},
+                error=(
+                    "agent session timeout"
+                    if return_code == 124
+                    else f"mock agent exited with status {return_code}"
+                ),
+                started_at=started,
+                finished_at=finished,
+                backend=self.backend,
+                thread_id=thread_id,
+                used_resume=bool(config.thread_id),
+                rotated_thread=False,
+                parse_mode="",
+            )
+        if config.handoff_callback is not None and not parse_error:
+            try:
+                config.handoff_callback(dict(handoff))
+            except Exception:
+                pass
         return AgentRunResult(
-            success=True,
+            success=not parse_error,
             return_code=0,
-            stdout=raw_text,
+            stdout=output_tail,
             stderr="",
-            raw_text=raw_text,
-            parsed_work=work,
+            raw_text=output_tail,
+            parsed_work=parsed_work,
             parsed_handoff=handoff,
-            error="",
+            error=parse_error,
             started_at=started,
             finished_at=finished,
             backend=self.backend,
             thread_id=thread_id,
             used_resume=bool(config.thread_id),
             rotated_thread=False,
-            parse_mode="strict",
+            parse_mode="" if parse_error else "strict",
         )
 
+    def _run_mock_in_process(
+        self,
+        config: AgentRunConfig,
+        *,
+        raw_text: str,
+        outcome: MockOutcome,
+        return_code: int,
+    ) -> tuple[int, str]:
+        """Sleep for the drawn latency, stopping at ``timeout_sec`` like a killed session."""
+        timeout = max(0, int(config.timeout_sec or 0))
+        timed_out = outcome.kind == OUTCOME_TIMEOUT or 0 < timeout < outcome.latency_sec
+        delay = outcome.latency_sec
+        if timed_out and timeout > 0:
+            delay = float(timeout)
+        if delay > 0:
+            time.sleep(delay)
+        if timed_out:
+            raw_text = raw_text[: raw_text.index("BEGIN_WORK")] + "\nTIMEOUT\n"
+            return_code = 124
+        self._write_logs(config, raw_text=raw_text)
+        return return_code, raw_text
+
+    def _run_mock_process(
+        self,
+        config: AgentRunConfig,
+        *,
+        raw_text: str,
+        outcome: MockOutcome,
+        return_code: int,
+    ) -> tuple[int, str]:
+        """Replay ``raw_text`` from a child process so spawn, pipe and kill costs are real."""
+        timeout = max(0, int(config.timeout_sec or 0))
+        delay = outcome.latency_sec
+        if outcome.kind == OUTCOME_TIMEOUT and timeout > 0:
+            # Outlive the timeout so the session is killed through the real path.
+            delay = max(delay, timeout + 1.0)
+        config.raw_log_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=str(config.raw_log_path.parent),
+            prefix=".mock-output-",
+            suffix=".txt",
+            delete=False,
+        ) as handle:
+            handle.write(raw_text)
+            output_path = Path(handle.name)
+        cmd = [
+            sys.executable,
+            "-c",
+            _MOCK_CHILD_SCRIPT,
+            f"{delay:.6f}",
+            str(output_path),
+            str(return_code),
+        ]
+        try:
+            with TranscriptLog(config.raw_log_path, config.redacted_log_path) as transcript:
+                try:
+                    proc = self._run_process(config=config, cmd=cmd, transcript=transcript)
+                except subprocess.TimeoutExpired:
+                    transcript.write("\nTIMEOUT\n")
+                    return 124, transcript.tail()
+                if outcome.kind == OUTCOME_TIMEOUT and proc.returncode == 0:
+                    # No timeout configured: report the injected timeout once the latency elapsed.
+                    transcript.write("\nTIMEOUT\n")
+                    return 124, transcript.tail()
+                return int(proc.returncode), transcript.tail()
+        finally:
+            output_path.unlink(missing_ok=True)
+
     @staticmethod
     def _write_logs(config: AgentRunConfig, raw_text: str) -> None:
         config.raw_log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -530,8 +750,19 @@ class AgentSessionRunner:
         return cmd
 
     def _run_process(
-        self, *, config: AgentRunConfig, cmd: list[str]
-    ) -> subprocess.CompletedProcess:
+        self,
+        *,
+        config: AgentRunConfig,
+        cmd: list[str],
+        parser: SessionOutputParser | None = None,
+        transcript: TranscriptLog | None = None,
+    ) -> ProcessCapture:
+        """Run ``cmd`` streaming its output into ``transcript`` line by line.
+
+        Only bounded tails of stdout and stderr stay in memory, along with the
+        thread id and the work/handoff blocks parsed from the agent messages in
+        ``codex exec --json`` events.
+        """
         timeout_value: int | None = None
         try:
             parsed_timeout = int(config.timeout_sec)
@@ -539,35 +770,37 @@ class AgentSessionRunner:
             parsed_timeout = 0
         if parsed_timeout > 0:
             timeout_value = parsed_timeout
-        if config.stream_callback is None:
-            return subprocess.run(
+
+        first_output = _FirstOutput(current_span())
+        transcript_start = transcript.written if transcript is not None else 0
+        with trace_span("process_spawn", category="spawn"):
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=timeout_value,
+                bufsize=1,
                 env=self._launch_env(config),
                 cwd=str(config.work_dir or config.project_root),
             )
-
-        proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
-            env=self._launch_env(config),
-            cwd=str(config.work_dir or config.project_root),
-        )
         if proc.stdout is None or proc.stderr is None:
             raise RuntimeError("failed to create subprocess pipes")
 
-        stdout_chunks: List[str] = []
-        stderr_chunks: List[str] = []
+        stdout_tail = TailBuffer()
+        stderr_tail = TailBuffer()
+        # Interleaved like the transcript, for parsing output that carries no JSON events.
+        output_tail = TailBuffer()
+        collector = _ExecEventCollector()
+        collect_lock = threading.Lock()
 
-        def _reader(stream_name: str, stream, sink: List[str]) -> None:  # type: ignore[no-untyped-def]
+        def _reader(  # type: ignore[no-untyped-def]
+            stream_name: str, stream, tail: TailBuffer
+        ) -> None:
             try:
                 for chunk in iter(stream.readline, ""):
-                    sink.append(chunk)
+                    tail.append(chunk)
+                    if transcript is not None:
+                        transcript.write(chunk)
                     self._emit_stream_event(
                         config,
                         {
@@ -576,7 +809,18 @@ class AgentSessionRunner:
                             "text": chunk,
                         },
                     )
-                    for parsed in _extract_exec_stream_events(chunk):
+                    parsed_events = _extract_exec_stream_events(chunk)
+                    if stream_name == "stdout" and not all(
+                        event.get("event") == "thread_started" for event in parsed_events or [{}]
+                    ):
+                        first_output.seen()
+                    with collect_lock:
+                        output_tail.append(chunk)
+                        for parsed in parsed_events:
+                            collector.add(parsed)
+                    for parsed in parsed_events:
+                        if parser is not None and stream_name == "stdout":
+                            parser.feed_stream_event(parsed)
                         self._emit_stream_event(config, parsed)
             finally:
                 try:
@@ -585,10 +829,10 @@ class AgentSessionRunner:
                     return
 
         stdout_thread = threading.Thread(
-            target=_reader, args=("stdout", proc.stdout, stdout_chunks), daemon=True
+            target=_reader, args=("stdout", proc.stdout, stdout_tail), daemon=True
         )
         stderr_thread = threading.Thread(
-            target=_reader, args=("stderr", proc.stderr, stderr_chunks), daemon=True
+            target=_reader, args=("stderr", proc.stderr, stderr_tail), daemon=True
         )
         stdout_thread.start()
         stderr_thread.start()
@@ -602,19 +846,33 @@ class AgentSessionRunner:
             raise subprocess.TimeoutExpired(
                 cmd=cmd,
                 timeout=timeout_value if timeout_value is not None else 0,
-                output="".join(stdout_chunks),
-                stderr="".join(stderr_chunks),
+                output=stdout_tail.text(),
+                stderr=stderr_tail.text(),
             )
 
         stdout_thread.join()
         stderr_thread.join()
-        return subprocess.CompletedProcess(
-            cmd,
-            int(proc.returncode),
-            stdout="".join(stdout_chunks),
-            stderr="".join(stderr_chunks),
+        return ProcessCapture(
+            returncode=int(proc.returncode),
+            stdout=stdout_tail.text(),
+            stderr=stderr_tail.text(),
+            output_tail=output_tail.text(),
+            thread_id=collector.thread_id,
+            agent_text=collector.agent_text.text().strip(),
+            agent_result=collector.parser.result(),
+            agent_text_complete=not collector.agent_text.truncated,
+            output_complete=not output_tail.truncated,
+            transcript_start=transcript_start,
+            transcript_end=transcript.written if transcript is not None else 0,
         )
 
+    @staticmethod
+    def _session_parser(config: AgentRunConfig) -> SessionOutputParser | None:
+        # Only stream `codex exec` output when someone is waiting on the handoff.
+        if config.stream_callback is None and config.handoff_callback is None:
+            return None
+        return SessionOutputParser(on_handoff=config.handoff_callback)
+
     @staticmethod
     def _emit_stream_event(config: AgentRunConfig, event: Dict[str, object]) -> None:
         callback = config.stream_callback
@@ -626,21 +884,252 @@ class AgentSessionRunner:
             return
 
 
-def _extract_exec_json(raw_text: str) -> tuple[str, str]:
-    thread_id = ""
-    agent_messages: list[str] = []
+class SessionOutputParser:
+    """Incrementally locate BEGIN_WORK/BEGIN_HANDOFF_JSON blocks in streamed agent text.
+
+    Marker searches resume where the previous chunk stopped, so block
+    boundaries are found without rescanning the transcript. Only the text of
+    blocks that are still open, plus enough of the tail to catch a marker split
+    across chunks, is kept; closed blocks keep just their bodies. The handoff
+    JSON is validated as soon as END_HANDOFF_JSON arrives and ``on_handoff``
+    fires once with the parsed payload, before the agent process has exited.
+    """
+
+    def __init__(self, *, on_handoff: Callable[[Dict[str, object]], None] | None = None):
+        self._on_handoff = on_handoff
+        self._window = _TextWindow()
+        self._work = _StreamBlock(WORK_BEGIN_RE, WORK_END_RE)
+        self._handoff = _StreamBlock(HANDOFF_BEGIN_RE, HANDOFF_END_RE)
+        self._handoff_payload: Dict[str, object] = {}
+        self._handoff_error = ""
+        self._handoff_notified = False
+        self._message_start = self._snapshot()
+
+    @property
+    def handoff_ready(self) -> bool:
+        return self._handoff.complete and not self._handoff_error
+
+    def feed_stream_event(self, event: Dict[str, object]) -> None:
+        kind = str(event.get("event") or "").strip()
+        text = str(event.get("text") or "")
+        if kind == "agent_delta":
+            self.feed_text(text)
+        elif kind == "agent_message" and text.strip():
+            # The completed message is authoritative; it replaces its streamed deltas.
+            if self._window.length != self._message_start[0]:
+                self._restore(self._message_start)
+            self.feed_text(text.strip() + "\n\n")
+            self._message_start = self._snapshot()
+
+    def feed_text(self, text: str) -> None:
+        if not text:
+            return
+        self._window.append(text)
+        self._work.advance(self._window)
+        while not self._handoff.complete and self._handoff.advance(self._window):
+            body = self._handoff.body
+            if not (body.startswith("{") and body.endswith("}")):
+                # Mirror HANDOFF_BLOCK_RE: only a block wrapping a JSON object counts.
+                self._handoff.skip()
+                continue
+            self._accept_handoff(body)
+        self._window.release(self._keep_from())
+
+    def result(self) -> tuple[str, Dict[str, object], str, str] | None:
+        """Return the strict parse result, or None when either block is incomplete."""
+        if not self._work.complete or not self._handoff.complete:
+            return None
+        work_text = self._work.body
+        if self._handoff_error:
+            return work_text, {}, self._handoff_error, "strict"
+        return work_text, dict(self._handoff_payload), "", "strict"
+
+    def _accept_handoff(self, body: str) -> None:
+        self._handoff_payload = {}
+        self._handoff_error = ""
+        try:
+            payload = json.loads(body)
+        except Exception as exc:  # noqa: BLE001
+            self._handoff_error = f"invalid handoff json: {exc}"
+            return
+        if not isinstance(payload, dict):
+            self._handoff_error = "handoff payload must be JSON object"
+            return
+        self._handoff_payload = payload
+        if self._on_handoff is None or self._handoff_notified:
+            return
+        self._handoff_notified = True
+        try:
+            self._on_handoff(dict(payload))
+        except Exception:
+            return
+
+    def _keep_from(self) -> int:
+        return min(self._work.keep_from(), self._handoff.keep_from(), self._window.length)
+
+    def _snapshot(self) -> tuple:
+        keep_from = self._keep_from()
+        return (
+            self._window.length,
+            keep_from,
+            self._window.text_from(keep_from),
+            self._work.state(),
+            self._handoff.state(),
+            self._handoff_payload,
+            self._handoff_error,
+        )
+
+    def _restore(self, snapshot: tuple) -> None:
+        length, keep_from, text, work, handoff, payload, error = snapshot
+        self._window.reset(keep_from, text, length)
+        self._work.restore(work)
+        self._handoff.restore(handoff)
+        self._handoff_payload = payload
+        self._handoff_error = error
+
+
+class _TextWindow:
+    """Appended text addressed by absolute offset; text before ``release`` is dropped."""
+
+    def __init__(self) -> None:
+        self._chunks: Deque[str] = deque()
+        self._base = 0
+        self.length = 0
+
+    def append(self, text: str) -> None:
+        self._chunks.append(text)
+        self.length += len(text)
+
+    def text_from(self, start: int) -> str:
+        parts: List[str] = []
+        offset = self.length
+        for chunk in reversed(self._chunks):
+            if offset <= start:
+                break
+            parts.append(chunk)
+            offset -= len(chunk)
+        return "".join(reversed(parts))[max(0, start - offset) :]
+
+    def release(self, keep_from: int) -> None:
+        while self._chunks and self._base + len(self._chunks[0]) <= keep_from:
+            self._base += len(self._chunks.popleft())
+
+    def reset(self, base: int, text: str, length: int) -> None:
+        self._chunks = deque([text] if text else [])
+        self._base = base
+        self.length = length
+
+
+class _StreamBlock:
+    def __init__(self, begin_re: re.Pattern[str], end_re: re.Pattern[str]):
+        self._begin_re = begin_re
+        self._end_re = end_re
+        self._pos = 0
+        self._body_start = -1
+        self._block_end = -1
+        self.body = ""
+
+    @property
+    def complete(self) -> bool:
+        return self._block_end >= 0
+
+    def advance(self, window: _TextWindow) -> bool:
+        """Scan newly appended text; return True once the closing marker is found."""
+        if self.complete:
+            return True
+        offset = self._pos
+        text = window.text_from(offset)
+        if self._body_start < 0:
+            match = self._begin_re.search(text)
+            if match is None:
+                self._pos = max(self._pos, window.length - MARKER_OVERLAP_CHARS)
+                return False
+            self._body_start = offset + match.end()
+            self._pos = self._body_start
+        match = self._end_re.search(text, self._pos - offset)
+        if match is None:
+            self._pos = max(self._body_start, window.length - MARKER_OVERLAP_CHARS)
+            return False
+        body = window.text_from(self._body_start)
+        self.body = body[: offset + match.start() - self._body_start].strip()
+        self._block_end = offset + match.end()
+        return True
+
+    def skip(self) -> None:
+        """Drop the current block and look for the next opening marker after it."""
+        self._pos = self._block_end
+        self._body_start = -1
+        self._block_end = -1
+        self.body = ""
+
+    def keep_from(self) -> int:
+        """First offset this block may still need to read."""
+        if self.complete:
+            return sys.maxsize
+        return self._body_start if self._body_start >= 0 else self._pos
+
+    def state(self) -> tuple[int, int, int, str]:
+        return self._pos, self._body_start, self._block_end, self.body
+
+    def restore(self, state: tuple[int, int, int, str]) -> None:
+        self._pos, self._body_start, self._block_end, self.body = state
+
+
+class _FirstOutput:
+    """Marks the session span once, when the agent's first output arrives."""
+
+    def __init__(self, span: Span | NullSpan) -> None:
+        self._span = span
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        self._seen = False
+
+    def seen(self) -> None:
+        with self._lock:
+            if self._seen:
+                return
+            self._seen = True
+        elapsed = round(time.monotonic() - self._started, 3)
+        self._span.set(time_to_first_output_sec=elapsed)
+        self._span.mark("first_output", since_start_sec=elapsed)
+
+
+class _ExecEventCollector:
+    """Thread id and agent messages from ``codex exec --json`` events.
+
+    Messages are parsed for work/handoff blocks as they arrive; only a bounded
+    tail of their text is kept.
+    """
+
+    def __init__(self) -> None:
+        self.thread_id = ""
+        self.parser = SessionOutputParser()
+        self.agent_text = TailBuffer()
+        self.agent_messages = 0
+
+    def add(self, event: Dict[str, object]) -> None:
+        kind = str(event.get("event") or "")
+        if kind == "thread_started":
+            thread = str(event.get("thread_id") or "").strip()
+            if thread:
+                self.thread_id = thread
+        elif kind == "agent_message":
+            text = str(event.get("text") or "").strip()
+            if text:
+                self.parser.feed_stream_event({"event": "agent_message", "text": text})
+                self.agent_text.append(("\n\n" if self.agent_messages else "") + text)
+                self.agent_messages += 1
+
+
+def _agent_text_from_log(raw_text: str) -> str:
+    """Agent messages replayed from raw ``codex exec --json`` output, joined like the tail."""
+    messages: List[str] = []
     for line in raw_text.splitlines():
         for event in _extract_exec_stream_events(line):
-            kind = str(event.get("event") or "")
-            if kind == "thread_started":
-                thread = str(event.get("thread_id") or "").strip()
-                if thread:
-                    thread_id = thread
-            elif kind == "agent_message":
-                text = str(event.get("text") or "").strip()
-                if text:
-                    agent_messages.append(text)
-    return thread_id, "\n\n".join(agent_messages).strip()
+            text = str(event.get("text") or "").strip()
+            if event.get("event") == "agent_message" and text:
+                messages.append(text)
+    return "\n\n".join(messages)
 
 
 def _extract_exec_stream_events(raw_line: str) -> List[Dict[str, object]]:
@@ -728,6 +1217,42 @@ def datetime_from_iso(value: str):
         return datetime.now(timezone.utc)
 
 
+def _streamed_or_parsed(
+    parser: SessionOutputParser | None, raw_text: str
+) -> tuple[str, Dict[str, object], str, str]:
+    with trace_span("parse", category="parse"):
+        streamed = parser.result() if parser is not None else None
+        if streamed is not None and not streamed[2]:
+            return streamed
+        return _parse_session_output(raw_text)
+
+
+def _parse_process_output(
+    parser: SessionOutputParser | None, proc: ProcessCapture, transcript: TranscriptLog | None
+) -> tuple[str, Dict[str, object], str, str]:
+    """Strict result from the streamed blocks, else a batch parse of the session text.
+
+    The batch parse needs the whole agent text (or plain output when there
+    were no JSON events). When the in-memory tail lost its start, the text is
+    rebuilt from this process's slice of the raw transcript on disk.
+    """
+    with trace_span("parse", category="parse"):
+        for streamed in (parser.result() if parser is not None else None, proc.agent_result):
+            if streamed is not None and not streamed[2]:
+                return streamed
+        if proc.agent_text:
+            text = proc.agent_text
+            if not proc.agent_text_complete and transcript is not None:
+                text = _agent_text_from_log(
+                    transcript.read_raw(proc.transcript_start, proc.transcript_end)
+                )
+        else:
+            text = proc.output_tail
+            if not proc.output_complete and transcript is not None:
+                text = transcript.read_raw(proc.transcript_start, proc.transcript_end)
+        return _parse_session_output(text)
+
+
 def _parse_session_output(raw_text: str) -> tuple[str, Dict[str, object], str, str]:
     work_match = WORK_BLOCK_RE.search(raw_text)
     handoff_match = HANDOFF_BLOCK_RE.search(raw_text)
@@ -795,23 +1320,100 @@ def _parse_session_output_fallback(
 
 def _extract_last_json_object(raw_text: str) -> tuple[object | None, tuple[int, int] | None]:
     decoder = json.JSONDecoder()
-    best_obj: object | None = None
-    best_span: tuple[int, int] | None = None
-    best_len = -1
-    best_start = -1
-    for index, char in enumerate(raw_text):
-        if char != "{":
-            continue
+    # Try the longest brace-balanced spans first (later start wins ties), so the
+    # outermost handoff object is usually decoded on the first attempt.
+    spans = sorted(_balanced_brace_spans(raw_text), key=lambda span: (span[0] - span[1], -span[0]))
+    for start, _ in spans:
         try:
-            parsed, end_index = decoder.raw_decode(raw_text[index:])
+            parsed, end_index = decoder.raw_decode(raw_text, start)
         except Exception:
             continue
-        if not isinstance(parsed, dict):
+        if isinstance(parsed, dict):
+            return parsed, (start, int(end_index))
+    return None, None
+
+
+def _balanced_brace_spans(raw_text: str) -> List[tuple[int, int]]:
+    """Return (start, end) of every balanced {...} span, in roughly one pass over raw_text.
+
+    Quotes open strings and a raw newline closes an unterminated one (JSON
+    strings cannot contain one), so a stray quote in prose can only hide the
+    rest of its line. A ``{`` seen inside such a string may still start an
+    object, so each one is rescanned from a clean state; past its first
+    newline that rescan tokenizes exactly like the main pass, and its closing
+    brace is looked up from the main pass's brace counter instead of scanned.
+    """
+    spans: List[tuple[int, int]] = []
+    stack: List[int] = []
+    shadowed: List[int] = []
+    event_positions: List[int] = []
+    event_counters: List[int] = []
+    closes_by_counter: Dict[int, List[int]] = {}
+    counter = 0
+    in_string = False
+    escaped_index = -1
+    for match in JSON_SCAN_TOKEN_RE.finditer(raw_text):
+        index = match.start()
+        char = raw_text[index]
+        if char == "\n":
+            in_string = False
+            continue
+        if in_string:
+            if char == "{":
+                shadowed.append(index)
+            if index == escaped_index:
+                continue
+            if char == "\\":
+                escaped_index = index + 1
+            elif char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+            continue
+        if char == "\\":
+            continue
+        counter += 1 if char == "{" else -1
+        event_positions.append(index)
+        event_counters.append(counter)
+        if char == "{":
+            stack.append(index)
             continue
-        span_len = int(end_index)
-        if span_len > best_len or (span_len == best_len and index > best_start):
-            best_obj = parsed
-            best_span = (index, index + span_len)
-            best_len = span_len
-            best_start = index
-    return best_obj, best_span
+        closes_by_counter.setdefault(counter, []).append(index)
+        if stack:
+            spans.append((stack.pop(), index + 1))
+
+    for start in shadowed:
+        depth = 0
+        in_string = False
+        escaped_index = -1
+        for match in JSON_SCAN_TOKEN_RE.finditer(raw_text, start):
+            index = match.start()
+            char = raw_text[index]
+            if char == "\n":
+                if in_string:
+                    break
+                before = bisect.bisect_left(event_positions, index)
+                target = (event_counters[before - 1] if before else 0) - depth
+                closes = closes_by_counter.get(target, [])
+                found = bisect.bisect_right(closes, index)
+                if found < len(closes):
+                    spans.append((start, closes[found] + 1))
+                break
+            if in_string:
+                if index == escaped_index:
+                    continue
+                if char == "\\":
+                    escaped_index = index + 1
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    spans.append((start, index + 1))
+                    break
+    return spans
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+HEAD_SLOT_TIER = 0
+SPECIALIST_SLOT_TIER = 1
+
+
+class AgentSlotPool:
+    """Project-wide cap on concurrently running agent sessions.
+
+    Waiters are granted slots in priority order (lowest tuple first) and FIFO
+    within the same priority. A capacity of 0 means unlimited.
+    """
+
+    def __init__(self, capacity: int = 0):
+        try:
+            parsed = int(capacity)
+        except Exception:
+            parsed = 0
+        self.capacity = max(0, parsed)
+        self._cond = threading.Condition()
+        self._waiting: List[Tuple[Tuple[int, ...], int]] = []
+        self._seq = itertools.count()
+        self._active = 0
+        self._peak = 0
+        self._granted = 0
+
+    def acquire(self, priority: Sequence[int] = ()) -> None:
+        ticket = (tuple(int(item) for item in priority), next(self._seq))
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            while not self._can_grant(ticket):
+                self._cond.wait()
+            heapq.heappop(self._waiting)
+            self._active += 1
+            self._granted += 1
+            self._peak = max(self._peak, self._active)
+            # The next waiter in line may also fit when capacity allows.
+            self._cond.notify_all()
+
+    def release(self) -> None:
+        with self._cond:
+            self._active = max(0, self._active - 1)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, priority: Sequence[int] = ()) -> Iterator[None]:
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "capacity": self.capacity,
+                "active": self._active,
+                "waiting": len(self._waiting),
+                "peak": self._peak,
+                "granted": self._granted,
+            }
+
+    def _can_grant(self, ticket: Tuple[Tuple[int, ...], int]) -> bool:
+        if self._waiting[0] != ticket:
+            return False
+        return self.capacity <= 0 or self._active < self.capacity
+
+
+def specialist_critical_path_lengths(depends_on: Dict[str, Sequence[str]]) -> Dict[str, int]:
+    """Return the longest dependent chain (including the node) for each specialist."""
+    dependents: Dict[str, List[str]] = {key: [] for key in depends_on}
+    for specialist_id, deps in depends_on.items():
+        for dep in deps:
+            if dep in dependents:
+                dependents[dep].append(specialist_id)
+
+    lengths: Dict[str, int] = {}
+
+    def _length(specialist_id: str, trail: frozenset) -> int:
+        if specialist_id in lengths:
+            return lengths[specialist_id]
+        best = 0
+        for child in dependents.get(specialist_id, []):
+            if child in trail:
+                continue
+            best = max(best, _length(child, trail | {child}))
+        lengths[specialist_id] = best + 1
+        return lengths[specialist_id]
+
+    for specialist_id in depends_on:
+        _length(specialist_id, frozenset({specialist_id}))
+    return lengths
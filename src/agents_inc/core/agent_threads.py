@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Dict, Optional
 
 import yaml
 
 from agents_inc.core.fabric_lib import now_iso
+from agents_inc.core.util.fs import atomic_write
 
 THREADS_SCHEMA_VERSION = "3.1"
 
+# Agents of one runtime record threads concurrently; serialize the read-modify-write.
+_THREADS_LOCK = threading.RLock()
+
 
 def agent_threads_path(project_root: Path) -> Path:
     return project_root / ".agents-inc" / "state" / "agent-threads.yaml"
@@ -46,11 +51,10 @@ def load_agent_threads(project_root: Path) -> dict:
 
 def save_agent_threads(project_root: Path, payload: dict) -> Path:
     path = agent_threads_path(project_root)
-    path.parent.mkdir(parents=True, exist_ok=True)
     clean = dict(payload)
     clean["schema_version"] = THREADS_SCHEMA_VERSION
-    with path.open("w", encoding="utf-8") as handle:
-        yaml.safe_dump(clean, handle, sort_keys=False)
+    # Agents read thread records while others record theirs; never expose a partial file.
+    atomic_write(path, yaml.safe_dump(clean, sort_keys=False))
     return path
 
 
@@ -64,52 +68,58 @@ def get_orchestrator_thread(project_root: Path) -> Optional[str]:
 
 
 def set_orchestrator_thread(project_root: Path, thread_id: str, status: str) -> Path:
-    payload = load_agent_threads(project_root)
-    payload["orchestrator"] = {
-        "thread_id": str(thread_id or "").strip(),
-        "status": str(status or "").strip(),
-        "updated_at": now_iso(),
-    }
-    return save_agent_threads(project_root, payload)
+    with _THREADS_LOCK:
+        payload = load_agent_threads(project_root)
+        payload["orchestrator"] = _thread_row(thread_id, status, None)
+        return save_agent_threads(project_root, payload)
 
 
-def get_head_thread(project_root: Path, group_id: str) -> Optional[str]:
+def get_head_thread_record(project_root: Path, group_id: str) -> dict:
     payload = load_agent_threads(project_root)
     heads = payload.get("heads", {})
     if not isinstance(heads, dict):
-        return None
+        return {}
     row = heads.get(group_id)
-    if not isinstance(row, dict):
-        return None
-    thread_id = str(row.get("thread_id") or "").strip()
+    return dict(row) if isinstance(row, dict) else {}
+
+
+def get_head_thread(project_root: Path, group_id: str) -> Optional[str]:
+    thread_id = str(get_head_thread_record(project_root, group_id).get("thread_id") or "").strip()
     return thread_id or None
 
 
-def set_head_thread(project_root: Path, group_id: str, thread_id: str, status: str) -> Path:
-    payload = load_agent_threads(project_root)
-    heads = payload.setdefault("heads", {})
-    if not isinstance(heads, dict):
-        heads = {}
-        payload["heads"] = heads
-    heads[group_id] = {
-        "thread_id": str(thread_id or "").strip(),
-        "status": str(status or "").strip(),
-        "updated_at": now_iso(),
-    }
-    return save_agent_threads(project_root, payload)
+def set_head_thread(
+    project_root: Path,
+    group_id: str,
+    thread_id: str,
+    status: str,
+    *,
+    details: Optional[Dict[str, object]] = None,
+) -> Path:
+    with _THREADS_LOCK:
+        payload = load_agent_threads(project_root)
+        heads = payload.setdefault("heads", {})
+        if not isinstance(heads, dict):
+            heads = {}
+            payload["heads"] = heads
+        heads[group_id] = _thread_row(thread_id, status, details)
+        return save_agent_threads(project_root, payload)
 
 
-def get_specialist_thread(project_root: Path, group_id: str, specialist_id: str) -> Optional[str]:
+def get_specialist_thread_record(project_root: Path, group_id: str, specialist_id: str) -> dict:
     payload = load_agent_threads(project_root)
     specialists = payload.get("specialists", {})
     if not isinstance(specialists, dict):
-        return None
+        return {}
     group_rows = specialists.get(group_id)
     if not isinstance(group_rows, dict):
-        return None
+        return {}
     row = group_rows.get(specialist_id)
-    if not isinstance(row, dict):
-        return None
+    return dict(row) if isinstance(row, dict) else {}
+
+
+def get_specialist_thread(project_root: Path, group_id: str, specialist_id: str) -> Optional[str]:
+    row = get_specialist_thread_record(project_root, group_id, specialist_id)
     thread_id = str(row.get("thread_id") or "").strip()
     return thread_id or None
 
@@ -120,22 +130,33 @@ def set_specialist_thread(
     specialist_id: str,
     thread_id: str,
     status: str,
+    *,
+    details: Optional[Dict[str, object]] = None,
 ) -> Path:
-    payload = load_agent_threads(project_root)
-    specialists = payload.setdefault("specialists", {})
-    if not isinstance(specialists, dict):
-        specialists = {}
-        payload["specialists"] = specialists
-    group_rows = specialists.setdefault(group_id, {})
-    if not isinstance(group_rows, dict):
-        group_rows = {}
-        specialists[group_id] = group_rows
-    group_rows[specialist_id] = {
-        "thread_id": str(thread_id or "").strip(),
-        "status": str(status or "").strip(),
-        "updated_at": now_iso(),
-    }
-    return save_agent_threads(project_root, payload)
+    with _THREADS_LOCK:
+        payload = load_agent_threads(project_root)
+        specialists = payload.setdefault("specialists", {})
+        if not isinstance(specialists, dict):
+            specialists = {}
+            payload["specialists"] = specialists
+        group_rows = specialists.setdefault(group_id, {})
+        if not isinstance(group_rows, dict):
+            group_rows = {}
+            specialists[group_id] = group_rows
+        group_rows[specialist_id] = _thread_row(thread_id, status, details)
+        return save_agent_threads(project_root, payload)
+
+
+def _thread_row(thread_id: str, status: str, details: Optional[Dict[str, object]]) -> dict:
+    row: Dict[str, object] = dict(details or {})
+    row.update(
+        {
+            "thread_id": str(thread_id or "").strip(),
+            "status": str(status or "").strip(),
+            "updated_at": now_iso(),
+        }
+    )
+    return row
 
 
 def thread_snapshot(project_root: Path) -> Dict[str, object]:
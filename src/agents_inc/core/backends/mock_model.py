@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import random
+import threading
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+
+import yaml
+
+from agents_inc.core.util.errors import FabricError
+
+MOCK_PROFILE_ENV = "AGENTS_INC_MOCK_PROFILE"
+MOCK_SEED_ENV = "AGENTS_INC_MOCK_SEED"
+MOCK_OUTPUT_BYTES_ENV = "AGENTS_INC_MOCK_OUTPUT_BYTES"
+
+OUTCOME_SUCCESS = "success"
+OUTCOME_EXIT = "exit"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_PARSE = "parse"
+OUTCOME_ESCALATION = "escalation"
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+HEAD_ROLE = "head"
+
+_RATE_FIELDS = (
+    ("failure_rate", OUTCOME_EXIT),
+    ("timeout_rate", OUTCOME_TIMEOUT),
+    ("parse_failure_rate", OUTCOME_PARSE),
+    ("escalation_rate", OUTCOME_ESCALATION),
+)
+_LATENCY_FIELDS = {"sec", "min_sec", "max_sec", "mean_sec", "stddev_sec", "median_sec", "sigma"}
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """Session duration distribution; every draw is clamped to ``[min_sec, max_sec]``.
+
+    ``fixed`` uses ``sec``; ``uniform`` spans ``min_sec..max_sec``; ``normal``
+    takes ``mean_sec``/``stddev_sec``; ``lognormal`` takes ``median_sec``/``sigma``;
+    ``exponential`` takes ``mean_sec``.
+    """
+
+    distribution: str = "fixed"
+    sec: float = 0.0
+    min_sec: float = 0.0
+    max_sec: Optional[float] = None
+    mean_sec: float = 0.0
+    stddev_sec: float = 0.0
+    median_sec: float = 0.0
+    sigma: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        kind = self.distribution
+        if kind == "uniform":
+            upper = self.max_sec if self.max_sec is not None else self.min_sec
+            value = rng.uniform(self.min_sec, upper)
+        elif kind == "normal":
+            value = rng.gauss(self.mean_sec, self.stddev_sec)
+        elif kind == "lognormal":
+            value = (
+                rng.lognormvariate(math.log(self.median_sec), self.sigma)
+                if self.median_sec > 0
+                else 0.0
+            )
+        elif kind == "exponential":
+            value = rng.expovariate(1.0 / self.mean_sec) if self.mean_sec > 0 else 0.0
+        else:
+            value = self.sec
+        value = max(self.min_sec, value)
+        if self.max_sec is not None:
+            value = min(self.max_sec, value)
+        return max(0.0, value)
+
+
+@dataclass(frozen=True)
+class MockRoleProfile:
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    output_bytes: int = 0
+    failure_rate: float = 0.0
+    timeout_rate: float = 0.0
+    parse_failure_rate: float = 0.0
+    escalation_rate: float = 0.0
+
+
+@dataclass(frozen=True)
+class MockOutcome:
+    kind: str
+    latency_sec: float
+    output_bytes: int
+
+
+class MockModel:
+    """Per-role latency, output size and failure injection for the mock backend.
+
+    Draws are reproducible: each session's random stream is derived from the
+    seed, its session label and how many times that label has run before, so
+    the same workload sees the same outcomes however threads interleave.
+    """
+
+    def __init__(
+        self,
+        *,
+        default: Optional[MockRoleProfile] = None,
+        roles: Optional[Mapping[str, MockRoleProfile]] = None,
+        seed: int = 0,
+        spawn_process: bool = False,
+    ) -> None:
+        self.default = default or MockRoleProfile()
+        self.roles = dict(roles or {})
+        self.seed = int(seed)
+        self.spawn_process = bool(spawn_process)
+        self._lock = threading.Lock()
+        self._calls: Dict[str, int] = {}
+
+    def profile_for(self, role: str) -> MockRoleProfile:
+        return self.roles.get(str(role or "").strip().lower(), self.default)
+
+    def draw(self, *, label: str, role: str) -> MockOutcome:
+        with self._lock:
+            index = self._calls.get(label, 0)
+            self._calls[label] = index + 1
+        rng = random.Random(f"{self.seed}:{label}:{index}")
+        profile = self.profile_for(role)
+        latency = profile.latency.sample(rng)
+        roll = rng.random()
+        kind = OUTCOME_SUCCESS
+        for field_name, outcome in _RATE_FIELDS:
+            rate = float(getattr(profile, field_name))
+            if roll < rate:
+                kind = outcome
+                break
+            roll -= rate
+        return MockOutcome(kind=kind, latency_sec=latency, output_bytes=profile.output_bytes)
+
+
+def mock_session_role(role: str, label: str) -> str:
+    """Profile key for a session: its prompt ``Role:`` or ``head`` for group heads."""
+    text = str(role or "").strip().lower()
+    if text:
+        return text
+    return HEAD_ROLE if str(label or "").endswith("/head") else ""
+
+
+def parse_mock_model(payload: Mapping[str, object], *, seed: Optional[int] = None) -> MockModel:
+    """Build a model from a profile mapping.
+
+    ``default`` holds the fields shared by every role and ``roles`` overrides
+    them per role (``head`` for group heads), e.g.::
+
+        seed: 7
+        spawn_process: true
+        default:
+          latency: {distribution: lognormal, median_sec: 20, sigma: 0.6, max_sec: 300}
+          failure_rate: 0.02
+        roles:
+          web-research: {latency: {distribution: uniform, min_sec: 30, max_sec: 90}}
+
+    A bare number for ``latency`` is a fixed duration in seconds.
+    """
+    if not isinstance(payload, Mapping):
+        raise FabricError("mock profile must be a mapping")
+    unknown = set(payload) - {"seed", "spawn_process", "default", "roles"}
+    if unknown:
+        raise FabricError(f"unknown mock profile keys: {', '.join(sorted(map(str, unknown)))}")
+    base = MockRoleProfile(output_bytes=_env_output_bytes())
+    default = _parse_role_profile(payload.get("default") or {}, base, "default")
+    roles_raw = payload.get("roles") or {}
+    if not isinstance(roles_raw, Mapping):
+        raise FabricError("mock profile 'roles' must be a mapping")
+    roles = {
+        str(name).strip().lower(): _parse_role_profile(fields or {}, default, str(name))
+        for name, fields in roles_raw.items()
+    }
+    if seed is None:
+        seed = int(payload.get("seed") or 0)  # type: ignore[arg-type]
+    return MockModel(
+        default=default,
+        roles=roles,
+        seed=seed,
+        spawn_process=bool(payload.get("spawn_process", False)),
+    )
+
+
+def load_mock_model(source: str = "", *, seed: Optional[int] = None) -> MockModel:
+    """Load a profile from a YAML/JSON file path or an inline JSON object."""
+    text = str(source or "").strip()
+    if not text:
+        return parse_mock_model({}, seed=seed)
+    if text.startswith("{"):
+        try:
+            payload = json.loads(text)
+        except ValueError as exc:
+            raise FabricError(f"invalid inline mock profile: {exc}") from exc
+    else:
+        path = Path(text).expanduser()
+        try:
+            payload = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        except (OSError, yaml.YAMLError) as exc:
+            raise FabricError(f"cannot load mock profile {path}: {exc}") from exc
+    return parse_mock_model(payload, seed=seed)
+
+
+_ACTIVE_LOCK = threading.Lock()
+_ACTIVE: Optional[Tuple[Tuple[object, ...], MockModel]] = None
+
+
+def active_mock_model() -> MockModel:
+    """Model configured by the environment, reused while the configuration is unchanged.
+
+    Reuse keeps the per-label call counters, so consecutive cycles in one
+    process draw fresh outcomes instead of replaying the first cycle's.
+    """
+    global _ACTIVE
+    source = os.environ.get(MOCK_PROFILE_ENV, "").strip()
+    seed_text = os.environ.get(MOCK_SEED_ENV, "").strip()
+    key: Tuple[object, ...] = (
+        source,
+        seed_text,
+        os.environ.get(MOCK_OUTPUT_BYTES_ENV, ""),
+        _mtime_ns(source),
+    )
+    with _ACTIVE_LOCK:
+        if _ACTIVE is not None and _ACTIVE[0] == key:
+            return _ACTIVE[1]
+        try:
+            seed = int(seed_text) if seed_text else None
+        except ValueError as exc:
+            raise FabricError(f"{MOCK_SEED_ENV} must be an integer") from exc
+        model = load_mock_model(source, seed=seed)
+        _ACTIVE = (key, model)
+        return model
+
+
+def _parse_role_profile(
+    fields: object, base: MockRoleProfile, name: str
+) -> MockRoleProfile:
+    if not isinstance(fields, Mapping):
+        raise FabricError(f"mock profile for '{name}' must be a mapping")
+    updates: Dict[str, object] = {}
+    for key, value in fields.items():
+        if key == "latency":
+            updates[key] = _parse_latency(value, name)
+        elif key == "output_bytes":
+            updates[key] = max(0, int(value))  # type: ignore[arg-type]
+        elif key in {field_name for field_name, _ in _RATE_FIELDS}:
+            rate = float(value)  # type: ignore[arg-type]
+            if not 0.0 <= rate <= 1.0:
+                raise FabricError(f"mock profile '{name}': {key} must be within [0, 1]")
+            updates[key] = rate
+        else:
+            raise FabricError(f"unknown mock profile field '{key}' for '{name}'")
+    profile = replace(base, **updates)
+    if sum(float(getattr(profile, field_name)) for field_name, _ in _RATE_FIELDS) > 1.0:
+        raise FabricError(
+            f"mock profile '{name}': failure, timeout, parse and escalation rates exceed 1"
+        )
+    return profile
+
+
+def _parse_latency(value: object, name: str) -> LatencyModel:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return LatencyModel(sec=max(0.0, float(value)))
+    if not isinstance(value, Mapping):
+        raise FabricError(f"mock profile '{name}': latency must be a number or a mapping")
+    distribution = str(value.get("distribution") or "fixed").strip().lower()
+    if distribution not in LATENCY_DISTRIBUTIONS:
+        raise FabricError(
+            f"mock profile '{name}': unknown latency distribution '{distribution}' "
+            f"(expected one of: {', '.join(LATENCY_DISTRIBUTIONS)})"
+        )
+    params: Dict[str, object] = {}
+    for key, raw in value.items():
+        if key == "distribution":
+            continue
+        if key not in _LATENCY_FIELDS:
+            raise FabricError(f"mock profile '{name}': unknown latency field '{key}'")
+        params[key] = None if raw is None else max(0.0, float(raw))  # type: ignore[arg-type]
+    return LatencyModel(distribution=distribution, **params)  # type: ignore[arg-type]
+
+
+def _env_output_bytes() -> int:
+    try:
+        return max(0, int(os.environ.get(MOCK_OUTPUT_BYTES_ENV, "0") or 0))
+    except ValueError:
+        return 0
+
+
+def _mtime_ns(source: str) -> int:
+    if not source or source.startswith("{"):
+        return 0
+    try:
+        return Path(source).expanduser().stat().st_mtime_ns
+    except OSError:
+        return 0
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from agents_inc.core.util.fs import load_yaml
+
+CATALOG_CACHE_ENV = "AGENTS_INC_CATALOG_CACHE"
+CATALOG_CACHE_FORMAT = "1"
+CATALOG_CACHE_RELPATH = Path(".cache") / "catalog.json"
+
+_MEMO: Dict[str, Tuple[Optional[str], str, Dict[str, dict]]] = {}
+_MEMO_LOCK = threading.Lock()
+
+
+def catalog_cache_enabled() -> bool:
+    """The cache is on unless ``AGENTS_INC_CATALOG_CACHE`` is ``0``/``off``/``false``."""
+    value = os.environ.get(CATALOG_CACHE_ENV, "").strip().lower()
+    return value not in {"0", "off", "false", "no"}
+
+
+def catalog_cache_path(fabric_root: Path) -> Path:
+    return Path(fabric_root) / CATALOG_CACHE_RELPATH
+
+
+class CatalogCache:
+    """Parsed catalog and manifest YAML, persisted as JSON under the fabric root.
+
+    Entries are keyed by the file's path and hold its ``ino:mtime_ns:size``
+    signature, the parsed document and any memoized check results (e.g. group
+    shape errors). A file whose signature still matches is decoded from the
+    cache instead of being parsed again, and its checks are not re-run. The
+    whole cache is dropped when ``version`` (cache format, fabric schema and
+    validator code) changes.
+
+    Only documents that survive a JSON round trip unchanged are cached; YAML
+    dates or non-string keys are parsed every time. Writes are best effort: a
+    read-only fabric root simply never gets a cache file.
+    """
+
+    def __init__(self, fabric_root: Path, version: str) -> None:
+        self.fabric_root = Path(fabric_root)
+        self.path = catalog_cache_path(self.fabric_root)
+        self.version = f"{CATALOG_CACHE_FORMAT}:{version}"
+        self.enabled = catalog_cache_enabled()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._entries: Dict[str, dict] = self._read() if self.enabled else {}
+
+    def load_yaml(self, path: Path) -> Any:
+        """``load_yaml(path)``, served from the cache while the file is unchanged."""
+        key = self._key(path)
+        signature = _signature(path)
+        entry = self._entries.get(key)
+        if entry is not None and signature is not None and entry.get("signature") == signature:
+            self.hits += 1
+            return json.loads(entry["data"])
+        self.misses += 1
+        # Stat before reading: a write racing the parse leaves a stale signature behind.
+        value = load_yaml(path)
+        data = _round_trip_json(value)
+        if data is not None and signature is not None:
+            self._entries[key] = {"signature": signature, "data": data}
+            self._dirty = True
+        elif self._entries.pop(key, None) is not None:
+            self._dirty = True
+        return value
+
+    def check(self, path: Path, name: str, run: Callable[[], List[str]]) -> List[str]:
+        """Result of ``run()`` for the cached copy of ``path``, memoized as ``name``.
+
+        Call after :meth:`load_yaml` for the same path; the memo is dropped with
+        the entry when the file changes.
+        """
+        key = self._key(path)
+        entry = self._entries.get(key)
+        if entry is None or entry.get("signature") != _signature(path):
+            return list(run())
+        checks = entry.get("checks") or {}
+        if name in checks:
+            return list(checks[name])
+        result = list(run())
+        self._entries[key] = {**entry, "checks": {**checks, name: [str(x) for x in result]}}
+        self._dirty = True
+        return result
+
+    def flush(self) -> None:
+        """Write the cache back if anything changed, dropping entries for deleted files."""
+        if not (self.enabled and self._dirty):
+            return
+        entries = {key: entry for key, entry in self._entries.items() if self._exists(key)}
+        text = json.dumps(
+            {"version": self.version, "entries": entries}, separators=(",", ":"), sort_keys=True
+        )
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(text, encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return
+        self._dirty = False
+        with _MEMO_LOCK:
+            _MEMO[str(self.path)] = (_signature(self.path), self.version, dict(entries))
+
+    # ── internals ─────────────────────────────────────────────────────────
+
+    def _read(self) -> Dict[str, dict]:
+        signature = _signature(self.path)
+        if signature is None:
+            return {}
+        with _MEMO_LOCK:
+            memo = _MEMO.get(str(self.path))
+        if memo is not None and memo[0] == signature and memo[1] == self.version:
+            return dict(memo[2])
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != self.version:
+            return {}
+        entries = payload.get("entries")
+        if not isinstance(entries, dict):
+            return {}
+        entries = {
+            str(key): entry
+            for key, entry in entries.items()
+            if isinstance(entry, dict) and isinstance(entry.get("data"), str)
+        }
+        with _MEMO_LOCK:
+            _MEMO[str(self.path)] = (signature, self.version, dict(entries))
+        return entries
+
+    def _key(self, path: Path) -> str:
+        path = Path(path)
+        try:
+            return path.relative_to(self.fabric_root).as_posix()
+        except ValueError:
+            return str(path.resolve())
+
+    def _exists(self, key: str) -> bool:
+        path = Path(key)
+        return (path if path.is_absolute() else self.fabric_root / path).exists()
+
+
+@contextmanager
+def catalog_cache(fabric_root: Path, version: str) -> Iterator[CatalogCache]:
+    """Open the fabric's catalog cache and write it back on exit."""
+    cache = CatalogCache(fabric_root, version)
+    try:
+        yield cache
+    finally:
+        cache.flush()
+
+
+def _round_trip_json(value: Any) -> Optional[str]:
+    try:
+        data = json.dumps(value, separators=(",", ":"), allow_nan=False)
+    except (TypeError, ValueError):
+        return None
+    return data if json.loads(data) == value else None
+
+
+def _signature(path: Path) -> Optional[str]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_size}"
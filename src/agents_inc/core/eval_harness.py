@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from agents_inc.core.exposed_state import exposed_state_snapshot
 from agents_inc.core.fabric_lib import gate_specialist_output, now_iso
 
 
@@ -70,6 +71,9 @@ def score_session(
     source: str = "turn-snapshot",
 ) -> Dict[str, object]:
     sessions = _latest_specialist_sessions(turn_dir)
+    # Handoffs are parsed through the shared snapshot so re-scoring an unchanged turn
+    # (or scoring right after reply synthesis) does not re-read them.
+    snapshot = exposed_state_snapshot(project_dir)
     by_group: Dict[str, dict] = {}
     specialist_scores: List[float] = []
 
@@ -107,7 +111,8 @@ def score_session(
             )
             work_exists = work_path.exists()
             handoff_exists = handoff_path.exists()
-            handoff_payload = _load_json(handoff_path)
+            loaded = snapshot.load_json(handoff_path)
+            handoff_payload = loaded if isinstance(loaded, dict) else {}
             gate = gate_specialist_output(
                 handoff_payload,
                 role=role,
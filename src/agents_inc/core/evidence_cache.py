@@ -1,59 +1,55 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse, urlunparse
 
 from agents_inc.core.session_state import state_dir
-from agents_inc.core.util.fs import dump_yaml, load_yaml_map
+from agents_inc.core.util.fs import atomic_write, load_yaml_map
 from agents_inc.core.util.time import now_iso
 
-EVIDENCE_CACHE_SCHEMA_VERSION = "1.0"
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to thread locks only
+    fcntl = None  # type: ignore[assignment]
+
+EVIDENCE_CACHE_SCHEMA_VERSION = "2.0"
 DEFAULT_EVIDENCE_CACHE_MAX_ENTRIES = 5000
+# Compact once the log holds this many records beyond the live entry count.
+EVIDENCE_CACHE_COMPACT_MIN_RECORDS = 256
 
 
 def evidence_cache_path(project_root: Path) -> Path:
+    """Compacted snapshot of the evidence cache (JSON, entries in LRU order)."""
+    return state_dir(project_root) / "evidence-cache.json"
+
+
+def evidence_cache_log_path(project_root: Path) -> Path:
+    """Append-only record log applied on top of the snapshot."""
+    return state_dir(project_root) / "evidence-cache.log"
+
+
+def legacy_evidence_cache_path(project_root: Path) -> Path:
     return state_dir(project_root) / "evidence-cache.yaml"
 
 
 def load_evidence_cache(
     project_root: Path, *, max_entries: int = DEFAULT_EVIDENCE_CACHE_MAX_ENTRIES
 ) -> dict:
-    path = evidence_cache_path(project_root)
-    default = {
-        "schema_version": EVIDENCE_CACHE_SCHEMA_VERSION,
-        "max_entries": int(max_entries),
-        "updated_at": now_iso(),
-        "entries": {},
-    }
-    loaded = load_yaml_map(path, default)
-    if not isinstance(loaded, dict):
-        loaded = dict(default)
-    loaded["schema_version"] = EVIDENCE_CACHE_SCHEMA_VERSION
-    try:
-        loaded["max_entries"] = max(1, int(loaded.get("max_entries", max_entries)))
-    except Exception:
-        loaded["max_entries"] = int(max_entries)
-    entries = loaded.get("entries")
-    if not isinstance(entries, dict):
-        loaded["entries"] = {}
-    return loaded
+    return evidence_cache_store(project_root, max_entries=max_entries).to_payload()
 
 
 def save_evidence_cache(project_root: Path, payload: dict) -> Path:
-    path = evidence_cache_path(project_root)
-    clean = dict(payload)
-    clean["schema_version"] = EVIDENCE_CACHE_SCHEMA_VERSION
-    if not isinstance(clean.get("entries"), dict):
-        clean["entries"] = {}
-    try:
-        clean["max_entries"] = max(1, int(clean.get("max_entries", DEFAULT_EVIDENCE_CACHE_MAX_ENTRIES)))
-    except Exception:
-        clean["max_entries"] = DEFAULT_EVIDENCE_CACHE_MAX_ENTRIES
-    clean["updated_at"] = now_iso()
-    dump_yaml(path, clean)
-    return path
+    store = evidence_cache_store(project_root)
+    store.replace(payload)
+    return store.snapshot_path
 
 
 def normalize_citation(value: str) -> str:
@@ -118,92 +114,445 @@ def canonicalize_evidence_refs(value: object) -> Tuple[List[dict], Dict[str, str
     return normalized_refs, id_map
 
 
+class EvidenceCacheStore:
+    """Evidence cache kept as a compacted JSON snapshot plus an append-only log.
+
+    Entries live in an in-memory OrderedDict in LRU order, so an upsert is a
+    dict update plus ``move_to_end`` and eviction pops from the front. Each
+    merge appends a single JSON line to the log; the snapshot is rewritten only
+    when the log has grown past the live entry count. Writers in this process
+    serialize on a thread lock and writers in other processes on an ``flock``
+    of ``evidence-cache.lock``; before every operation the store replays log
+    records appended by other processes.
+    """
+
+    def __init__(self, project_root: Path, *, max_entries: int = DEFAULT_EVIDENCE_CACHE_MAX_ENTRIES):
+        self.project_root = Path(project_root)
+        self.snapshot_path = evidence_cache_path(self.project_root)
+        self.log_path = evidence_cache_log_path(self.project_root)
+        self.lock_path = state_dir(self.project_root) / "evidence-cache.lock"
+        self._default_max_entries = max(1, int(max_entries))
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._max_entries = self._default_max_entries
+        self._updated_at = ""
+        self._snapshot_sig: Optional[Tuple[int, int, int]] = None
+        self._log_sig: Optional[Tuple[int, int]] = None
+        self._log_offset = 0
+        self._log_records = 0
+        self._loaded = False
+        self._from_disk = False
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    def to_payload(self) -> dict:
+        with self._locked(exclusive=False):
+            return {
+                "schema_version": EVIDENCE_CACHE_SCHEMA_VERSION,
+                "max_entries": self._max_entries,
+                "updated_at": self._updated_at or now_iso(),
+                "entries": {key: dict(row) for key, row in self._entries.items()},
+            }
+
+    def get_many(self, evidence_ids: List[str], *, refresh: bool = True) -> Dict[str, dict]:
+        """Look up entries; with ``refresh=False`` answer from memory once loaded."""
+        with self._lock:
+            if refresh or not self._loaded:
+                with self._locked(exclusive=False):
+                    return self._lookup(evidence_ids)
+            return self._lookup(evidence_ids)
+
+    def __len__(self) -> int:
+        with self._locked(exclusive=False):
+            return len(self._entries)
+
+    def merge(
+        self,
+        evidence_refs: List[dict],
+        *,
+        max_entries: Optional[int] = None,
+        hits: Optional[Dict[str, int]] = None,
+    ) -> List[str]:
+        """Upsert refs as one log record; return the evidence ids evicted to stay in bounds.
+
+        ``hits`` overrides the hit-count increment per evidence id, for callers
+        that coalesced several sightings into one row.
+        """
+        with self._locked(exclusive=True):
+            timestamp = now_iso()
+            touched: "OrderedDict[str, dict]" = OrderedDict()
+            for row in evidence_refs:
+                if not isinstance(row, dict):
+                    continue
+                evidence_id = str(row.get("evidence_id") or "").strip()
+                if not evidence_id:
+                    continue
+                current = touched.get(evidence_id) or self._entries.get(evidence_id)
+                increment = int((hits or {}).get(evidence_id, 1))
+                touched[evidence_id] = _merged_entry(
+                    current, row, evidence_id, timestamp, increment=increment
+                )
+                touched.move_to_end(evidence_id)
+            if not touched:
+                return []
+            if max_entries is not None and not self._has_files():
+                self._max_entries = max(1, int(max_entries))
+            for evidence_id, entry in touched.items():
+                self._entries[evidence_id] = entry
+                self._entries.move_to_end(evidence_id)
+            evicted = self._evict_overflow()
+            self._updated_at = timestamp
+            record: Dict[str, object] = {
+                "op": "merge",
+                "at": timestamp,
+                "max_entries": self._max_entries,
+                "rows": list(touched.values()),
+            }
+            if evicted:
+                record["evicted"] = evicted
+            self._append_record(record)
+            self._maybe_compact()
+            return evicted
+
+    def replace(self, payload: dict) -> None:
+        with self._locked(exclusive=True):
+            self._entries = _ordered_entries(payload.get("entries"))
+            try:
+                self._max_entries = max(
+                    1, int(payload.get("max_entries", DEFAULT_EVIDENCE_CACHE_MAX_ENTRIES))
+                )
+            except Exception:
+                self._max_entries = DEFAULT_EVIDENCE_CACHE_MAX_ENTRIES
+            self._evict_overflow()
+            self._updated_at = now_iso()
+            self._write_snapshot()
+
+    def compact(self) -> None:
+        with self._locked(exclusive=True):
+            self._write_snapshot()
+
+    def _lookup(self, evidence_ids: List[str]) -> Dict[str, dict]:
+        out: Dict[str, dict] = {}
+        for evidence_id in evidence_ids:
+            key = str(evidence_id or "").strip()
+            row = self._entries.get(key) if key else None
+            if row is not None:
+                out[key] = dict(row)
+        return out
+
+    @contextmanager
+    def _locked(self, *, exclusive: bool) -> Iterator[None]:
+        with self._lock:
+            handle = None
+            if fcntl is not None:
+                self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+                handle = self.lock_path.open("a+")
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                self._refresh()
+                yield
+            finally:
+                if handle is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+                    handle.close()
+
+    def _refresh(self) -> None:
+        snapshot_sig = _stat_sig(self.snapshot_path)
+        log_stat = _stat(self.log_path)
+        log_sig = (int(log_stat.st_dev), int(log_stat.st_ino)) if log_stat is not None else None
+        log_size = int(log_stat.st_size) if log_stat is not None else 0
+        if (
+            not self._loaded
+            or snapshot_sig != self._snapshot_sig
+            or log_sig != self._log_sig
+            or log_size < self._log_offset
+        ):
+            self._load_snapshot()
+            self._snapshot_sig = snapshot_sig
+            self._log_sig = log_sig
+            self._log_offset = 0
+            self._log_records = 0
+            self._loaded = True
+        if log_size > self._log_offset:
+            self._replay_log()
+
+    def _load_snapshot(self) -> None:
+        self._entries = OrderedDict()
+        self._max_entries = self._default_max_entries
+        self._updated_at = ""
+        payload: object = None
+        if self.snapshot_path.exists():
+            try:
+                payload = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            except Exception:
+                payload = None
+        else:
+            legacy = legacy_evidence_cache_path(self.project_root)
+            if legacy.exists():
+                payload = load_yaml_map(legacy, {})
+        self._from_disk = isinstance(payload, dict)
+        if not isinstance(payload, dict):
+            return
+        try:
+            self._max_entries = max(1, int(payload.get("max_entries", self._default_max_entries)))
+        except Exception:
+            self._max_entries = self._default_max_entries
+        self._updated_at = str(payload.get("updated_at") or "")
+        self._entries = _ordered_entries(payload.get("entries"))
+
+    def _replay_log(self) -> None:
+        with self.log_path.open("rb") as handle:
+            handle.seek(self._log_offset)
+            data = handle.read()
+        end = data.rfind(b"\n")
+        if end < 0:
+            return
+        for line in data[: end + 1].splitlines():
+            try:
+                record = json.loads(line.decode("utf-8"))
+            except Exception:
+                continue
+            if isinstance(record, dict):
+                self._apply_record(record)
+                self._log_records += 1
+        self._log_offset += end + 1
+
+    def _apply_record(self, record: dict) -> None:
+        rows = record.get("rows")
+        for row in rows if isinstance(rows, list) else []:
+            evidence_id = str((row or {}).get("evidence_id") or "").strip() if isinstance(row, dict) else ""
+            if not evidence_id:
+                continue
+            self._entries[evidence_id] = dict(row)
+            self._entries.move_to_end(evidence_id)
+        try:
+            self._max_entries = max(1, int(record.get("max_entries", self._max_entries)))
+        except Exception:
+            pass
+        evicted = record.get("evicted")
+        for evidence_id in evicted if isinstance(evicted, list) else []:
+            self._entries.pop(str(evidence_id), None)
+        if record.get("at"):
+            self._updated_at = str(record.get("at"))
+
+    def _append_record(self, record: dict) -> None:
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        with self.log_path.open("ab") as handle:
+            handle.write(line)
+        log_stat = _stat(self.log_path)
+        if log_stat is not None:
+            self._log_sig = (int(log_stat.st_dev), int(log_stat.st_ino))
+            self._log_offset = int(log_stat.st_size)
+        self._log_records += 1
+
+    def _maybe_compact(self) -> None:
+        if self._log_records >= max(EVIDENCE_CACHE_COMPACT_MIN_RECORDS, len(self._entries)):
+            self._write_snapshot()
+
+    def _write_snapshot(self) -> None:
+        payload = {
+            "schema_version": EVIDENCE_CACHE_SCHEMA_VERSION,
+            "max_entries": self._max_entries,
+            "updated_at": self._updated_at or now_iso(),
+            "entries": self._entries,
+        }
+        atomic_write(self.snapshot_path, json.dumps(payload, ensure_ascii=False, indent=1) + "\n")
+        # A fresh log file (new inode) tells other processes to reload the snapshot.
+        atomic_write(self.log_path, "")
+        self._snapshot_sig = _stat_sig(self.snapshot_path)
+        log_stat = _stat(self.log_path)
+        self._log_sig = (int(log_stat.st_dev), int(log_stat.st_ino)) if log_stat is not None else None
+        self._log_offset = 0
+        self._log_records = 0
+        self._from_disk = True
+
+    def _has_files(self) -> bool:
+        # A persisted cap wins over the caller's default, as with the old YAML file.
+        return self._from_disk or self._log_sig is not None
+
+    def _evict_overflow(self) -> List[str]:
+        evicted: List[str] = []
+        while len(self._entries) > self._max_entries:
+            evidence_id, _ = self._entries.popitem(last=False)
+            evicted.append(evidence_id)
+        return evicted
+
+
+_STORES: Dict[str, EvidenceCacheStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def evidence_cache_store(
+    project_root: Path, *, max_entries: int = DEFAULT_EVIDENCE_CACHE_MAX_ENTRIES
+) -> EvidenceCacheStore:
+    """Return the process-wide store for ``project_root``."""
+    key = str(Path(project_root).expanduser().resolve())
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = EvidenceCacheStore(Path(key), max_entries=max_entries)
+            _STORES[key] = store
+        return store
+
+
+class EvidenceCacheWriteBuffer:
+    """Write-behind buffer that coalesces evidence refs seen during a runtime cycle.
+
+    Specialist and head threads ``add`` refs without touching disk; ``resolve``
+    answers from the pending refs and the store's in-memory index. ``flush``
+    writes everything as a single store merge, i.e. one log append under the
+    cache file lock.
+    """
+
+    def __init__(self, store: EvidenceCacheStore):
+        self.store = store
+        self._lock = threading.Lock()
+        self._pending: "OrderedDict[str, dict]" = OrderedDict()
+        self._hits: Dict[str, int] = {}
+
+    def add(self, evidence_refs: List[dict]) -> int:
+        added = 0
+        with self._lock:
+            for row in evidence_refs:
+                if not isinstance(row, dict):
+                    continue
+                evidence_id = str(row.get("evidence_id") or "").strip()
+                if not evidence_id:
+                    continue
+                current = self._pending.get(evidence_id, {"evidence_id": evidence_id})
+                for field in ("citation", "title", "source_type", "domain"):
+                    value = str(row.get(field) or "").strip()
+                    if value:
+                        current[field] = value
+                self._pending[evidence_id] = current
+                self._pending.move_to_end(evidence_id)
+                self._hits[evidence_id] = self._hits.get(evidence_id, 0) + 1
+                added += 1
+        return added
+
+    def resolve(self, evidence_ids: List[str], *, refresh: bool = False) -> Dict[str, dict]:
+        keys = [str(item or "").strip() for item in evidence_ids if str(item or "").strip()]
+        out = self.store.get_many(keys, refresh=refresh)
+        with self._lock:
+            for key in keys:
+                pending = self._pending.get(key)
+                if pending is None:
+                    continue
+                row = dict(out.get(key) or {})
+                row.update({field: value for field, value in pending.items() if value})
+                out[key] = row
+        return out
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self, *, max_entries: Optional[int] = None) -> int:
+        with self._lock:
+            rows = list(self._pending.values())
+            hits = dict(self._hits)
+            self._pending = OrderedDict()
+            self._hits = {}
+        if rows:
+            self.store.merge(rows, max_entries=max_entries, hits=hits)
+        return len(rows)
+
+
+_BUFFERS: Dict[str, EvidenceCacheWriteBuffer] = {}
+
+
+def evidence_cache_buffer(project_root: Path) -> EvidenceCacheWriteBuffer:
+    """Return the process-wide write-behind buffer for ``project_root``."""
+    store = evidence_cache_store(project_root)
+    key = str(store.project_root)
+    with _STORES_LOCK:
+        buffer = _BUFFERS.get(key)
+        if buffer is None:
+            buffer = EvidenceCacheWriteBuffer(store)
+            _BUFFERS[key] = buffer
+        return buffer
+
+
+def flush_evidence_cache_buffers() -> int:
+    with _STORES_LOCK:
+        buffers = list(_BUFFERS.values())
+    return sum(buffer.flush() for buffer in buffers)
+
+
+atexit.register(flush_evidence_cache_buffers)
+
+
 def merge_evidence_refs_into_cache(
     *,
     project_root: Path,
     evidence_refs: List[dict],
     max_entries: int = DEFAULT_EVIDENCE_CACHE_MAX_ENTRIES,
 ) -> dict:
-    cache = load_evidence_cache(project_root, max_entries=max_entries)
-    entries = cache.get("entries")
-    if not isinstance(entries, dict):
-        entries = {}
-    timestamp = now_iso()
-    for row in evidence_refs:
-        if not isinstance(row, dict):
-            continue
-        evidence_id = str(row.get("evidence_id") or "").strip()
-        if not evidence_id:
-            continue
-        current = entries.get(evidence_id)
-        if not isinstance(current, dict):
-            current = {
-                "evidence_id": evidence_id,
-                "citation": "",
-                "title": "",
-                "source_type": "",
-                "domain": "",
-                "first_seen_at": timestamp,
-                "last_seen_at": timestamp,
-                "hit_count": 0,
-            }
-        citation = str(row.get("citation") or "").strip()
-        title = str(row.get("title") or "").strip()
-        source_type = str(row.get("source_type") or "").strip()
-        domain = str(row.get("domain") or "").strip()
-        if citation:
-            current["citation"] = citation
-        if title:
-            current["title"] = title
-        if source_type:
-            current["source_type"] = source_type
-        if domain:
-            current["domain"] = domain
-        current["evidence_id"] = evidence_id
-        current["last_seen_at"] = timestamp
-        if not current.get("first_seen_at"):
-            current["first_seen_at"] = timestamp
-        try:
-            current["hit_count"] = int(current.get("hit_count", 0)) + 1
-        except Exception:
-            current["hit_count"] = 1
-        entries[evidence_id] = current
-
-    max_allowed = int(cache.get("max_entries", max_entries))
-    if len(entries) > max_allowed:
-        ordered = sorted(
-            entries.values(),
-            key=lambda row: str((row if isinstance(row, dict) else {}).get("last_seen_at") or ""),
-        )
-        overflow = max(0, len(entries) - max_allowed)
-        prune = ordered[:overflow]
-        for item in prune:
-            if not isinstance(item, dict):
-                continue
-            key = str(item.get("evidence_id") or "").strip()
-            if key and key in entries:
-                entries.pop(key, None)
-
-    cache["entries"] = entries
-    cache["updated_at"] = timestamp
-    save_evidence_cache(project_root, cache)
-    return cache
+    store = evidence_cache_store(project_root, max_entries=max_entries)
+    store.merge(evidence_refs, max_entries=max_entries)
+    return store.to_payload()
 
 
 def resolve_evidence_ids(project_root: Path, evidence_ids: List[str]) -> Dict[str, dict]:
-    cache = load_evidence_cache(project_root)
-    entries = cache.get("entries")
-    if not isinstance(entries, dict):
-        return {}
-    out: Dict[str, dict] = {}
-    for evidence_id in evidence_ids:
-        key = str(evidence_id or "").strip()
-        if not key:
-            continue
-        row = entries.get(key)
-        if isinstance(row, dict):
-            out[key] = dict(row)
-    return out
+    """Resolve ids from the store, including refs still waiting in the write buffer."""
+    return evidence_cache_buffer(project_root).resolve(evidence_ids, refresh=True)
+
+
+def _merged_entry(
+    current: Optional[dict], row: dict, evidence_id: str, timestamp: str, *, increment: int = 1
+) -> dict:
+    entry = dict(current) if isinstance(current, dict) else {
+        "evidence_id": evidence_id,
+        "citation": "",
+        "title": "",
+        "source_type": "",
+        "domain": "",
+        "first_seen_at": timestamp,
+        "last_seen_at": timestamp,
+        "hit_count": 0,
+    }
+    for field in ("citation", "title", "source_type", "domain"):
+        value = str(row.get(field) or "").strip()
+        if value:
+            entry[field] = value
+    entry["evidence_id"] = evidence_id
+    entry["last_seen_at"] = timestamp
+    if not entry.get("first_seen_at"):
+        entry["first_seen_at"] = timestamp
+    try:
+        entry["hit_count"] = int(entry.get("hit_count", 0)) + increment
+    except Exception:
+        entry["hit_count"] = increment
+    return entry
+
+
+def _ordered_entries(value: object) -> "OrderedDict[str, dict]":
+    rows = value if isinstance(value, dict) else {}
+    valid = [
+        (str(key), dict(row))
+        for key, row in rows.items()
+        if isinstance(row, dict) and str(key).strip()
+    ]
+    # Stable sort keeps file order for equal timestamps, matching the old LRU tie-break.
+    valid.sort(key=lambda item: str(item[1].get("last_seen_at") or ""))
+    return OrderedDict(valid)
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _stat_sig(path: Path) -> Optional[Tuple[int, int, int]]:
+    stat = _stat(path)
+    if stat is None:
+        return None
+    return (int(stat.st_ino), int(stat.st_mtime_ns), int(stat.st_size))
 
 
 def _domain(citation: str) -> str:
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+import yaml
+
+DEFAULT_PERSONA_CONFIDENCE_THRESHOLD = 0.8
+DEFAULT_PERSONA_OVERRIDE_POLICY = "head-meeting-only"
+
+_EMPTY_MAPPING: Mapping[str, object] = MappingProxyType({})
+
+FileSignature = Optional[Tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class ExposedGroupView:
+    """Parsed, read-only view of one group's published (exposed) state.
+
+    ``handoff`` and ``evidence_lookup`` are shared between every consumer of the
+    snapshot, so callers must copy before modifying nested values.
+    """
+
+    group_id: str
+    handoff_path: Path
+    summary_path: Path
+    notes_path: Path
+    handoff_exists: bool
+    handoff_is_mapping: bool
+    handoff: Mapping[str, object]
+    summary_text: str
+    notes_text: str
+    persona_threshold: float
+    persona_override_policy: str
+    claims: Tuple[dict, ...]
+    evidence_lookup: Mapping[str, dict]
+
+
+def file_signature(path: Path) -> FileSignature:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (int(stat.st_mtime_ns), int(stat.st_size))
+
+
+class ExposedStateSnapshot:
+    """Per-project cache of parsed group files, keyed by (path, mtime, size).
+
+    Head meeting, reply synthesis and evaluation read the same exposed files
+    every cycle; each file is parsed once until it changes on disk.
+    """
+
+    def __init__(self, project_dir: Path) -> None:
+        self.project_dir = Path(project_dir)
+        self._lock = threading.RLock()
+        self._files: Dict[Tuple[str, str], Tuple[FileSignature, object]] = {}
+        self._views: Dict[str, Tuple[Tuple[FileSignature, ...], ExposedGroupView]] = {}
+
+    def group(self, group_id: str) -> ExposedGroupView:
+        group_dir = self.project_dir / "agent-groups" / group_id
+        exposed_dir = group_dir / "exposed"
+        paths = (
+            group_dir / "group.yaml",
+            exposed_dir / "handoff.json",
+            exposed_dir / "summary.md",
+            exposed_dir / "INTEGRATION_NOTES.md",
+        )
+        signatures = tuple(file_signature(path) for path in paths)
+        with self._lock:
+            cached = self._views.get(group_id)
+            if cached is not None and cached[0] == signatures:
+                return cached[1]
+            view = self._build_view(group_id, *paths)
+            self._views[group_id] = (signatures, view)
+            return view
+
+    def load_json(self, path: Path) -> object:
+        """Parse a JSON file (YAML fallback for hand-edited files); None when missing or invalid."""
+        return self._cached(path, "json", _parse_json_text)
+
+    def load_yaml(self, path: Path) -> object:
+        return self._cached(path, "yaml", yaml.safe_load)
+
+    def read_text(self, path: Path) -> str:
+        value = self._cached(path, "text", lambda text: text)
+        return value if isinstance(value, str) else ""
+
+    def _cached(self, path: Path, kind: str, parse: Callable[[str], object]) -> object:
+        key = (str(path), kind)
+        signature = file_signature(path)
+        with self._lock:
+            cached = self._files.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+        if signature is None:
+            value: object = None
+        else:
+            try:
+                value = parse(path.read_text(encoding="utf-8", errors="replace"))
+            except Exception:
+                value = None
+        with self._lock:
+            self._files[key] = (signature, value)
+        return value
+
+    def _build_view(
+        self,
+        group_id: str,
+        manifest_path: Path,
+        handoff_path: Path,
+        summary_path: Path,
+        notes_path: Path,
+    ) -> ExposedGroupView:
+        manifest = self.load_yaml(manifest_path)
+        head = manifest.get("head", {}) if isinstance(manifest, dict) else {}
+        persona = head.get("persona", {}) if isinstance(head, dict) else {}
+        if not isinstance(persona, dict):
+            persona = {}
+        try:
+            threshold = float(
+                persona.get("confidence_threshold") or DEFAULT_PERSONA_CONFIDENCE_THRESHOLD
+            )
+        except Exception:
+            threshold = DEFAULT_PERSONA_CONFIDENCE_THRESHOLD
+        threshold = max(0.0, min(1.0, threshold))
+        override_policy = str(persona.get("override_policy") or DEFAULT_PERSONA_OVERRIDE_POLICY)
+
+        handoff_exists = handoff_path.exists()
+        loaded = self.load_json(handoff_path) if handoff_exists else None
+        handoff: Mapping[str, object] = (
+            MappingProxyType(loaded) if isinstance(loaded, dict) else _EMPTY_MAPPING
+        )
+        claims_payload = handoff.get("claims")
+        if not isinstance(claims_payload, list):
+            claims_payload = handoff.get("claims_with_citations")
+        claims = tuple(
+            item for item in (claims_payload if isinstance(claims_payload, list) else [])
+            if isinstance(item, dict)
+        )
+        return ExposedGroupView(
+            group_id=group_id,
+            handoff_path=handoff_path,
+            summary_path=summary_path,
+            notes_path=notes_path,
+            handoff_exists=handoff_exists,
+            handoff_is_mapping=isinstance(loaded, dict),
+            handoff=handoff,
+            summary_text=self.read_text(summary_path),
+            notes_text=self.read_text(notes_path),
+            persona_threshold=threshold,
+            persona_override_policy=override_policy,
+            claims=claims,
+            evidence_lookup=MappingProxyType(build_evidence_lookup(handoff)),
+        )
+
+
+def build_evidence_lookup(payload: Mapping[str, object]) -> Dict[str, dict]:
+    refs = payload.get("evidence_refs")
+    if not isinstance(refs, list):
+        return {}
+    out: Dict[str, dict] = {}
+    for row in refs:
+        if not isinstance(row, dict):
+            continue
+        evidence_id = str(
+            row.get("evidence_id") or row.get("id") or row.get("key") or ""
+        ).strip()
+        if not evidence_id:
+            continue
+        out[evidence_id] = dict(row)
+    return out
+
+
+def _parse_json_text(text: str) -> object:
+    try:
+        return json.loads(text)
+    except ValueError:
+        return yaml.safe_load(text)
+
+
+_SNAPSHOTS: Dict[str, ExposedStateSnapshot] = {}
+_SNAPSHOTS_LOCK = threading.Lock()
+
+
+def exposed_state_snapshot(project_dir: Path) -> ExposedStateSnapshot:
+    key = str(Path(project_dir).expanduser().resolve())
+    with _SNAPSHOTS_LOCK:
+        snapshot = _SNAPSHOTS.get(key)
+        if snapshot is None:
+            snapshot = ExposedStateSnapshot(Path(key))
+            _SNAPSHOTS[key] = snapshot
+        return snapshot
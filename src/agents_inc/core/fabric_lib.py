@@ -20,10 +20,11 @@ import hashlib
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import ContextManager, Dict, List, Optional, Tuple
 
 import yaml
 
+from agents_inc.core.catalog_cache import CatalogCache, catalog_cache
 from agents_inc.core.context_state import load_global_context
 
 # ── canonical utility imports (single source of truth) ────────────────────
@@ -713,31 +714,73 @@ def ensure_project_shape(project: dict, source: str = "<unknown>") -> List[str]:
 # ── Catalog I/O ────────────────────────────────────────────────────────────
 
 
+def catalog_cache_version() -> str:
+    """Cache key for parsed catalogs: group schema plus this module, which holds the checks."""
+    try:
+        stat = Path(__file__).stat()
+    except OSError:
+        return SCHEMA_VERSION
+    return f"{SCHEMA_VERSION}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def open_catalog_cache(fabric_root: Path) -> ContextManager[CatalogCache]:
+    """Context manager over the fabric's :class:`CatalogCache`, flushed on exit."""
+    return catalog_cache(fabric_root, catalog_cache_version())
+
+
 def load_group_catalog(fabric_root: Path) -> Dict[str, dict]:
+    with open_catalog_cache(fabric_root) as cache:
+        return {gid: data for gid, (_, data) in _read_group_catalog(fabric_root, cache).items()}
+
+
+def check_group_catalog(fabric_root: Path) -> Tuple[Dict[str, dict], List[str]]:
+    """Load the group catalog together with its ``ensure_group_shape`` errors.
+
+    Shape errors are memoized in the catalog cache per file, so groups whose
+    YAML has not changed are not re-validated.
+    """
+    groups: Dict[str, dict] = {}
+    errors: List[str] = []
+    with open_catalog_cache(fabric_root) as cache:
+        for gid, (path, data) in _read_group_catalog(fabric_root, cache).items():
+            source = f"catalog/groups/{gid}.yaml"
+            errors.extend(
+                cache.check(
+                    path,
+                    "group_shape",
+                    lambda data=data, source=source: ensure_group_shape(data, source=source),
+                )
+            )
+            groups[gid] = data
+    return groups, errors
+
+
+def _read_group_catalog(fabric_root: Path, cache: CatalogCache) -> Dict[str, Tuple[Path, dict]]:
     catalog_dir = fabric_root / "catalog" / "groups"
-    out: Dict[str, dict] = {}
+    out: Dict[str, Tuple[Path, dict]] = {}
     for path in sorted(catalog_dir.glob("*.yaml")):
-        data = load_yaml(path)
+        data = cache.load_yaml(path)
         if not isinstance(data, dict):
             raise FabricError(f"invalid yaml object: {path}")
         gid = data.get("group_id")
         if not gid:
             raise FabricError(f"group manifest missing group_id: {path}")
-        out[gid] = data
+        out[gid] = (path, data)
     return out
 
 
 def load_profiles(fabric_root: Path) -> Dict[str, dict]:
     profile_dir = fabric_root / "catalog" / "profiles"
     out: Dict[str, dict] = {}
-    for path in sorted(profile_dir.glob("*.yaml")):
-        data = load_yaml(path)
-        if not isinstance(data, dict):
-            raise FabricError(f"invalid profile yaml object: {path}")
-        profile_id = data.get("profile_id")
-        if not profile_id:
-            raise FabricError(f"profile missing profile_id: {path}")
-        out[profile_id] = data
+    with open_catalog_cache(fabric_root) as cache:
+        for path in sorted(profile_dir.glob("*.yaml")):
+            data = cache.load_yaml(path)
+            if not isinstance(data, dict):
+                raise FabricError(f"invalid profile yaml object: {path}")
+            profile_id = data.get("profile_id")
+            if not profile_id:
+                raise FabricError(f"profile missing profile_id: {path}")
+            out[profile_id] = data
     return out
 
 
@@ -823,7 +866,8 @@ def remove_project_registry_entry(fabric_root: Path, project_id: str) -> None:
 def load_project_manifest(fabric_root: Path, project_id: str) -> Tuple[Path, dict]:
     project_dir = fabric_root / "generated" / "projects" / slugify(project_id)
     manifest_path = project_dir / "manifest.yaml"
-    manifest = load_yaml(manifest_path)
+    with open_catalog_cache(fabric_root) as cache:
+        manifest = cache.load_yaml(manifest_path)
     if not isinstance(manifest, dict):
         raise FabricError(f"invalid project manifest: {manifest_path}")
     return project_dir, manifest
@@ -5,7 +5,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Dict, List
 
-from agents_inc.core.fabric_lib import load_yaml, now_iso, stable_json, write_text
+from agents_inc.core.exposed_state import exposed_state_snapshot
+from agents_inc.core.fabric_lib import now_iso, stable_json, write_text
+from agents_inc.core.util.similarity import jaccard_matrix
 
 
 @dataclass
@@ -72,31 +74,12 @@ def _consensus_tokens(text: object) -> set[str]:
     return tokens
 
 
-def _token_jaccard(left: set[str], right: set[str]) -> float:
-    if not left and not right:
-        return 1.0
-    if not left or not right:
-        return 0.0
-    union = left | right
-    if not union:
-        return 0.0
-    return len(left & right) / len(union)
-
-
 def _build_similarity_matrix(exposed_rows: Dict[str, dict], groups: List[str]) -> Dict[tuple[str, str], float]:
-    matrix: Dict[tuple[str, str], float] = {}
     token_map = {
         group_id: _consensus_tokens(exposed_rows.get(group_id, {}).get("objective_response", ""))
         for group_id in groups
     }
-    for group_id in groups:
-        matrix[(group_id, group_id)] = 1.0
-    for index, left_group in enumerate(groups):
-        for right_group in groups[index + 1 :]:
-            similarity = _token_jaccard(token_map.get(left_group, set()), token_map.get(right_group, set()))
-            matrix[(left_group, right_group)] = similarity
-            matrix[(right_group, left_group)] = similarity
-    return matrix
+    return jaccard_matrix(token_map, groups)
 
 
 def _group_similarity_stats(
@@ -413,56 +396,30 @@ def run_head_meeting(config: HeadMeetingConfig) -> dict:
 
 
 def _collect_group_exposed(project_dir: Path, groups: List[str]) -> Dict[str, dict]:
+    snapshot = exposed_state_snapshot(project_dir)
     out: Dict[str, dict] = {}
     for group_id in groups:
-        handoff_path = project_dir / "agent-groups" / group_id / "exposed" / "handoff.json"
-        summary_path = project_dir / "agent-groups" / group_id / "exposed" / "summary.md"
-        payload = {}
+        view = snapshot.group(group_id)
+        handoff_path = view.handoff_path
+        payload = view.handoff
         reasons: List[str] = []
-        summary_text = ""
-        if summary_path.exists():
-            summary_text = summary_path.read_text(encoding="utf-8", errors="replace")
-        group_manifest_path = project_dir / "agent-groups" / group_id / "group.yaml"
-        group_manifest = load_yaml(group_manifest_path) if group_manifest_path.exists() else {}
-        if not isinstance(group_manifest, dict):
-            group_manifest = {}
-        head_persona = group_manifest.get("head", {})
-        if isinstance(head_persona, dict):
-            head_persona = head_persona.get("persona", {})
-        else:
-            head_persona = {}
-        if not isinstance(head_persona, dict):
-            head_persona = {}
-        try:
-            persona_threshold = float(head_persona.get("confidence_threshold") or 0.8)
-        except Exception:
-            persona_threshold = 0.8
-        persona_threshold = max(0.0, min(1.0, persona_threshold))
-        persona_override_policy = str(head_persona.get("override_policy") or "head-meeting-only")
-        if handoff_path.exists():
-            loaded = load_yaml(handoff_path)
-            if isinstance(loaded, dict):
-                payload = loaded
-            else:
-                reasons.append("exposed handoff is not a mapping")
-        else:
+        summary_text = view.summary_text
+        persona_threshold = view.persona_threshold
+        persona_override_policy = view.persona_override_policy
+        if not view.handoff_exists:
             reasons.append("missing exposed handoff")
+        elif not view.handoff_is_mapping:
+            reasons.append("exposed handoff is not a mapping")
 
         status = str(payload.get("status") or "").strip().upper()
         if status in {"", "PENDING"}:
             reasons.append("handoff status is pending")
 
-        claims = payload.get("claims")
-        if not isinstance(claims, list):
-            claims = payload.get("claims_with_citations")
-        if not isinstance(claims, list):
-            claims = []
-        claim_count = len([item for item in claims if isinstance(item, dict)])
+        claims = view.claims
+        claim_count = len(claims)
         citation_count = 0
         seen_ids: set[str] = set()
         for claim in claims:
-            if not isinstance(claim, dict):
-                continue
             evidence_ids = claim.get("evidence_ids")
             if isinstance(evidence_ids, list):
                 for item in evidence_ids:
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 import shutil
 import time
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
-from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, ContextManager, Dict, List, Optional, Tuple
 
+from agents_inc.core.agent_home import (
+    ensure_agent_home_template,
+    instantiate_agent_home,
+)
 from agents_inc.core.agent_session_runner import AgentRunConfig, AgentSessionRunner
+from agents_inc.core.agent_slots import (
+    HEAD_SLOT_TIER,
+    SPECIALIST_SLOT_TIER,
+    AgentSlotPool,
+    specialist_critical_path_lengths,
+)
 from agents_inc.core.agent_threads import (
+    get_head_thread_record,
+    get_specialist_thread_record,
     set_head_thread,
     set_specialist_thread,
 )
@@ -21,9 +35,8 @@ from agents_inc.core.escalation import (
 )
 from agents_inc.core.evidence_cache import (
     canonicalize_evidence_refs,
+    evidence_cache_buffer,
     evidence_id_for_citation,
-    merge_evidence_refs_into_cache,
-    resolve_evidence_ids,
 )
 from agents_inc.core.fabric_lib import build_dispatch_plan, now_iso, stable_json, write_text
 from agents_inc.core.model_profiles import (
@@ -32,6 +45,20 @@ from agents_inc.core.model_profiles import (
     DEFAULT_SPECIALIST_MODEL,
     DEFAULT_SPECIALIST_REASONING_EFFORT,
 )
+from agents_inc.core.retry_policy import (
+    TRANSIENT_FAILURE_CLASSES,
+    RetryScheduler,
+    classify_agent_failure,
+    resolve_retry_policies,
+)
+from agents_inc.core.tracing import (
+    NULL_SPAN,
+    NullSpan,
+    Span,
+    current_span,
+    trace_span,
+    traced,
+)
 from agents_inc.core.util.dispatch import gate_specialist_output
 from agents_inc.core.util.edges import resolve_handoff_edges
 
@@ -62,6 +89,8 @@ OBJECTIVE_PARTIAL_HINTS = (
     "assumption",
 )
 LIVE_NOTE_PREFIX = "LIVE_NOTE:"
+SPECIALIST_MEMO_NAME = "memo.json"
+SPECIALIST_MEMO_SCHEMA_VERSION = "1.0"
 
 
 @dataclass
@@ -90,6 +119,12 @@ class LayeredRuntimeConfig:
     execution_mode: str = "full"
     progress_callback: Callable[[dict], None] | None = None
     cycle_id: int = 0
+    reuse_unchanged_specialists: bool = True
+    continue_agent_threads: bool = False
+    # Groups whose exposed output from an earlier cycle stands; they are not re-run.
+    carried_groups: List[str] = field(default_factory=list)
+    # Per failure class overrides, e.g. {"timeout": {"base_delay_sec": 10, "max_retries": 4}}.
+    retry_policies: Dict[str, dict] = field(default_factory=dict)
 
 
 @dataclass
@@ -310,6 +345,12 @@ class _LiveNoteParser:
         self._on_note(note)
 
 
+def _agent_slot(slots: Optional[AgentSlotPool], priority: Tuple[int, ...]) -> ContextManager[None]:
+    if slots is None:
+        return nullcontext()
+    return slots.slot(priority)
+
+
 def _resolve_task_web_search_enabled(*, config: LayeredRuntimeConfig, task: dict, role: str) -> bool:
     default_enabled = bool(task.get("web_search_enabled", True))
     policy = str(config.web_search_policy or "web-role-only").strip().lower()
@@ -336,6 +377,14 @@ def run_layered_runtime(config: LayeredRuntimeConfig) -> dict:
     layer4_dir.mkdir(parents=True, exist_ok=True)
 
     runner = AgentSessionRunner()
+    # One slot pool caps concurrent agent sessions across every group in the turn.
+    slots = AgentSlotPool(config.max_parallel)
+    retry_policies = resolve_retry_policies(config.retry_backoff_sec, config.retry_policies)
+    retries = RetryScheduler(
+        retry_policies,
+        retry_attempts=config.retry_attempts,
+        abort_check=lambda: _abort_requested(config),
+    )
     ledger_rows: List[dict] = []
 
     orchestrator_plan = {
@@ -344,10 +393,15 @@ def run_layered_runtime(config: LayeredRuntimeConfig) -> dict:
         "message": config.message,
         "selected_groups": config.selected_groups,
         "group_objectives": config.group_objectives or {},
+        "carried_groups": sorted(config.carried_groups or []),
         "settings": {
             "max_parallel": config.max_parallel,
+            "agent_slot_capacity": slots.capacity,
             "retry_attempts": config.retry_attempts,
             "retry_backoff_sec": config.retry_backoff_sec,
+            "retry_policies": {
+                failure_class: asdict(policy) for failure_class, policy in retry_policies.items()
+            },
             "agent_timeout_sec": config.agent_timeout_sec,
             "agent_timeout_mode": _timeout_mode(config.agent_timeout_sec),
             "heartbeat_sec": config.heartbeat_sec,
@@ -446,19 +500,54 @@ def run_layered_runtime(config: LayeredRuntimeConfig) -> dict:
             "cooperation_ledger_path": str(config.turn_dir / "cooperation-ledger.ndjson"),
             "wait_state_path": str(config.turn_dir / "wait-state.json"),
             "escalations": escalations,
+            "retry_stats": retries.stats(),
         }
 
-    max_group_workers = (
-        len(config.selected_groups)
-        if int(config.max_parallel) <= 0
-        else max(1, min(int(config.max_parallel), len(config.selected_groups)))
-    )
+    carried_groups = _resolve_carried_groups(config)
+    for group_id in carried_groups:
+        group_head_sessions[group_id]["status"] = "CARRIED"
+        for session in specialist_sessions.get(group_id, {}).values():
+            session["status"] = "CARRIED"
+        group_results[group_id] = {
+            "status": "COMPLETE",
+            "started_at": now_iso(),
+            "finished_at": now_iso(),
+            "error": "",
+            "carried_forward": True,
+            "specialist_count": 0,
+            "timed_out_specialists": [],
+            "escalations": [],
+            "specialist_failures": [],
+        }
+        ledger_rows.append(
+            {
+                "ts": now_iso(),
+                "event": "group_carried_forward",
+                "group_id": group_id,
+                "exposed_handoff": str(
+                    config.project_dir / "agent-groups" / group_id / "exposed" / "handoff.json"
+                ),
+            }
+        )
+        _emit_progress(
+            config,
+            {
+                "event": "runtime_group_carried",
+                "project_id": config.project_id,
+                "cycle": int(config.cycle_id),
+                "group_id": group_id,
+            },
+        )
+    run_groups = [group_id for group_id in config.selected_groups if group_id not in carried_groups]
+
+    # Group workers only coordinate; agent sessions are bounded by the slot pool.
+    max_group_workers = max(1, len(run_groups))
 
     timed_out_specialists: List[dict] = []
     specialist_failures: List[dict] = []
     with ThreadPoolExecutor(max_workers=max_group_workers) as pool:
         future_map = {}
-        for group_id in config.selected_groups:
+        for group_id in run_groups:
             _emit_progress(
                 config,
                 {
@@ -469,7 +558,7 @@ def run_layered_runtime(config: LayeredRuntimeConfig) -> dict:
                 },
             )
             future = pool.submit(
-                _run_group,
+                traced(_run_group, "group", category="group", group_id=group_id),
                 config,
                 group_id,
                 runner,
@@ -478,6 +567,8 @@ def run_layered_runtime(config: LayeredRuntimeConfig) -> dict:
                 layer3_dir,
                 layer4_dir,
                 ledger_rows,
+                slots,
+                retries,
             )
             future_map[future] = group_id
         heartbeat_every = max(1, int(config.heartbeat_sec))
@@ -633,13 +724,17 @@ def run_layered_runtime(config: LayeredRuntimeConfig) -> dict:
     else:
         write_text(cooperation_path, "")
 
-    _persist_turn_evidence_cache(config=config, group_results=group_results)
+    with trace_span("evidence_cache_persist", category="evidence_cache"):
+        _persist_turn_evidence_cache(config=config, group_results=group_results)
+
+    retry_stats = _record_retry_stats(retries, orchestrator_plan, layer2_dir)
 
     return {
         "schema_version": "3.1",
         "group_status": group_results,
         "blocked": not wait_state["all_groups_complete"],
         "blocked_groups": wait_state["blocked_groups"],
+        "carried_groups": carried_groups,
         "reasons": blocked_reasons,
         "timed_out_specialists": timed_out_specialists,
         "specialist_failures": specialist_failures,
@@ -650,9 +745,23 @@ def run_layered_runtime(config: LayeredRuntimeConfig) -> dict:
         "cooperation_ledger_path": str(cooperation_path),
         "wait_state_path": str(config.turn_dir / "wait-state.json"),
         "escalations": escalations,
+        "retry_stats": retry_stats,
     }
 
 
+def _resolve_carried_groups(config: LayeredRuntimeConfig) -> List[str]:
+    carried = set(config.carried_groups or [])
+    out: List[str] = []
+    for group_id in config.selected_groups:
+        if group_id not in carried:
+            continue
+        # Only a published handoff can stand in for a run; otherwise execute the group.
+        handoff = config.project_dir / "agent-groups" / group_id / "exposed" / "handoff.json"
+        if handoff.is_file():
+            out.append(group_id)
+    return out
+
+
 def _run_group(
     config: LayeredRuntimeConfig,
     group_id: str,
@@ -662,6 +771,8 @@ def _run_group(
     layer3_dir: Path,
     layer4_dir: Path,
     ledger_rows: List[dict],
+    slots: Optional[AgentSlotPool] = None,
+    retries: Optional[RetryScheduler] = None,
 ) -> dict:
     started_at = now_iso()
     group_manifest = config.group_manifests[group_id]
@@ -698,42 +809,90 @@ def _run_group(
             total_specialists=total_specialists,
             pending_specialists=pending_specialists,
         )
-        for phase in dispatch.get("phases", []):
-            if _abort_requested(config):
-                group_error = "abort requested"
-                ledger_rows.append(
-                    {
-                        "ts": now_iso(),
-                        "event": "group_abort_requested",
-                        "group_id": group_id,
-                    }
-                )
-                break
-            tasks = phase.get("tasks", [])
-            if not isinstance(tasks, list):
-                continue
-            max_workers = (
-                len(tasks)
-                if int(config.max_parallel) <= 0
-                else max(1, min(int(config.max_parallel), len(tasks)))
-            )
-            with ThreadPoolExecutor(max_workers=max_workers) as pool:
-                future_map = {
-                    pool.submit(
-                        _run_specialist_with_retries,
-                        config,
-                        group_id,
-                        group_objective,
-                        task,
-                        runner,
-                        specialist_sessions,
-                        layer4_dir,
-                        ledger_rows,
-                    ): task
-                    for task in tasks
-                }
-                for future in as_completed(future_map):
-                    task = future_map[future]
+        tasks = _ordered_dispatch_tasks(dispatch)
+        task_by_id = {str(task.get("agent_id") or ""): task for task in tasks}
+        waiting_on = {
+            specialist_id: {
+                str(dep).strip()
+                for dep in (task.get("depends_on") or [])
+                if str(dep).strip() in task_by_id
+            }
+            for specialist_id, task in task_by_id.items()
+        }
+        critical_path = specialist_critical_path_lengths(waiting_on)
+        max_workers = (
+            len(tasks)
+            if slots is not None or int(config.max_parallel) <= 0
+            else max(1, min(int(config.max_parallel), len(tasks)))
+        )
+        # Specialists start as soon as their own dependencies complete instead of
+        # waiting on every task in the previous dispatch phase.
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            future_map: Dict[Future, dict] = {}
+            launched: set[str] = set()
+            while True:
+                if not group_error and _abort_requested(config):
+                    group_error = "abort requested"
+                    if retries is not None:
+                        retries.abort()
+                    ledger_rows.append(
+                        {
+                            "ts": now_iso(),
+                            "event": "group_abort_requested",
+                            "group_id": group_id,
+                        }
+                    )
+                    for pending in future_map:
+                        if not pending.done():
+                            pending.cancel()
+                if not group_error:
+                    for task in tasks:
+                        specialist_id = str(task.get("agent_id") or "")
+                        if specialist_id in launched or waiting_on.get(specialist_id):
+                            continue
+                        launched.add(specialist_id)
+                        future = pool.submit(
+                            traced(
+                                _run_specialist_with_retries,
+                                "specialist",
+                                category="specialist",
+                                group_id=group_id,
+                                specialist_id=specialist_id,
+                            ),
+                            config,
+                            group_id,
+                            group_objective,
+                            task,
+                            runner,
+                            specialist_sessions,
+                            layer4_dir,
+                            ledger_rows,
+                            slots=slots,
+                            slot_priority=(
+                                SPECIALIST_SLOT_TIER,
+                                -critical_path.get(specialist_id, 1),
+                            ),
+                            retries=retries,
+                        )
+                        future_map[future] = task
+                running = [future for future in future_map if not future.done()]
+                finished = [
+                    future
+                    for future in future_map
+                    if future.done() and not future.cancelled()
+                ]
+                if not running and not finished:
+                    if not group_error and len(launched) < len(tasks):
+                        blocked = sorted(set(task_by_id) - launched)
+                        group_error = "unsatisfied specialist dependencies: {0}".format(
+                            ", ".join(blocked)
+                        )
+                    break
+                if not finished:
+                    wait(running, return_when=FIRST_COMPLETED)
+                    continue
+                for future in finished:
+                    task = future_map.pop(future)
                     specialist_id = str(task.get("agent_id") or "")
                     role = str(task.get("role") or "domain-core")
                     try:
@@ -771,6 +930,9 @@ def _run_group(
                             escalation_request=None,
                         )
                     phase_outputs[result.specialist_id] = result
+                    if result.success:
+                        for dependent in waiting_on.values():
+                            dependent.discard(specialist_id)
                     if result.timed_out:
                         timed_out_specialists.append(
                             {
@@ -812,19 +974,6 @@ def _run_group(
                             )
                         else:
                             group_error = result.error or f"specialist '{result.specialist_id}' failed"
-                    if _abort_requested(config) and not group_error:
-                        group_error = "abort requested"
-                        ledger_rows.append(
-                            {
-                                "ts": now_iso(),
-                                "event": "group_abort_requested",
-                                "group_id": group_id,
-                            }
-                        )
-                        for pending in future_map:
-                            if not pending.done():
-                                pending.cancel()
-                        break
                     completed_specialists = len(
                         [
                             row
@@ -847,11 +996,10 @@ def _run_group(
                         total_specialists=total_specialists,
                         pending_specialists=pending_specialists,
                     )
-
-            if group_error:
-                break
     elif _abort_requested(config):
         group_error = "abort requested"
+        if retries is not None:
+            retries.abort()
         ledger_rows.append(
             {
                 "ts": now_iso(),
@@ -881,17 +1029,20 @@ def _run_group(
             "specialist_failures": specialist_failures,
         }
 
-    head_result = _run_head_with_retries(
-        config=config,
-        group_id=group_id,
-        objective=group_objective,
-        dispatch=dispatch,
-        phase_outputs=phase_outputs,
-        execution_mode=execution_mode,
-        runner=runner,
-        layer3_dir=layer3_dir,
-        ledger_rows=ledger_rows,
-    )
+    with trace_span("head", category="head", group_id=group_id):
+        head_result = _run_head_with_retries(
+            config=config,
+            group_id=group_id,
+            objective=group_objective,
+            dispatch=dispatch,
+            phase_outputs=phase_outputs,
+            execution_mode=execution_mode,
+            runner=runner,
+            layer3_dir=layer3_dir,
+            ledger_rows=ledger_rows,
+            slots=slots,
+            retries=retries,
+        )
 
     group_head_sessions[group_id]["attempts"] = head_result.attempt
     group_head_sessions[group_id]["codex_home"] = head_result.codex_home
@@ -1092,6 +1243,24 @@ def _run_group(
     }
 
 
+def _ordered_dispatch_tasks(dispatch: dict) -> List[dict]:
+    tasks: List[dict] = []
+    seen: set[str] = set()
+    for phase in dispatch.get("phases", []):
+        rows = phase.get("tasks", []) if isinstance(phase, dict) else []
+        if not isinstance(rows, list):
+            continue
+        for task in rows:
+            if not isinstance(task, dict):
+                continue
+            specialist_id = str(task.get("agent_id") or "").strip()
+            if not specialist_id or specialist_id in seen:
+                continue
+            seen.add(specialist_id)
+            tasks.append(task)
+    return tasks
+
+
 def _run_specialist_with_retries(
     config: LayeredRuntimeConfig,
     group_id: str,
@@ -1101,6 +1270,9 @@ def _run_specialist_with_retries(
     specialist_sessions: Dict[str, dict],
     layer4_dir: Path,
     ledger_rows: List[dict],
+    slots: Optional[AgentSlotPool] = None,
+    slot_priority: Tuple[int, ...] = (SPECIALIST_SLOT_TIER,),
+    retries: Optional[RetryScheduler] = None,
 ) -> SpecialistResult:
     specialist_id = str(task.get("agent_id") or "")
     role = str(task.get("role") or "domain-core")
@@ -1110,7 +1282,8 @@ def _run_specialist_with_retries(
         task=task,
         role=role,
     )
-    attempts_total = max(1, int(config.retry_attempts) + 1)
+    if retries is None:
+        retries = _default_retry_scheduler(config)
 
     specialist_root = config.project_dir / "agent-groups" / group_id / "internal" / specialist_id
     specialist_root.mkdir(parents=True, exist_ok=True)
@@ -1122,12 +1295,74 @@ def _run_specialist_with_retries(
     redacted_log_path = group_layer4 / "redacted.log"
 
     skill_name = str(task.get("skill_name") or "").strip()
-    codex_home, visible_skills, missing_skills, mount_status = _prepare_agent_codex_home(
-        config=config,
-        runtime_dir=group_layer4,
+    allowed_skill_names = [skill_name] if skill_name else []
+    timed_out = False
+    retry_gate_reasons: List[str] = []
+    resolved_reference_paths = _resolve_required_reference_paths(
+        project_dir=config.project_dir,
+        group_id=group_id,
+        required_references=task.get("required_references", []),
+    )
+    resolved_dependency_artifacts = _resolve_dependency_artifact_paths(
+        project_dir=config.project_dir,
         group_id=group_id,
-        allowed_skill_names=[skill_name] if skill_name else [],
+        dependencies=task.get("dependency_checks") or task.get("depends_on", []),
+    )
+
+    def _prompt_for(gate_reasons: List[str]) -> str:
+        return _build_specialist_prompt(
+            objective=objective,
+            group_id=group_id,
+            specialist_id=specialist_id,
+            role=role,
+            focus=focus,
+            skill_name=skill_name,
+            dependencies=task.get("depends_on", []),
+            required_outputs=task.get("required_outputs", []),
+            required_references=task.get("required_references", []),
+            required_reference_paths=resolved_reference_paths,
+            dependency_artifact_paths=resolved_dependency_artifacts,
+            web_search_enabled=web_search_enabled,
+            artifact_scope={
+                "work_path": str(work_path),
+                "handoff_path": str(handoff_path),
+            },
+            retry_gate_reasons=gate_reasons,
+        )
+
+    memo_key = _specialist_memo_key(
+        config=config,
+        backend=runner.backend,
+        role=role,
+        prompt=_prompt_for([]),
+        web_search_enabled=web_search_enabled,
+        input_paths=resolved_reference_paths + resolved_dependency_artifacts,
+        skill_names=_resolve_agent_skills(config, allowed_skill_names)[0],
     )
+    # A memo hit publishes the prior output without running an agent, so it needs no CODEX_HOME.
+    if config.reuse_unchanged_specialists:
+        memo = _load_specialist_memo(specialist_root, memo_key)
+        if memo is not None:
+            return _reuse_specialist_memo(
+                config=config,
+                group_id=group_id,
+                specialist_id=specialist_id,
+                role=role,
+                memo=memo,
+                specialist_sessions=specialist_sessions,
+                layer4_dir=layer4_dir,
+                ledger_rows=ledger_rows,
+                work_path=work_path,
+                handoff_path=handoff_path,
+            )
+
+    with trace_span("codex_home_prep", category="codex_home"):
+        codex_home, visible_skills, missing_skills, mount_status = _prepare_agent_codex_home(
+            config=config,
+            runtime_dir=group_layer4,
+            group_id=group_id,
+            allowed_skill_names=allowed_skill_names,
+        )
     specialist_sessions[group_id][specialist_id]["codex_home"] = str(codex_home)
     specialist_sessions[group_id][specialist_id]["visible_skills"] = visible_skills
     specialist_sessions[group_id][specialist_id]["mount_status"] = mount_status
@@ -1160,65 +1395,104 @@ def _run_specialist_with_retries(
             escalation_request=None,
         )
 
-    timed_out = False
-    retry_gate_reasons: List[str] = []
-    resolved_reference_paths = _resolve_required_reference_paths(
-        project_dir=config.project_dir,
-        group_id=group_id,
-        required_references=task.get("required_references", []),
-    )
-    resolved_dependency_artifacts = _resolve_dependency_artifact_paths(
-        project_dir=config.project_dir,
-        group_id=group_id,
-        dependencies=task.get("depends_on", []),
-    )
-    for attempt in range(1, attempts_total + 1):
+    dependency_digests = {
+        path: _digest_path(Path(path)) for path in resolved_dependency_artifacts
+    }
+    thread_details = {
+        "turn_dir": str(config.turn_dir),
+        "cycle": int(config.cycle_id),
+        "codex_home": str(codex_home),
+        "inputs": dependency_digests,
+    }
+    resume_thread_id: Optional[str] = None
+    changed_dependency_paths = list(resolved_dependency_artifacts)
+    if config.continue_agent_threads:
+        record = get_specialist_thread_record(config.project_root, group_id, specialist_id)
+        resume_thread_id = _continuable_thread(config, record)
+        if resume_thread_id:
+            _carry_thread_sessions(
+                prior_home=Path(str(record.get("codex_home") or "")),
+                codex_home=codex_home,
+                thread_id=resume_thread_id,
+            )
+            prior_inputs = record.get("inputs")
+            if not isinstance(prior_inputs, dict):
+                prior_inputs = {}
+            changed_dependency_paths = [
+                path
+                for path in resolved_dependency_artifacts
+                if prior_inputs.get(path) != dependency_digests[path]
+            ]
+
+    attempt = 0
+    attempt_span: Span | NullSpan = NULL_SPAN
+    while True:
+        attempt += 1
+        # Ended by the next attempt, the retry wait or the enclosing specialist span.
+        attempt_span.end()
+        attempt_span = trace_span("attempt", category="attempt", attempt=attempt)
         specialist_sessions[group_id][specialist_id]["status"] = "RUNNING"
         specialist_sessions[group_id][specialist_id]["attempts"] = attempt
         specialist_sessions[group_id][specialist_id]["started_at"] = now_iso()
 
-        prompt = _build_specialist_prompt(
-            objective=objective,
-            group_id=group_id,
-            specialist_id=specialist_id,
-            role=role,
-            focus=focus,
-            skill_name=skill_name,
-            dependencies=task.get("depends_on", []),
-            required_outputs=task.get("required_outputs", []),
-            required_references=task.get("required_references", []),
-            required_reference_paths=resolved_reference_paths,
-            dependency_artifact_paths=resolved_dependency_artifacts,
-            web_search_enabled=web_search_enabled,
-            artifact_scope={
-                "work_path": str(work_path),
-                "handoff_path": str(handoff_path),
-            },
-            retry_gate_reasons=retry_gate_reasons,
-        )
+        prompt = _prompt_for(retry_gate_reasons)
+        run_prompt = prompt
+        if resume_thread_id:
+            run_prompt = _build_specialist_delta_prompt(
+                objective=objective,
+                group_id=group_id,
+                specialist_id=specialist_id,
+                changed_dependency_paths=changed_dependency_paths,
+                artifact_scope={
+                    "work_path": str(work_path),
+                    "handoff_path": str(handoff_path),
+                },
+                retry_gate_reasons=retry_gate_reasons,
+            )
 
-        result = runner.run(
-            AgentRunConfig(
-                project_root=config.project_root,
-                work_dir=specialist_root,
-                prompt=prompt,
-                raw_log_path=raw_log_path,
-                redacted_log_path=redacted_log_path,
-                timeout_sec=config.agent_timeout_sec,
-                web_search=web_search_enabled,
-                codex_home=codex_home,
-                # Specialists start fresh each run to avoid stale cross-turn context drift.
-                thread_id=None,
-                session_label=f"{group_id}/{specialist_id}",
-                model=config.specialist_model,
-                model_reasoning_effort=config.specialist_reasoning_effort,
-                disable_mcp=True,
-                approval_policy="never",
-                sandbox_mode="workspace-write",
-                sandbox_cd_dir=specialist_root,
-                sandbox_network_access=True,
+        def _on_handoff(payload: Dict[str, object], attempt: int = attempt) -> None:
+            # Fires while the session is still tearing down; the gate still runs on the result.
+            specialist_sessions[group_id][specialist_id]["handoff_ready_at"] = now_iso()
+            _emit_progress(
+                config,
+                {
+                    "event": "runtime_specialist_handoff_ready",
+                    "project_id": config.project_id,
+                    "cycle": int(config.cycle_id),
+                    "group_id": group_id,
+                    "specialist_id": specialist_id,
+                    "attempt": attempt,
+                    "status": str(payload.get("status") or ""),
+                },
+            )
+
+        # Retries queue behind first attempts of the same tier for a free slot.
+        with _agent_slot(slots, _retry_slot_priority(slot_priority, attempt)):
+            result = runner.run(
+                AgentRunConfig(
+                    project_root=config.project_root,
+                    work_dir=specialist_root,
+                    prompt=run_prompt,
+                    fallback_prompt=prompt if resume_thread_id else None,
+                    raw_log_path=raw_log_path,
+                    redacted_log_path=redacted_log_path,
+                    timeout_sec=config.agent_timeout_sec,
+                    web_search=web_search_enabled,
+                    codex_home=codex_home,
+                    # Threads only continue across cycles of one turn; new turns start fresh
+                    # to avoid stale cross-turn context drift.
+                    thread_id=resume_thread_id,
+                    session_label=f"{group_id}/{specialist_id}",
+                    model=config.specialist_model,
+                    model_reasoning_effort=config.specialist_reasoning_effort,
+                    disable_mcp=True,
+                    approval_policy="never",
+                    sandbox_mode="workspace-write",
+                    sandbox_cd_dir=specialist_root,
+                    sandbox_network_access=True,
+                    handoff_callback=_on_handoff,
+                )
             )
-        )
 
         escalation_state = resolve_escalation_state(
             work_dir=specialist_root,
@@ -1315,12 +1589,13 @@ def _run_specialist_with_retries(
             handoff_payload.setdefault("repro_steps", ["specialist execution complete"])
             handoff_payload.setdefault("artifact_paths", [])
             handoff_payload.pop("claims_with_citations", None)
-            gate = gate_specialist_output(
-                handoff_payload,
-                role=role,
-                citation_required=True,
-                web_available=web_search_enabled,
-            )
+            with trace_span("gate", category="gate"):
+                gate = gate_specialist_output(
+                    handoff_payload,
+                    role=role,
+                    citation_required=True,
+                    web_available=web_search_enabled,
+                )
             gate_status = str(gate.get("status") or "BLOCKED_REVIEW")
             gate_reasons = gate.get("reasons")
             if not isinstance(gate_reasons, list):
@@ -1357,7 +1632,7 @@ def _run_specialist_with_retries(
                         "ts": now_iso(),
                         "event": (
                             "specialist_gate_retry"
-                            if attempt < attempts_total
+                            if attempt <= int(config.retry_attempts)
                             else "specialist_gate_failed"
                         ),
                         "group_id": group_id,
@@ -1431,6 +1706,7 @@ def _run_specialist_with_retries(
                         specialist_id,
                         result.thread_id,
                         "COMPLETE",
+                        details=thread_details,
                     )
                 ledger_rows.append(
                     {
@@ -1494,6 +1770,14 @@ def _run_specialist_with_retries(
                 },
             )
             specialist_sessions[group_id][specialist_id].update(snapshot_paths)
+            if not retry_gate_reasons:
+                # Only first-attempt output is keyed by the memo; retries see extra gate feedback.
+                _write_specialist_memo(
+                    specialist_root,
+                    key=memo_key,
+                    config=config,
+                    snapshot_paths=snapshot_paths,
+                )
 
             specialist_sessions[group_id][specialist_id]["status"] = "COMPLETE"
             specialist_sessions[group_id][specialist_id]["finished_at"] = now_iso()
@@ -1505,6 +1789,7 @@ def _run_specialist_with_retries(
                     specialist_id,
                     result.thread_id,
                     "COMPLETE",
+                    details=thread_details,
                 )
             ledger_rows.append(
                 {
@@ -1554,14 +1839,22 @@ def _run_specialist_with_retries(
                 "FAILED",
             )
 
+        failure_class = classify_agent_failure(result)
+        retry_delay = (
+            retries.next_delay(failure_class, attempt)
+            if failure_class in TRANSIENT_FAILURE_CLASSES
+            else None
+        )
         ledger_rows.append(
             {
                 "ts": now_iso(),
-                "event": "specialist_retry" if attempt < attempts_total else "specialist_failed",
+                "event": "specialist_retry" if retry_delay is not None else "specialist_failed",
                 "group_id": group_id,
                 "specialist_id": specialist_id,
                 "attempt": attempt,
                 "error": result.error or "agent failed",
+                "failure_class": failure_class,
+                "retry_delay_sec": round(retry_delay, 3) if retry_delay is not None else None,
                 "raw_log": str(raw_log_path),
                 "redacted_log": str(redacted_log_path),
                 "codex_home": str(codex_home),
@@ -1574,12 +1867,12 @@ def _run_specialist_with_retries(
             }
         )
 
-        if attempt < attempts_total:
-            if _is_retryable_specialist_failure(result):
-                if int(config.retry_backoff_sec) > 0:
-                    time.sleep(int(config.retry_backoff_sec))
-                continue
-            break
+        attempt_span.set(failure_class=failure_class)
+        # A failed or rotated attempt leaves no trustworthy thread to continue; retry fresh.
+        resume_thread_id = None
+        if retry_delay is not None and _wait_for_retry(retries, retry_delay, attempt_span):
+            continue
+        break
 
     return SpecialistResult(
         success=False,
@@ -1611,6 +1904,8 @@ def _run_head_with_retries(
     runner: AgentSessionRunner,
     layer3_dir: Path,
     ledger_rows: List[dict],
+    slots: Optional[AgentSlotPool] = None,
+    retries: Optional[RetryScheduler] = None,
 ) -> HeadResult:
     group_layer3 = layer3_dir / group_id
     group_layer3.mkdir(parents=True, exist_ok=True)
@@ -1624,12 +1919,13 @@ def _run_head_with_retries(
         execution_mode=execution_mode,
         head_skill=head_skill,
     )
-    codex_home, visible_skills, missing_skills, mount_status = _prepare_agent_codex_home(
-        config=config,
-        runtime_dir=group_layer3,
-        group_id=group_id,
-        allowed_skill_names=allowed_skills,
-    )
+    with trace_span("codex_home_prep", category="codex_home"):
+        codex_home, visible_skills, missing_skills, mount_status = _prepare_agent_codex_home(
+            config=config,
+            runtime_dir=group_layer3,
+            group_id=group_id,
+            allowed_skill_names=allowed_skills,
+        )
 
     if head_skill and head_skill in missing_skills and runner.backend != "mock":
         message = (
@@ -1650,7 +1946,8 @@ def _run_head_with_retries(
             error=message,
         )
 
-    attempts_total = max(1, int(config.retry_attempts) + 1)
+    if retries is None:
+        retries = _default_retry_scheduler(config)
     prompt = _build_head_prompt(
         objective=objective,
         group_id=group_id,
@@ -1660,8 +1957,52 @@ def _run_head_with_retries(
         visible_skill_names=visible_skills,
     )
     head_timeout_sec = _resolve_head_timeout_sec(config.agent_timeout_sec)
+    specialist_digests = {
+        specialist_id: _digest_path(Path(output.handoff_path))
+        for specialist_id, output in sorted(phase_outputs.items())
+    }
+    thread_details = {
+        "turn_dir": str(config.turn_dir),
+        "cycle": int(config.cycle_id),
+        "codex_home": str(codex_home),
+        "inputs": specialist_digests,
+    }
+    resume_thread_id: Optional[str] = None
+    run_prompt = prompt
+    if config.continue_agent_threads:
+        record = get_head_thread_record(config.project_root, group_id)
+        resume_thread_id = _continuable_thread(config, record)
+        if resume_thread_id:
+            _carry_thread_sessions(
+                prior_home=Path(str(record.get("codex_home") or "")),
+                codex_home=codex_home,
+                thread_id=resume_thread_id,
+            )
+            prior_inputs = record.get("inputs")
+            if not isinstance(prior_inputs, dict):
+                prior_inputs = {}
+            run_prompt = _build_head_delta_prompt(
+                objective=objective,
+                group_id=group_id,
+                phase_outputs={
+                    specialist_id: output
+                    for specialist_id, output in phase_outputs.items()
+                    if prior_inputs.get(specialist_id) != specialist_digests[specialist_id]
+                },
+                unchanged_specialists=[
+                    specialist_id
+                    for specialist_id in sorted(phase_outputs)
+                    if prior_inputs.get(specialist_id) == specialist_digests[specialist_id]
+                ],
+                execution_mode=execution_mode,
+            )
 
-    for attempt in range(1, attempts_total + 1):
+    attempt = 0
+    attempt_span: Span | NullSpan = NULL_SPAN
+    while True:
+        attempt += 1
+        attempt_span.end()
+        attempt_span = trace_span("attempt", category="attempt", attempt=attempt)
         group_work_dir = config.project_dir / "agent-groups" / group_id
         group_work_dir.mkdir(parents=True, exist_ok=True)
         _emit_group_worklog_note(
@@ -1683,28 +2024,31 @@ def _run_head_with_retries(
                 text=text,
             )
         )
-        result = runner.run(
-            AgentRunConfig(
-                project_root=config.project_root,
-                work_dir=group_work_dir,
-                prompt=prompt,
-                raw_log_path=raw_log_path,
-                redacted_log_path=redacted_log_path,
-                timeout_sec=head_timeout_sec,
-                web_search=(execution_mode == "light"),
-                codex_home=codex_home,
-                # Heads must start fresh each run to avoid stale cross-turn context bloat.
-                thread_id=None,
-                session_label=f"{group_id}/head",
-                model=config.head_model,
-                model_reasoning_effort=config.head_reasoning_effort,
-                approval_policy="never",
-                sandbox_mode="workspace-write",
-                sandbox_cd_dir=group_work_dir,
-                sandbox_network_access=True,
-                stream_callback=note_parser.feed_stream_event,
+        with _agent_slot(slots, _retry_slot_priority((HEAD_SLOT_TIER,), attempt)):
+            result = runner.run(
+                AgentRunConfig(
+                    project_root=config.project_root,
+                    work_dir=group_work_dir,
+                    prompt=run_prompt,
+                    fallback_prompt=prompt if resume_thread_id else None,
+                    raw_log_path=raw_log_path,
+                    redacted_log_path=redacted_log_path,
+                    timeout_sec=head_timeout_sec,
+                    web_search=(execution_mode == "light"),
+                    codex_home=codex_home,
+                    # Heads only continue across cycles of one turn; new turns start fresh
+                    # to avoid stale cross-turn context bloat.
+                    thread_id=resume_thread_id,
+                    session_label=f"{group_id}/head",
+                    model=config.head_model,
+                    model_reasoning_effort=config.head_reasoning_effort,
+                    approval_policy="never",
+                    sandbox_mode="workspace-write",
+                    sandbox_cd_dir=group_work_dir,
+                    sandbox_network_access=True,
+                    stream_callback=note_parser.feed_stream_event,
+                )
             )
-        )
         note_parser.flush()
 
         payload = dict(result.parsed_handoff or {})
@@ -1740,7 +2084,13 @@ def _run_head_with_retries(
                 }
             )
             if result.thread_id:
-                set_head_thread(config.project_root, group_id, result.thread_id, "COMPLETE")
+                set_head_thread(
+                    config.project_root,
+                    group_id,
+                    result.thread_id,
+                    "COMPLETE",
+                    details=thread_details,
+                )
             return HeadResult(
                 success=True,
                 group_id=group_id,
@@ -1755,13 +2105,17 @@ def _run_head_with_retries(
                 error="",
             )
 
+        failure_class = classify_agent_failure(result)
+        retry_delay = retries.next_delay(failure_class, attempt)
         ledger_rows.append(
             {
                 "ts": now_iso(),
-                "event": "group_head_retry" if attempt < attempts_total else "group_head_failed",
+                "event": "group_head_retry" if retry_delay is not None else "group_head_failed",
                 "group_id": group_id,
                 "attempt": attempt,
                 "error": result.error or "head agent failed",
+                "failure_class": failure_class,
+                "retry_delay_sec": round(retry_delay, 3) if retry_delay is not None else None,
                 "raw_log": str(raw_log_path),
                 "redacted_log": str(redacted_log_path),
                 "codex_home": str(codex_home),
@@ -1774,13 +2128,17 @@ def _run_head_with_retries(
         )
         if result.thread_id:
             set_head_thread(config.project_root, group_id, result.thread_id, "FAILED")
-        if attempt < attempts_total and int(config.retry_backoff_sec) > 0:
-            time.sleep(int(config.retry_backoff_sec))
+        attempt_span.set(failure_class=failure_class)
+        # A failed or rotated attempt leaves no trustworthy thread to continue; retry fresh.
+        resume_thread_id = None
+        run_prompt = prompt
+        if retry_delay is None or not _wait_for_retry(retries, retry_delay, attempt_span):
+            break
 
     return HeadResult(
         success=False,
         group_id=group_id,
-        attempt=attempts_total,
+        attempt=attempt,
         work_text="",
         handoff_payload={},
         raw_log_path=str(raw_log_path),
@@ -1863,6 +2221,17 @@ def _role_specific_contract(role: str) -> Tuple[List[str], List[str]]:
     return ([], [])
 
 
+def _retry_feedback_text(retry_gate_reasons: List[str] | None) -> str:
+    retry_items = [str(item).strip() for item in retry_gate_reasons or [] if str(item).strip()]
+    if not retry_items:
+        return ""
+    return (
+        "Retry correction checklist from prior gate failure (MUST satisfy all):\n"
+        + "\n".join(f"- {item}" for item in retry_items)
+        + "\n"
+    )
+
+
 def _build_specialist_prompt(
     *,
     objective: str,
@@ -1892,15 +2261,7 @@ def _build_specialist_prompt(
             f"- {item}" for item in role_requirements
         )
         role_requirements_text += "\n"
-    retry_feedback_text = ""
-    if retry_gate_reasons:
-        retry_items = [str(item).strip() for item in retry_gate_reasons if str(item).strip()]
-        if retry_items:
-            retry_feedback_text = (
-                "Retry correction checklist from prior gate failure (MUST satisfy all):\n"
-                + "\n".join(f"- {item}" for item in retry_items)
-                + "\n"
-            )
+    retry_feedback_text = _retry_feedback_text(retry_gate_reasons)
     role_handoff_text = "".join(f"{line}\n" for line in role_handoff_fields)
     compact_reference_paths = _compact_prompt_list(required_reference_paths, limit=4)
     compact_dependency_paths = _compact_prompt_list(dependency_artifact_paths, limit=4)
@@ -1957,31 +2318,120 @@ def _build_specialist_prompt(
     )
 
 
-def _default_head_persona_brief(group_id: str) -> dict:
-    normalized_group = str(group_id or "group").strip() or "group"
-    return {
-        "persona_id": f"persona-{normalized_group}-head",
-        "tone": "authoritative",
-        "aggression": "unrestricted-confrontation",
-        "pride_statement": (
-            f"I represent {normalized_group} and defend domain standards with uncompromising rigor."
-        ),
-        "domain_doctrine": [
-            "Decompose the objective into explicit technical sub-problems before deciding.",
-            "Promote only claims whose evidence, assumptions, and limits are visible.",
-            "Challenge weak evidence directly and refuse cosmetic certainty.",
-        ],
-        "challenge_style": "Confront weak assumptions directly and demand stronger support.",
-        "visibility": "moderate",
-        "confidence_threshold": 0.8,
-        "override_policy": "head-meeting-only",
-    }
+def _build_specialist_delta_prompt(
+    *,
+    objective: str,
+    group_id: str,
+    specialist_id: str,
+    changed_dependency_paths: List[str],
+    artifact_scope: dict,
+    retry_gate_reasons: List[str] | None = None,
+) -> str:
+    """Follow-up turn for a resumed specialist thread; the contract is already in context."""
+    compact_changed = _compact_prompt_list(changed_dependency_paths, limit=4)
+    return (
+        f"Continue as specialist {specialist_id} of group {group_id} for a new cycle. "
+        "Your role contract, requirements and output format are unchanged from earlier in this thread.\n"
+        f"Refined objective: {objective}\n"
+        f"Changed dependency artifacts (re-read these): {json.dumps(compact_changed, ensure_ascii=True)}\n"
+        + _retry_feedback_text(retry_gate_reasons)
+        + "Return ONLY the BEGIN_WORK/END_WORK and BEGIN_HANDOFF_JSON/END_HANDOFF_JSON blocks, "
+        "with a complete updated handoff rather than a diff.\n"
+        f"Artifact scope target (runtime-managed) work_path={artifact_scope['work_path']} handoff_path={artifact_scope['handoff_path']}\n"
+        "If ESCALATION_RESPONSE.json exists in your working directory, consume it before finalizing output.\n"
+    )
 
 
-def _resolve_head_persona_brief(*, dispatch: dict, execution_mode: str, group_id: str) -> dict:
-    if execution_mode == "light":
-        task_brief = dispatch.get("head_task_brief", {})
-        if not isinstance(task_brief, dict):
+def _build_head_delta_prompt(
+    *,
+    objective: str,
+    group_id: str,
+    phase_outputs: Dict[str, SpecialistResult],
+    unchanged_specialists: List[str],
+    execution_mode: str,
+) -> str:
+    """Follow-up turn for a resumed head thread carrying only changed specialist summaries."""
+    inputs_text = ""
+    if execution_mode != "light":
+        inputs_text = (
+            f"Changed specialist summaries (canonical): {json.dumps(_head_specialist_summaries(phase_outputs), ensure_ascii=True)}\n"
+            f"Specialists unchanged since your previous answer: {json.dumps(unchanged_specialists, ensure_ascii=True)}\n"
+        )
+    return (
+        f"Continue as the {group_id} group head for a new cycle. "
+        "Your persona contract, expert charter, rules and output format are unchanged from earlier "
+        "in this thread.\n"
+        f"Refined objective: {objective}\n"
+        + inputs_text
+        + "Emit LIVE_NOTE lines as before, then return ONLY the BEGIN_WORK/END_WORK and "
+        "BEGIN_HANDOFF_JSON/END_HANDOFF_JSON blocks with a complete updated handoff rather than a diff.\n"
+    )
+
+
+def _continuable_thread(config: LayeredRuntimeConfig, record: dict) -> Optional[str]:
+    """Return a recorded thread id when an earlier cycle of this turn completed it."""
+    thread_id = str(record.get("thread_id") or "").strip()
+    prior_turn_dir = str(record.get("turn_dir") or "").strip()
+    if not thread_id or not prior_turn_dir or str(record.get("status") or "") != "COMPLETE":
+        return None
+    try:
+        prior_cycle = int(record.get("cycle") or 0)
+    except (TypeError, ValueError):
+        return None
+    # Cycle runtimes live side by side under one turn's cycles/ directory.
+    if Path(prior_turn_dir).parent != config.turn_dir.parent or prior_cycle >= int(config.cycle_id):
+        return None
+    return thread_id
+
+
+def _carry_thread_sessions(*, prior_home: Path, codex_home: Path, thread_id: str) -> int:
+    """Copy a thread's session rollouts into the new CODEX_HOME so resume can find them.
+
+    The prior cycle's artifacts stay intact: each rollout is copied rather than moved or
+    hard-linked, since resume appends to it. The turn token report counts a rollout path
+    once, from its furthest-along copy.
+    """
+    sessions_root = prior_home / "sessions"
+    if not sessions_root.is_dir() or prior_home.resolve() == codex_home.resolve():
+        return 0
+    copied = 0
+    for path in sorted(sessions_root.rglob(f"*{thread_id}*")):
+        if not path.is_file():
+            continue
+        target = codex_home / "sessions" / path.relative_to(sessions_root)
+        if target.exists():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(str(path), str(target))
+        copied += 1
+    return copied
+
+
+def _default_head_persona_brief(group_id: str) -> dict:
+    normalized_group = str(group_id or "group").strip() or "group"
+    return {
+        "persona_id": f"persona-{normalized_group}-head",
+        "tone": "authoritative",
+        "aggression": "unrestricted-confrontation",
+        "pride_statement": (
+            f"I represent {normalized_group} and defend domain standards with uncompromising rigor."
+        ),
+        "domain_doctrine": [
+            "Decompose the objective into explicit technical sub-problems before deciding.",
+            "Promote only claims whose evidence, assumptions, and limits are visible.",
+            "Challenge weak evidence directly and refuse cosmetic certainty.",
+        ],
+        "challenge_style": "Confront weak assumptions directly and demand stronger support.",
+        "visibility": "moderate",
+        "confidence_threshold": 0.8,
+        "override_policy": "head-meeting-only",
+    }
+
+
+def _resolve_head_persona_brief(*, dispatch: dict, execution_mode: str, group_id: str) -> dict:
+    if execution_mode == "light":
+        task_brief = dispatch.get("head_task_brief", {})
+        if not isinstance(task_brief, dict):
             task_brief = {}
         raw = task_brief.get("head_persona", {})
     else:
@@ -2088,6 +2538,76 @@ def _resolve_head_expert_profile(*, dispatch: dict, execution_mode: str, group_i
     return resolved
 
 
+def _head_specialist_summaries(phase_outputs: Dict[str, SpecialistResult]) -> List[dict]:
+    input_rows: List[dict] = []
+    for specialist_id, output in sorted(phase_outputs.items())[:HEAD_PROMPT_MAX_SPECIALISTS]:
+        handoff_path = Path(output.handoff_path)
+        status = ""
+        dependencies_satisfied: Optional[bool] = None
+        citation_count = 0
+        has_web_url = False
+        claim_preview_rows: List[dict] = []
+        artifact_preview: List[str] = []
+        if handoff_path.exists():
+            try:
+                payload = json.loads(handoff_path.read_text(encoding="utf-8"))
+                status = str(payload.get("status") or payload.get("execution_status") or "").strip()
+                deps_value = payload.get("dependencies_satisfied")
+                if isinstance(deps_value, bool):
+                    dependencies_satisfied = deps_value
+                summary = payload.get("citations_summary")
+                if isinstance(summary, dict):
+                    try:
+                        citation_count = int(summary.get("count") or 0)
+                    except Exception:
+                        citation_count = 0
+                    has_web_url = bool(summary.get("has_web_url"))
+
+                claims = payload.get("claims")
+                if not isinstance(claims, list):
+                    claims = payload.get("claims_with_citations", [])
+                if isinstance(claims, list):
+                    for claim in claims[:HEAD_PROMPT_MAX_CLAIMS_PER_SPECIALIST]:
+                        if not isinstance(claim, dict):
+                            continue
+                        claim_text = str(claim.get("claim") or claim.get("text") or "").strip()
+                        evidence_ids = claim.get("evidence_ids")
+                        if not isinstance(evidence_ids, list):
+                            evidence_ids = []
+                        preview_ids = [str(item).strip() for item in evidence_ids if str(item).strip()][:3]
+                        if claim_text or preview_ids:
+                            claim_preview_rows.append(
+                                {
+                                    "claim": claim_text[:HEAD_PROMPT_CLAIM_PREVIEW_CHARS],
+                                    "evidence_ids": preview_ids,
+                                }
+                            )
+
+                artifact_rows = payload.get("produced_artifacts")
+                if not isinstance(artifact_rows, list):
+                    artifact_rows = payload.get("artifact_paths")
+                if isinstance(artifact_rows, list):
+                    for item in artifact_rows[:HEAD_PROMPT_MAX_ARTIFACTS_PER_SPECIALIST]:
+                        text = str(item).strip()
+                        if text:
+                            artifact_preview.append(text)
+            except Exception:
+                status = ""
+        input_rows.append(
+            {
+                "specialist_id": specialist_id,
+                "status": status or "UNKNOWN",
+                "dependencies_satisfied": dependencies_satisfied,
+                "citation_count": citation_count,
+                "has_web_url": has_web_url,
+                "claims": claim_preview_rows,
+                "produced_artifacts": artifact_preview,
+                "handoff_path": str(handoff_path),
+            }
+        )
+    return input_rows
+
+
 def _build_head_prompt(
     *,
     objective: str,
@@ -2191,72 +2711,7 @@ def _build_head_prompt(
             "END_HANDOFF_JSON\n"
         )
 
-    input_rows: List[dict] = []
-    for specialist_id, output in sorted(phase_outputs.items())[:HEAD_PROMPT_MAX_SPECIALISTS]:
-        handoff_path = Path(output.handoff_path)
-        status = ""
-        dependencies_satisfied: Optional[bool] = None
-        citation_count = 0
-        has_web_url = False
-        claim_preview_rows: List[dict] = []
-        artifact_preview: List[str] = []
-        if handoff_path.exists():
-            try:
-                payload = json.loads(handoff_path.read_text(encoding="utf-8"))
-                status = str(payload.get("status") or payload.get("execution_status") or "").strip()
-                deps_value = payload.get("dependencies_satisfied")
-                if isinstance(deps_value, bool):
-                    dependencies_satisfied = deps_value
-                summary = payload.get("citations_summary")
-                if isinstance(summary, dict):
-                    try:
-                        citation_count = int(summary.get("count") or 0)
-                    except Exception:
-                        citation_count = 0
-                    has_web_url = bool(summary.get("has_web_url"))
-
-                claims = payload.get("claims")
-                if not isinstance(claims, list):
-                    claims = payload.get("claims_with_citations", [])
-                if isinstance(claims, list):
-                    for claim in claims[:HEAD_PROMPT_MAX_CLAIMS_PER_SPECIALIST]:
-                        if not isinstance(claim, dict):
-                            continue
-                        claim_text = str(claim.get("claim") or claim.get("text") or "").strip()
-                        evidence_ids = claim.get("evidence_ids")
-                        if not isinstance(evidence_ids, list):
-                            evidence_ids = []
-                        preview_ids = [str(item).strip() for item in evidence_ids if str(item).strip()][:3]
-                        if claim_text or preview_ids:
-                            claim_preview_rows.append(
-                                {
-                                    "claim": claim_text[:HEAD_PROMPT_CLAIM_PREVIEW_CHARS],
-                                    "evidence_ids": preview_ids,
-                                }
-                            )
-
-                artifact_rows = payload.get("produced_artifacts")
-                if not isinstance(artifact_rows, list):
-                    artifact_rows = payload.get("artifact_paths")
-                if isinstance(artifact_rows, list):
-                    for item in artifact_rows[:HEAD_PROMPT_MAX_ARTIFACTS_PER_SPECIALIST]:
-                        text = str(item).strip()
-                        if text:
-                            artifact_preview.append(text)
-            except Exception:
-                status = ""
-        input_rows.append(
-            {
-                "specialist_id": specialist_id,
-                "status": status or "UNKNOWN",
-                "dependencies_satisfied": dependencies_satisfied,
-                "citation_count": citation_count,
-                "has_web_url": has_web_url,
-                "claims": claim_preview_rows,
-                "produced_artifacts": artifact_preview,
-                "handoff_path": str(handoff_path),
-            }
-        )
+    input_rows = _head_specialist_summaries(phase_outputs)
 
     return activation + (
         "You are the group head agent in a layered multi-agent runtime. "
@@ -2323,6 +2778,24 @@ def _resolve_head_timeout_sec(timeout_sec: int) -> int:
     return min(HEAD_MAX_TIMEOUT_SEC, bounded)
 
 
+def _resolve_agent_skills(
+    config: LayeredRuntimeConfig, allowed_skill_names: List[str]
+) -> Tuple[List[str], List[str]]:
+    """Split allowed skills into those installed in the project CODEX_HOME and the missing."""
+    source_skills_local = config.project_root / ".agents-inc" / "codex-home" / "skills" / "local"
+    visible: List[str] = []
+    missing: List[str] = []
+    for skill_name in allowed_skill_names:
+        normalized = str(skill_name).strip()
+        if not normalized or normalized in visible or normalized in missing:
+            continue
+        if (source_skills_local / normalized).exists():
+            visible.append(normalized)
+        else:
+            missing.append(normalized)
+    return visible, missing
+
+
 def _prepare_agent_codex_home(
     *,
     config: LayeredRuntimeConfig,
@@ -2332,54 +2805,51 @@ def _prepare_agent_codex_home(
 ) -> Tuple[Path, List[str], List[str], Dict[str, object]]:
     source_home = config.project_root / ".agents-inc" / "codex-home"
     source_skills_local = source_home / "skills" / "local"
+    references_source = config.project_dir / "agent-groups" / group_id / "references"
+    mount_references = references_source.exists()
 
-    agent_home = runtime_dir / "codex-home"
-    _remove_path(agent_home)
-    (agent_home / "skills" / "local").mkdir(parents=True, exist_ok=True)
-
+    entries: List[Tuple[str, Path]] = []
     for name in ["auth.json", "config.toml"]:
         src = source_home / name
-        dst = agent_home / name
         if src.exists():
-            _symlink_or_copy(src, dst)
-
-    visible: List[str] = []
-    missing: List[str] = []
-
-    deduped_allowed: List[str] = []
-    for skill_name in allowed_skill_names:
-        normalized = str(skill_name).strip()
-        if not normalized or normalized in deduped_allowed:
-            continue
-        deduped_allowed.append(normalized)
+            entries.append((name, src))
+
+    visible, missing = _resolve_agent_skills(config, allowed_skill_names)
+    for skill_name in visible:
+        # Overlay the skill entry by entry so the group's references can be mounted
+        # without writing into the shared project skill directory.
+        for child in sorted((source_skills_local / skill_name).iterdir()):
+            if mount_references and child.name == "references":
+                continue
+            entries.append((f"skills/local/{skill_name}/{child.name}", child))
+        if mount_references:
+            entries.append((f"skills/local/{skill_name}/references", references_source))
 
-    for skill_name in deduped_allowed:
-        src = source_skills_local / skill_name
-        dst = agent_home / "skills" / "local" / skill_name
-        if src.exists():
-            _symlink_or_copy(src, dst)
-            visible.append(skill_name)
-        else:
-            missing.append(skill_name)
+    template_root = config.project_root / ".agents-inc" / "codex-home-templates"
+    template = ensure_agent_home_template(template_root, entries)
+    agent_home = runtime_dir / "codex-home"
+    try:
+        home_counts = instantiate_agent_home(template, agent_home)
+    except OSError:
+        # The template was superseded mid-instantiation; rebuild against current sources.
+        template = ensure_agent_home_template(template_root, entries)
+        home_counts = instantiate_agent_home(template, agent_home)
+    (agent_home / "skills" / "local").mkdir(parents=True, exist_ok=True)
 
-    references_source = config.project_dir / "agent-groups" / group_id / "references"
     mount_errors: List[str] = []
     mounted_count = 0
     mount_mode = "none"
-
-    if references_source.exists():
+    if mount_references:
         if visible:
             mount_mode = "symlink"
             for skill_name in visible:
-                skill_dir = agent_home / "skills" / "local" / skill_name
-                references_target = skill_dir / "references"
-                try:
-                    _symlink_or_copy(references_source, references_target)
-                except Exception as exc:  # noqa: BLE001
-                    mount_errors.append(f"{skill_name}: {exc}")
+                rel = f"skills/local/{skill_name}/references"
+                status = template.modes.get(rel)
+                if status == "error":
+                    mount_errors.append(f"{skill_name}: {template.errors.get(rel, '')}")
                     continue
                 mounted_count += 1
-                if not references_target.is_symlink():
+                if status == "copy":
                     mount_mode = "copy"
         else:
             mount_mode = "no-visible-skills"
@@ -2388,38 +2858,19 @@ def _prepare_agent_codex_home(
 
     mount_status = {
         "references_source": str(references_source),
-        "references_available": bool(references_source.exists()),
+        "references_available": bool(mount_references),
         "mounted_skill_count": mounted_count,
         "visible_skill_count": len(visible),
         "mode": mount_mode,
         "errors": mount_errors,
+        "home_template": template.key,
+        "home_entries_reused": home_counts["kept"],
+        "home_entries_linked": home_counts["created"],
     }
 
     return agent_home, visible, missing, mount_status
 
 
-def _remove_path(path: Path) -> None:
-    if not path.exists() and not path.is_symlink():
-        return
-    if path.is_file() or path.is_symlink():
-        path.unlink()
-        return
-    shutil.rmtree(path)
-
-
-def _symlink_or_copy(src: Path, dst: Path) -> None:
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    if dst.exists() or dst.is_symlink():
-        _remove_path(dst)
-    try:
-        dst.symlink_to(src)
-    except Exception:
-        if src.is_file():
-            shutil.copy2(src, dst)
-        else:
-            shutil.copytree(src, dst)
-
-
 def _archive_escalation_files(*, work_dir: Path, archive_dir: Path) -> Dict[str, str]:
     request_path = work_dir / ESCALATION_REQUEST_FILE
     response_path = work_dir / ESCALATION_RESPONSE_FILE
@@ -2462,6 +2913,186 @@ def _write_specialist_snapshot(
     }
 
 
+def _digest_path(path: Path) -> str:
+    if path.is_file():
+        digest = hashlib.sha256()
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 16), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    if path.is_dir():
+        digest = hashlib.sha256()
+        for child in sorted(item for item in path.rglob("*") if item.is_file()):
+            digest.update(str(child.relative_to(path)).encode("utf-8", errors="replace"))
+            digest.update(_digest_path(child).encode("ascii"))
+        return digest.hexdigest()
+    return "missing"
+
+
+def _specialist_memo_key(
+    *,
+    config: LayeredRuntimeConfig,
+    backend: str,
+    role: str,
+    prompt: str,
+    web_search_enabled: bool,
+    input_paths: List[str],
+    skill_names: List[str],
+) -> str:
+    """Hash every input of a specialist run: prompt, input files, skills and model settings."""
+    skills_root = config.project_root / ".agents-inc" / "codex-home" / "skills" / "local"
+    payload = {
+        "schema_version": SPECIALIST_MEMO_SCHEMA_VERSION,
+        "backend": backend,
+        "role": role,
+        "prompt": prompt,
+        "model": config.specialist_model,
+        "reasoning_effort": config.specialist_reasoning_effort or "",
+        "web_search": bool(web_search_enabled),
+        "execution_mode": config.execution_mode,
+        "inputs": {path: _digest_path(Path(path)) for path in input_paths},
+        "skills": {name: _digest_path(skills_root / name) for name in skill_names},
+    }
+    return hashlib.sha256(stable_json(payload).encode("utf-8", errors="replace")).hexdigest()
+
+
+def _load_specialist_memo(specialist_root: Path, key: str) -> Optional[dict]:
+    path = specialist_root / SPECIALIST_MEMO_NAME
+    if not path.exists():
+        return None
+    try:
+        memo = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    if not isinstance(memo, dict) or str(memo.get("key") or "") != key:
+        return None
+    work_snapshot = Path(str(memo.get("snapshot_work_path") or ""))
+    handoff_snapshot = Path(str(memo.get("snapshot_handoff_path") or ""))
+    if not work_snapshot.is_file() or not handoff_snapshot.is_file():
+        return None
+    try:
+        handoff_payload = json.loads(handoff_snapshot.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    if not isinstance(handoff_payload, dict):
+        return None
+    memo["work_text"] = work_snapshot.read_text(encoding="utf-8")
+    memo["handoff_payload"] = handoff_payload
+    return memo
+
+
+def _write_specialist_memo(
+    specialist_root: Path,
+    *,
+    key: str,
+    config: LayeredRuntimeConfig,
+    snapshot_paths: Dict[str, str],
+) -> None:
+    payload = {
+        "schema_version": SPECIALIST_MEMO_SCHEMA_VERSION,
+        "key": key,
+        "recorded_at": now_iso(),
+        "turn_dir": str(config.turn_dir),
+        "cycle": int(config.cycle_id),
+    }
+    payload.update(snapshot_paths)
+    write_text(
+        specialist_root / SPECIALIST_MEMO_NAME,
+        json.dumps(payload, indent=2, sort_keys=True) + "\n",
+    )
+
+
+def _reuse_specialist_memo(
+    *,
+    config: LayeredRuntimeConfig,
+    group_id: str,
+    specialist_id: str,
+    role: str,
+    memo: dict,
+    specialist_sessions: Dict[str, dict],
+    layer4_dir: Path,
+    ledger_rows: List[dict],
+    work_path: Path,
+    handoff_path: Path,
+) -> SpecialistResult:
+    """Publish a memoized snapshot as this cycle's specialist output without running the agent."""
+    work_text = str(memo.get("work_text") or "")
+    handoff_payload = dict(memo.get("handoff_payload") or {})
+    session = specialist_sessions[group_id][specialist_id]
+    session["status"] = "RUNNING"
+    session["attempts"] = 0
+    session["started_at"] = now_iso()
+
+    write_text(work_path, work_text.rstrip() + "\n")
+    write_text(handoff_path, json.dumps(handoff_payload, indent=2, sort_keys=True) + "\n")
+    _persist_payload_evidence_cache(
+        project_root=config.project_root,
+        payload=handoff_payload,
+    )
+    reused_from = str(memo.get("snapshot_meta_path") or "")
+    snapshot_paths = _write_specialist_snapshot(
+        snapshot_root=layer4_dir / "specialists" / group_id / specialist_id,
+        work_text=work_text,
+        handoff_payload=handoff_payload,
+        meta_payload={
+            "schema_version": "1.0",
+            "generated_at": now_iso(),
+            "project_id": config.project_id,
+            "group_id": group_id,
+            "specialist_id": specialist_id,
+            "role": role,
+            "attempt": 0,
+            "success": True,
+            "error": "",
+            "reused": True,
+            "reused_from": reused_from,
+            "memo_key": str(memo.get("key") or ""),
+        },
+    )
+    session.update(snapshot_paths)
+    session["status"] = "COMPLETE"
+    session["finished_at"] = now_iso()
+    session["error"] = ""
+    session["reused_from"] = reused_from
+    ledger_rows.append(
+        {
+            "ts": now_iso(),
+            "event": "specialist_reused",
+            "group_id": group_id,
+            "specialist_id": specialist_id,
+            "memo_key": str(memo.get("key") or ""),
+            "reused_from": reused_from,
+        }
+    )
+    _emit_progress(
+        config,
+        {
+            "event": "runtime_specialist_reused",
+            "project_id": config.project_id,
+            "cycle": int(config.cycle_id),
+            "group_id": group_id,
+            "specialist_id": specialist_id,
+        },
+    )
+    return SpecialistResult(
+        success=True,
+        group_id=group_id,
+        specialist_id=specialist_id,
+        role=role,
+        attempt=0,
+        work_path=str(work_path),
+        handoff_path=str(handoff_path),
+        raw_log_path="",
+        redacted_log_path="",
+        codex_home="",
+        visible_skills=[],
+        mount_status={},
+        timed_out=False,
+        error="",
+        escalation_request=None,
+    )
+
+
 def _collect_specialist_payloads(phase_outputs: Dict[str, SpecialistResult]) -> List[dict]:
     payloads: List[dict] = []
     for specialist_id, result in sorted(phase_outputs.items()):
@@ -2716,7 +3347,8 @@ def _hydrate_evidence_refs_from_cache(*, project_root: Path, payload: dict) -> d
     }
     needed_ids = [item for item in _collect_claim_evidence_ids(claims) if item not in existing_ids]
     if needed_ids:
-        cached = resolve_evidence_ids(project_root, needed_ids)
+        # Served from memory: pending refs from this cycle plus the loaded cache index.
+        cached = evidence_cache_buffer(project_root).resolve(needed_ids)
         for evidence_id in needed_ids:
             row = cached.get(evidence_id)
             if not isinstance(row, dict):
@@ -2799,24 +3431,44 @@ def _apply_evidence_auto_heal(*, project_root: Path, payload: dict) -> dict:
 def _persist_payload_evidence_cache(*, project_root: Path, payload: dict) -> None:
     refs = _normalized_evidence_refs(payload)
     if refs:
-        merge_evidence_refs_into_cache(project_root=project_root, evidence_refs=refs)
+        # Buffered per cycle; _persist_turn_evidence_cache writes them in one flush.
+        evidence_cache_buffer(project_root).add(refs)
 
 
-def _is_retryable_specialist_failure(result: object) -> bool:
-    # Runtime failure retries should target transient failures only.
-    error_text = str(getattr(result, "error", "") or "").strip().lower()
-    return_code = int(getattr(result, "return_code", 0) or 0)
-    if return_code == 124 or "timeout" in error_text:
-        return True
-    if return_code != 0:
-        return True
-    parse_markers = (
-        "missing begin_work/end_work block",
-        "missing begin_handoff_json/end_handoff_json block",
-        "invalid handoff json",
-        "handoff payload must be json object",
+def _default_retry_scheduler(config: LayeredRuntimeConfig) -> RetryScheduler:
+    return RetryScheduler(
+        resolve_retry_policies(config.retry_backoff_sec, config.retry_policies),
+        retry_attempts=config.retry_attempts,
+        abort_check=lambda: _abort_requested(config),
     )
-    return any(marker in error_text for marker in parse_markers)
+
+
+def _record_retry_stats(retries: RetryScheduler, orchestrator_plan: dict, layer2_dir: Path) -> dict:
+    """Add the turn's retry counters to the plan settings and the enclosing trace span."""
+    stats = retries.stats()
+    orchestrator_plan["settings"]["retry_stats"] = stats
+    write_text(layer2_dir / "orchestrator-plan.json", stable_json(orchestrator_plan) + "\n")
+    by_class = stats.get("by_class") or {}
+    current_span().set(
+        retries_scheduled=stats["scheduled"],
+        retries_aborted=stats["aborted"],
+        retry_delay_sec=stats["total_delay_sec"],
+        **{f"retries_{failure_class}": count for failure_class, count in by_class.items()},
+    )
+    return stats
+
+
+def _wait_for_retry(
+    retries: RetryScheduler, delay_sec: float, attempt_span: Span | NullSpan
+) -> bool:
+    """Close the failed attempt's span and trace the backoff on its own."""
+    attempt_span.end()
+    with trace_span("retry_wait", category="retry", delay_sec=round(delay_sec, 3)):
+        return retries.wait(delay_sec)
+
+
+def _retry_slot_priority(priority: Tuple[int, ...], attempt: int) -> Tuple[int, ...]:
+    return tuple(priority[:1]) + (max(0, int(attempt) - 1),) + tuple(priority[1:])
 
 
 def _compact_prompt_list(values: List[str], *, limit: int = 5) -> List[str]:
@@ -3171,10 +3823,17 @@ def _resolve_required_reference_paths(
 def _resolve_dependency_artifact_paths(
     *, project_dir: Path, group_id: str, dependencies: object
 ) -> List[str]:
+    """Absolute paths of the upstream artifacts a task reads.
+
+    Accepts the dispatch ``dependency_checks`` entries or plain ``depends_on`` ids; a bare
+    id stands for that specialist's ``internal/<id>/handoff.json``.
+    """
     rows = dependencies if isinstance(dependencies, list) else []
     group_root = project_dir / "agent-groups" / group_id
     out: List[str] = []
     for dep in rows:
+        if isinstance(dep, str) and dep.strip():
+            dep = {"required_artifacts": [f"internal/{dep.strip()}/handoff.json"]}
         if not isinstance(dep, dict):
             continue
         artifacts = dep.get("required_artifacts")
@@ -3230,8 +3889,10 @@ def _persist_turn_evidence_cache(
                 seen.add(evidence_id)
                 refs.append(row)
 
+    buffer = evidence_cache_buffer(config.project_root)
     if refs:
-        merge_evidence_refs_into_cache(project_root=config.project_root, evidence_refs=refs)
+        buffer.add(refs)
+    buffer.flush()
 
 
 def _timeout_mode(timeout_sec: int) -> str:
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 import sys
 from typing import Deque, Dict, Iterable, List, Optional
 
+from agents_inc.core.progress_bus import DEFAULT_MAX_RENDER_HZ, ProgressEventBus
+
 try:
     from rich.console import Group
     from rich.live import Live
@@ -32,11 +34,13 @@ class _GroupPaneState:
 
 
 class LiveDashboard(AbstractContextManager):
-    def __init__(self, *, screen: bool = True):
+    def __init__(self, *, screen: bool = True, max_render_hz: float = DEFAULT_MAX_RENDER_HZ):
         if not _RICH_AVAILABLE:
             raise RuntimeError("rich is not available")
         self._screen = bool(screen)
+        self._max_render_hz = float(max_render_hz)
         self._live: Live | None = None
+        self._bus: ProgressEventBus | None = None
         self._reset_state()
 
     def _reset_state(self) -> None:
@@ -49,6 +53,7 @@ class LiveDashboard(AbstractContextManager):
         self._blocked_status = ""
         self._meeting_lines: Deque[str] = deque(maxlen=14)
         self._groups: Dict[str, _GroupPaneState] = {}
+        self._last_event_stats: Dict[str, int] = {}
 
     def __enter__(self) -> "LiveDashboard":
         self.start()
@@ -66,8 +71,19 @@ class LiveDashboard(AbstractContextManager):
             return
         self._live = Live(self._render(), refresh_per_second=8, screen=self._screen, transient=True)
         self._live.start()
+        # Producers run on agent worker threads; rendering happens on the bus thread.
+        self._bus = ProgressEventBus(
+            self._apply_event,
+            render=self._refresh,
+            max_render_hz=self._max_render_hz,
+        )
+        self._bus.start()
 
     def stop(self) -> None:
+        if self._bus is not None:
+            self._bus.close()
+            self._last_event_stats = self._bus.stats()
+            self._bus = None
         if self._live is None:
             return
         live = self._live
@@ -87,6 +103,23 @@ class LiveDashboard(AbstractContextManager):
         self._live = None
 
     def handle_event(self, event: dict) -> None:
+        """Queue ``event`` for the render thread, or apply it inline when not live."""
+        bus = self._bus
+        if bus is not None:
+            bus.publish(event)
+            return
+        self._apply_event(event)
+        self._refresh()
+
+    def event_stats(self) -> Dict[str, int]:
+        bus = self._bus
+        return bus.stats() if bus is not None else dict(self._last_event_stats)
+
+    def _refresh(self) -> None:
+        if self._live is not None:
+            self._live.update(self._render(), refresh=True)
+
+    def _apply_event(self, event: dict) -> None:
         kind = str(event.get("event") or "").strip().lower()
         if not kind:
             return
@@ -106,6 +139,10 @@ class LiveDashboard(AbstractContextManager):
             state = self._group_state(str(event.get("group_id") or "unknown"))
             state.status = "running"
             self._append_group_line(state, "session dispatched")
+        elif kind == "runtime_group_carried":
+            state = self._group_state(str(event.get("group_id") or "unknown"))
+            state.status = "carried"
+            self._append_group_line(state, "unchanged, carried forward")
         elif kind == "runtime_group_waiting":
             state = self._group_state(str(event.get("group_id") or "unknown"))
             state.status = "waiting"
@@ -146,9 +183,6 @@ class LiveDashboard(AbstractContextManager):
             cycles = int(event.get("cycles_executed", 0) or 0)
             self._append_meeting_line(f"turn completed after {cycles} cycle(s)")
 
-        if self._live is not None:
-            self._live.update(self._render(), refresh=True)
-
     def _ensure_groups(self, groups: Iterable[object]) -> None:
         for raw in groups:
             group_id = str(raw or "").strip()
@@ -209,6 +243,9 @@ class LiveDashboard(AbstractContextManager):
         ]
         if self._blocked_status:
             rows.append(f"blocked_status={self._blocked_status}")
+        stats = self.event_stats()
+        if stats.get("dropped") or stats.get("merged"):
+            rows.append(f"events dropped={stats.get('dropped', 0)} merged={stats.get('merged', 0)}")
         return "  |  ".join(rows)
 
     def _render_group_grid(self):
@@ -251,7 +288,7 @@ class LiveDashboard(AbstractContextManager):
     @staticmethod
     def _border_style_for_status(status: str) -> str:
         normalized = str(status or "pending").strip().lower()
-        if normalized in {"complete", "complete_with_warnings"}:
+        if normalized in {"complete", "complete_with_warnings", "carried"}:
             return "green"
         if normalized in {"blocked", "failed"}:
             return "red"
@@ -1,4 +1,8 @@
-from agents_inc.core.orchestration.cycle_engine import build_cycle_summary
+from agents_inc.core.orchestration.cycle_engine import (
+    build_cycle_summary,
+    exposed_output_digests,
+    select_dirty_groups,
+)
 from agents_inc.core.orchestration.meeting import build_negotiation_monitor
 from agents_inc.core.orchestration.report import render_blocked_report, render_key_points
 from agents_inc.core.orchestration.turn_router import (
@@ -9,8 +13,10 @@ from agents_inc.core.orchestration.turn_router import (
 __all__ = [
     "build_cycle_summary",
     "build_negotiation_monitor",
+    "exposed_output_digests",
     "render_blocked_report",
     "render_key_points",
     "resolve_primary_group",
+    "select_dirty_groups",
     "selected_groups_from_manifest",
 ]
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from typing import Dict
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from agents_inc.core.fabric_lib import stable_json
+
+EXPOSED_OUTPUT_FILES = ("handoff.json", "summary.md", "INTEGRATION_NOTES.md")
 
 
 def build_cycle_summary(
@@ -13,11 +20,13 @@ def build_cycle_summary(
     cycle_timeouts: list,
     cycle_escalations: list,
     latest_artifacts: Dict[str, str],
+    carried_groups: Sequence[str] = (),
 ) -> dict:
     return {
         "cycle_id": cycle_id,
         "runtime_blocked": bool(runtime_result.get("blocked")),
         "blocked_groups": runtime_result.get("blocked_groups", []),
+        "carried_groups": sorted(carried_groups),
         "objectives_hash": objectives_hash,
         "agent_timeout_sec": agent_timeout_sec,
         "agent_timeout_mode": agent_timeout_mode,
@@ -25,3 +34,68 @@ def build_cycle_summary(
         "escalation_count": len(cycle_escalations),
         "latest_artifacts": latest_artifacts,
     }
+
+
+def exposed_output_digests(project_dir: Path, groups: Sequence[str]) -> Dict[str, str]:
+    """Content digest of each group's exposed files; "" when nothing is published.
+
+    The handoff's ``updated_at`` stamp is ignored so a re-run that publishes the
+    same content does not mark downstream groups dirty.
+    """
+    out: Dict[str, str] = {}
+    for group_id in groups:
+        exposed = project_dir / "agent-groups" / group_id / "exposed"
+        digest = hashlib.sha256()
+        found = False
+        for name in EXPOSED_OUTPUT_FILES:
+            path = exposed / name
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            found = True
+            if name == "handoff.json":
+                data = _stable_handoff_bytes(data)
+            digest.update(name.encode("utf-8") + b"\0" + data + b"\0")
+        out[group_id] = digest.hexdigest() if found else ""
+    return out
+
+
+def _stable_handoff_bytes(data: bytes) -> bytes:
+    try:
+        payload = json.loads(data.decode("utf-8", errors="replace"))
+    except ValueError:
+        return data
+    if not isinstance(payload, dict):
+        return data
+    payload.pop("updated_at", None)
+    return stable_json(payload).encode("utf-8")
+
+
+def select_dirty_groups(
+    *,
+    selected_groups: Sequence[str],
+    unsatisfied_groups: Sequence[str],
+    objectives: Dict[str, str],
+    refined_objectives: Dict[str, str],
+    handoff_edges: Sequence[Tuple[str, str]],
+    changed_outputs: Sequence[str],
+) -> List[str]:
+    """Groups the next cycle must re-run, in ``selected_groups`` order.
+
+    A group is dirty when the meeting left it unsatisfied, its refined objective
+    differs from the one it just ran, or a producer on one of its incoming
+    handoff edges published different exposed output this cycle.
+    """
+    unsatisfied = set(unsatisfied_groups)
+    changed = set(changed_outputs)
+    dirty: List[str] = []
+    for group_id in selected_groups:
+        reasons = (
+            group_id in unsatisfied,
+            str(objectives.get(group_id) or "") != str(refined_objectives.get(group_id) or ""),
+            any(dst == group_id and src in changed for src, dst in handoff_edges),
+        )
+        if any(reasons):
+            dirty.append(group_id)
+    return dirty
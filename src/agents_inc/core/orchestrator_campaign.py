@@ -12,8 +12,8 @@ from typing import Optional
 
 from agents_inc.core.fabric_lib import (
     FabricError,
+    check_group_catalog,
     dump_yaml,
-    ensure_group_shape,
     load_group_catalog,
     load_yaml,
     now_iso,
@@ -192,12 +192,7 @@ def _recommended_groups(task: str, output_target: str) -> list[str]:
 
 
 def _validate_group_contracts(fabric_root: Path) -> None:
-    groups = load_group_catalog(fabric_root)
-    failures: list[str] = []
-    for group_id, group in groups.items():
-        errors = ensure_group_shape(group, source=f"catalog/groups/{group_id}.yaml")
-        if errors:
-            failures.extend(errors)
+    _, failures = check_group_catalog(fabric_root)
     if failures:
         raise FabricError("group contract validation failed:\n- " + "\n- ".join(failures))
 
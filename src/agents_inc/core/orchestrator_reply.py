@@ -7,11 +7,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
+from agents_inc.core.exposed_state import exposed_state_snapshot
 from agents_inc.core.fabric_lib import (
     FabricError,
     build_dispatch_plan,
     execution_mode_from_manifest,
-    load_yaml,
+    open_catalog_cache,
     slugify,
     stable_json,
     write_text,
@@ -28,7 +29,11 @@ from agents_inc.core.model_profiles import (
 )
 from agents_inc.core.negotiation_monitor import NegotiationCycleRecord
 from agents_inc.core.orchestration import report as orchestration_report
-from agents_inc.core.orchestration.cycle_engine import build_cycle_summary
+from agents_inc.core.orchestration.cycle_engine import (
+    build_cycle_summary,
+    exposed_output_digests,
+    select_dirty_groups,
+)
 from agents_inc.core.orchestration.meeting import build_negotiation_monitor
 from agents_inc.core.orchestration.turn_router import (
     resolve_primary_group as resolve_primary_group_router,
@@ -53,8 +58,11 @@ from agents_inc.core.session_state import (
     resolve_state_project_root,
     write_checkpoint,
 )
+from agents_inc.core.token_ledger import record_turn_token_usage
 from agents_inc.core.token_usage import write_turn_token_usage_report
+from agents_inc.core.tracing import NULL_SPAN, Span, Tracer, activate_tracer, trace_span
 from agents_inc.core.util.edges import resolve_handoff_edges
+from agents_inc.core.util.similarity import NearDuplicateIndex
 
 OBJECTIVE_COVERAGE_THRESHOLD = 0.8
 OBJECTIVE_RESPONSE_STATUS_VALUES = {"ANSWERED", "PARTIAL", "BLOCKED"}
@@ -91,6 +99,10 @@ class OrchestratorReplyConfig:
     resume_from_cycle: int = 0
     resume_group_objectives: Dict[str, str] | None = None
     resume_previous_cycle_summaries: List[dict] | None = None
+    reuse_unchanged_specialists: bool = True
+    continue_agent_threads: bool = False
+    incremental_cycles: bool = True
+    retry_policies: Dict[str, dict] | None = None
 
 
 def _turn_id() -> str:
@@ -102,7 +114,8 @@ def _load_project_bundle(config: OrchestratorReplyConfig) -> Tuple[Path, Path, d
     manifest_path = project_dir / "manifest.yaml"
     if not manifest_path.exists():
         raise FabricError(f"project manifest not found: {manifest_path}")
-    manifest = load_yaml(manifest_path)
+    with open_catalog_cache(config.fabric_root) as cache:
+        manifest = cache.load_yaml(manifest_path)
     if not isinstance(manifest, dict):
         raise FabricError(f"invalid project manifest: {manifest_path}")
     project_root = resolve_state_project_root(config.fabric_root, config.project_id)
@@ -131,23 +144,26 @@ def _selected_groups(manifest: dict) -> List[str]:
     return groups
 
 
-def _load_group_manifests(project_dir: Path, manifest: dict, groups: List[str]) -> Dict[str, dict]:
+def _load_group_manifests(
+    fabric_root: Path, project_dir: Path, manifest: dict, groups: List[str]
+) -> Dict[str, dict]:
     out: Dict[str, dict] = {}
     group_entries = manifest.get("groups")
     if not isinstance(group_entries, dict):
         raise FabricError("project manifest missing groups map")
-    for group_id in groups:
-        payload = group_entries.get(group_id)
-        if not isinstance(payload, dict):
-            raise FabricError(f"group '{group_id}' missing from project manifest")
-        rel = str(payload.get("manifest_path") or "").strip()
-        if not rel:
-            raise FabricError(f"group '{group_id}' has empty manifest_path")
-        group_path = project_dir / rel
-        group_manifest = load_yaml(group_path)
-        if not isinstance(group_manifest, dict):
-            raise FabricError(f"invalid group manifest: {group_path}")
-        out[group_id] = group_manifest
+    with open_catalog_cache(fabric_root) as cache:
+        for group_id in groups:
+            payload = group_entries.get(group_id)
+            if not isinstance(payload, dict):
+                raise FabricError(f"group '{group_id}' missing from project manifest")
+            rel = str(payload.get("manifest_path") or "").strip()
+            if not rel:
+                raise FabricError(f"group '{group_id}' has empty manifest_path")
+            group_path = project_dir / rel
+            group_manifest = cache.load_yaml(group_path)
+            if not isinstance(group_manifest, dict):
+                raise FabricError(f"invalid group manifest: {group_path}")
+            out[group_id] = group_manifest
     return out
 
 
@@ -557,29 +573,6 @@ def _extract_evidence_rows(web_evidence: List[dict], min_urls: int = 8) -> List[
     return rows
 
 
-def _safe_read(path: Path) -> str:
-    if not path.exists():
-        return ""
-    return path.read_text(encoding="utf-8", errors="replace").strip()
-
-
-def _build_evidence_lookup(payload: dict) -> Dict[str, dict]:
-    refs = payload.get("evidence_refs")
-    if not isinstance(refs, list):
-        return {}
-    out: Dict[str, dict] = {}
-    for row in refs:
-        if not isinstance(row, dict):
-            continue
-        evidence_id = str(
-            row.get("evidence_id") or row.get("id") or row.get("key") or ""
-        ).strip()
-        if not evidence_id:
-            continue
-        out[evidence_id] = dict(row)
-    return out
-
-
 def _evidence_ids_from_claim(claim: dict) -> List[str]:
     rows = claim.get("evidence_ids")
     if not isinstance(rows, list):
@@ -818,47 +811,28 @@ def _fallback_objective_response(*, summary_text: str, claims: List[dict], group
 
 
 def _collect_group_contributions(project_dir: Path, groups: List[str], objective: str) -> List[dict]:
+    snapshot = exposed_state_snapshot(project_dir)
     rows: List[dict] = []
     for group_id in groups:
-        exposed_dir = project_dir / "agent-groups" / group_id / "exposed"
-        group_manifest_path = project_dir / "agent-groups" / group_id / "group.yaml"
-        summary_path = exposed_dir / "summary.md"
-        handoff_path = exposed_dir / "handoff.json"
-        notes_path = exposed_dir / "INTEGRATION_NOTES.md"
-
-        group_manifest = load_yaml(group_manifest_path) if group_manifest_path.exists() else {}
-        if not isinstance(group_manifest, dict):
-            group_manifest = {}
-        head_persona = group_manifest.get("head", {})
-        if isinstance(head_persona, dict):
-            head_persona = head_persona.get("persona", {})
-        else:
-            head_persona = {}
-        if not isinstance(head_persona, dict):
-            head_persona = {}
-        try:
-            persona_threshold = float(head_persona.get("confidence_threshold") or 0.8)
-        except Exception:
-            persona_threshold = 0.8
-        persona_threshold = max(0.0, min(1.0, persona_threshold))
-        persona_override_policy = str(head_persona.get("override_policy") or "head-meeting-only")
-
-        summary_text = _safe_read(summary_path)
-        notes_text = _safe_read(notes_path)
+        view = snapshot.group(group_id)
+        summary_path = view.summary_path
+        handoff_path = view.handoff_path
+        notes_path = view.notes_path
+        persona_threshold = view.persona_threshold
+        persona_override_policy = view.persona_override_policy
+
+        summary_text = view.summary_text.strip()
+        notes_text = view.notes_text.strip()
         reasons: List[str] = []
         structural_reasons: List[str] = []
-        handoff_payload: dict = {}
+        handoff_payload = view.handoff
 
-        if not handoff_path.exists():
+        if not view.handoff_exists:
             reasons.append("missing exposed/handoff.json")
             structural_reasons.append("missing exposed/handoff.json")
-        else:
-            loaded = load_yaml(handoff_path)
-            if not isinstance(loaded, dict):
-                reasons.append("exposed/handoff.json is not a mapping")
-                structural_reasons.append("exposed/handoff.json is not a mapping")
-            else:
-                handoff_payload = loaded
+        elif not view.handoff_is_mapping:
+            reasons.append("exposed/handoff.json is not a mapping")
+            structural_reasons.append("exposed/handoff.json is not a mapping")
 
         status = str(handoff_payload.get("status") or "").strip().upper()
         if status in {"", "PENDING"}:
@@ -873,15 +847,8 @@ def _collect_group_contributions(project_dir: Path, groups: List[str], objective
                 if preview and preview not in artifact_preview:
                     artifact_preview.append(preview)
 
-        claims_payload = handoff_payload.get("claims")
-        if not isinstance(claims_payload, list):
-            claims_payload = handoff_payload.get("claims_with_citations")
-        claims: List[dict] = []
-        if isinstance(claims_payload, list):
-            for item in claims_payload:
-                if isinstance(item, dict):
-                    claims.append(item)
-        evidence_lookup = _build_evidence_lookup(handoff_payload)
+        claims = list(view.claims)
+        evidence_lookup = view.evidence_lookup
 
         citation_refs: List[str] = []
         claim_preview_rows: List[dict] = []
@@ -1531,17 +1498,6 @@ def _consensus_tokens(text: object) -> set[str]:
     return set(_objective_tokens(str(text or "")))
 
 
-def _token_jaccard(left: set[str], right: set[str]) -> float:
-    if not left and not right:
-        return 1.0
-    if not left or not right:
-        return 0.0
-    union = left | right
-    if not union:
-        return 0.0
-    return len(left & right) / len(union)
-
-
 def _split_signal_lines(text: str, *, limit: int = 6) -> List[str]:
     rows: List[str] = []
     for raw in re.split(r"[\r\n]+|(?<=[.!?])\s+", str(text or "").strip()):
@@ -1635,6 +1591,9 @@ def _extract_consensus_signals(contributions: List[dict]) -> List[dict]:
 
 def _cluster_consensus_signals(signals: List[dict]) -> List[dict]:
     clusters: List[dict] = []
+    # Cluster token sets are fixed at creation, so an inverted index finds the most
+    # similar cluster without scoring clusters that share no tokens.
+    index = NearDuplicateIndex()
     for signal in signals:
         if not isinstance(signal, dict):
             continue
@@ -1644,14 +1603,8 @@ def _cluster_consensus_signals(signals: List[dict]) -> List[dict]:
         text = str(signal.get("text") or "").strip()
         if not text:
             continue
-        best_index = -1
-        best_similarity = 0.0
-        for index, cluster in enumerate(clusters):
-            similarity = _token_jaccard(tokens, cluster.get("tokens", set()))
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_index = index
-        if best_index >= 0 and best_similarity >= CONSENSUS_CLUSTER_SIMILARITY:
+        best_index, _ = index.best_match(tokens, threshold=CONSENSUS_CLUSTER_SIMILARITY)
+        if best_index >= 0:
             cluster = clusters[best_index]
             rows = cluster.get("rows", [])
             if isinstance(rows, list):
@@ -1670,6 +1623,7 @@ def _cluster_consensus_signals(signals: List[dict]) -> List[dict]:
             if rep and len(text) < len(rep):
                 cluster["representative_text"] = text
         else:
+            index.add(tokens)
             clusters.append(
                 {
                     "representative_text": text,
@@ -2863,6 +2817,27 @@ def _append_ndjson(path: Path, payload: dict) -> None:
 
 
 def run_orchestrator_reply(config: OrchestratorReplyConfig) -> dict:
+    """Run one turn, writing ``trace.json`` and ``trace-summary.json`` to its turn dir.
+
+    The trace is written even when the turn is blocked, so a slow blocked turn
+    can be inspected in Perfetto like a completed one.
+    """
+    tracer = Tracer()
+    with activate_tracer(tracer):
+        turn_span = tracer.begin("turn", project_id=slugify(config.project_id))
+        trace_paths: Dict[str, str] = {}
+        try:
+            result = _run_orchestrator_reply(config, turn_span)
+        finally:
+            turn_span.end()
+            turn_dir = turn_span.attrs.get("turn_dir")
+            if turn_dir:
+                trace_paths = tracer.write(Path(str(turn_dir)), root=turn_span)
+    result.update(trace_paths)
+    return result
+
+
+def _run_orchestrator_reply(config: OrchestratorReplyConfig, turn_span: Span) -> dict:
     project_id = slugify(config.project_id)
     config = OrchestratorReplyConfig(
         fabric_root=config.fabric_root,
@@ -2914,6 +2889,10 @@ def run_orchestrator_reply(config: OrchestratorReplyConfig) -> dict:
             if isinstance(config.resume_previous_cycle_summaries, list)
             else None
         ),
+        reuse_unchanged_specialists=bool(config.reuse_unchanged_specialists),
+        continue_agent_threads=bool(config.continue_agent_threads),
+        incremental_cycles=bool(config.incremental_cycles),
+        retry_policies=dict(config.retry_policies or {}),
     )
     project_root, project_dir, manifest = _load_project_bundle(config)
     policy = ensure_response_policy(project_root)
@@ -2928,6 +2907,7 @@ def run_orchestrator_reply(config: OrchestratorReplyConfig) -> dict:
     )
 
     turn_dir = _turn_dir(project_root, config.output_dir)
+    turn_span.set(turn_dir=str(turn_dir))
     write_text(turn_dir / "request.txt", config.message.strip() + "\n")
 
     mode = classify_request_mode(config.message, policy)
@@ -2978,7 +2958,9 @@ def run_orchestrator_reply(config: OrchestratorReplyConfig) -> dict:
             "quality": quality,
         }
 
-    group_manifests = _load_group_manifests(project_dir, manifest, selected_groups)
+    group_manifests = _load_group_manifests(
+        config.fabric_root, project_dir, manifest, selected_groups
+    )
     delegation = _build_delegation_ledger(
         project_id=config.project_id,
         message=config.message,
@@ -3030,8 +3012,11 @@ def run_orchestrator_reply(config: OrchestratorReplyConfig) -> dict:
     timed_out_specialists: List[dict] = []
     unresolved_escalations: List[dict] = []
     latest_artifacts: Dict[str, str] = {}
+    carried_groups: List[str] = []
+    cycle_span = NULL_SPAN
 
     while True:
+        cycle_span.end()
         next_cycle = cycle + 1
         if config.max_cycles > 0 and next_cycle > config.max_cycles:
             block_status = "BLOCKED_MAX_CYCLES"
@@ -3040,6 +3025,7 @@ def run_orchestrator_reply(config: OrchestratorReplyConfig) -> dict:
             )
             break
         cycle = next_cycle
+        cycle_span = trace_span("cycle", cycle=cycle)
 
         _emit_progress(
             config,
@@ -3048,6 +3034,7 @@ def run_orchestrator_reply(config: OrchestratorReplyConfig) -> dict:
                 "project_id": config.project_id,
                 "cycle": cycle,
                 "selected_groups": selected_groups,
+                "carried_groups": carried_groups,
             },
         )
         cycle_dir = turn_dir / "cycles" / f"cycle-{cycle:04d}"
@@ -3068,34 +3055,42 @@ def run_orchestrator_reply(config: OrchestratorReplyConfig) -> dict:
             )
             + "\n",
         )
-        runtime_result = run_layered_runtime(
-            LayeredRuntimeConfig(
-                project_id=config.project_id,
-                project_root=project_root,
-                project_dir=project_dir,
-                turn_dir=cycle_dir,
-                message=config.message,
-                selected_groups=selected_groups,
-                group_manifests=group_manifests,
-                group_objectives=group_objectives,
-                max_parallel=config.max_parallel,
-                retry_attempts=config.retry_attempts,
-                retry_backoff_sec=config.retry_backoff_sec,
-                agent_timeout_sec=config.agent_timeout_sec,
-                heartbeat_sec=config.heartbeat_sec,
-                abort_file=config.abort_file,
-                audit=config.audit,
-                handoff_edges=active_handoff_edges,
-                specialist_model=config.specialist_model,
-                specialist_reasoning_effort=config.specialist_reasoning_effort,
-                head_model=config.head_model,
-                head_reasoning_effort=config.head_reasoning_effort,
-                web_search_policy=config.web_search_policy,
-                progress_callback=config.progress_callback,
-                cycle_id=cycle,
-                execution_mode=execution_mode,
+        exposed_before = (
+            exposed_output_digests(project_dir, selected_groups) if config.incremental_cycles else {}
+        )
+        with trace_span("layered_runtime", category="runtime", cycle=cycle):
+            runtime_result = run_layered_runtime(
+                LayeredRuntimeConfig(
+                    project_id=config.project_id,
+                    project_root=project_root,
+                    project_dir=project_dir,
+                    turn_dir=cycle_dir,
+                    message=config.message,
+                    selected_groups=selected_groups,
+                    group_manifests=group_manifests,
+                    group_objectives=group_objectives,
+                    max_parallel=config.max_parallel,
+                    retry_attempts=config.retry_attempts,
+                    retry_backoff_sec=config.retry_backoff_sec,
+                    agent_timeout_sec=config.agent_timeout_sec,
+                    heartbeat_sec=config.heartbeat_sec,
+                    abort_file=config.abort_file,
+                    audit=config.audit,
+                    handoff_edges=active_handoff_edges,
+                    specialist_model=config.specialist_model,
+                    specialist_reasoning_effort=config.specialist_reasoning_effort,
+                    head_model=config.head_model,
+                    head_reasoning_effort=config.head_reasoning_effort,
+                    web_search_policy=config.web_search_policy,
+                    progress_callback=config.progress_callback,
+                    cycle_id=cycle,
+                    execution_mode=execution_mode,
+                    reuse_unchanged_specialists=config.reuse_unchanged_specialists,
+                    continue_agent_threads=config.continue_agent_threads,
+                    carried_groups=carried_groups,
+                    retry_policies=dict(config.retry_policies or {}),
+                )
             )
-        )
         latest_artifacts = _write_turn_latest_artifacts(turn_dir, runtime_result)
         cycle_timeouts = runtime_result.get("timed_out_specialists", [])
         if isinstance(cycle_timeouts, list):
@@ -3122,6 +3117,7 @@ def run_orchestrator_reply(config: OrchestratorReplyConfig) -> dict:
                 cycle_timeouts=cycle_timeouts,
                 cycle_escalations=cycle_escalations,
                 latest_artifacts=latest_artifacts,
+                carried_groups=runtime_result.get("carried_groups", []),
             )
         )
         last_completed_cycle = max(last_completed_cycle, cycle)
@@ -3261,17 +3257,18 @@ def run_orchestrator_reply(config: OrchestratorReplyConfig) -> dict:
             _emit_progress(config, payload)
 
         _meeting_note("reviewing exposed handoffs, strict evidence gates, and consensus alignment.")
-        meeting = run_head_meeting(
-            HeadMeetingConfig(
-                project_id=config.project_id,
-                cycle_id=cycle,
-                cycle_dir=cycle_dir,
-                project_dir=project_dir,
-                selected_groups=selected_groups,
-                message=config.message,
-                note_callback=_meeting_note,
+        with trace_span("head_meeting", category="meeting", cycle=cycle):
+            meeting = run_head_meeting(
+                HeadMeetingConfig(
+                    project_id=config.project_id,
+                    cycle_id=cycle,
+                    cycle_dir=cycle_dir,
+                    project_dir=project_dir,
+                    selected_groups=selected_groups,
+                    message=config.message,
+                    note_callback=_meeting_note,
+                )
             )
-        )
         meeting_outputs.append(meeting)
         refined_objectives = _refine_group_objectives(
             current_objectives=group_objectives,
@@ -3325,7 +3322,31 @@ def run_orchestrator_reply(config: OrchestratorReplyConfig) -> dict:
         )
         if bool(meeting.get("all_satisfied")):
             break
+        if config.incremental_cycles:
+            exposed_after = exposed_output_digests(project_dir, selected_groups)
+            dirty_groups = select_dirty_groups(
+                selected_groups=selected_groups,
+                unsatisfied_groups=unsatisfied_groups,
+                objectives=group_objectives,
+                refined_objectives=refined_objectives,
+                handoff_edges=active_handoff_edges,
+                changed_outputs=[
+                    group_id
+                    for group_id in selected_groups
+                    if exposed_after.get(group_id) != exposed_before.get(group_id)
+                ],
+            )
+            # Nothing dirty means the meeting is waiting on cross-group consensus;
+            # fall back to a full cycle rather than spinning on an empty one.
+            carried_groups = [
+                group_id
+                for group_id in selected_groups
+                if dirty_groups and group_id not in dirty_groups
+            ]
         group_objectives = refined_objectives
+    cycle_span.end()
+    # Open until the turn span ends, whichever exit the turn takes.
+    trace_span("report", category="report")
 
     final_all_satisfied = (
         bool(meeting_outputs[-1].get("all_satisfied")) if meeting_outputs else False
@@ -3374,6 +3395,17 @@ def run_orchestrator_reply(config: OrchestratorReplyConfig) -> dict:
         "negotiation_monitor": monitor,
     }
     write_text(turn_dir / "group-evidence-index.json", stable_json(evidence_index) + "\n")
+    record_turn_token_usage(
+        project_root=project_root,
+        project_id=config.project_id,
+        turn_dir=turn_dir,
+        sessions=token_usage_report.get("sessions", []),
+        accepted_claims={
+            str(row.get("group_id") or ""): int(row.get("claim_count", 0) or 0)
+            for row in contributions
+            if isinstance(row, dict) and row.get("group_id") and bool(row.get("valid"))
+        },
+    )
 
     if not delegation.get("all_active_groups_contributed") and not block_status:
         block_status = "BLOCKED_GROUP_CONTRIBUTIONS"
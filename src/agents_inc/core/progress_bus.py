@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+
+# Snapshot events: only the newest pending one per key matters to a renderer.
+MERGEABLE_EVENTS = {"runtime_heartbeat", "runtime_group_waiting"}
+# Streamed notes: droppable, and only the tail fits in a dashboard pane anyway.
+NOTE_EVENTS = {"runtime_group_note", "meeting_room_note"}
+
+DEFAULT_MAX_PENDING = 512
+DEFAULT_MAX_NOTES_PER_GROUP = 12
+DEFAULT_MAX_RENDER_HZ = 8.0
+
+
+class ProgressEventBus:
+    """Decouples progress producers from a slow consumer such as a terminal UI.
+
+    ``publish`` never blocks on the consumer: events are queued, coalesced and
+    delivered to ``sink`` on a dedicated thread, which calls ``render`` at most
+    ``max_render_hz`` times per second. Lifecycle events are delivered in
+    order; snapshot events are merged per group and note events are dropped
+    oldest-first once a group (or the whole queue) is over budget. A queue
+    still over ``max_pending`` sheds its oldest snapshot, then the oldest
+    lifecycle event of a group with a newer one pending, then the oldest
+    event; lifecycle drops are also counted in ``dropped_lifecycle``.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[dict], None],
+        *,
+        render: Optional[Callable[[], None]] = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_notes_per_group: int = DEFAULT_MAX_NOTES_PER_GROUP,
+        max_render_hz: float = DEFAULT_MAX_RENDER_HZ,
+    ) -> None:
+        self._sink = sink
+        self._render = render
+        self._max_pending = max(1, int(max_pending))
+        self._max_notes_per_group = max(1, int(max_notes_per_group))
+        self._render_interval = 1.0 / max(0.1, float(max_render_hz))
+        self._cond = threading.Condition()
+        self._pending: "OrderedDict[Hashable, dict]" = OrderedDict()
+        self._note_counts: Dict[str, int] = {}
+        self._seq = 0
+        self._closed = False
+        self._stop_wait = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._counters = {
+            "published": 0,
+            "delivered": 0,
+            "merged": 0,
+            "dropped": 0,
+            "dropped_lifecycle": 0,
+            "renders": 0,
+            "sink_errors": 0,
+        }
+
+    def __enter__(self) -> "ProgressEventBus":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        self.close()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="agents-inc-progress-bus", daemon=True
+        )
+        self._thread.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Deliver what is pending, render once more and stop the consumer."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._stop_wait.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        self._thread = None
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            out = dict(self._counters)
+            out["pending"] = len(self._pending)
+        return out
+
+    def publish(self, event: dict) -> None:
+        if not isinstance(event, dict):
+            return
+        kind = str(event.get("event") or "").strip().lower()
+        group_id = str(event.get("group_id") or "")
+        with self._cond:
+            if self._closed:
+                return
+            self._counters["published"] += 1
+            self._seq += 1
+            if kind in MERGEABLE_EVENTS:
+                key: Hashable = (kind, group_id)
+                if self._pending.pop(key, None) is not None:
+                    self._counters["merged"] += 1
+            elif kind in NOTE_EVENTS:
+                key = ("note", group_id, self._seq)
+                count = self._note_counts.get(group_id, 0)
+                if count >= self._max_notes_per_group:
+                    self._drop_oldest_note(group_id)
+                else:
+                    self._note_counts[group_id] = count + 1
+            else:
+                key = ("event", group_id, self._seq)
+            self._pending[key] = dict(event)
+            if len(self._pending) > self._max_pending:
+                self._shed_one()
+            self._cond.notify()
+
+    def _drop_oldest_note(self, group_id: Optional[str]) -> bool:
+        for key in self._pending:
+            if isinstance(key, tuple) and key[0] == "note" and (
+                group_id is None or key[1] == group_id
+            ):
+                del self._pending[key]
+                self._counters["dropped"] += 1
+                if group_id is None:
+                    owner = str(key[1])
+                    self._note_counts[owner] = max(0, self._note_counts.get(owner, 0) - 1)
+                return True
+        return False
+
+    def _shed_one(self) -> None:
+        if self._drop_oldest_note(None):
+            return
+        victim = next((key for key in self._pending if key[0] in MERGEABLE_EVENTS), None)
+        if victim is None:
+            # Keep each group's newest lifecycle event; the oldest one is the last resort.
+            groups = Counter(key[1] for key in self._pending if key[0] == "event")
+            victim = next(
+                (key for key in self._pending if key[0] == "event" and groups[key[1]] > 1),
+                next(iter(self._pending)),
+            )
+            self._counters["dropped_lifecycle"] += 1
+        del self._pending[victim]
+        self._counters["dropped"] += 1
+
+    def _take_batch(self) -> list:
+        batch = list(self._pending.values())
+        self._pending.clear()
+        self._note_counts.clear()
+        return batch
+
+    def _deliver(self, batch: list) -> None:
+        for event in batch:
+            try:
+                self._sink(event)
+            except Exception:
+                with self._cond:
+                    self._counters["sink_errors"] += 1
+                continue
+        with self._cond:
+            self._counters["delivered"] += len(batch)
+
+    def _do_render(self) -> None:
+        if self._render is None:
+            return
+        try:
+            self._render()
+        except Exception:
+            # Rendering is best effort; a broken frame must not stop delivery.
+            return
+        with self._cond:
+            self._counters["renders"] += 1
+
+    def _run(self) -> None:
+        next_render = 0.0
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                closed = self._closed
+                batch = self._take_batch()
+            self._deliver(batch)
+            if closed:
+                self._do_render()
+                return
+            delay = next_render - time.monotonic()
+            if delay > 0:
+                # Let events accumulate until the next frame is due.
+                self._stop_wait.wait(delay)
+                with self._cond:
+                    closed = self._closed
+                    batch = self._take_batch()
+                self._deliver(batch)
+            self._do_render()
+            next_render = time.monotonic() + self._render_interval
+            if closed:
+                return
@@ -25,6 +25,9 @@ def format_progress_event(event: dict) -> str:
         return "live: turn started | groups={0} | max_cycles={1}".format(groups, cap)
     if kind == "cycle_started":
         cycle = int(event.get("cycle", 0) or 0)
+        carried = event.get("carried_groups", [])
+        if isinstance(carried, list) and carried:
+            return f"live: cycle {cycle} started | carried={_join_groups(carried)}"
         return f"live: cycle {cycle} started"
     if kind == "runtime_heartbeat":
         cycle = int(event.get("cycle", 0) or 0)
@@ -53,6 +56,23 @@ def format_progress_event(event: dict) -> str:
         if not text:
             return ""
         return f"live: cycle {cycle} group {group_id} note | {text}"
+    if kind == "runtime_specialist_handoff_ready":
+        cycle = int(event.get("cycle", 0) or 0)
+        group_id = str(event.get("group_id") or "").strip() or "unknown"
+        specialist_id = str(event.get("specialist_id") or "").strip() or "unknown"
+        return f"live: cycle {cycle} group {group_id} specialist {specialist_id} handoff ready"
+    if kind == "runtime_specialist_reused":
+        cycle = int(event.get("cycle", 0) or 0)
+        group_id = str(event.get("group_id") or "").strip() or "unknown"
+        specialist_id = str(event.get("specialist_id") or "").strip() or "unknown"
+        return (
+            f"live: cycle {cycle} group {group_id} specialist {specialist_id} "
+            "unchanged, reused prior output"
+        )
+    if kind == "runtime_group_carried":
+        cycle = int(event.get("cycle", 0) or 0)
+        group_id = str(event.get("group_id") or "").strip() or "unknown"
+        return f"live: cycle {cycle} group {group_id} unchanged, carried forward"
     if kind == "runtime_group_done":
         cycle = int(event.get("cycle", 0) or 0)
         group_id = str(event.get("group_id") or "").strip() or "unknown"
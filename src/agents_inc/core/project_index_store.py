@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from agents_inc.core.util.errors import FabricError
+from agents_inc.core.util.fs import atomic_dump_yaml, load_yaml_map
+
+INDEX_SCHEMA_VERSION = "3.0"
+INDEX_STALE_TTL_ENV = "AGENTS_INC_INDEX_STALE_TTL_SEC"
+DEFAULT_INDEX_STALE_TTL_SEC = 60.0
+INDEX_DB_SUFFIX = ".sqlite3"
+# Concurrent orchestrator runs queue on the database lock for up to this long.
+INDEX_BUSY_TIMEOUT_SEC = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    project_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    project_root TEXT NOT NULL DEFAULT '',
+    checked_at REAL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS projects_status ON projects (status);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def project_index_db_path(index_path: Path) -> Path:
+    """SQLite store kept next to the YAML index, e.g. ``projects-index.sqlite3``."""
+    return Path(index_path).with_suffix(INDEX_DB_SUFFIX)
+
+
+def index_stale_ttl_sec() -> float:
+    raw = os.environ.get(INDEX_STALE_TTL_ENV, "").strip()
+    if not raw:
+        return DEFAULT_INDEX_STALE_TTL_SEC
+    try:
+        return max(0.0, float(raw))
+    except ValueError as exc:
+        raise FabricError(f"{INDEX_STALE_TTL_ENV} must be a number of seconds") from exc
+
+
+class ProjectIndexStore:
+    """Global project index in SQLite, with the YAML index as import source and mirror.
+
+    Rows are keyed by ``project_id`` and indexed by ``status``, so a checkpoint
+    upsert or a status change touches one row instead of rewriting the whole
+    index. Writers take ``BEGIN IMMEDIATE`` and wait on the busy timeout, which
+    serializes simultaneous orchestrator runs across processes.
+
+    The YAML file stays readable for people and older tools. It is imported
+    when the database is first created and again whenever its signature no
+    longer matches the one recorded after our last import or export, i.e. when
+    something else edited it. It is re-exported when projects are added,
+    removed or change status explicitly; checkpoint bookkeeping and staleness
+    live only in the database.
+
+    Staleness (``active`` vs ``stale``) is the result of a ``stat`` of the
+    project root cached per row in ``checked_at``; reads re-check rows older
+    than the TTL, and any write to a row clears its timestamp.
+    """
+
+    def __init__(self, index_path: Path) -> None:
+        self.index_path = Path(index_path)
+        self.db_path = project_index_db_path(self.index_path)
+
+    # ── public API ────────────────────────────────────────────────────────
+
+    def load(self) -> dict:
+        with self._connection() as conn:
+            return {"schema_version": INDEX_SCHEMA_VERSION, "projects": self._projects(conn)}
+
+    def replace_all(self, projects: Dict[str, dict]) -> None:
+        with self._write() as conn:
+            self._replace_rows(conn, projects)
+            self._export(conn)
+
+    def get(self, project_id: str) -> Optional[dict]:
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT project_id, status, payload FROM projects WHERE project_id = ?",
+                (project_id,),
+            ).fetchone()
+        return _row_entry(row) if row is not None else None
+
+    def list(self, statuses: Optional[Iterable[str]] = None) -> List[dict]:
+        query = "SELECT project_id, status, payload FROM projects"
+        params: Tuple[str, ...] = ()
+        if statuses is not None:
+            params = tuple(statuses)
+            query += f" WHERE status IN ({', '.join('?' for _ in params)})"
+        with self._connection() as conn:
+            rows = conn.execute(query + " ORDER BY project_id", params).fetchall()
+        return [_row_entry(row) for row in rows]
+
+    def upsert(self, project_id: str, entry: dict) -> None:
+        self.upsert_many({project_id: entry})
+
+    def upsert_many(self, entries: Dict[str, dict]) -> None:
+        if not entries:
+            return
+        with self._write() as conn:
+            inserted = False
+            for project_id, entry in entries.items():
+                exists = conn.execute(
+                    "SELECT 1 FROM projects WHERE project_id = ?", (project_id,)
+                ).fetchone()
+                inserted = inserted or exists is None
+                self._put(conn, project_id, entry)
+            if inserted or not self.index_path.exists():
+                self._export(conn)
+
+    def set_status(self, project_id: str, status: str, updated_at: str) -> Optional[dict]:
+        with self._write() as conn:
+            row = conn.execute(
+                "SELECT project_id, status, payload FROM projects WHERE project_id = ?",
+                (project_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            entry = _row_entry(row)
+            entry.pop("project_id", None)
+            entry["status"] = status
+            entry["updated_at"] = updated_at
+            self._put(conn, project_id, entry)
+            self._export(conn)
+        return {"project_id": project_id, **entry}
+
+    def remove(self, project_id: str) -> bool:
+        with self._write() as conn:
+            removed = conn.execute(
+                "DELETE FROM projects WHERE project_id = ?", (project_id,)
+            ).rowcount
+            if removed:
+                self._export(conn)
+        return bool(removed)
+
+    def refresh_staleness(
+        self, *, max_age_sec: float, project_id: Optional[str] = None
+    ) -> int:
+        """Re-stat project roots not checked within ``max_age_sec``; returns status changes.
+
+        Explicitly ``inactive`` projects are never re-checked.
+        """
+        now = time.time()
+        query = (
+            "SELECT project_id, status, payload FROM projects WHERE status != 'inactive'"
+            " AND (checked_at IS NULL OR checked_at <= ?)"
+        )
+        params: Tuple[object, ...] = (now - max_age_sec,)
+        if project_id is not None:
+            query += " AND project_id = ?"
+            params += (project_id,)
+        with self._connection() as conn:
+            due = conn.execute(query, params).fetchall()
+        if not due:
+            return 0
+        # Stat outside the write lock; roots on network mounts can be slow.
+        checked: List[Tuple[str, str, str, str, bool]] = []
+        for row_id, previous, payload in due:
+            entry = _row_entry((row_id, previous, payload))
+            entry.pop("project_id", None)
+            root = entry.get("project_root")
+            if isinstance(root, str) and root:
+                entry["status"] = "active" if Path(root).expanduser().exists() else "stale"
+            # Rows without a root keep their status; they are only marked checked.
+            status = str(entry.get("status") or previous)
+            next_payload = json.dumps(entry, default=str)
+            checked.append((row_id, payload, status, next_payload, status != previous))
+        changed = 0
+        with self._write() as conn:
+            for row_id, payload, status, next_payload, flipped in checked:
+                # Rows another writer touched since they were read keep that writer's version.
+                updated = conn.execute(
+                    "UPDATE projects SET status = ?, checked_at = ?, payload = ?"
+                    " WHERE project_id = ? AND payload = ?",
+                    (status, now, next_payload, row_id, payload),
+                ).rowcount
+                if updated and flipped:
+                    changed += 1
+        return changed
+
+    # ── storage ───────────────────────────────────────────────────────────
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Autocommit connection with the YAML index imported if it changed externally."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            conn = sqlite3.connect(
+                str(self.db_path), timeout=INDEX_BUSY_TIMEOUT_SEC, isolation_level=None
+            )
+        except sqlite3.Error as exc:
+            raise FabricError(f"cannot open project index {self.db_path}: {exc}") from exc
+        with closing(conn):
+            conn.executescript(_SCHEMA)
+            if self._meta(conn, "yaml_signature") != _signature(self.index_path):
+                self._begin(conn)
+                try:
+                    # Another process may have imported or exported while we waited.
+                    if self._meta(conn, "yaml_signature") != _signature(self.index_path):
+                        self._import(conn)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            yield conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        with self._connection() as conn:
+            self._begin(conn)
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _begin(self, conn: sqlite3.Connection) -> None:
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.OperationalError as exc:
+            raise FabricError(f"project index {self.db_path} is busy: {exc}") from exc
+
+    def _import(self, conn: sqlite3.Connection) -> None:
+        if not self.index_path.exists():
+            # Nothing to import; the next write exports the database contents.
+            conn.execute("DELETE FROM meta WHERE key = 'yaml_signature'")
+            return
+        data = load_yaml_map(self.index_path, {"projects": {}})
+        projects = data.get("projects")
+        self._replace_rows(conn, projects if isinstance(projects, dict) else {})
+        if str(data.get("schema_version") or "") != INDEX_SCHEMA_VERSION:
+            # Auto-upgrade old index schema to avoid breaking checkpoint writes on
+            # otherwise valid project metadata.
+            self._export(conn)
+        else:
+            self._set_meta(conn, "yaml_signature", _signature(self.index_path))
+
+    def _export(self, conn: sqlite3.Connection) -> None:
+        atomic_dump_yaml(
+            self.index_path,
+            {"schema_version": INDEX_SCHEMA_VERSION, "projects": self._projects(conn)},
+        )
+        self._set_meta(conn, "yaml_signature", _signature(self.index_path))
+
+    def _replace_rows(self, conn: sqlite3.Connection, projects: Dict[str, dict]) -> None:
+        conn.execute("DELETE FROM projects")
+        for project_id, entry in projects.items():
+            if isinstance(entry, dict):
+                self._put(conn, str(project_id), entry)
+
+    def _put(self, conn: sqlite3.Connection, project_id: str, entry: dict) -> None:
+        payload = {key: value for key, value in entry.items() if key != "project_id"}
+        root = payload.get("project_root")
+        conn.execute(
+            "INSERT OR REPLACE INTO projects"
+            " (project_id, status, project_root, checked_at, payload) VALUES (?, ?, ?, NULL, ?)",
+            (
+                project_id,
+                str(payload.get("status") or ""),
+                root if isinstance(root, str) else "",
+                json.dumps(payload, default=str),
+            ),
+        )
+
+    def _projects(self, conn: sqlite3.Connection) -> Dict[str, dict]:
+        out: Dict[str, dict] = {}
+        for row in conn.execute(
+            "SELECT project_id, status, payload FROM projects ORDER BY project_id"
+        ):
+            entry = _row_entry(row)
+            out[str(entry.pop("project_id"))] = entry
+        return out
+
+    def _meta(self, conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return str(row[0]) if row is not None else None
+
+    def _set_meta(self, conn: sqlite3.Connection, key: str, value: Optional[str]) -> None:
+        if value is None:
+            conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+        else:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+def _row_entry(row: Tuple[str, str, str]) -> dict:
+    project_id, status, payload = row
+    try:
+        entry = json.loads(payload)
+    except ValueError:
+        entry = {}
+    if not isinstance(entry, dict):
+        entry = {}
+    if status:
+        entry["status"] = status
+    return {"project_id": project_id, **entry}
+
+
+def _signature(path: Path) -> Optional[str]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_size}"
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterable, Mapping, Optional, Union
+
+FAILURE_TIMEOUT = "timeout"
+FAILURE_EXIT = "exit"
+FAILURE_PARSE = "parse"
+FAILURE_OTHER = "other"
+FAILURE_CLASSES = (FAILURE_TIMEOUT, FAILURE_EXIT, FAILURE_PARSE, FAILURE_OTHER)
+# Specialists only retry transient failures; heads retry every class.
+TRANSIENT_FAILURE_CLASSES = frozenset({FAILURE_TIMEOUT, FAILURE_EXIT, FAILURE_PARSE})
+
+DEFAULT_MAX_DELAY_SEC = 60.0
+
+_PARSE_MARKERS = (
+    "missing begin_work/end_work block",
+    "missing begin_handoff_json/end_handoff_json block",
+    "invalid handoff json",
+    "handoff payload must be json object",
+)
+
+
+def classify_agent_failure(result: object) -> str:
+    error_text = str(getattr(result, "error", "") or "").strip().lower()
+    return_code = int(getattr(result, "return_code", 0) or 0)
+    if return_code == 124 or "timeout" in error_text:
+        return FAILURE_TIMEOUT
+    if return_code != 0:
+        return FAILURE_EXIT
+    if any(marker in error_text for marker in _PARSE_MARKERS):
+        return FAILURE_PARSE
+    return FAILURE_OTHER
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Backoff for one failure class.
+
+    The n-th retry waits ``base_delay_sec * multiplier**(n-1)`` capped at
+    ``max_delay_sec``, then jittered uniformly into its upper half so agents
+    failing together do not retry together. ``max_retries`` of None defers to
+    the runtime's ``retry_attempts``.
+    """
+
+    base_delay_sec: float = 0.0
+    max_delay_sec: float = DEFAULT_MAX_DELAY_SEC
+    multiplier: float = 2.0
+    max_retries: Optional[int] = None
+
+    def delay_for(self, retry_index: int, rng: random.Random) -> float:
+        if self.base_delay_sec <= 0:
+            return 0.0
+        exponent = max(0, int(retry_index) - 1)
+        ceiling = min(
+            max(self.max_delay_sec, self.base_delay_sec),
+            self.base_delay_sec * (max(1.0, self.multiplier) ** exponent),
+        )
+        return rng.uniform(ceiling / 2.0, ceiling)
+
+
+def default_retry_policies(retry_backoff_sec: float) -> Dict[str, RetryPolicy]:
+    base = max(0.0, float(retry_backoff_sec or 0))
+    transient = RetryPolicy(base_delay_sec=base, max_delay_sec=max(DEFAULT_MAX_DELAY_SEC, base))
+    return {
+        FAILURE_TIMEOUT: transient,
+        FAILURE_EXIT: transient,
+        # Malformed output is not a provider hiccup; waiting does not help.
+        FAILURE_PARSE: RetryPolicy(base_delay_sec=0.0),
+        FAILURE_OTHER: transient,
+    }
+
+
+def resolve_retry_policies(
+    retry_backoff_sec: float, overrides: Optional[Mapping[str, Mapping[str, object]]] = None
+) -> Dict[str, RetryPolicy]:
+    policies = default_retry_policies(retry_backoff_sec)
+    for failure_class, fields in (overrides or {}).items():
+        if failure_class not in policies:
+            raise ValueError(
+                f"unknown retry failure class '{failure_class}' "
+                f"(expected one of: {', '.join(FAILURE_CLASSES)})"
+            )
+        if not isinstance(fields, Mapping):
+            raise ValueError(f"retry policy for '{failure_class}' must be a mapping")
+        updates: Dict[str, object] = {}
+        for key, value in fields.items():
+            if key == "max_retries":
+                updates[key] = (
+                    None if value is None else max(0, int(value))  # type: ignore[arg-type]
+                )
+            elif key in {"base_delay_sec", "max_delay_sec", "multiplier"}:
+                updates[key] = max(0.0, float(value))  # type: ignore[arg-type]
+            else:
+                raise ValueError(f"unknown retry policy field '{key}' for '{failure_class}'")
+        policies[failure_class] = replace(policies[failure_class], **updates)
+    return policies
+
+
+def parse_retry_policy_overrides(values: Iterable[str]) -> Dict[str, Dict[str, object]]:
+    """Parse CLI specs like ``timeout:base_delay_sec=10,max_retries=4``."""
+    out: Dict[str, Dict[str, object]] = {}
+    for raw in values:
+        text = str(raw or "").strip()
+        if not text:
+            continue
+        failure_class, sep, body = text.partition(":")
+        if not sep or not body.strip():
+            raise ValueError(
+                f"invalid retry policy '{text}' (expected CLASS:KEY=VALUE[,KEY=VALUE])"
+            )
+        fields = out.setdefault(failure_class.strip(), {})
+        for item in body.split(","):
+            key, eq, value = item.partition("=")
+            if not eq:
+                raise ValueError(f"invalid retry policy field '{item}' in '{text}'")
+            fields[key.strip()] = value.strip()
+    # Validate eagerly so bad specs fail at argument parsing time.
+    resolve_retry_policies(0, out)
+    return out
+
+
+class RetryScheduler:
+    """Delay queue for agent retries shared by every group in a cycle.
+
+    A retrying agent parks here between attempts without holding an agent
+    slot; its worker thread still blocks in :meth:`wait` for the backoff.
+    :meth:`abort` wakes every parked retry immediately; an abort that only
+    shows up through ``abort_check`` is noticed within ``poll_sec``.
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[str, RetryPolicy],
+        *,
+        retry_attempts: int,
+        abort_check: Optional[Callable[[], bool]] = None,
+        rng: Optional[random.Random] = None,
+        poll_sec: float = 0.5,
+    ) -> None:
+        self._policies = dict(policies)
+        self._retry_attempts = max(0, int(retry_attempts))
+        self._abort_check = abort_check
+        self._rng = rng or random.Random()
+        self._poll_sec = max(0.01, float(poll_sec))
+        self._cond = threading.Condition()
+        self._waiting = 0
+        self._counters = {"scheduled": 0, "aborted": 0}
+        self._by_class = {failure_class: 0 for failure_class in FAILURE_CLASSES}
+        self._delay_total = 0.0
+        self._aborted = False
+
+    def policy(self, failure_class: str) -> RetryPolicy:
+        return self._policies.get(failure_class) or self._policies[FAILURE_OTHER]
+
+    def next_delay(self, failure_class: str, retry_index: int) -> Optional[float]:
+        """Delay before retry ``retry_index`` (1-based), or None when retries are spent."""
+        policy = self.policy(failure_class)
+        limit = self._retry_attempts if policy.max_retries is None else policy.max_retries
+        if retry_index > limit:
+            return None
+        with self._cond:
+            key = failure_class if failure_class in self._by_class else FAILURE_OTHER
+            self._by_class[key] += 1
+            return policy.delay_for(retry_index, self._rng)
+
+    def wait(self, delay_sec: float) -> bool:
+        """Park until the retry is due; False when an abort was requested meanwhile."""
+        due = time.monotonic() + max(0.0, float(delay_sec))
+        with self._cond:
+            self._waiting += 1
+            self._counters["scheduled"] += 1
+            self._delay_total += max(0.0, float(delay_sec))
+        try:
+            while True:
+                if self._aborted or (self._abort_check is not None and self._abort_check()):
+                    with self._cond:
+                        self._counters["aborted"] += 1
+                    return False
+                remaining = due - time.monotonic()
+                if remaining <= 0:
+                    return True
+                with self._cond:
+                    self._cond.wait(min(remaining, self._poll_sec))
+        finally:
+            with self._cond:
+                self._waiting -= 1
+
+    def abort(self) -> None:
+        """Fail every parked and future :meth:`wait` without waiting out its delay."""
+        with self._cond:
+            self._aborted = True
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Union[float, Dict[str, int]]]:
+        """Counters so far; ``by_class`` counts retries granted per failure class."""
+        with self._cond:
+            return {
+                "waiting": self._waiting,
+                "scheduled": self._counters["scheduled"],
+                "aborted": self._counters["aborted"],
+                "total_delay_sec": round(self._delay_total, 3),
+                "by_class": dict(self._by_class),
+            }
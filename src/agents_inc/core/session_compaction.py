@@ -5,6 +5,7 @@ from typing import Dict, List, Optional
 
 from agents_inc.core.fabric_lib import FabricError, load_yaml
 from agents_inc.core.session_state import state_dir
+from agents_inc.core.state_store import SnapshotStore, prune_materialized
 from agents_inc.core.util.fs import dump_yaml, load_yaml_map
 from agents_inc.core.util.time import now_iso, to_stamp  # noqa: F401  (now_iso re-exported)
 
@@ -23,6 +24,11 @@ def latest_compacted_path(project_root: Path) -> Path:
     return state_dir(project_root) / "latest-compacted.yaml"
 
 
+def compaction_store(project_root: Path) -> SnapshotStore:
+    """Deduplicated history of retained compactions; shares chunks with checkpoints."""
+    return SnapshotStore(state_dir(project_root), "compacted")
+
+
 def group_sessions_path(project_root: Path) -> Path:
     return state_dir(project_root) / "group-sessions.yaml"
 
@@ -130,6 +136,9 @@ def compact_session(
     compact_payload["created_at"] = now
     compact_payload["updated_at"] = now
 
+    store = compaction_store(project_root)
+    store.append(compact_id, compact_payload)
+    # Only the latest compaction is kept as a full YAML copy; older ones live in the store.
     compact_path = compacted_dir(project_root) / f"{compact_id}.yaml"
     dump_yaml(compact_path, compact_payload)
 
@@ -147,6 +156,7 @@ def compact_session(
     state["counter"] = counter
     state["updated_at"] = now
     dump_yaml(compacted_state_path(project_root), state)
+    prune_materialized(compacted_dir(project_root), store, keep=compact_path)
 
     return {
         "compact_id": compact_id,
@@ -164,10 +174,14 @@ def load_compacted(project_root: Path, compact_id: str = "latest") -> dict:
         if not isinstance(path_raw, str) or not path_raw.strip():
             raise FabricError(f"latest compacted session does not exist: {project_root}")
         compact_path = Path(path_raw).expanduser().resolve()
+        compact_id = str(latest.get("compact_id") or compact_path.stem)
     else:
         compact_path = compacted_dir(project_root) / f"{compact_id}.yaml"
     if not compact_path.exists():
-        raise FabricError(f"compacted session does not exist: {compact_path}")
+        stored = compaction_store(project_root).load(compact_id)
+        if stored is None:
+            raise FabricError(f"compacted session does not exist: {compact_path}")
+        return stored
     loaded = load_yaml(compact_path)
     if not isinstance(loaded, dict):
         raise FabricError(f"invalid compacted session: {compact_path}")
@@ -6,11 +6,16 @@ from typing import Dict, List, Optional
 
 from agents_inc.core.context_state import load_global_context
 from agents_inc.core.fabric_lib import FabricError, load_yaml
+from agents_inc.core.project_index_store import (  # noqa: F401  (INDEX_SCHEMA_VERSION re-exported)
+    INDEX_SCHEMA_VERSION,
+    ProjectIndexStore,
+    index_stale_ttl_sec,
+)
+from agents_inc.core.state_store import SnapshotStore, prune_materialized
 from agents_inc.core.util.fs import dump_yaml, load_yaml_map
 from agents_inc.core.util.time import now_iso, to_stamp  # noqa: F401  (now_iso re-exported)
 
 STATE_SCHEMA_VERSION = "3.0"
-INDEX_SCHEMA_VERSION = "3.0"
 STATE_REL_DIR = Path(".agents-inc") / "state"
 
 try:
@@ -134,55 +139,23 @@ def save_session_state(project_root: Path, state: dict) -> None:
 
 
 def load_project_index(path: Path) -> dict:
-    default = {
-        "schema_version": INDEX_SCHEMA_VERSION,
-        "projects": {},
-    }
-    data = load_yaml_map(path, default)
-    if path.exists():
-        found = str(data.get("schema_version") or "")
-        if found != INDEX_SCHEMA_VERSION:
-            # Auto-upgrade old index schema to avoid breaking checkpoint writes on
-            # otherwise valid project metadata.
-            data["schema_version"] = INDEX_SCHEMA_VERSION
-            save_project_index(path, data)
-    projects = data.get("projects")
-    if not isinstance(projects, dict):
-        data["projects"] = {}
-    data["schema_version"] = INDEX_SCHEMA_VERSION
-    return data
+    return ProjectIndexStore(path).load()
 
 
 def save_project_index(path: Path, index_data: dict) -> None:
-    clean = dict(index_data)
-    clean["schema_version"] = INDEX_SCHEMA_VERSION
-    projects = clean.get("projects")
-    if not isinstance(projects, dict):
-        clean["projects"] = {}
-    dump_yaml(path, clean)
-
-
-def mark_stale_index_entries(index_path: Path) -> dict:
-    index_data = load_project_index(index_path)
-    projects = index_data.setdefault("projects", {})
-    changed = False
-    for payload in projects.values():
-        if not isinstance(payload, dict):
-            continue
-        if str(payload.get("status") or "") == "inactive":
-            # Explicitly deactivated projects stay inactive until user reactivates them.
-            continue
-        project_root_raw = payload.get("project_root")
-        if not isinstance(project_root_raw, str):
-            continue
-        is_active = Path(project_root_raw).expanduser().exists()
-        status = "active" if is_active else "stale"
-        if payload.get("status") != status:
-            payload["status"] = status
-            changed = True
-    if changed:
-        save_project_index(index_path, index_data)
-    return index_data
+    """Replace the whole index; prefer the per-entry helpers below for single changes."""
+    projects = index_data.get("projects")
+    ProjectIndexStore(path).replace_all(projects if isinstance(projects, dict) else {})
+
+
+def mark_stale_index_entries(index_path: Path, max_age_sec: float = 0.0) -> dict:
+    """Re-check project roots last checked more than ``max_age_sec`` ago and return the index.
+
+    Explicitly deactivated projects stay inactive until the user reactivates them.
+    """
+    store = ProjectIndexStore(index_path)
+    store.refresh_staleness(max_age_sec=max_age_sec)
+    return store.load()
 
 
 def upsert_project_index_entry(
@@ -195,17 +168,17 @@ def upsert_project_index_entry(
     checkpoint_path: Path,
     updated_at: str,
 ) -> None:
-    index_data = load_project_index(index_path)
-    projects = index_data.setdefault("projects", {})
-    projects[project_id] = {
-        "project_root": str(project_root),
-        "fabric_root": str(fabric_root),
-        "last_checkpoint": checkpoint_id,
-        "last_checkpoint_path": str(checkpoint_path),
-        "updated_at": updated_at,
-        "status": "active" if project_root.exists() else "stale",
-    }
-    save_project_index(index_path, index_data)
+    ProjectIndexStore(index_path).upsert(
+        project_id,
+        {
+            "project_root": str(project_root),
+            "fabric_root": str(fabric_root),
+            "last_checkpoint": checkpoint_id,
+            "last_checkpoint_path": str(checkpoint_path),
+            "updated_at": updated_at,
+            "status": "active" if project_root.exists() else "stale",
+        },
+    )
 
 
 def list_active_index_projects(index_path: Path) -> List[dict]:
@@ -213,58 +186,29 @@ def list_active_index_projects(index_path: Path) -> List[dict]:
 
 
 def list_index_projects(index_path: Path, include_stale: bool = False) -> List[dict]:
-    index_data = mark_stale_index_entries(index_path)
-    projects = index_data.get("projects", {})
-    out: List[dict] = []
-    if not isinstance(projects, dict):
-        return out
-    for project_id, payload in sorted(projects.items()):
-        if not isinstance(payload, dict):
-            continue
-        if not include_stale and payload.get("status") != "active":
-            continue
-        out.append({"project_id": project_id, **payload})
-    return out
+    store = ProjectIndexStore(index_path)
+    store.refresh_staleness(max_age_sec=index_stale_ttl_sec())
+    return store.list(None if include_stale else ("active",))
 
 
 def get_index_project(index_path: Path, project_id: str) -> Optional[dict]:
-    index_data = mark_stale_index_entries(index_path)
-    projects = index_data.get("projects", {})
-    if not isinstance(projects, dict):
-        return None
-    payload = projects.get(project_id)
-    if not isinstance(payload, dict):
-        return None
-    return {"project_id": project_id, **payload}
+    store = ProjectIndexStore(index_path)
+    store.refresh_staleness(max_age_sec=index_stale_ttl_sec(), project_id=project_id)
+    return store.get(project_id)
 
 
 def set_index_project_status(index_path: Path, project_id: str, status: str) -> dict:
     normalized = str(status).strip().lower()
     if normalized not in {"active", "stale", "inactive"}:
         raise FabricError(f"unsupported project status: {status}")
-    index_data = load_project_index(index_path)
-    projects = index_data.setdefault("projects", {})
-    if not isinstance(projects, dict) or project_id not in projects:
+    updated = ProjectIndexStore(index_path).set_status(project_id, normalized, now_iso())
+    if updated is None:
         raise FabricError(f"project '{project_id}' not found in index")
-    payload = projects.get(project_id)
-    if not isinstance(payload, dict):
-        raise FabricError(f"invalid project entry for '{project_id}'")
-    payload["status"] = normalized
-    payload["updated_at"] = now_iso()
-    save_project_index(index_path, index_data)
-    return {"project_id": project_id, **payload}
+    return updated
 
 
 def remove_index_project(index_path: Path, project_id: str) -> bool:
-    index_data = load_project_index(index_path)
-    projects = index_data.setdefault("projects", {})
-    if not isinstance(projects, dict):
-        return False
-    if project_id not in projects:
-        return False
-    projects.pop(project_id, None)
-    save_project_index(index_path, index_data)
-    return True
+    return ProjectIndexStore(index_path).remove(project_id)
 
 
 def _find_local_project_manifest(project_root: Path, project_id: str) -> Optional[Path]:
@@ -318,15 +262,12 @@ def _checkpoint_info_for_project_root(project_root: Path) -> Dict[str, str]:
 
 
 def sync_index_from_scan(index_path: Path, scan_root: Path) -> Dict[str, int]:
-    index_data = load_project_index(index_path)
-    projects = index_data.setdefault("projects", {})
-    if not isinstance(projects, dict):
-        projects = {}
-        index_data["projects"] = projects
+    store = ProjectIndexStore(index_path)
+    projects = store.load()["projects"]
 
     created = 0
     updated = 0
-    changed = False
+    changes: Dict[str, dict] = {}
     now = now_iso()
 
     for found in discover_projects(scan_root):
@@ -344,9 +285,8 @@ def sync_index_from_scan(index_path: Path, scan_root: Path) -> Dict[str, int]:
         }
         prev = projects.get(project_id)
         if not isinstance(prev, dict):
-            projects[project_id] = next_payload
+            changes[project_id] = next_payload
             created += 1
-            changed = True
             continue
 
         if str(prev.get("status") or "") == "inactive":
@@ -357,14 +297,11 @@ def sync_index_from_scan(index_path: Path, scan_root: Path) -> Dict[str, int]:
         stable_next = dict(next_payload)
         stable_next.pop("updated_at", None)
         if stable_prev != stable_next:
-            projects[project_id] = next_payload
+            changes[project_id] = next_payload
             updated += 1
-            changed = True
-
-    if changed:
-        save_project_index(index_path, index_data)
 
-    mark_stale_index_entries(index_path)
+    store.upsert_many(changes)
+    store.refresh_staleness(max_age_sec=index_stale_ttl_sec())
     return {"created": created, "updated": updated}
 
 
@@ -428,17 +365,31 @@ def find_resume_project(
     return None
 
 
+def checkpoint_store(project_root: Path) -> SnapshotStore:
+    """Deduplicated history of every retained checkpoint of a project."""
+    return SnapshotStore(state_dir(project_root), "checkpoints")
+
+
 def load_checkpoint(project_root: Path, checkpoint_id: str = "latest") -> dict:
+    """Load a checkpoint; ``latest`` reads the full copy named by the latest pointer.
+
+    Older checkpoints are rebuilt from the snapshot store; YAML files written
+    before the store existed are still read directly.
+    """
     if checkpoint_id == "latest":
         latest = load_yaml_map(latest_checkpoint_path(project_root), {})
         cp_path_raw = latest.get("checkpoint_path")
         if not isinstance(cp_path_raw, str):
             raise FabricError(f"latest checkpoint does not exist: {project_root}")
         cp_path = Path(cp_path_raw).expanduser().resolve()
+        checkpoint_id = str(latest.get("checkpoint_id") or cp_path.stem)
     else:
         cp_path = checkpoints_dir(project_root) / f"{checkpoint_id}.yaml"
     if not cp_path.exists():
-        raise FabricError(f"checkpoint does not exist: {cp_path}")
+        stored = checkpoint_store(project_root).load(checkpoint_id)
+        if stored is None:
+            raise FabricError(f"checkpoint does not exist: {cp_path}")
+        return stored
 
     data = load_yaml(cp_path)
     if not isinstance(data, dict):
@@ -487,6 +438,9 @@ def write_checkpoint(
     checkpoint_payload["created_at"] = created_at
     checkpoint_payload["updated_at"] = created_at
 
+    store = checkpoint_store(project_root)
+    store.append(checkpoint_id, checkpoint_payload)
+    # Only the latest checkpoint is kept as a full YAML copy; older ones live in the store.
     checkpoint_path = checkpoints_dir(project_root) / f"{checkpoint_id}.yaml"
     dump_yaml(checkpoint_path, checkpoint_payload)
 
@@ -511,6 +465,7 @@ def write_checkpoint(
         "updated_at": created_at,
     }
     save_session_state(project_root, updated_state)
+    prune_materialized(checkpoints_dir(project_root), store, keep=checkpoint_path)
 
     project_id = payload.get("project_id")
     if isinstance(project_id, str) and project_id:
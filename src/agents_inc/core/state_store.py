@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from agents_inc.core.util.errors import FabricError
+from agents_inc.core.util.fs import atomic_write
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to thread locks only
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None  # type: ignore[assignment]
+
+STATE_COMPRESSION_ENV = "AGENTS_INC_STATE_COMPRESSION"
+STATE_KEEP_LAST_ENV = "AGENTS_INC_STATE_KEEP_LAST"
+DEFAULT_STATE_KEEP_LAST = 50
+COMPRESSIONS = ("gzip", "zstd", "none")
+# Every this many records a snapshot stores its full key->chunk map, bounding delta chains.
+KEYFRAME_INTERVAL = 16
+SNAPSHOTS_DIR = "snapshots"
+
+_OBJECT_SUFFIXES = {"zstd": ".json.zst", "gzip": ".json.gz", "none": ".json"}
+_THREAD_LOCKS: Dict[str, threading.Lock] = {}
+_THREAD_LOCKS_GUARD = threading.Lock()
+
+
+def state_compression() -> str:
+    """Configured chunk compression; ``zstd`` falls back to gzip when zstandard is missing."""
+    value = os.environ.get(STATE_COMPRESSION_ENV, "").strip().lower() or "gzip"
+    if value not in COMPRESSIONS:
+        raise FabricError(
+            f"{STATE_COMPRESSION_ENV} must be one of: {', '.join(COMPRESSIONS)} (got '{value}')"
+        )
+    if value == "zstd" and zstandard is None:
+        return "gzip"
+    return value
+
+
+def state_keep_last() -> int:
+    """Snapshots kept per stream by the retention GC; 0 keeps everything."""
+    raw = os.environ.get(STATE_KEEP_LAST_ENV, "").strip()
+    if not raw:
+        return DEFAULT_STATE_KEEP_LAST
+    try:
+        return max(0, int(raw))
+    except ValueError as exc:
+        raise FabricError(f"{STATE_KEEP_LAST_ENV} must be an integer") from exc
+
+
+class SnapshotStore:
+    """Checkpoint-style snapshots stored as content-addressed, deduplicated chunks.
+
+    Each top-level key of a snapshot is serialized to a chunk named by its
+    SHA-256 and written once under ``snapshots/objects``, so values that do not
+    change between snapshots, or that a checkpoint and a compaction share, are
+    stored a single time. The stream log (``snapshots/<stream>.jsonl``) holds one
+    line per snapshot: a full key->chunk map every ``KEYFRAME_INTERVAL`` records
+    and otherwise a structural delta (changed and removed keys) against the
+    previous snapshot.
+
+    Appends and GC take an ``flock`` on ``snapshots/.lock``. Once a stream
+    holds more than ``keep_last`` plus some slack, the oldest records are
+    dropped, the new oldest is rewritten as a keyframe, and chunks no stream
+    references any more are deleted.
+    """
+
+    def __init__(
+        self,
+        state_root: Path,
+        stream: str,
+        *,
+        compression: Optional[str] = None,
+        keep_last: Optional[int] = None,
+    ) -> None:
+        self.state_root = Path(state_root)
+        self.stream = stream
+        self.root = self.state_root / SNAPSHOTS_DIR
+        self.log_path = self.root / f"{stream}.jsonl"
+        self.objects_dir = self.root / "objects"
+        self.lock_path = self.root / ".lock"
+        self.compression = compression or state_compression()
+        self.keep_last = state_keep_last() if keep_last is None else max(0, int(keep_last))
+
+    def append(self, record_id: str, payload: dict) -> dict:
+        """Store ``payload`` as ``record_id``; returns write stats for the snapshot."""
+        with self._locked():
+            # Chunks are written under the lock so a concurrent sweep cannot collect
+            # them before the record referencing them is appended.
+            tree: List[Tuple[str, str]] = []
+            written = 0
+            for key, value in payload.items():
+                digest, created = self._put_chunk(value)
+                tree.append((str(key), digest))
+                written += int(created)
+            records = self._records()
+            record: dict = {"id": record_id}
+            if records and _delta_depth(records) < KEYFRAME_INTERVAL - 1:
+                base = _resolve_tree(records, len(records) - 1)
+                record["base"] = records[-1]["id"]
+                record["set"] = [[key, digest] for key, digest in tree if base.get(key) != digest]
+                current = {key for key, _ in tree}
+                record["unset"] = [key for key in base if key not in current]
+            else:
+                record["tree"] = [[key, digest] for key, digest in tree]
+            self.root.mkdir(parents=True, exist_ok=True)
+            with self.log_path.open("ab") as handle:
+                # Terminate a line torn by an interrupted append before adding ours.
+                torn = handle.tell() > 0 and not _ends_with_newline(self.log_path)
+                line = json.dumps(record, separators=(",", ":")) + "\n"
+                handle.write((("\n" if torn else "") + line).encode("utf-8"))
+            records.append(record)
+            pruned: List[str] = []
+            if self.keep_last and len(records) > self.keep_last + max(8, self.keep_last // 4):
+                pruned = self._gc(records)
+        return {"chunks": len(tree), "chunks_written": written, "pruned": pruned}
+
+    def load(self, record_id: str) -> Optional[dict]:
+        with self._locked():
+            records = self._records()
+        for index in range(len(records) - 1, -1, -1):
+            if records[index].get("id") == record_id:
+                tree = _resolve_tree(records, index)
+                return {key: self._get_chunk(digest) for key, digest in tree.items()}
+        return None
+
+    def ids(self) -> List[str]:
+        with self._locked():
+            return [str(record.get("id")) for record in self._records()]
+
+    def gc(self) -> List[str]:
+        """Apply the retention policy now; returns the ids that were dropped."""
+        with self._locked():
+            return self._gc(self._records())
+
+    # ── internals ─────────────────────────────────────────────────────────
+
+    def _gc(self, records: List[dict]) -> List[str]:
+        pruned: List[str] = []
+        if self.keep_last and len(records) > self.keep_last:
+            cut = len(records) - self.keep_last
+            keyframe = {"id": records[cut]["id"]}
+            keyframe["tree"] = [[k, d] for k, d in _resolve_tree(records, cut).items()]
+            pruned = [str(record.get("id")) for record in records[:cut]]
+            records[:] = [keyframe] + records[cut + 1 :]
+            atomic_write(
+                self.log_path,
+                "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in records),
+            )
+        self._sweep()
+        return pruned
+
+    def _sweep(self) -> None:
+        """Delete chunks that no stream in this state directory references."""
+        live: Set[str] = set()
+        for log_path in self.root.glob("*.jsonl"):
+            for record in _read_records(log_path):
+                for key in ("tree", "set"):
+                    live.update(str(row[1]) for row in record.get(key) or [])
+        if not self.objects_dir.exists():
+            return
+        for path in self.objects_dir.glob("*/*"):
+            digest = path.name.split(".", 1)[0]
+            if digest not in live and not path.name.endswith(".tmp"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _records(self) -> List[dict]:
+        return _read_records(self.log_path)
+
+    def _put_chunk(self, value: object) -> Tuple[str, bool]:
+        data = json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        if self._chunk_path(digest) is not None:
+            return digest, False
+        path = self.objects_dir / digest[:2] / (digest + _OBJECT_SUFFIXES[self.compression])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(_compress(data, self.compression))
+        tmp.replace(path)
+        return digest, True
+
+    def _get_chunk(self, digest: str) -> object:
+        path = self._chunk_path(digest)
+        if path is None:
+            raise FabricError(f"missing snapshot chunk {digest} in {self.objects_dir}")
+        raw = path.read_bytes()
+        if path.name.endswith(".zst"):
+            if zstandard is None:
+                raise FabricError(f"snapshot chunk {path} needs the 'zstandard' package")
+            raw = zstandard.ZstdDecompressor().decompress(raw)
+        elif path.name.endswith(".gz"):
+            raw = gzip.decompress(raw)
+        return json.loads(raw.decode("utf-8"))
+
+    def _chunk_path(self, digest: str) -> Optional[Path]:
+        folder = self.objects_dir / digest[:2]
+        for suffix in _OBJECT_SUFFIXES.values():
+            path = folder / (digest + suffix)
+            if path.exists():
+                return path
+        return None
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with _thread_lock(self.lock_path):
+            handle = None
+            if fcntl is not None:
+                self.root.mkdir(parents=True, exist_ok=True)
+                handle = self.lock_path.open("a+")
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if handle is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+                    handle.close()
+
+
+def _read_records(log_path: Path) -> List[dict]:
+    if not log_path.exists():
+        return []
+    out: List[dict] = []
+    for line in log_path.read_text(encoding="utf-8").splitlines():
+        try:
+            row = json.loads(line)
+        except ValueError:
+            # A torn final line from an interrupted append; the next GC drops it.
+            continue
+        if isinstance(row, dict) and row.get("id"):
+            out.append(row)
+    return out
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with path.open("rb") as handle:
+        handle.seek(-1, os.SEEK_END)
+        return handle.read(1) == b"\n"
+
+
+def _delta_depth(records: List[dict]) -> int:
+    """Number of deltas stacked on the last keyframe."""
+    depth = 0
+    for record in reversed(records):
+        if "tree" in record:
+            break
+        depth += 1
+    return depth
+
+
+def _resolve_tree(records: List[dict], index: int) -> Dict[str, str]:
+    """Key->chunk map of ``records[index]``, replaying deltas from the nearest keyframe."""
+    start = index
+    while start > 0 and "tree" not in records[start]:
+        start -= 1
+    tree: Dict[str, str] = {}
+    for record in records[start : index + 1]:
+        if "tree" in record:
+            tree = {str(key): str(digest) for key, digest in record["tree"]}
+            continue
+        for key in record.get("unset") or []:
+            tree.pop(str(key), None)
+        for key, digest in record.get("set") or []:
+            tree[str(key)] = str(digest)
+    return tree
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    if compression == "none":
+        return data
+    return gzip.compress(data, compresslevel=6)
+
+
+@contextmanager
+def _thread_lock(path: Path) -> Iterator[None]:
+    key = str(path)
+    with _THREAD_LOCKS_GUARD:
+        lock = _THREAD_LOCKS.setdefault(key, threading.Lock())
+    with lock:
+        yield
+
+
+def prune_materialized(directory: Path, store: SnapshotStore, *, keep: Path) -> int:
+    """Delete full YAML copies next to the store, keeping ``keep``.
+
+    Copies of snapshots the store holds are redundant. Older copies written
+    before the store existed are pruned to the same ``keep_last`` as the store.
+    """
+    if not directory.exists():
+        return 0
+    stored = set(store.ids())
+    legacy: List[Path] = []
+    removed = 0
+    for path in sorted(directory.glob("*.yaml")):
+        if path == keep:
+            continue
+        if path.stem not in stored:
+            legacy.append(path)
+            continue
+        path.unlink()
+        removed += 1
+    if store.keep_last:
+        for path in legacy[: max(0, len(legacy) - store.keep_last)]:
+            path.unlink()
+            removed += 1
+    return removed
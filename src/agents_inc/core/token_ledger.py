@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from agents_inc.core.session_state import state_dir
+from agents_inc.core.token_usage import USAGE_FIELDS
+from agents_inc.core.util.time import now_iso
+
+TOKEN_LEDGER_SCHEMA_VERSION = "1.0"
+TOKEN_LEDGER_NAME = "token-ledger.ndjson"
+LEDGER_BREAKDOWNS = ("group", "agent", "role", "model", "cycle", "turn")
+
+_CYCLE_DIR_RE = re.compile(r"^cycle-(\d+)$")
+_LEDGER_LOCK = threading.Lock()
+
+
+def token_ledger_path(project_root: Path) -> Path:
+    return state_dir(project_root) / TOKEN_LEDGER_NAME
+
+
+def attribute_session_file(turn_dir: Path, session_file: Path) -> dict:
+    """Map a codex session log to the cycle, group, agent and role that produced it.
+
+    Heads run from ``layer3/<group>/codex-home`` and specialists from
+    ``layer4/<group>/<specialist>/codex-home`` inside each cycle directory.
+    """
+    try:
+        parts = list(Path(session_file).resolve().relative_to(Path(turn_dir).resolve()).parts)
+    except ValueError:
+        parts = list(Path(session_file).parts)
+    cycle = 0
+    for part in parts:
+        match = _CYCLE_DIR_RE.match(part)
+        if match:
+            cycle = int(match.group(1))
+    out = {"cycle": cycle, "group_id": "", "agent_id": "", "role": "other"}
+    if "codex-home" not in parts:
+        return out
+    home_index = parts.index("codex-home")
+    for layer, role in (("layer3", "head"), ("layer4", "specialist")):
+        if layer not in parts[:home_index]:
+            continue
+        scope = parts[parts.index(layer) + 1 : home_index]
+        if role == "head" and len(scope) == 1:
+            out.update({"group_id": scope[0], "agent_id": "head", "role": "head"})
+        elif role == "specialist" and len(scope) == 2:
+            out.update({"group_id": scope[0], "agent_id": scope[1], "role": "specialist"})
+        break
+    return out
+
+
+def _cycle_models(turn_dir: Path) -> Dict[int, dict]:
+    """Read head/specialist models from each cycle's orchestrator plan."""
+    out: Dict[int, dict] = {}
+    root = Path(turn_dir)
+    candidates = [(0, root / "layer2" / "orchestrator-plan.json")]
+    cycles_root = root / "cycles"
+    if cycles_root.exists():
+        for cycle_dir in sorted(cycles_root.iterdir()):
+            match = _CYCLE_DIR_RE.match(cycle_dir.name)
+            if match:
+                candidates.append((int(match.group(1)), cycle_dir / "layer2" / "orchestrator-plan.json"))
+    for cycle, plan_path in candidates:
+        if not plan_path.exists():
+            continue
+        try:
+            plan = json.loads(plan_path.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        settings = plan.get("settings") if isinstance(plan, dict) else None
+        if isinstance(settings, dict):
+            out[cycle] = settings
+    return out
+
+
+def record_turn_token_usage(
+    *,
+    project_root: Path,
+    project_id: str,
+    turn_dir: Path,
+    sessions: Iterable[dict],
+    accepted_claims: Optional[Dict[str, int]] = None,
+) -> dict:
+    """Append one ledger row per session (and per group claim count) for a finished turn."""
+    turn_root = Path(turn_dir).resolve()
+    turn_id = turn_root.name
+    recorded_at = now_iso()
+    models = _cycle_models(turn_root)
+    rows: List[dict] = []
+    for session in sessions:
+        if not isinstance(session, dict):
+            continue
+        session_file = str(session.get("session_file") or "")
+        attribution = attribute_session_file(turn_root, Path(session_file))
+        settings = models.get(int(attribution["cycle"])) or models.get(0) or {}
+        role = str(attribution["role"])
+        model_key = "head" if role == "head" else "specialist"
+        row = {
+            "kind": "usage",
+            "schema_version": TOKEN_LEDGER_SCHEMA_VERSION,
+            "recorded_at": recorded_at,
+            "project_id": project_id,
+            "turn_id": turn_id,
+            "session_file": session_file,
+            "model": str(settings.get(f"{model_key}_model") or ""),
+            "reasoning_effort": str(settings.get(f"{model_key}_reasoning_effort") or ""),
+        }
+        row.update(attribution)
+        for field in USAGE_FIELDS:
+            row[field] = _as_int(session.get(field))
+        row["billable_token_estimate"] = _billable(row)
+        rows.append(row)
+    for group_id, count in sorted((accepted_claims or {}).items()):
+        rows.append(
+            {
+                "kind": "claims",
+                "schema_version": TOKEN_LEDGER_SCHEMA_VERSION,
+                "recorded_at": recorded_at,
+                "project_id": project_id,
+                "turn_id": turn_id,
+                "group_id": str(group_id),
+                "accepted_claims": _as_int(count),
+            }
+        )
+    path = token_ledger_path(project_root)
+    if rows:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = "".join(json.dumps(row, sort_keys=True) + "\n" for row in rows)
+        with _LEDGER_LOCK:
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(text)
+    return {"ledger_path": str(path), "rows_written": len(rows)}
+
+
+def load_token_ledger(
+    project_root: Path,
+    *,
+    since: str = "",
+    until: str = "",
+    group_ids: Optional[Iterable[str]] = None,
+) -> List[dict]:
+    """Return ledger rows in the time range; a re-recorded turn replaces its earlier rows."""
+    path = token_ledger_path(project_root)
+    if not path.exists():
+        return []
+    since_at = _parse_time(since)
+    until_at = _parse_time(until)
+    groups = {str(item).strip() for item in group_ids or [] if str(item).strip()}
+    latest: Dict[tuple, dict] = {}
+    with path.open("r", encoding="utf-8", errors="replace") as handle:
+        for line in handle:
+            try:
+                row = json.loads(line)
+            except Exception:
+                continue
+            if not isinstance(row, dict):
+                continue
+            recorded = _parse_time(str(row.get("recorded_at") or ""))
+            if since_at is not None and (recorded is None or recorded < since_at):
+                continue
+            if until_at is not None and (recorded is None or recorded > until_at):
+                continue
+            if groups and str(row.get("group_id") or "") not in groups:
+                continue
+            key = (
+                str(row.get("kind") or ""),
+                str(row.get("turn_id") or ""),
+                str(row.get("session_file") or ""),
+                str(row.get("group_id") or ""),
+            )
+            latest[key] = row
+    return list(latest.values())
+
+
+def summarize_token_ledger(rows: List[dict], *, by: str = "group", top: int = 0) -> List[dict]:
+    """Aggregate usage rows by one breakdown (see LEDGER_BREAKDOWNS), most billable first.
+
+    ``agent`` buckets are ``<group>/<agent>`` so the same specialist id in two
+    groups is reported separately.
+    """
+    if by not in LEDGER_BREAKDOWNS:
+        raise ValueError(f"unsupported ledger breakdown: {by}")
+    buckets: Dict[str, dict] = {}
+    claims_by_group: Dict[str, int] = {}
+    for row in rows:
+        if row.get("kind") == "claims":
+            group_id = str(row.get("group_id") or "")
+            claims_by_group[group_id] = claims_by_group.get(group_id, 0) + _as_int(row.get("accepted_claims"))
+            continue
+        key = _bucket_key(row, by)
+        bucket = buckets.setdefault(
+            key,
+            {by: key, "sessions": 0, "groups": set(), **{field: 0 for field in USAGE_FIELDS}},
+        )
+        bucket["sessions"] += 1
+        bucket["groups"].add(str(row.get("group_id") or ""))
+        for field in USAGE_FIELDS:
+            bucket[field] += _as_int(row.get(field))
+    out: List[dict] = []
+    for bucket in buckets.values():
+        groups = bucket.pop("groups")
+        bucket["billable_token_estimate"] = _billable(bucket)
+        # Claims are counted per group, so per-claim cost only makes sense for group-scoped buckets.
+        if by in {"group", "agent"} or len(groups) == 1:
+            claims = sum(claims_by_group.get(group, 0) for group in groups)
+            bucket["accepted_claims"] = claims
+            bucket["billable_tokens_per_claim"] = (
+                round(bucket["billable_token_estimate"] / claims, 1) if claims else None
+            )
+        out.append(bucket)
+    out.sort(key=lambda row: (-int(row["billable_token_estimate"]), str(row[by])))
+    return out[:top] if top and top > 0 else out
+
+
+def _bucket_key(row: dict, by: str) -> str:
+    if by == "agent":
+        return f"{row.get('group_id') or '-'}/{row.get('agent_id') or '-'}"
+    field = {"group": "group_id", "turn": "turn_id"}.get(by, by)
+    value = row.get(field)
+    return str(value) if value is not None else ""
+
+
+def _billable(row: dict) -> int:
+    return max(0, _as_int(row.get("input_tokens")) - _as_int(row.get("cached_input_tokens"))) + _as_int(
+        row.get("output_tokens")
+    )
+
+
+def _as_int(value: object) -> int:
+    try:
+        return max(0, int(float(str(value))))
+    except Exception:
+        return 0
+
+
+def _parse_time(value: str) -> Optional[datetime]:
+    text = str(value or "").strip()
+    if not text:
+        return None
+    if len(text) == 10:
+        text = text + "T00:00:00Z"
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional
 
 from agents_inc.core.fabric_lib import now_iso, stable_json, write_text
 
 TOKEN_USAGE_SCHEMA_VERSION = "1.0"
 TOKEN_USAGE_JSON_NAME = "token-usage-report.json"
 TOKEN_USAGE_MD_NAME = "token-usage-report.md"
+TOKEN_USAGE_INDEX_NAME = "token-usage-index.json"
+SESSION_GLOB = "**/codex-home/sessions/**/*.jsonl"
 
 
 def _as_int(value: object) -> int:
@@ -37,68 +41,108 @@ def _iter_token_count_nodes(event: object) -> Iterable[dict]:
             yield node
 
 
-def _lookup_numeric(node: dict, keys: List[str]) -> int:
-    best = 0
-    for candidate in _iter_dict_nodes(node):
-        for key in keys:
-            if key not in candidate:
-                continue
-            best = max(best, _as_int(candidate.get(key)))
-    return best
+USAGE_FIELDS = (
+    "input_tokens",
+    "cached_input_tokens",
+    "output_tokens",
+    "reasoning_output_tokens",
+    "total_token_usage",
+)
+# Every alias a token_count payload may use, mapped to the report field it feeds.
+_USAGE_KEY_FIELDS: Dict[str, str] = {
+    "input_tokens": "input_tokens",
+    "input": "input_tokens",
+    "input_token_count": "input_tokens",
+    "prompt_tokens": "input_tokens",
+    "cached_input_tokens": "cached_input_tokens",
+    "cached_input": "cached_input_tokens",
+    "cache_read_input_tokens": "cached_input_tokens",
+    "output_tokens": "output_tokens",
+    "output": "output_tokens",
+    "completion_tokens": "output_tokens",
+    "reasoning_output_tokens": "reasoning_output_tokens",
+    "reasoning_tokens": "reasoning_output_tokens",
+    "reasoning_output": "reasoning_output_tokens",
+    "total_token_usage": "total_token_usage",
+    "total_tokens": "total_token_usage",
+    "total": "total_token_usage",
+    "total_token_count": "total_token_usage",
+}
 
 
 def _extract_usage(node: dict) -> dict:
-    input_tokens = _lookup_numeric(
-        node,
-        ["input_tokens", "input", "input_token_count", "prompt_tokens"],
-    )
-    cached_input_tokens = _lookup_numeric(
-        node,
-        ["cached_input_tokens", "cached_input", "cache_read_input_tokens"],
-    )
-    output_tokens = _lookup_numeric(
-        node,
-        ["output_tokens", "output", "completion_tokens"],
+    """Collect the max value of every usage field in one walk of ``node``."""
+    usage = {field: 0 for field in USAGE_FIELDS}
+    stack: List[object] = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            for key, value in current.items():
+                field = _USAGE_KEY_FIELDS.get(key)
+                if field is not None:
+                    parsed = _as_int(value)
+                    if parsed > usage[field]:
+                        usage[field] = parsed
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(current, list):
+            stack.extend(item for item in current if isinstance(item, (dict, list)))
+    usage["total_token_usage"] = max(
+        usage["total_token_usage"], usage["input_tokens"] + usage["output_tokens"]
     )
-    reasoning_output_tokens = _lookup_numeric(
-        node,
-        ["reasoning_output_tokens", "reasoning_tokens", "reasoning_output"],
-    )
-    total_token_usage = _lookup_numeric(
-        node,
-        ["total_token_usage", "total_tokens", "total", "total_token_count"],
-    )
-    total_token_usage = max(total_token_usage, input_tokens + output_tokens)
-    return {
-        "input_tokens": input_tokens,
-        "cached_input_tokens": cached_input_tokens,
-        "output_tokens": output_tokens,
-        "reasoning_output_tokens": reasoning_output_tokens,
-        "total_token_usage": total_token_usage,
-    }
+    return usage
 
 
-def _select_session_usage(events: List[dict]) -> dict:
-    with_total = [row for row in events if int(row.get("total_token_usage", 0)) > 0]
-    selected = max(with_total, key=lambda row: int(row.get("total_token_usage", 0))) if with_total else events[-1]
-    return {
-        "input_tokens": _as_int(selected.get("input_tokens")),
-        "cached_input_tokens": _as_int(selected.get("cached_input_tokens")),
-        "output_tokens": _as_int(selected.get("output_tokens")),
-        "reasoning_output_tokens": _as_int(selected.get("reasoning_output_tokens")),
-        "total_token_usage": _as_int(selected.get("total_token_usage")),
-        "event_count": len(events),
-    }
+def _has_usage(usage: dict) -> bool:
+    return any(int(usage.get(field, 0)) > 0 for field in USAGE_FIELDS)
 
 
-def _parse_session_usage(session_file: Path) -> dict | None:
-    events: List[dict] = []
-    try:
-        lines = session_file.read_text(encoding="utf-8", errors="replace").splitlines()
-    except Exception:
-        return None
-    for line in lines:
-        text = line.strip()
+class _SessionUsageState:
+    """Running selection for one session file: the max-total event, else the last event."""
+
+    def __init__(self, row: Optional[dict] = None):
+        row = row if isinstance(row, dict) else {}
+        self.offset = _as_int(row.get("offset"))
+        self.file_id = str(row.get("file_id") or "")
+        self.event_count = _as_int(row.get("event_count"))
+        best = row.get("best")
+        last = row.get("last")
+        self.best: Optional[dict] = dict(best) if isinstance(best, dict) else None
+        self.last: Optional[dict] = dict(last) if isinstance(last, dict) else None
+
+    def add(self, usage: dict) -> None:
+        self.event_count += 1
+        self.last = usage
+        total = int(usage.get("total_token_usage", 0))
+        # Strictly greater keeps the first event on ties, as max() did.
+        if total > 0 and (self.best is None or total > int(self.best.get("total_token_usage", 0))):
+            self.best = usage
+
+    def selected(self, session_file: str) -> Optional[dict]:
+        if self.event_count <= 0 or self.last is None:
+            return None
+        chosen = self.best if self.best is not None else self.last
+        out = {field: _as_int(chosen.get(field)) for field in USAGE_FIELDS}
+        out["event_count"] = self.event_count
+        out["session_file"] = session_file
+        return out
+
+    def to_row(self) -> dict:
+        return {
+            "offset": self.offset,
+            "file_id": self.file_id,
+            "event_count": self.event_count,
+            "best": self.best,
+            "last": self.last,
+        }
+
+
+def _scan_session_lines(data: bytes, state: _SessionUsageState) -> None:
+    for line in data.splitlines():
+        # Cheap substring test first: most session lines are not token_count events.
+        if b"token_count" not in line.lower():
+            continue
+        text = line.decode("utf-8", errors="replace").strip()
         if not text:
             continue
         try:
@@ -107,22 +151,144 @@ def _parse_session_usage(session_file: Path) -> dict | None:
             continue
         for node in _iter_token_count_nodes(payload):
             usage = _extract_usage(node)
-            if usage["total_token_usage"] <= 0 and not any(
-                int(usage[key]) > 0
-                for key in (
-                    "input_tokens",
-                    "cached_input_tokens",
-                    "output_tokens",
-                    "reasoning_output_tokens",
-                )
-            ):
+            if _has_usage(usage):
+                state.add(usage)
+
+
+def _is_json_line(data: bytes) -> bool:
+    try:
+        json.loads(data.decode("utf-8", errors="strict"))
+    except Exception:
+        return False
+    return True
+
+
+def _file_id(stat: os.stat_result) -> str:
+    return f"{int(stat.st_dev)}:{int(stat.st_ino)}"
+
+
+def _rollout_key(root: Path, session_file: Path) -> str:
+    """The session file's path within its cycle, shared by an agent's home across cycles."""
+    try:
+        parts = session_file.relative_to(root).parts
+    except ValueError:
+        return str(session_file)
+    if len(parts) > 2 and parts[0] == "cycles":
+        parts = parts[2:]
+    return "/".join(parts)
+
+
+class TokenUsageAggregator:
+    """Incremental token accounting for the Codex session logs under a turn dir.
+
+    Each session file keeps a byte offset and its running selection in the
+    ``token-usage-index.json`` sidecar, so ``refresh`` only parses lines
+    appended since the previous call (or since the previous report). A file
+    that shrank or was replaced is re-read from the start. ``refresh`` is safe
+    to call from live progress callbacks while sessions are still running.
+    """
+
+    def __init__(self, turn_dir: Path):
+        self.root = Path(turn_dir).resolve()
+        self.index_path = self.root / TOKEN_USAGE_INDEX_NAME
+        self._lock = threading.Lock()
+        self._states: Dict[str, _SessionUsageState] = {}
+        self._session_files: List[Path] = []
+        self._index_loaded = False
+
+    def refresh(self) -> dict:
+        """Parse newly appended session lines and return the current summary."""
+        with self._lock:
+            self._load_index()
+            self._session_files = sorted(self.root.glob(SESSION_GLOB))
+            seen = set()
+            for session_file in self._session_files:
+                key = str(session_file)
+                seen.add(key)
+                self._states[key] = self._advance(session_file, self._states.get(key))
+            for key in list(self._states):
+                if key not in seen:
+                    self._states.pop(key)
+            return _aggregate(self._rows_locked())
+
+    def rows(self) -> List[dict]:
+        with self._lock:
+            return self._rows_locked()
+
+    def session_files(self) -> List[Path]:
+        with self._lock:
+            return list(self._session_files)
+
+    def save_index(self) -> Path:
+        with self._lock:
+            payload = {
+                "schema_version": TOKEN_USAGE_SCHEMA_VERSION,
+                "updated_at": now_iso(),
+                "files": {key: state.to_row() for key, state in sorted(self._states.items())},
+            }
+            write_text(self.index_path, json.dumps(payload, sort_keys=True) + "\n")
+            return self.index_path
+
+    def _rows_locked(self) -> List[dict]:
+        # A resumed thread's rollout is copied into the agent's home in each later cycle;
+        # only the copy that got furthest is counted.
+        rows: Dict[str, dict] = {}
+        for session_file in self._session_files:
+            state = self._states.get(str(session_file))
+            selected = state.selected(str(session_file)) if state is not None else None
+            if selected is None:
                 continue
-            events.append(usage)
-    if not events:
-        return None
-    selected = _select_session_usage(events)
-    selected["session_file"] = str(session_file)
-    return selected
+            key = _rollout_key(self.root, session_file)
+            current = rows.get(key)
+            if current is None or (
+                selected["total_token_usage"], selected["event_count"]
+            ) > (current["total_token_usage"], current["event_count"]):
+                rows[key] = selected
+        return list(rows.values())
+
+    def _load_index(self) -> None:
+        if self._index_loaded:
+            return
+        self._index_loaded = True
+        if not self.index_path.exists():
+            return
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        files = payload.get("files") if isinstance(payload, dict) else None
+        if not isinstance(files, dict):
+            return
+        for key, row in files.items():
+            self._states[str(key)] = _SessionUsageState(row if isinstance(row, dict) else None)
+
+    @staticmethod
+    def _advance(session_file: Path, state: Optional[_SessionUsageState]) -> _SessionUsageState:
+        try:
+            stat = session_file.stat()
+        except OSError:
+            return state or _SessionUsageState()
+        file_id = _file_id(stat)
+        if state is None or state.file_id != file_id or int(stat.st_size) < state.offset:
+            state = _SessionUsageState()
+            state.file_id = file_id
+        if int(stat.st_size) == state.offset:
+            return state
+        try:
+            with session_file.open("rb") as handle:
+                handle.seek(state.offset)
+                data = handle.read()
+        except OSError:
+            return state
+        end = data.rfind(b"\n")
+        complete = data[: end + 1] if end >= 0 else b""
+        trailing = data[end + 1 :]
+        if trailing.strip() and _is_json_line(trailing):
+            # A finished log may lack the final newline; a half-written line waits for the next refresh.
+            complete = data
+        _scan_session_lines(complete, state)
+        state.offset += len(complete)
+        return state
 
 
 def _aggregate(rows: List[dict]) -> dict:
@@ -193,13 +359,11 @@ def _render_markdown(*, turn_dir: Path, session_files: List[Path], rows: List[di
 def write_turn_token_usage_report(*, turn_dir: Path) -> dict:
     root = Path(turn_dir).resolve()
     root.mkdir(parents=True, exist_ok=True)
-    session_files = sorted(root.glob("**/codex-home/sessions/**/*.jsonl"))
-    rows: List[dict] = []
-    for session_file in session_files:
-        usage = _parse_session_usage(session_file)
-        if usage is not None:
-            rows.append(usage)
-    summary = _aggregate(rows)
+    aggregator = TokenUsageAggregator(root)
+    summary = aggregator.refresh()
+    aggregator.save_index()
+    session_files = aggregator.session_files()
+    rows = aggregator.rows()
     payload = {
         "schema_version": TOKEN_USAGE_SCHEMA_VERSION,
         "generated_at": now_iso(),
@@ -225,4 +389,5 @@ def write_turn_token_usage_report(*, turn_dir: Path) -> dict:
         "json_path": str(json_path),
         "md_path": str(md_path),
         "summary": summary,
+        "sessions": rows,
     }
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, TypeVar
+
+TRACE_SCHEMA_VERSION = "1.0"
+TRACE_FILE = "trace.json"
+TRACE_SUMMARY_FILE = "trace-summary.json"
+
+T = TypeVar("T")
+
+
+class Span:
+    """One timed region. Spans nest through the active context, also across
+    worker threads started with :func:`traced`.
+
+    ``end`` is idempotent and also ends children opened on the same thread
+    that are still running, so a loop can open a span per iteration without
+    closing it on every early return.
+    """
+
+    __slots__ = (
+        "tracer",
+        "span_id",
+        "parent",
+        "name",
+        "category",
+        "attrs",
+        "thread_id",
+        "start_ns",
+        "end_ns",
+        "_children",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        span_id: int,
+        parent: Optional["Span"],
+        name: str,
+        category: str,
+        attrs: Dict[str, object],
+    ) -> None:
+        self.tracer = tracer
+        self.span_id = span_id
+        self.parent = parent
+        self.name = name
+        self.category = category
+        self.attrs = attrs
+        self.thread_id = threading.get_ident()
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self._children: List["Span"] = []
+        self._token: Optional[contextvars.Token] = None
+
+    @property
+    def duration_ns(self) -> int:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return max(0, end - self.start_ns)
+
+    def set(self, **attrs: object) -> None:
+        self.attrs.update(attrs)
+
+    def mark(self, name: str, **attrs: object) -> None:
+        """Record an instant event, e.g. the first output token, from any thread."""
+        self.tracer._instant(self, name, attrs)
+
+    def end(self) -> None:
+        if self.end_ns is not None:
+            return
+        with self.tracer._lock:
+            dangling = [child for child in self._children if child.thread_id == self.thread_id]
+        for child in reversed(dangling):
+            child.end()
+        self.end_ns = time.perf_counter_ns()
+        if self._token is not None:
+            try:
+                _CURRENT_SPAN.reset(self._token)
+            except ValueError:
+                # Ended from another context; fall back to the parent explicitly.
+                _CURRENT_SPAN.set(self.parent)
+            self._token = None
+        if self.parent is not None:
+            with self.tracer._lock:
+                if self in self.parent._children:
+                    self.parent._children.remove(self)
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        if exc_type is not None:
+            self.attrs.setdefault("error", exc_type.__name__)
+        self.end()
+
+
+class NullSpan:
+    """Stand-in returned when no tracer is active; every operation is a no-op."""
+
+    span_id = 0
+    attrs: Dict[str, object] = {}
+
+    def set(self, **attrs: object) -> None:
+        return None
+
+    def mark(self, name: str, **attrs: object) -> None:
+        return None
+
+    def end(self) -> None:
+        return None
+
+    def __enter__(self) -> "NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        return None
+
+
+NULL_SPAN = NullSpan()
+
+
+class Tracer:
+    """Collects spans for one turn on the monotonic clock."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._spans: List[Span] = []
+        self._instants: List[dict] = []
+        self._thread_names: Dict[int, str] = {}
+        self.origin_ns = time.perf_counter_ns()
+
+    def begin(self, name: str, *, category: str = "", **attrs: object) -> Span:
+        parent = _CURRENT_SPAN.get()
+        if parent is not None and parent.tracer is not self:
+            parent = None
+        with self._lock:
+            self._next_id += 1
+            span = Span(self, self._next_id, parent, name, category or name, dict(attrs))
+            self._spans.append(span)
+            self._thread_names.setdefault(span.thread_id, threading.current_thread().name)
+            if parent is not None:
+                parent._children.append(span)
+        span._token = _CURRENT_SPAN.set(span)
+        return span
+
+    def _instant(self, span: Span, name: str, attrs: Dict[str, object]) -> None:
+        thread_id = threading.get_ident()
+        with self._lock:
+            self._thread_names.setdefault(thread_id, threading.current_thread().name)
+            self._instants.append(
+                {
+                    "name": name,
+                    "span_id": span.span_id,
+                    "thread_id": thread_id,
+                    "ts_ns": time.perf_counter_ns(),
+                    "args": dict(attrs),
+                }
+            )
+
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def chrome_trace(self) -> dict:
+        """Trace Event Format payload, loadable in Perfetto or chrome://tracing."""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self._spans)
+            instants = list(self._instants)
+            thread_names = dict(self._thread_names)
+        tids = {thread_id: index + 1 for index, thread_id in enumerate(thread_names)}
+        events: List[dict] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tids[thread_id],
+                "args": {"name": name},
+            }
+            for thread_id, name in thread_names.items()
+        ]
+        for span in spans:
+            args = {key: _json_value(value) for key, value in span.attrs.items()}
+            args["span_id"] = span.span_id
+            if span.parent is not None:
+                args["parent_id"] = span.parent.span_id
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": self._micros(span.start_ns),
+                    "dur": round(span.duration_ns / 1000.0, 3),
+                    "pid": pid,
+                    "tid": tids[span.thread_id],
+                    "args": args,
+                }
+            )
+        for row in instants:
+            args = {key: _json_value(value) for key, value in row["args"].items()}
+            args["span_id"] = row["span_id"]
+            events.append(
+                {
+                    "name": row["name"],
+                    "ph": "i",
+                    "s": "t",
+                    "ts": self._micros(row["ts_ns"]),
+                    "pid": pid,
+                    "tid": tids[row["thread_id"]],
+                    "args": args,
+                }
+            )
+        events.sort(key=lambda event: (event.get("ts", 0), -float(event.get("dur", 0))))
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def summary(self, root: Optional[Span] = None) -> dict:
+        """Critical path through the span tree plus per-category totals.
+
+        From the end of a span, the critical path steps back through the
+        child that finished last, then the child that finished last before
+        that one started, and so on; ``self_sec`` is the part of a critical
+        span not covered by its critical children.
+        """
+        spans = self.spans()
+        children: Dict[int, List[Span]] = {}
+        for span in spans:
+            if span.parent is not None:
+                children.setdefault(span.parent.span_id, []).append(span)
+        if root is None:
+            roots = [span for span in spans if span.parent is None]
+            root = max(roots, key=lambda span: span.duration_ns) if roots else None
+        path: List[dict] = []
+        if root is not None:
+            self._critical_path(root, children, 0, path)
+        categories: Dict[str, dict] = {}
+        for span in spans:
+            row = categories.setdefault(
+                span.category, {"count": 0, "total_sec": 0.0, "max_sec": 0.0}
+            )
+            seconds = span.duration_ns / 1e9
+            row["count"] += 1
+            row["total_sec"] += seconds
+            row["max_sec"] = max(row["max_sec"], seconds)
+        for row in categories.values():
+            row["total_sec"] = round(row["total_sec"], 6)
+            row["max_sec"] = round(row["max_sec"], 6)
+        return {
+            "schema_version": TRACE_SCHEMA_VERSION,
+            "total_sec": round(root.duration_ns / 1e9, 6) if root is not None else 0.0,
+            "span_count": len(spans),
+            "critical_path": path,
+            "by_category": dict(sorted(categories.items())),
+        }
+
+    def _critical_path(
+        self, span: Span, children: Dict[int, List[Span]], depth: int, out: List[dict]
+    ) -> None:
+        end_ns = span.end_ns if span.end_ns is not None else span.start_ns + span.duration_ns
+        chain: List[Span] = []
+        cursor = end_ns
+        candidates = sorted(
+            children.get(span.span_id, []),
+            key=lambda child: child.start_ns + child.duration_ns,
+            reverse=True,
+        )
+        for child in candidates:
+            if child.start_ns + child.duration_ns <= cursor:
+                chain.append(child)
+                cursor = child.start_ns
+        chain.reverse()
+        covered = sum(child.duration_ns for child in chain)
+        out.append(
+            {
+                "span_id": span.span_id,
+                "name": span.name,
+                "category": span.category,
+                "depth": depth,
+                "start_sec": round((span.start_ns - self.origin_ns) / 1e9, 6),
+                "duration_sec": round(span.duration_ns / 1e9, 6),
+                "self_sec": round(max(0, span.duration_ns - covered) / 1e9, 6),
+                "args": {key: _json_value(value) for key, value in span.attrs.items()},
+            }
+        )
+        for child in chain:
+            self._critical_path(child, children, depth + 1, out)
+
+    def write(self, out_dir: Path, root: Optional[Span] = None) -> Dict[str, str]:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        trace_path = out_dir / TRACE_FILE
+        summary_path = out_dir / TRACE_SUMMARY_FILE
+        trace_path.write_text(json.dumps(self.chrome_trace()) + "\n", encoding="utf-8")
+        summary_path.write_text(
+            json.dumps(self.summary(root), indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        return {"trace_path": str(trace_path), "trace_summary_path": str(summary_path)}
+
+    def _micros(self, ns: int) -> float:
+        return round((ns - self.origin_ns) / 1000.0, 3)
+
+
+_CURRENT_TRACER: contextvars.ContextVar[Optional[Tracer]] = contextvars.ContextVar(
+    "agents_inc_tracer", default=None
+)
+_CURRENT_SPAN: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "agents_inc_span", default=None
+)
+
+
+@contextmanager
+def activate_tracer(tracer: Tracer) -> Iterator[Tracer]:
+    token = _CURRENT_TRACER.set(tracer)
+    span_token = _CURRENT_SPAN.set(None)
+    try:
+        yield tracer
+    finally:
+        _CURRENT_SPAN.reset(span_token)
+        _CURRENT_TRACER.reset(token)
+
+
+def current_tracer() -> Optional[Tracer]:
+    return _CURRENT_TRACER.get()
+
+
+def current_span() -> "Span | NullSpan":
+    span = _CURRENT_SPAN.get()
+    return span if span is not None else NULL_SPAN
+
+
+def trace_span(name: str, *, category: str = "", **attrs: object) -> "Span | NullSpan":
+    """Open a span under the current one; end it with ``.end()`` or use it as a context manager."""
+    tracer = _CURRENT_TRACER.get()
+    if tracer is None:
+        return NULL_SPAN
+    return tracer.begin(name, category=category, **attrs)
+
+
+def traced(
+    fn: Callable[..., T], name: str, *, category: str = "", **attrs: object
+) -> Callable[..., T]:
+    """Wrap ``fn`` for a worker thread: it runs in a span parented to the caller's span."""
+    context = contextvars.copy_context()
+
+    def _call(*args: object, **kwargs: object) -> T:
+        def _run() -> T:
+            with trace_span(name, category=category, **attrs):
+                return fn(*args, **kwargs)
+
+        return context.run(_run)
+
+    return _call
+
+
+def _json_value(value: object) -> object:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
@@ -2,24 +2,41 @@ from __future__ import annotations
 
 import re
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import Deque, List, Optional, TextIO
 
 from agents_inc.core.fabric_lib import now_iso, write_text
 
 SENSITIVE_PATTERNS = [
+    # Key blocks first, so a secret value running into an END marker cannot hide the block.
+    re.compile(r"-----BEGIN [A-Z ]*PRIVATE KEY-----[\s\S]*?-----END [A-Z ]*PRIVATE KEY-----"),
     re.compile(r"(?i)(api[_-]?key\s*[:=]\s*)[A-Za-z0-9_\-]{8,}"),
     re.compile(r"(?i)(bearer\s+)[A-Za-z0-9._\-]{12,}"),
     re.compile(r"(?i)(token\s*[:=]\s*)[A-Za-z0-9._\-]{12,}"),
-    re.compile(r"-----BEGIN [A-Z ]*PRIVATE KEY-----[\s\S]*?-----END [A-Z ]*PRIVATE KEY-----"),
 ]
 
+PRIVATE_KEY_BEGIN = re.compile(r"-----BEGIN [A-Z ]*PRIVATE KEY-----")
+PRIVATE_KEY_END = re.compile(r"-----END [A-Z ]*PRIVATE KEY-----")
+# A secret prefix whose value may still follow on a later line (the patterns' \s spans newlines).
+DANGLING_SECRET_PREFIX = re.compile(
+    r"(?i)(?:(?:api[_-]?key|token)\s*(?:[:=]\s*)?|bearer\s+)$"
+)
+
 ANSI_ESCAPE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
 FINAL_PLAN_BLOCK = re.compile(
     r"BEGIN_FINAL_PLAN\s*(.*?)\s*END_FINAL_PLAN",
     flags=re.DOTALL | re.IGNORECASE,
 )
 
+DEFAULT_TRANSCRIPT_TAIL_CHARS = 1 << 20
+# Lines without a newline are redacted in pieces once they grow past this size.
+MAX_PENDING_LINE_CHARS = 1 << 20
+# An unterminated private-key block is redacted wholesale past this size; its remaining
+# lines are suppressed up to the END marker.
+MAX_HELD_KEY_BLOCK_CHARS = 64 * 1024
+
 
 def capture_with_script(
     *,
@@ -47,24 +64,263 @@ def capture_with_script(
 
 def _cleanup_control_sequences(text: str) -> str:
     # Remove ANSI escapes and terminal backspace effects from macOS `script` logs.
-    cleaned = ANSI_ESCAPE.sub("", text)
-    while "\b" in cleaned:
-        cleaned = re.sub(r".\x08", "", cleaned)
+    cleaned = _apply_backspaces(ANSI_ESCAPE.sub("", text))
     cleaned = cleaned.replace("\r", "")
     return cleaned
 
 
-def redact_text(text: str) -> str:
-    redacted = _cleanup_control_sequences(text)
+def _apply_backspaces(text: str) -> str:
+    """Erase the character before each backspace in one pass.
+
+    Like a terminal, a backspace never crosses a line break and one at the
+    start of a line erases nothing.
+    """
+    if "\b" not in text:
+        return text
+    out: List[str] = []
+    for char in text:
+        if char != "\b":
+            out.append(char)
+        elif out and out[-1] != "\n":
+            out.pop()
+    return "".join(out)
+
+
+def _redact_patterns(text: str) -> str:
     for pattern in SENSITIVE_PATTERNS:
-        redacted = pattern.sub(r"\1[REDACTED]" if pattern.groups else "[REDACTED]", redacted)
-    return redacted
+        text = pattern.sub(r"\1[REDACTED]" if pattern.groups else "[REDACTED]", text)
+    return text
+
+
+def redact_text(text: str) -> str:
+    return _redact_patterns(_cleanup_control_sequences(text))
+
+
+class StreamingRedactor:
+    """Line-at-a-time ``redact_text`` for transcripts that arrive in chunks.
+
+    Only the current partial line, a line ending in a secret prefix such as
+    ``api_key:`` (until the line carrying its value arrives) and an open
+    private-key block are held back; everything else is returned as soon as
+    its line is complete.
+    """
+
+    def __init__(self) -> None:
+        self._pending = ""
+        self._prefix = ""
+        self._held: Optional[List[str]] = None
+        self._held_chars = 0
+        self._suppressing = False
+
+    def feed(self, text: str) -> str:
+        self._pending += text
+        cut = self._pending.rfind("\n") + 1
+        if not cut:
+            if len(self._pending) < MAX_PENDING_LINE_CHARS:
+                return ""
+            cut = len(self._pending)
+        complete, self._pending = self._pending[:cut], self._pending[cut:]
+        return "".join(self._redact_line(line) for line in complete.splitlines(keepends=True))
+
+    def flush(self) -> str:
+        out: List[str] = []
+        if self._pending:
+            out.append(self._redact_line(self._pending))
+            self._pending = ""
+        if self._prefix:
+            out.append(_redact_patterns(self._prefix))
+            self._prefix = ""
+        if self._held is not None:
+            out.append(_redact_patterns("".join(self._held)))
+            self._held = None
+        return "".join(out)
+
+    def _redact_line(self, line: str) -> str:
+        cleaned = _cleanup_control_sequences(line)
+        if self._suppressing:
+            end = PRIVATE_KEY_END.search(cleaned)
+            if end is None:
+                return ""
+            self._suppressing = False
+            cleaned = cleaned[end.end() :]
+        if self._held is not None:
+            self._held.append(cleaned)
+            self._held_chars += len(cleaned)
+            if PRIVATE_KEY_END.search(cleaned) is None:
+                if self._held_chars <= MAX_HELD_KEY_BLOCK_CHARS:
+                    return ""
+                # Never release key material unredacted: drop the block through its END line.
+                block, self._held = "".join(self._held), None
+                self._suppressing = True
+                return _redact_patterns(block[: _open_key_block(block)]) + "[REDACTED]"
+            cleaned, self._held = "".join(self._held), None
+        elif self._prefix:
+            cleaned, self._prefix = self._prefix + cleaned, ""
+        if _open_key_block(cleaned) >= 0:
+            self._held = [cleaned]
+            self._held_chars = len(cleaned)
+            return ""
+        dangling = DANGLING_SECRET_PREFIX.search(cleaned)
+        if dangling is not None:
+            # Redact the prefix together with the line that carries its value.
+            keep = 0 if len(cleaned) <= MAX_HELD_KEY_BLOCK_CHARS else dangling.start()
+            self._prefix = cleaned[keep:]
+            return _redact_patterns(cleaned[:keep])
+        return _redact_patterns(cleaned)
+
+
+def _open_key_block(text: str) -> int:
+    """Offset of a private-key BEGIN marker in ``text`` with no END after it, else -1."""
+    pos = 0
+    while True:
+        begin = PRIVATE_KEY_BEGIN.search(text, pos)
+        if begin is None:
+            return -1
+        end = PRIVATE_KEY_END.search(text, begin.end())
+        if end is None:
+            return begin.start()
+        pos = end.end()
+
+
+class TailBuffer:
+    """Keeps the last ``max_chars`` characters written to it."""
+
+    def __init__(self, max_chars: int = DEFAULT_TRANSCRIPT_TAIL_CHARS) -> None:
+        self._max_chars = max(1, int(max_chars))
+        self._chunks: Deque[str] = deque()
+        self._size = 0
+        # Set once anything written has been dropped, i.e. text() is no longer everything.
+        self.truncated = False
+
+    def append(self, text: str) -> None:
+        if not text:
+            return
+        if len(text) >= self._max_chars:
+            self.truncated = self.truncated or self._size > 0 or len(text) > self._max_chars
+            self._chunks.clear()
+            text = text[-self._max_chars :]
+            self._size = 0
+        self._chunks.append(text)
+        self._size += len(text)
+        while self._size > self._max_chars:
+            self.truncated = True
+            head = self._chunks[0]
+            excess = self._size - self._max_chars
+            if len(head) <= excess:
+                self._chunks.popleft()
+                self._size -= len(head)
+            else:
+                self._chunks[0] = head[excess:]
+                self._size -= excess
+
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+
+class TranscriptLog:
+    """Raw and redacted session logs written as output arrives.
+
+    Writers on several threads (stdout and stderr readers) may share one log.
+    Memory is bounded by the tail kept for error reporting, the current
+    partial line and any open private-key block. ``written`` and ``read_raw``
+    let a caller re-read its own slice of the raw log when the tail is too short.
+    """
+
+    def __init__(
+        self,
+        raw_log_path: Path,
+        redacted_log_path: Path,
+        *,
+        tail_chars: int = DEFAULT_TRANSCRIPT_TAIL_CHARS,
+    ) -> None:
+        raw_log_path.parent.mkdir(parents=True, exist_ok=True)
+        redacted_log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Line buffered so both logs can be followed while the session runs.
+        self._raw: Optional[TextIO] = raw_log_path.open(
+            "w", encoding="utf-8", newline="", buffering=1
+        )
+        self._redacted: Optional[TextIO] = redacted_log_path.open(
+            "w", encoding="utf-8", buffering=1
+        )
+        self._redactor = StreamingRedactor()
+        self._raw_log_path = raw_log_path
+        self._tail = TailBuffer(tail_chars)
+        self._written = 0
+        self._raw_last = ""
+        self._redacted_last = ""
+
+    def __enter__(self) -> "TranscriptLog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        self.close()
+
+    def write(self, text: str) -> None:
+        if not text:
+            return
+        with self._lock:
+            if self._raw is None or self._redacted is None:
+                return
+            self._raw.write(text)
+            self._written += len(text)
+            self._raw_last = text[-1]
+            self._tail.append(text)
+            redacted = self._redactor.feed(text)
+            if redacted:
+                self._redacted.write(redacted)
+                self._redacted_last = redacted[-1]
+
+    def tail(self) -> str:
+        with self._lock:
+            return self._tail.text()
+
+    @property
+    def written(self) -> int:
+        """Characters written to the raw log so far."""
+        with self._lock:
+            return self._written
+
+    def read_raw(self, start: int, end: int) -> str:
+        """Raw log text between two ``written`` offsets, read back from disk."""
+        with self._lock:
+            if self._raw is not None:
+                self._raw.flush()
+        with self._raw_log_path.open("r", encoding="utf-8", newline="") as handle:
+            skip = max(0, int(start))
+            while skip > 0:
+                chunk = handle.read(min(skip, 1 << 20))
+                if not chunk:
+                    return ""
+                skip -= len(chunk)
+            return handle.read(max(0, int(end) - int(start)))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._raw is None or self._redacted is None:
+                return
+            redacted = self._redactor.flush()
+            if redacted:
+                self._redacted.write(redacted)
+                self._redacted_last = redacted[-1]
+            if self._raw_last != "\n":
+                self._raw.write("\n")
+            if self._redacted_last != "\n":
+                self._redacted.write("\n")
+            self._raw.close()
+            self._redacted.close()
+            self._raw = None
+            self._redacted = None
 
 
 def redact_log(raw_log_path: Path, redacted_log_path: Path) -> None:
-    raw_text = raw_log_path.read_text(encoding="utf-8", errors="replace")
     redacted_log_path.parent.mkdir(parents=True, exist_ok=True)
-    redacted_log_path.write_text(redact_text(raw_text), encoding="utf-8")
+    redactor = StreamingRedactor()
+    with raw_log_path.open("r", encoding="utf-8", errors="replace", newline="") as src:
+        with redacted_log_path.open("w", encoding="utf-8") as dst:
+            for line in src:
+                dst.write(redactor.feed(line))
+            dst.write(redactor.flush())
 
 
 def write_command_log(path: Path, commands: list[dict]) -> None:
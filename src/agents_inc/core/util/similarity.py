@@ -0,0 +1,112 @@
+"""Token-set similarity for consensus clustering and head-meeting alignment.
+
+Jaccard scores are computed from inverted-index overlap counts, so only
+pairs that share at least one token are ever compared. Results are identical
+to the all-pairs set formulation.
+"""
+
+from __future__ import annotations
+
+from typing import AbstractSet, Dict, List, Sequence, Tuple
+
+
+def token_jaccard(left: AbstractSet[str], right: AbstractSet[str]) -> float:
+    if not left and not right:
+        return 1.0
+    if not left or not right:
+        return 0.0
+    overlap = len(left & right)
+    return overlap / (len(left) + len(right) - overlap)
+
+
+class NearDuplicateIndex:
+    """Inverted index over fixed token sets that finds the most similar entry.
+
+    Entries are never modified once added, which is what lets the overlap
+    counts stand in for full set intersections.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self._postings: List[List[int]] = []
+        self._sizes: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def add(self, tokens: AbstractSet[str]) -> int:
+        entry = len(self._sizes)
+        self._sizes.append(len(tokens))
+        for token in tokens:
+            token_id = self._ids.get(token)
+            if token_id is None:
+                token_id = len(self._postings)
+                self._ids[token] = token_id
+                self._postings.append([])
+            self._postings[token_id].append(entry)
+        return entry
+
+    def best_match(self, tokens: AbstractSet[str], threshold: float = 0.0) -> Tuple[int, float]:
+        """Return ``(entry, similarity)`` for the best entry, or ``(-1, 0.0)``.
+
+        Only entries sharing a token with ``tokens`` are scored; ties go to the
+        earliest entry and entries scoring below ``threshold`` are skipped.
+        """
+        size = len(tokens)
+        if not size:
+            return -1, 0.0
+        overlaps: Dict[int, int] = {}
+        for token in tokens:
+            token_id = self._ids.get(token)
+            if token_id is None:
+                continue
+            for entry in self._postings[token_id]:
+                overlaps[entry] = overlaps.get(entry, 0) + 1
+        best_entry = -1
+        best_similarity = 0.0
+        for entry, overlap in overlaps.items():
+            similarity = overlap / (size + self._sizes[entry] - overlap)
+            if similarity < threshold:
+                continue
+            if similarity > best_similarity or (
+                similarity == best_similarity and entry < best_entry
+            ):
+                best_entry = entry
+                best_similarity = similarity
+        return best_entry, best_similarity
+
+
+def jaccard_matrix(
+    token_map: Dict[str, AbstractSet[str]], keys: Sequence[str]
+) -> Dict[Tuple[str, str], float]:
+    """Full symmetric Jaccard matrix over ``keys``; disjoint pairs score 0.0."""
+    matrix: Dict[Tuple[str, str], float] = {}
+    postings: Dict[str, List[int]] = {}
+    sizes: List[int] = []
+    for index, key in enumerate(keys):
+        tokens = token_map.get(key) or set()
+        sizes.append(len(tokens))
+        for token in tokens:
+            postings.setdefault(token, []).append(index)
+    overlaps: Dict[Tuple[int, int], int] = {}
+    for rows in postings.values():
+        for position, left in enumerate(rows):
+            for right in rows[position + 1 :]:
+                pair = (left, right)
+                overlaps[pair] = overlaps.get(pair, 0) + 1
+    for index, left_key in enumerate(keys):
+        matrix[(left_key, left_key)] = 1.0
+        for right_index in range(index + 1, len(keys)):
+            right_key = keys[right_index]
+            left_size = sizes[index]
+            right_size = sizes[right_index]
+            if not left_size and not right_size:
+                similarity = 1.0
+            elif not left_size or not right_size:
+                similarity = 0.0
+            else:
+                overlap = overlaps.get((index, right_index), 0)
+                similarity = overlap / (left_size + right_size - overlap)
+            matrix[(left_key, right_key)] = similarity
+            matrix[(right_key, left_key)] = similarity
+    return matrix
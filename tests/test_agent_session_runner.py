@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import io
+import json
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -15,9 +18,34 @@ if str(SRC) not in sys.path:
 from agents_inc.core.agent_session_runner import (  # noqa: E402
     AgentRunConfig,
     AgentSessionRunner,
+    SessionOutputParser,
+    _extract_last_json_object,
     _parse_session_output,
 )
-from agents_inc.core.codex_app_client import TurnResult  # noqa: E402
+from agents_inc.core.codex_app_client import CodexAppServerError, TurnResult  # noqa: E402
+from agents_inc.core.transcript_capture import TailBuffer  # noqa: E402
+
+
+def _reference_extract_last_json_object(raw_text: str):  # type: ignore[no-untyped-def]
+    # Previous quadratic implementation, kept to check the scanner returns the same result.
+    decoder = json.JSONDecoder()
+    best = (None, None)
+    best_len = -1
+    best_start = -1
+    for index, char in enumerate(raw_text):
+        if char != "{":
+            continue
+        try:
+            parsed, end_index = decoder.raw_decode(raw_text[index:])
+        except Exception:
+            continue
+        if not isinstance(parsed, dict):
+            continue
+        if end_index > best_len or (end_index == best_len and index > best_start):
+            best = (parsed, (index, index + end_index))
+            best_len = end_index
+            best_start = index
+    return best
 
 
 class AgentSessionRunnerTimeoutTests(unittest.TestCase):
@@ -32,11 +60,14 @@ class AgentSessionRunnerTimeoutTests(unittest.TestCase):
                 redacted_log_path=project_root / "redacted.log",
                 timeout_sec=0,
             )
-            with patch("subprocess.run") as run_mock:
-                run_mock.return_value.returncode = 0
+            with patch("subprocess.Popen") as popen_mock:
+                proc = popen_mock.return_value
+                proc.stdout = io.StringIO("")
+                proc.stderr = io.StringIO("")
+                proc.returncode = 0
                 with patch.object(AgentSessionRunner, "_launch_env", return_value={}):
                     runner._run_process(config=config, cmd=["echo", "ok"])
-            kwargs = run_mock.call_args.kwargs
+            kwargs = proc.wait.call_args.kwargs
             self.assertIsNone(kwargs.get("timeout"))
 
     def test_finite_timeout_uses_seconds(self) -> None:
@@ -50,11 +81,14 @@ class AgentSessionRunnerTimeoutTests(unittest.TestCase):
                 redacted_log_path=project_root / "redacted.log",
                 timeout_sec=77,
             )
-            with patch("subprocess.run") as run_mock:
-                run_mock.return_value.returncode = 0
+            with patch("subprocess.Popen") as popen_mock:
+                proc = popen_mock.return_value
+                proc.stdout = io.StringIO("")
+                proc.stderr = io.StringIO("")
+                proc.returncode = 0
                 with patch.object(AgentSessionRunner, "_launch_env", return_value={}):
                     runner._run_process(config=config, cmd=["echo", "ok"])
-            kwargs = run_mock.call_args.kwargs
+            kwargs = proc.wait.call_args.kwargs
             self.assertEqual(kwargs.get("timeout"), 77)
 
     def test_backend_registry_env_selection(self) -> None:
@@ -146,6 +180,212 @@ Here is final payload:
         self.assertEqual(payload.get("status"), "COMPLETE")
         self.assertTrue(bool(work.strip()))
 
+    def test_extract_last_json_object_prefers_longest_object(self) -> None:
+        cases = [
+            'notes {"a": 1} more {"b": {"c": 2}, "d": "x}y"} tail',
+            'prose with {stray brace then {"status": "COMPLETE", "claims": []}',
+            'he said "quote and then\n{"k": "v \\" }"}',
+            '{not json {"inner": true}}',
+            '{"a": 1}{"b": 2}',
+            'note {see "x} {"a": 1}',
+            'set {it\'s "quoted} ok {"a": {"b": 1}}',
+            'x {y "z} {"k": 1} "w}',
+            'stray {brace "then {"multi":\n  {"line": true}\n} }',
+            "no objects here",
+        ]
+        expected = [
+            {"b": {"c": 2}, "d": "x}y"},
+            {"status": "COMPLETE", "claims": []},
+            {"k": 'v " }'},
+            {"inner": True},
+            {"b": 2},
+            {"a": 1},
+            {"a": {"b": 1}},
+            {"k": 1},
+            {"multi": {"line": True}},
+            None,
+        ]
+        for raw, want in zip(cases, expected):
+            parsed, span = _extract_last_json_object(raw)
+            self.assertEqual(parsed, want, msg=raw)
+            self.assertEqual((parsed, span), _reference_extract_last_json_object(raw), msg=raw)
+
+    def test_extract_last_json_object_is_linear_on_large_transcripts(self) -> None:
+        lines = []
+        for index in range(30000):
+            lines.append(json.dumps({"type": "item.delta", "delta": f"tok {index} {{x}}"}))
+            lines.append('prose with {brace and "quote')
+            lines.append('code print(f"{value}") s.split(\'{\') "x {y')
+        payload = {"status": "COMPLETE", "claims": [{"claim": f"c{i}"} for i in range(200)]}
+        lines.append(json.dumps(payload))
+        raw = "\n".join(lines)
+        started = time.monotonic()
+        parsed, span = _extract_last_json_object(raw)
+        elapsed = time.monotonic() - started
+        self.assertEqual(parsed, payload)
+        self.assertEqual(span, (len(raw) - len(lines[-1]), len(raw)))
+        self.assertLess(elapsed, 5.0)
+
+    def test_session_output_parser_matches_batch_parse_across_split_chunks(self) -> None:
+        raw = (
+            "LIVE_NOTE: starting\n"
+            "begin_work\n# Work\n\nstreamed body\nEND_WORK\n"
+            "BEGIN_HANDOFF_JSON\nnot json yet\nEND_HANDOFF_JSON\n"
+            "BEGIN_HANDOFF_JSON\n{\"status\": \"COMPLETE\", \"next_actions\": [\"ship\"]}\nEND_HANDOFF_JSON\n"
+        )
+        seen = []
+        parser = SessionOutputParser(on_handoff=seen.append)
+        for index in range(0, len(raw), 3):
+            parser.feed_stream_event({"event": "agent_delta", "text": raw[index : index + 3]})
+        self.assertTrue(parser.handoff_ready)
+        self.assertEqual(parser.result(), _parse_session_output(raw))
+        self.assertEqual(seen, [{"status": "COMPLETE", "next_actions": ["ship"]}])
+
+    def test_session_output_parser_reports_handoff_before_stream_ends(self) -> None:
+        seen = []
+        parser = SessionOutputParser(on_handoff=seen.append)
+        parser.feed_stream_event({"event": "agent_delta", "text": "BEGIN_HANDOFF_JSON\n{\"status\":"})
+        self.assertFalse(parser.handoff_ready)
+        parser.feed_stream_event({"event": "agent_delta", "text": " \"PARTIAL\"}\nEND_HANDOFF"})
+        self.assertEqual(seen, [])
+        parser.feed_stream_event({"event": "agent_delta", "text": "_JSON\nBEGIN_WORK\n"})
+        self.assertEqual(seen, [{"status": "PARTIAL"}])
+        self.assertIsNone(parser.result())
+
+        # The completed message replaces its deltas and does not fire the callback again.
+        parser.feed_stream_event(
+            {
+                "event": "agent_message",
+                "text": "BEGIN_HANDOFF_JSON\n{\"status\": \"PARTIAL\"}\nEND_HANDOFF_JSON\nBEGIN_WORK\nok\nEND_WORK",
+            }
+        )
+        self.assertEqual(parser.result(), ("ok", {"status": "PARTIAL"}, "", "strict"))
+        self.assertEqual(len(seen), 1)
+
+    def test_session_output_parser_is_linear_in_small_deltas(self) -> None:
+        filler = "".join(f"line {index} with some streamed words\n" for index in range(80000))
+        raw = (
+            "BEGIN_WORK\n" + filler + "END_WORK\n"
+            + filler
+            + 'BEGIN_HANDOFF_JSON\n{"status": "COMPLETE"}\nEND_HANDOFF_JSON\n'
+        )
+        parser = SessionOutputParser()
+        started = time.monotonic()
+        for index in range(0, len(raw), 20):
+            parser.feed_stream_event({"event": "agent_delta", "text": raw[index : index + 20]})
+        elapsed = time.monotonic() - started
+        self.assertGreater(len(raw), 5_000_000)
+        self.assertEqual(parser.result(), (filler.strip(), {"status": "COMPLETE"}, "", "strict"))
+        self.assertLess(elapsed, 10.0)
+
+    def test_session_output_parser_surfaces_invalid_handoff_json(self) -> None:
+        parser = SessionOutputParser()
+        parser.feed_text("BEGIN_WORK\nok\nEND_WORK\nBEGIN_HANDOFF_JSON\n{\"status\": }\nEND_HANDOFF_JSON\n")
+        work, handoff, error, mode = parser.result()  # type: ignore[misc]
+        self.assertEqual((work, handoff, mode), ("ok", {}, "strict"))
+        self.assertTrue(error.startswith("invalid handoff json"))
+        self.assertFalse(parser.handoff_ready)
+
+    def test_mock_output_size_is_configurable(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_root = Path(td)
+            config = AgentRunConfig(
+                project_root=project_root,
+                prompt="Role: domain-core\n",
+                raw_log_path=project_root / "raw.log",
+                redacted_log_path=project_root / "redacted.log",
+                session_label="group-a/specialist",
+            )
+            runner = AgentSessionRunner(backend="mock")
+            baseline = runner.run(config)
+            with patch.dict("os.environ", {"AGENTS_INC_MOCK_OUTPUT_BYTES": "40000"}):
+                padded = runner.run(config)
+            self.assertTrue(padded.success)
+            self.assertGreater(len(padded.parsed_handoff["claims"]), 1)
+            self.assertEqual(len(baseline.parsed_handoff["claims"]), 1)
+            self.assertGreater(len(padded.raw_text), 40000)
+            self.assertLess(len(padded.raw_text), 60000)
+
+    def test_codex_exec_streams_logs_and_keeps_bounded_output(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_root = Path(td)
+            answer = (
+                "BEGIN_WORK\nok\nEND_WORK\n"
+                'BEGIN_HANDOFF_JSON\n{"status": "COMPLETE"}\nEND_HANDOFF_JSON'
+            )
+            script = (
+                "import json\n"
+                "print(json.dumps({'type': 'thread.started', 'thread_id': 'thread-x'}))\n"
+                "for i in range(3000):\n"
+                "    print('tool output line %05d ' % i + 'x' * 80)\n"
+                "print('api_key=SUPERSECRET123')\n"
+                f"item = {{'type': 'agent_message', 'text': {answer!r}}}\n"
+                "print(json.dumps({'type': 'item.completed', 'item': item}))\n"
+            )
+            runner = AgentSessionRunner(backend="mock")
+            config = AgentRunConfig(
+                project_root=project_root,
+                prompt="test prompt",
+                raw_log_path=project_root / "raw.log",
+                redacted_log_path=project_root / "redacted.log",
+            )
+            with patch("shutil.which", return_value=sys.executable), patch.object(
+                AgentSessionRunner, "_build_codex_cmd", return_value=[sys.executable, "-c", script]
+            ), patch.object(AgentSessionRunner, "_launch_env", return_value=None), patch(
+                "agents_inc.core.agent_session_runner.TailBuffer", lambda: TailBuffer(4096)
+            ):
+                result = runner._run_codex(config)
+
+            self.assertTrue(result.success, result.error)
+            self.assertEqual(result.thread_id, "thread-x")
+            self.assertEqual(result.parsed_handoff.get("status"), "COMPLETE")
+            self.assertLessEqual(len(result.stdout), 4096)
+            raw_log = config.raw_log_path.read_text(encoding="utf-8")
+            self.assertIn("tool output line 00000", raw_log)
+            self.assertIn("SUPERSECRET123", raw_log)
+            redacted_log = config.redacted_log_path.read_text(encoding="utf-8")
+            self.assertIn("tool output line 02999", redacted_log)
+            self.assertNotIn("SUPERSECRET123", redacted_log)
+
+    def test_codex_exec_fallback_parse_rereads_the_transcript(self) -> None:
+        # Both runs outgrow the 4 KiB tails and carry the handoff in a JSON fence, so the
+        # fallback parse needs the whole text back from the raw log.
+        prelude = (
+            "import json\n"
+            "body = ''.join('work line %05d %s\\n' % (i, 'y' * 60) for i in range(2000))\n"
+            "handoff = '```json\\n{\"status\": \"COMPLETE\"}\\n```'\n"
+            "work = 'BEGIN_WORK\\n' + body + 'END_WORK'\n"
+        )
+        scripts = {
+            "plain": prelude + "print(work + '\\n' + handoff)\n",
+            "events": prelude
+            + "for text in (work, handoff):\n"
+            + "    item = {'type': 'agent_message', 'text': text}\n"
+            + "    print(json.dumps({'type': 'item.completed', 'item': item}))\n",
+        }
+        body = "".join("work line %05d %s\n" % (i, "y" * 60) for i in range(2000))
+        for name, script in scripts.items():
+            with self.subTest(name), tempfile.TemporaryDirectory() as td:
+                project_root = Path(td)
+                config = AgentRunConfig(
+                    project_root=project_root,
+                    prompt="test prompt",
+                    raw_log_path=project_root / "raw.log",
+                    redacted_log_path=project_root / "redacted.log",
+                )
+                with patch("shutil.which", return_value=sys.executable), patch.object(
+                    AgentSessionRunner,
+                    "_build_codex_cmd",
+                    return_value=[sys.executable, "-c", script],
+                ), patch.object(AgentSessionRunner, "_launch_env", return_value=None), patch(
+                    "agents_inc.core.agent_session_runner.TailBuffer", lambda: TailBuffer(4096)
+                ):
+                    result = AgentSessionRunner(backend="mock")._run_codex(config)
+                self.assertTrue(result.success, result.error)
+                self.assertEqual(result.parse_mode, "fallback")
+                self.assertEqual(result.parsed_handoff, {"status": "COMPLETE"})
+                self.assertEqual(result.parsed_work, body.strip())
+
     def test_streaming_head_sessions_use_app_server_path(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             project_root = Path(td)
@@ -227,6 +467,59 @@ Here is final payload:
             self.assertIn("agent_delta", event_names)
             self.assertIn("agent_message", event_names)
 
+    def test_failed_resume_rotates_with_fallback_prompt(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_root = Path(td)
+            prompts = []
+
+            class _StaleThreadClient:
+                def __init__(self, **kwargs) -> None:  # type: ignore[no-untyped-def]
+                    return None
+
+                def start(self) -> None:
+                    return None
+
+                def close(self) -> None:
+                    return None
+
+                def start_thread(self) -> str:
+                    return "thread-fresh"
+
+                def resume_thread(self, thread_id: str) -> str:
+                    raise CodexAppServerError(f"unknown thread {thread_id}")
+
+                def run_turn(self, *, thread_id: str, text: str, **kwargs) -> TurnResult:  # type: ignore[no-untyped-def]
+                    prompts.append(text)
+                    return TurnResult(
+                        thread_id=thread_id,
+                        turn_id="turn-1",
+                        text="BEGIN_WORK\nok\nEND_WORK\nBEGIN_HANDOFF_JSON\n{}\nEND_HANDOFF_JSON\n",
+                    )
+
+            runner = AgentSessionRunner(backend="mock")
+            config = AgentRunConfig(
+                project_root=project_root,
+                prompt="delta prompt",
+                fallback_prompt="full prompt",
+                thread_id="thread-stale",
+                raw_log_path=project_root / "raw.log",
+                redacted_log_path=project_root / "redacted.log",
+                web_search=True,
+                stream_callback=lambda event: None,
+            )
+            with patch("shutil.which", return_value="/usr/bin/codex"):
+                with patch(
+                    "agents_inc.core.agent_session_runner.CodexAppClient",
+                    _StaleThreadClient,
+                ):
+                    result = runner._run_codex(config)
+
+            self.assertTrue(result.success)
+            self.assertTrue(result.rotated_thread)
+            self.assertEqual(result.thread_id, "thread-fresh")
+            self.assertEqual(len(prompts), 1)
+            self.assertTrue(prompts[0].endswith("full prompt"))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
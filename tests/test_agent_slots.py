@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from copy import deepcopy
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from agents_inc.core.agent_session_runner import AgentSessionRunner  # noqa: E402
+from agents_inc.core.agent_slots import (  # noqa: E402
+    HEAD_SLOT_TIER,
+    SPECIALIST_SLOT_TIER,
+    AgentSlotPool,
+    specialist_critical_path_lengths,
+)
+from agents_inc.core.layered_runtime import LayeredRuntimeConfig, run_layered_runtime  # noqa: E402
+
+
+class AgentSlotPoolTests(unittest.TestCase):
+    def test_capacity_bounds_concurrent_holders(self) -> None:
+        pool = AgentSlotPool(2)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def _work() -> None:
+            with pool.slot((SPECIALIST_SLOT_TIER,)):
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                time.sleep(0.05)
+                with lock:
+                    state["active"] -= 1
+
+        threads = [threading.Thread(target=_work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(state["peak"], 2)
+        stats = pool.stats()
+        self.assertEqual(stats["peak"], 2)
+        self.assertEqual(stats["granted"], 8)
+        self.assertEqual(stats["active"], 0)
+
+    def test_waiters_are_granted_in_priority_order(self) -> None:
+        pool = AgentSlotPool(1)
+        order: list[str] = []
+        pool.acquire((SPECIALIST_SLOT_TIER,))
+
+        def _wait(label: str, priority: tuple) -> None:
+            with pool.slot(priority):
+                order.append(label)
+
+        threads = [
+            threading.Thread(target=_wait, args=("specialist", (SPECIALIST_SLOT_TIER, -1))),
+            threading.Thread(target=_wait, args=("critical", (SPECIALIST_SLOT_TIER, -3))),
+            threading.Thread(target=_wait, args=("head", (HEAD_SLOT_TIER,))),
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 2.0
+        while pool.stats()["waiting"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        pool.release()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(order, ["head", "critical", "specialist"])
+
+    def test_zero_capacity_is_unlimited(self) -> None:
+        pool = AgentSlotPool(0)
+        for _ in range(5):
+            pool.acquire()
+        self.assertEqual(pool.stats()["active"], 5)
+
+    def test_critical_path_lengths_follow_dependents(self) -> None:
+        lengths = specialist_critical_path_lengths(
+            {"a": [], "b": ["a"], "c": ["b"], "d": []}
+        )
+        self.assertEqual(lengths, {"a": 3, "b": 2, "c": 1, "d": 1})
+
+    def test_runtime_caps_sessions_across_groups(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            project_root = root / "project-root"
+            project_dir = root / "project-dir"
+            turn_dir = root / "turn-001"
+            for path in [project_root, project_dir, turn_dir]:
+                path.mkdir(parents=True, exist_ok=True)
+
+            developer_manifest = yaml.safe_load(
+                (ROOT / "catalog" / "groups" / "developer.yaml").read_text(encoding="utf-8")
+            )
+            qa_manifest = yaml.safe_load(
+                (ROOT / "catalog" / "groups" / "quality-assurance.yaml").read_text(encoding="utf-8")
+            )
+            runtime_config = LayeredRuntimeConfig(
+                project_id="proj-slots",
+                project_root=project_root,
+                project_dir=project_dir,
+                turn_dir=turn_dir,
+                message="test global agent slots",
+                selected_groups=["developer", "quality-assurance"],
+                group_manifests={
+                    "developer": deepcopy(developer_manifest),
+                    "quality-assurance": deepcopy(qa_manifest),
+                },
+                max_parallel=3,
+            )
+
+            lock = threading.Lock()
+            state = {"active": 0, "peak": 0}
+            original_run = AgentSessionRunner.run
+
+            def _tracked_run(self, config):  # type: ignore[no-untyped-def]
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                try:
+                    time.sleep(0.02)
+                    return original_run(self, config)
+                finally:
+                    with lock:
+                        state["active"] -= 1
+
+            with patch.dict("os.environ", {"AGENTS_INC_BACKEND": "mock"}, clear=False):
+                with patch.object(AgentSessionRunner, "run", _tracked_run):
+                    result = run_layered_runtime(runtime_config)
+
+            self.assertFalse(bool(result.get("blocked")))
+            self.assertLessEqual(state["peak"], 3)
+            self.assertGreaterEqual(state["peak"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
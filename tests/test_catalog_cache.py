@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from agents_inc.core import fabric_lib  # noqa: E402
+from agents_inc.core.catalog_cache import catalog_cache_path  # noqa: E402
+from agents_inc.core.fabric_lib import (  # noqa: E402
+    check_group_catalog,
+    load_group_catalog,
+    load_profiles,
+    load_project_manifest,
+)
+
+
+def _no_parse(*_args, **_kwargs):
+    raise AssertionError("yaml.safe_load called for an unchanged file")
+
+
+class CatalogCacheTests(unittest.TestCase):
+    def _fabric(self, td: str) -> Path:
+        fabric_root = Path(td) / "fabric"
+        shutil.copytree(ROOT / "catalog" / "groups", fabric_root / "catalog" / "groups")
+        shutil.copytree(ROOT / "catalog" / "profiles", fabric_root / "catalog" / "profiles")
+        return fabric_root
+
+    def test_unchanged_files_are_served_without_parsing(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            fabric_root = self._fabric(td)
+            project_dir = fabric_root / "generated" / "projects" / "proj-cache"
+            project_dir.mkdir(parents=True)
+            (project_dir / "manifest.yaml").write_text(
+                yaml.safe_dump({"project_id": "proj-cache", "groups": {}}), encoding="utf-8"
+            )
+            groups = load_group_catalog(fabric_root)
+            profiles = load_profiles(fabric_root)
+            _, manifest = load_project_manifest(fabric_root, "proj-cache")
+            self.assertTrue(catalog_cache_path(fabric_root).exists())
+
+            with patch("agents_inc.core.util.fs.yaml.safe_load", side_effect=_no_parse):
+                self.assertEqual(load_group_catalog(fabric_root), groups)
+                self.assertEqual(load_profiles(fabric_root), profiles)
+                self.assertEqual(load_project_manifest(fabric_root, "proj-cache")[1], manifest)
+                # Callers get their own copies.
+                load_group_catalog(fabric_root)["developer"]["purpose"] = "mutated"
+                self.assertEqual(load_group_catalog(fabric_root), groups)
+
+    def test_changed_added_and_removed_sources_invalidate_entries(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            fabric_root = self._fabric(td)
+            groups_dir = fabric_root / "catalog" / "groups"
+            load_group_catalog(fabric_root)
+
+            developer = groups_dir / "developer.yaml"
+            data = yaml.safe_load(developer.read_text(encoding="utf-8"))
+            data["purpose"] = "A different purpose for the developer group."
+            developer.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+            (groups_dir / "extra.yaml").write_text(
+                yaml.safe_dump({**data, "group_id": "extra"}), encoding="utf-8"
+            )
+            (groups_dir / "data-curation.yaml").unlink()
+
+            reloaded = load_group_catalog(fabric_root)
+            self.assertEqual(reloaded["developer"]["purpose"], data["purpose"])
+            self.assertIn("extra", reloaded)
+            self.assertNotIn("data-curation", reloaded)
+            cached = json.loads(catalog_cache_path(fabric_root).read_text(encoding="utf-8"))
+            self.assertIn("catalog/groups/extra.yaml", cached["entries"])
+            self.assertNotIn("catalog/groups/data-curation.yaml", cached["entries"])
+
+            # YAML that does not survive JSON (a date) is parsed every time, never cached.
+            (groups_dir / "dated.yaml").write_text(
+                "group_id: dated\ncreated: 2024-01-02\n", encoding="utf-8"
+            )
+            self.assertEqual(str(load_group_catalog(fabric_root)["dated"]["created"]), "2024-01-02")
+            cached = json.loads(catalog_cache_path(fabric_root).read_text(encoding="utf-8"))
+            self.assertNotIn("catalog/groups/dated.yaml", cached["entries"])
+
+    def test_group_shape_checks_are_memoized_until_the_version_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            fabric_root = self._fabric(td)
+            calls = []
+            original = fabric_lib.ensure_group_shape
+
+            def _counting(group: dict, source: str = "<unknown>") -> list:
+                calls.append(source)
+                return original(group, source)
+
+            with patch.object(fabric_lib, "ensure_group_shape", _counting):
+                groups, errors = check_group_catalog(fabric_root)
+                self.assertEqual(errors, [])
+                self.assertEqual(len(calls), len(groups))
+                self.assertEqual(check_group_catalog(fabric_root), (groups, []))
+                self.assertEqual(len(calls), len(groups))
+                with patch.object(fabric_lib, "catalog_cache_version", return_value="next"):
+                    check_group_catalog(fabric_root)
+                self.assertEqual(len(calls), 2 * len(groups))
+
+    def test_cache_can_be_disabled(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            fabric_root = self._fabric(td)
+            with patch.dict("os.environ", {"AGENTS_INC_CATALOG_CACHE": "off"}):
+                load_group_catalog(fabric_root)
+            self.assertFalse(catalog_cache_path(fabric_root).exists())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import os
+import subprocess
 import sys
 import tempfile
 import unittest
@@ -50,6 +52,13 @@ class CLIMainTests(unittest.TestCase):
         self.assertEqual(code, 3)
         mocked.assert_called_once()
 
+    def test_main_routes_token_ledger_command(self) -> None:
+        with patch("agents_inc.cli.token_ledger.main", return_value=8) as mocked:
+            with patch.object(sys, "argv", ["agents-inc", "token-ledger", "proj-x", "--by", "agent"]):
+                code = cli_main.main()
+        self.assertEqual(code, 8)
+        mocked.assert_called_once()
+
     def test_main_routes_list_command(self) -> None:
         with patch("agents_inc.cli.list_sessions.main", return_value=7) as mocked:
             with patch.object(sys, "argv", ["agents-inc", "list", "--json"]):
@@ -108,6 +117,48 @@ class CLIMainTests(unittest.TestCase):
             code = cli_main.main()
         self.assertEqual(code, 0)
 
+    def test_every_command_resolves_to_a_cli_main(self) -> None:
+        for cmd in cli_main.COMMANDS:
+            self.assertTrue(callable(cli_main._load_command(cmd)), cmd)
+
+    def test_startup_imports_stay_within_budget(self) -> None:
+        # A fresh interpreter shows what each invocation really loads; the budget is
+        # expressed in modules so it does not flake with machine speed.
+        probe = (
+            "import sys\n"
+            "from agents_inc.cli import main\n"
+            "sys.argv = ['agents-inc', *sys.argv[1:]]\n"
+            "try:\n"
+            "    main.main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "sys.stderr.write(' '.join(sorted(sys.modules)))\n"
+        )
+        heavy = {
+            "agents_inc.core.orchestrator_reply",
+            "agents_inc.core.layered_runtime",
+            "agents_inc.core.live_dashboard",
+            "rich",
+        }
+        with tempfile.TemporaryDirectory() as td:
+            for argv, budget in ((["--version"], 4), (["--help"], 4), (["list", "--help"], 30)):
+                proc = subprocess.run(
+                    [sys.executable, "-c", probe, *argv],
+                    capture_output=True,
+                    text=True,
+                    cwd=td,
+                    env={**os.environ, "PYTHONPATH": str(SRC), "HOME": td},
+                    check=False,
+                )
+                self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+                modules = set(proc.stderr.split())
+                ours = sorted(name for name in modules if name.startswith("agents_inc"))
+                self.assertLessEqual(len(ours), budget, msg=f"{argv}: {ours}")
+                self.assertFalse(heavy & modules, msg=f"{argv}: {sorted(heavy & modules)}")
+                if argv[0].startswith("-"):
+                    self.assertNotIn("yaml", modules)
+                    self.assertNotIn("importlib.metadata", modules)
+
     def test_resume_cli_no_launch(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             project_root = Path(td) / "proj-test"
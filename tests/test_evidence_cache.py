@@ -3,16 +3,25 @@ from __future__ import annotations
 
 import sys
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 
+import yaml
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
 from agents_inc.core.evidence_cache import (  # noqa: E402
+    EVIDENCE_CACHE_COMPACT_MIN_RECORDS,
+    EvidenceCacheStore,
+    EvidenceCacheWriteBuffer,
+    evidence_cache_log_path,
+    evidence_cache_path,
     evidence_id_for_citation,
+    legacy_evidence_cache_path,
     load_evidence_cache,
     merge_evidence_refs_into_cache,
 )
@@ -51,6 +60,113 @@ class EvidenceCacheTests(unittest.TestCase):
             self.assertIn("ev_c", entries)
             self.assertNotIn("ev_a", entries)
 
+    def test_store_replays_log_written_by_another_writer(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_root = Path(td)
+            writer = EvidenceCacheStore(project_root, max_entries=3)
+            reader = EvidenceCacheStore(project_root)
+            writer.merge([{"evidence_id": "ev_a", "citation": "https://a.example.org"}], max_entries=3)
+            self.assertEqual(reader.get_many(["ev_a"])["ev_a"]["citation"], "https://a.example.org")
+            self.assertEqual(reader.max_entries, 3)
+
+            reader.merge([{"evidence_id": "ev_a"}, {"evidence_id": "ev_b"}])
+            writer.compact()
+            self.assertEqual(evidence_cache_log_path(project_root).read_text(encoding="utf-8"), "")
+            self.assertEqual(reader.get_many(["ev_a"])["ev_a"]["hit_count"], 2)
+
+            restarted = EvidenceCacheStore(project_root)
+            self.assertEqual(sorted(restarted.to_payload()["entries"]), ["ev_a", "ev_b"])
+
+    def test_log_is_compacted_into_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_root = Path(td)
+            store = EvidenceCacheStore(project_root)
+            for index in range(EVIDENCE_CACHE_COMPACT_MIN_RECORDS):
+                store.merge([{"evidence_id": f"ev_{index % 4}"}])
+            self.assertTrue(evidence_cache_path(project_root).exists())
+            self.assertEqual(evidence_cache_log_path(project_root).stat().st_size, 0)
+            self.assertEqual(len(store), 4)
+
+    def test_concurrent_merges_do_not_lose_updates(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_root = Path(td)
+
+            def _merge(worker: int) -> None:
+                for _ in range(20):
+                    merge_evidence_refs_into_cache(
+                        project_root=project_root,
+                        evidence_refs=[{"evidence_id": "ev_shared"}, {"evidence_id": f"ev_{worker}"}],
+                    )
+
+            threads = [threading.Thread(target=_merge, args=(index,)) for index in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            restarted = EvidenceCacheStore(project_root)
+            self.assertEqual(restarted.get_many(["ev_shared"])["ev_shared"]["hit_count"], 160)
+            self.assertEqual(len(restarted), 9)
+
+    def test_legacy_yaml_cache_is_read_once(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_root = Path(td)
+            legacy = legacy_evidence_cache_path(project_root)
+            legacy.parent.mkdir(parents=True, exist_ok=True)
+            legacy.write_text(
+                yaml.safe_dump(
+                    {
+                        "schema_version": "1.0",
+                        "max_entries": 2,
+                        "entries": {
+                            "ev_new": {"evidence_id": "ev_new", "last_seen_at": "2026-01-02T00:00:00Z"},
+                            "ev_old": {"evidence_id": "ev_old", "last_seen_at": "2026-01-01T00:00:00Z"},
+                        },
+                    }
+                ),
+                encoding="utf-8",
+            )
+            store = EvidenceCacheStore(project_root)
+            evicted = store.merge([{"evidence_id": "ev_c"}])
+            self.assertEqual(evicted, ["ev_old"])
+            self.assertEqual(store.max_entries, 2)
+
+    def test_write_buffer_coalesces_refs_into_one_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_root = Path(td)
+            store = EvidenceCacheStore(project_root)
+            store.merge([{"evidence_id": "ev_old", "citation": "https://old.example.org"}])
+            buffer = EvidenceCacheWriteBuffer(store)
+
+            def _add(worker: int) -> None:
+                for _ in range(10):
+                    buffer.add(
+                        [
+                            {"evidence_id": "ev_shared", "citation": "https://shared.example.org"},
+                            {"evidence_id": f"ev_{worker}"},
+                        ]
+                    )
+
+            threads = [threading.Thread(target=_add, args=(index,)) for index in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            resolved = buffer.resolve(["ev_shared", "ev_old", "ev_missing"])
+            self.assertEqual(resolved["ev_shared"]["citation"], "https://shared.example.org")
+            self.assertEqual(resolved["ev_old"]["citation"], "https://old.example.org")
+            self.assertNotIn("ev_missing", resolved)
+            self.assertNotIn("ev_shared", EvidenceCacheStore(project_root).to_payload()["entries"])
+
+            log_lines_before = len(evidence_cache_log_path(project_root).read_text(encoding="utf-8").splitlines())
+            self.assertEqual(buffer.flush(), 7)
+            self.assertEqual(buffer.pending_count(), 0)
+            log_lines_after = len(evidence_cache_log_path(project_root).read_text(encoding="utf-8").splitlines())
+            self.assertEqual(log_lines_after - log_lines_before, 1)
+            entries = EvidenceCacheStore(project_root).to_payload()["entries"]
+            self.assertEqual(entries["ev_shared"]["hit_count"], 60)
+            self.assertEqual(entries["ev_3"]["hit_count"], 10)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
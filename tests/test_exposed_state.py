@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from agents_inc.core import exposed_state  # noqa: E402
+from agents_inc.core.exposed_state import ExposedStateSnapshot  # noqa: E402
+
+
+def _write_group(project_dir: Path, group_id: str, handoff: object) -> Path:
+    group_dir = project_dir / "agent-groups" / group_id
+    (group_dir / "exposed").mkdir(parents=True, exist_ok=True)
+    (group_dir / "group.yaml").write_text(
+        "head:\n  persona:\n    confidence_threshold: 0.7\n    override_policy: never\n",
+        encoding="utf-8",
+    )
+    (group_dir / "exposed" / "summary.md").write_text("# Summary\n", encoding="utf-8")
+    handoff_path = group_dir / "exposed" / "handoff.json"
+    handoff_path.write_text(
+        handoff if isinstance(handoff, str) else json.dumps(handoff), encoding="utf-8"
+    )
+    return handoff_path
+
+
+class ExposedStateSnapshotTests(unittest.TestCase):
+    def test_group_view_is_parsed_once_until_files_change(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_dir = Path(td)
+            handoff_path = _write_group(
+                project_dir,
+                "developer",
+                {
+                    "status": "COMPLETE",
+                    "claims": [{"claim": "a", "evidence_ids": ["e1"]}, "noise"],
+                    "evidence_refs": [{"evidence_id": "e1", "citation": "https://x"}],
+                },
+            )
+            snapshot = ExposedStateSnapshot(project_dir)
+            with patch.object(
+                exposed_state, "_parse_json_text", wraps=exposed_state._parse_json_text
+            ) as parse:
+                view = snapshot.group("developer")
+                self.assertIs(snapshot.group("developer"), view)
+                self.assertEqual(parse.call_count, 1)
+
+                self.assertEqual(view.persona_threshold, 0.7)
+                self.assertEqual(view.persona_override_policy, "never")
+                self.assertEqual(len(view.claims), 1)
+                self.assertEqual(view.evidence_lookup["e1"]["citation"], "https://x")
+                with self.assertRaises(TypeError):
+                    view.handoff["status"] = "PENDING"  # type: ignore[index]
+
+                handoff_path.write_text(json.dumps({"status": "PENDING"}), encoding="utf-8")
+                stat = handoff_path.stat()
+                os.utime(handoff_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+                refreshed = snapshot.group("developer")
+                self.assertEqual(parse.call_count, 2)
+            self.assertEqual(refreshed.handoff.get("status"), "PENDING")
+            self.assertEqual(refreshed.claims, ())
+
+    def test_missing_and_non_mapping_handoffs(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_dir = Path(td)
+            _write_group(project_dir, "developer", "[1, 2]")
+            snapshot = ExposedStateSnapshot(project_dir)
+            listed = snapshot.group("developer")
+            self.assertTrue(listed.handoff_exists)
+            self.assertFalse(listed.handoff_is_mapping)
+            missing = snapshot.group("quality-assurance")
+            self.assertFalse(missing.handoff_exists)
+            self.assertEqual(missing.persona_threshold, 0.8)
+            self.assertEqual(dict(missing.handoff), {})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -11,6 +11,7 @@ import time
 import unittest
 from dataclasses import dataclass
 from pathlib import Path
+from unittest.mock import patch
 
 import yaml
 
@@ -86,6 +87,18 @@ def run_cmd(cmd: list[str]) -> str:
     return proc.stdout
 
 
+# These tests use the repo checkout as the fabric root; keep the catalog cache out of the tree.
+_CATALOG_CACHE_OFF = patch.dict(os.environ, {"AGENTS_INC_CATALOG_CACHE": "off"})
+
+
+def setUpModule() -> None:
+    _CATALOG_CACHE_OFF.start()
+
+
+def tearDownModule() -> None:
+    _CATALOG_CACHE_OFF.stop()
+
+
 class FabricUnitTests(unittest.TestCase):
     def test_manifest_validation_rejects_invalid_group(self) -> None:
         manifest = {
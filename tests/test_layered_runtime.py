@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 import tempfile
 import time
 import unittest
 from copy import deepcopy
 from pathlib import Path
+from typing import List
 from unittest.mock import patch
 
 import yaml
@@ -17,7 +19,9 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
+from agents_inc.core.agent_home import symlink_or_copy  # noqa: E402
 from agents_inc.core.agent_session_runner import AgentSessionRunner  # noqa: E402
+from agents_inc.core.agent_threads import get_specialist_thread_record  # noqa: E402
 from agents_inc.core.evidence_cache import load_evidence_cache  # noqa: E402
 from agents_inc.core.layered_runtime import (  # noqa: E402
     HeadResult,
@@ -28,7 +32,6 @@ from agents_inc.core.layered_runtime import (  # noqa: E402
     _hydrate_evidence_refs_from_cache,
     _prepare_agent_codex_home,
     _resolve_head_timeout_sec,
-    _symlink_or_copy,
     run_layered_runtime,
 )
 
@@ -70,6 +73,68 @@ class LayeredRuntimeMountTests(unittest.TestCase):
             mounted_ref = agent_home / "skills" / "local" / "skill-a" / "references" / "doc.md"
             self.assertTrue(mounted_ref.exists())
 
+    def test_agent_codex_homes_share_one_template_and_reconcile(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            project_root = root / "project-root"
+            project_dir = root / "project-dir"
+            source_skill = (
+                project_root / ".agents-inc" / "codex-home" / "skills" / "local" / "skill-a"
+            )
+            source_skill.mkdir(parents=True, exist_ok=True)
+            (source_skill / "SKILL.md").write_text("# skill-a\n", encoding="utf-8")
+            refs = project_dir / "agent-groups" / "group-a" / "references"
+            refs.mkdir(parents=True, exist_ok=True)
+            (refs / "doc.md").write_text("ref\n", encoding="utf-8")
+            config = LayeredRuntimeConfig(
+                project_id="proj-a",
+                project_root=project_root,
+                project_dir=project_dir,
+                turn_dir=root / "turn",
+                message="test",
+                selected_groups=["group-a"],
+                group_manifests={},
+            )
+
+            def _prepare(agent: str):  # type: ignore[no-untyped-def]
+                return _prepare_agent_codex_home(
+                    config=config,
+                    runtime_dir=root / "runtime" / "group-a" / agent,
+                    group_id="group-a",
+                    allowed_skill_names=["skill-a"],
+                )
+
+            # Symlinks unavailable: the reference tree is copied into the template once
+            # and agent homes hard-link it instead of copying it again.
+            with patch.object(Path, "symlink_to", side_effect=OSError("symlink blocked")):
+                home_a, _, _, status_a = _prepare("specialist-a")
+                home_b, _, _, status_b = _prepare("specialist-b")
+            self.assertEqual(status_a["mode"], "copy")
+            self.assertEqual(status_a["home_template"], status_b["home_template"])
+            ref_a = home_a / "skills" / "local" / "skill-a" / "references" / "doc.md"
+            ref_b = home_b / "skills" / "local" / "skill-a" / "references" / "doc.md"
+            self.assertTrue(os.path.samefile(ref_a, ref_b))
+            self.assertFalse((source_skill / "references").exists())
+            templates = project_root / ".agents-inc" / "codex-home-templates"
+            self.assertEqual(len([p for p in templates.iterdir() if p.is_dir()]), 1)
+
+            # A later attempt keeps what matches and drops leftovers from the last run.
+            (home_a / "sessions").mkdir()
+            (home_a / "sessions" / "old.jsonl").write_text("{}\n", encoding="utf-8")
+            _, _, _, again = _prepare("specialist-a")
+            self.assertEqual(again["home_entries_linked"], 0)
+            self.assertGreater(again["home_entries_reused"], 0)
+            self.assertFalse((home_a / "sessions").exists())
+
+            # Changed references publish a new template and retire the old one.
+            (refs / "extra.md").write_text("more\n", encoding="utf-8")
+            _, _, _, changed = _prepare("specialist-a")
+            self.assertNotEqual(changed["home_template"], status_a["home_template"])
+            self.assertTrue(
+                (home_a / "skills" / "local" / "skill-a" / "references" / "extra.md").exists()
+            )
+            self.assertEqual(len([p for p in templates.iterdir() if p.is_dir()]), 1)
+
     def test_symlink_or_copy_falls_back_to_copy(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             root = Path(td)
@@ -78,7 +143,7 @@ class LayeredRuntimeMountTests(unittest.TestCase):
             src.mkdir(parents=True, exist_ok=True)
             (src / "a.txt").write_text("x\n", encoding="utf-8")
             with patch.object(Path, "symlink_to", side_effect=OSError("symlink blocked")):
-                _symlink_or_copy(src, dst)
+                symlink_or_copy(src, dst)
             self.assertTrue((dst / "a.txt").exists())
             self.assertFalse(dst.is_symlink())
 
@@ -442,6 +507,350 @@ class LayeredRuntimeMountTests(unittest.TestCase):
                 str(first_row.get("citation", "")),
             )
 
+    def test_failed_sessions_retry_with_per_class_backoff(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            project_root = root / "project-root"
+            project_dir = root / "project-dir"
+            project_root.mkdir(parents=True, exist_ok=True)
+            project_dir.mkdir(parents=True, exist_ok=True)
+            developer_manifest = yaml.safe_load(
+                (ROOT / "catalog" / "groups" / "developer.yaml").read_text(encoding="utf-8")
+            )
+            runtime_config = LayeredRuntimeConfig(
+                project_id="proj-retry-policy",
+                project_root=project_root,
+                project_dir=project_dir,
+                turn_dir=root / "turn-001",
+                message="retry transient failures",
+                selected_groups=["developer"],
+                group_manifests={"developer": deepcopy(developer_manifest)},
+                retry_attempts=2,
+                retry_backoff_sec=30,
+                retry_policies={"exit": {"base_delay_sec": 0.05, "max_delay_sec": 0.2}},
+            )
+
+            original_run = AgentSessionRunner.run
+            failed_once: set = set()
+
+            def _flaky_run(self, config):  # type: ignore[no-untyped-def]
+                label = str(config.session_label)
+                if label not in failed_once:
+                    failed_once.add(label)
+                    result = original_run(self, config)
+                    result.success = False
+                    if label.endswith("/head"):
+                        result.return_code = 0
+                        result.error = "invalid handoff json"
+                    else:
+                        result.return_code = 1
+                        result.error = "provider hiccup"
+                    return result
+                return original_run(self, config)
+
+            started = time.monotonic()
+            with patch.dict("os.environ", {"AGENTS_INC_BACKEND": "mock"}, clear=False):
+                with patch.object(AgentSessionRunner, "run", _flaky_run):
+                    result = run_layered_runtime(runtime_config)
+            elapsed = time.monotonic() - started
+
+            self.assertFalse(bool(result.get("blocked")))
+            # The 30s default backoff would apply to timeouts; exit and parse classes override it.
+            self.assertLess(elapsed, 20.0)
+            ledger = [
+                json.loads(line)
+                for line in Path(result["cooperation_ledger_path"])
+                .read_text(encoding="utf-8")
+                .splitlines()
+                if line.strip()
+            ]
+            specialist_retries = [row for row in ledger if row["event"] == "specialist_retry"]
+            self.assertTrue(specialist_retries)
+            for row in specialist_retries:
+                self.assertEqual(row["failure_class"], "exit")
+                self.assertTrue(0.025 <= row["retry_delay_sec"] <= 0.05)
+            head_retries = [row for row in ledger if row["event"] == "group_head_retry"]
+            self.assertEqual([row["failure_class"] for row in head_retries], ["parse"])
+            self.assertEqual(head_retries[0]["retry_delay_sec"], 0.0)
+            plan_path = root / "turn-001" / "layer2" / "orchestrator-plan.json"
+            plan = json.loads(plan_path.read_text(encoding="utf-8"))
+            self.assertEqual(plan["settings"]["retry_policies"]["timeout"]["base_delay_sec"], 30.0)
+            retry_stats = result["retry_stats"]
+            self.assertEqual(retry_stats["by_class"]["exit"], len(specialist_retries))
+            self.assertEqual(retry_stats["by_class"]["parse"], 1)
+            self.assertEqual(retry_stats["by_class"]["timeout"], 0)
+            self.assertEqual(retry_stats["scheduled"], len(specialist_retries) + 1)
+            self.assertEqual(plan["settings"]["retry_stats"], retry_stats)
+
+    def test_unchanged_specialists_reuse_prior_output(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            project_root = root / "project-root"
+            project_dir = root / "project-dir"
+            project_root.mkdir(parents=True, exist_ok=True)
+            project_dir.mkdir(parents=True, exist_ok=True)
+            developer_manifest = yaml.safe_load(
+                (ROOT / "catalog" / "groups" / "developer.yaml").read_text(encoding="utf-8")
+            )
+
+            def _config(turn: str, **overrides) -> LayeredRuntimeConfig:  # type: ignore
+                return LayeredRuntimeConfig(
+                    project_id="proj-reuse",
+                    project_root=project_root,
+                    project_dir=project_dir,
+                    turn_dir=root / turn,
+                    message="same objective every run",
+                    selected_groups=["developer"],
+                    group_manifests={"developer": deepcopy(developer_manifest)},
+                    **overrides,
+                )
+
+            captured = []
+            original_run = AgentSessionRunner.run
+
+            def _capture_run(self, config):  # type: ignore[no-untyped-def]
+                captured.append(str(config.session_label))
+                return original_run(self, config)
+
+            def _specialist_runs() -> List[str]:
+                rows = [label for label in captured if not label.endswith("/head")]
+                captured.clear()
+                return rows
+
+            # Only gate-passing output is memoized; mock handoffs cite unknown evidence ids.
+            with patch.dict("os.environ", {"AGENTS_INC_BACKEND": "mock"}, clear=False), patch(
+                "agents_inc.core.layered_runtime.gate_specialist_output",
+                return_value={"status": "PASS", "reasons": []},
+            ):
+                with patch.object(AgentSessionRunner, "run", _capture_run):
+                    first = run_layered_runtime(_config("turn-001"))
+                    first_runs = _specialist_runs()
+                    second = run_layered_runtime(_config("turn-002"))
+                    second_runs = _specialist_runs()
+                    third = run_layered_runtime(
+                        _config("turn-003", specialist_model="other-model")
+                    )
+                    third_runs = _specialist_runs()
+                    fourth = run_layered_runtime(
+                        _config(
+                            "turn-004",
+                            specialist_model="other-model",
+                            reuse_unchanged_specialists=False,
+                        )
+                    )
+                    fourth_runs = _specialist_runs()
+
+            for result in (first, second, third, fourth):
+                self.assertFalse(bool(result.get("blocked")))
+            self.assertGreater(len(first_runs), 0)
+            self.assertEqual(second_runs, [])
+            self.assertEqual(sorted(third_runs), sorted(first_runs))
+            self.assertEqual(sorted(fourth_runs), sorted(first_runs))
+
+            specialist_id = first_runs[0].split("/", 1)[1]
+            internal_dir = project_dir / "agent-groups" / "developer" / "internal" / specialist_id
+            snapshot_root = root / "turn-002" / "layer4" / "specialists" / "developer"
+            snapshot_meta = snapshot_root / specialist_id / "meta.json"
+            self.assertTrue((internal_dir / "handoff.json").exists())
+            self.assertTrue((internal_dir / "memo.json").exists())
+            meta = json.loads(snapshot_meta.read_text(encoding="utf-8"))
+            self.assertTrue(meta["reused"])
+            self.assertIn("turn-001", meta["reused_from"])
+            # Memo hits are served before any CODEX_HOME is prepared for the specialist.
+            layer4 = "layer4/developer/{0}/codex-home".format(specialist_id)
+            self.assertTrue((root / "turn-001" / layer4).is_dir())
+            self.assertFalse((root / "turn-002" / layer4).exists())
+
+    def test_dependents_rerun_when_an_upstream_handoff_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            project_root = root / "project-root"
+            project_dir = root / "project-dir"
+            project_root.mkdir(parents=True, exist_ok=True)
+            project_dir.mkdir(parents=True, exist_ok=True)
+            developer_manifest = yaml.safe_load(
+                (ROOT / "catalog" / "groups" / "developer.yaml").read_text(encoding="utf-8")
+            )
+
+            def _config(turn: str) -> LayeredRuntimeConfig:
+                return LayeredRuntimeConfig(
+                    project_id="proj-reuse-deps",
+                    project_root=project_root,
+                    project_dir=project_dir,
+                    turn_dir=root / turn,
+                    message="same objective every run",
+                    selected_groups=["developer"],
+                    group_manifests={"developer": deepcopy(developer_manifest)},
+                )
+
+            captured = []
+            marker = {"value": "v1"}
+            original_run = AgentSessionRunner.run
+
+            def _capture_run(self, config):  # type: ignore[no-untyped-def]
+                label = str(config.session_label)
+                captured.append(label)
+                result = original_run(self, config)
+                if label == "developer/domain-core-specialist" and result.parsed_handoff:
+                    result.parsed_handoff["claims"] = [
+                        {"claim": f"upstream output {marker['value']}", "evidence_ids": ["ev_1"]}
+                    ]
+                return result
+
+            def _specialist_runs() -> List[str]:
+                rows = sorted(label for label in captured if not label.endswith("/head"))
+                captured.clear()
+                return rows
+
+            internal = project_dir / "agent-groups" / "developer" / "internal"
+            with patch.dict("os.environ", {"AGENTS_INC_BACKEND": "mock"}, clear=False), patch(
+                "agents_inc.core.layered_runtime.gate_specialist_output",
+                return_value={"status": "PASS", "reasons": []},
+            ):
+                with patch.object(AgentSessionRunner, "run", _capture_run):
+                    run_layered_runtime(_config("turn-001"))
+                    _specialist_runs()
+                    # Upstream re-runs with the same output: dependents keep their memos.
+                    (internal / "domain-core-specialist" / "memo.json").unlink()
+                    run_layered_runtime(_config("turn-002"))
+                    same_output_runs = _specialist_runs()
+                    # Upstream re-runs and publishes a different handoff.
+                    (internal / "domain-core-specialist" / "memo.json").unlink()
+                    marker["value"] = "v2"
+                    run_layered_runtime(_config("turn-003"))
+                    changed_output_runs = _specialist_runs()
+
+            self.assertEqual(same_output_runs, ["developer/domain-core-specialist"])
+            self.assertEqual(
+                changed_output_runs,
+                [
+                    "developer/domain-core-specialist",
+                    "developer/evidence-review-specialist",
+                    "developer/integration-specialist",
+                    "developer/repro-qa-specialist",
+                ],
+            )
+
+    def test_continue_agent_threads_resumes_previous_cycle_with_delta_prompt(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            project_root = root / "project-root"
+            project_dir = root / "project-dir"
+            project_root.mkdir(parents=True, exist_ok=True)
+            project_dir.mkdir(parents=True, exist_ok=True)
+            developer_manifest = yaml.safe_load(
+                (ROOT / "catalog" / "groups" / "developer.yaml").read_text(encoding="utf-8")
+            )
+
+            def _config(turn: str, cycle: int) -> LayeredRuntimeConfig:
+                return LayeredRuntimeConfig(
+                    project_id="proj-threads",
+                    project_root=project_root,
+                    project_dir=project_dir,
+                    turn_dir=root / turn / "cycles" / f"cycle-{cycle:04d}",
+                    message=f"objective refined in cycle {cycle}",
+                    selected_groups=["developer"],
+                    group_manifests={"developer": deepcopy(developer_manifest)},
+                    cycle_id=cycle,
+                    continue_agent_threads=True,
+                    retry_policies={"exit": {"base_delay_sec": 0.01, "max_delay_sec": 0.02}},
+                )
+
+            captured = []
+            fail_resumed = set()
+            original_run = AgentSessionRunner.run
+
+            def _capture_run(self, config):  # type: ignore[no-untyped-def]
+                captured.append(config)
+                result = original_run(self, config)
+                label = str(config.session_label)
+                if label == "developer/domain-core-specialist" and result.parsed_handoff:
+                    # Each cycle's upstream handoff differs, so dependents see it as changed.
+                    result.parsed_handoff["claims"] = [
+                        {"claim": f"upstream output {len(captured)}", "evidence_ids": ["ev_1"]}
+                    ]
+                if config.thread_id and label in fail_resumed:
+                    fail_resumed.discard(label)
+                    result.success = False
+                    if label.endswith("/head"):
+                        result.return_code = 0
+                        result.error = "invalid handoff json"
+                    else:
+                        result.return_code = 1
+                        result.error = "provider hiccup"
+                return result
+
+            def _runs() -> dict:
+                rows: dict = {}
+                for cfg in captured:
+                    rows.setdefault(str(cfg.session_label), []).append(cfg)
+                captured.clear()
+                return rows
+
+            with patch.dict("os.environ", {"AGENTS_INC_BACKEND": "mock"}, clear=False):
+                with patch.object(AgentSessionRunner, "run", _capture_run):
+                    run_layered_runtime(_config("turn-a", 1))
+                    first = _runs()
+                    record = get_specialist_thread_record(
+                        project_root, "developer", "domain-core-specialist"
+                    )
+                    prior_home = Path(record["codex_home"])
+                    rollout_name = f"rollout-{record['thread_id']}.jsonl"
+                    rollout = prior_home / "sessions" / "2026" / rollout_name
+                    rollout.parent.mkdir(parents=True, exist_ok=True)
+                    rollout.write_text("{}\n", encoding="utf-8")
+
+                    # The resumed attempts fail once; their retries must start fresh threads.
+                    fail_resumed.update({"developer/domain-core-specialist", "developer/head"})
+                    second_result = run_layered_runtime(_config("turn-a", 2))
+                    second = _runs()
+                    run_layered_runtime(_config("turn-b", 3))
+                    other_turn = _runs()
+
+            self.assertFalse(bool(second_result.get("blocked")))
+            for label, (cfg,) in first.items():
+                self.assertIsNone(cfg.thread_id)
+                resumed = second[label][0]
+                self.assertTrue(resumed.thread_id)
+                self.assertTrue(resumed.prompt.startswith("Continue as"))
+                self.assertLess(len(resumed.prompt), len(cfg.prompt))
+                self.assertIn("Objective: objective refined in cycle 2", resumed.fallback_prompt)
+                self.assertIsNone(other_turn[label][0].thread_id)
+            self.assertEqual(
+                second["developer/domain-core-specialist"][0].thread_id, record["thread_id"]
+            )
+            self.assertIn("objective refined in cycle 2", second["developer/head"][0].prompt)
+            for label in ("developer/domain-core-specialist", "developer/head"):
+                resumed, retry = second[label]
+                self.assertIsNone(retry.thread_id)
+                self.assertIsNone(retry.fallback_prompt)
+                self.assertEqual(retry.prompt, resumed.fallback_prompt)
+            upstream_handoff = str(
+                (
+                    project_dir
+                    / "agent-groups"
+                    / "developer"
+                    / "internal"
+                    / "domain-core-specialist"
+                    / "handoff.json"
+                ).resolve()
+            )
+            self.assertIn(upstream_handoff, first["developer/integration-specialist"][0].prompt)
+            dependent = second["developer/integration-specialist"][0]
+            self.assertTrue(dependent.prompt.startswith("Continue as"))
+            self.assertIn(
+                f"Changed dependency artifacts (re-read these): {json.dumps([upstream_handoff])}",
+                dependent.prompt,
+            )
+            record = get_specialist_thread_record(
+                project_root, "developer", "integration-specialist"
+            )
+            self.assertEqual(list(record["inputs"]), [upstream_handoff])
+            # The prior cycle keeps its rollout; the resumed home gets a copy.
+            self.assertEqual(rollout.read_text(encoding="utf-8"), "{}\n")
+            resumed_home = Path(str(second["developer/domain-core-specialist"][0].codex_home))
+            self.assertTrue((resumed_home / rollout.relative_to(prior_home)).exists())
+
     def test_specialist_prompt_includes_role_specific_requirements(self) -> None:
         base_kwargs = {
             "objective": "test objective",
@@ -833,5 +1242,83 @@ class LayeredRuntimeMountTests(unittest.TestCase):
             )
 
 
+    def test_full_mode_starts_specialists_when_dependencies_complete(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            project_root = root / "project-root"
+            project_dir = root / "project-dir"
+            turn_dir = root / "turn-001"
+            project_root.mkdir(parents=True, exist_ok=True)
+            project_dir.mkdir(parents=True, exist_ok=True)
+            turn_dir.mkdir(parents=True, exist_ok=True)
+
+            group_manifest = yaml.safe_load(
+                (ROOT / "catalog" / "groups" / "developer.yaml").read_text(encoding="utf-8")
+            )
+            self.assertIsInstance(group_manifest, dict)
+            runtime_config = LayeredRuntimeConfig(
+                project_id="proj-dag",
+                project_root=project_root,
+                project_dir=project_dir,
+                turn_dir=turn_dir,
+                message="test dependency-driven scheduling",
+                selected_groups=["developer"],
+                group_manifests={"developer": deepcopy(group_manifest)},
+                execution_mode="full",
+            )
+
+            started: dict[str, float] = {}
+            finished: dict[str, float] = {}
+
+            def _fake_specialist(*args, **kwargs):  # type: ignore[no-untyped-def]
+                task = args[3]
+                specialist_id = str(task.get("agent_id") or "specialist")
+                started[specialist_id] = time.monotonic()
+                if specialist_id == "web-research-specialist":
+                    time.sleep(0.8)
+                finished[specialist_id] = time.monotonic()
+                return SpecialistResult(
+                    success=True,
+                    group_id="developer",
+                    specialist_id=specialist_id,
+                    role=str(task.get("role") or "domain-core"),
+                    attempt=1,
+                    work_path="",
+                    handoff_path="",
+                    raw_log_path="",
+                    redacted_log_path="",
+                    codex_home="",
+                    visible_skills=[],
+                    mount_status={},
+                    timed_out=False,
+                    error="",
+                    escalation_request=None,
+                )
+
+            def _fake_head(**kwargs):  # type: ignore[no-untyped-def]
+                return HeadResult(
+                    success=True,
+                    group_id="developer",
+                    attempt=1,
+                    work_text="# Summary\n\nhead merged outputs.\n",
+                    handoff_payload={},
+                    raw_log_path="",
+                    redacted_log_path="",
+                    codex_home="",
+                    visible_skills=[],
+                    mount_status={},
+                    error="",
+                )
+
+            with patch("agents_inc.core.layered_runtime._run_specialist_with_retries", side_effect=_fake_specialist):
+                with patch("agents_inc.core.layered_runtime._run_head_with_retries", side_effect=_fake_head):
+                    result = run_layered_runtime(runtime_config)
+
+            self.assertFalse(bool(result.get("blocked")))
+            self.assertEqual(len(started), len(group_manifest["specialists"]))
+            for dependent in ["integration-specialist", "evidence-review-specialist"]:
+                self.assertGreaterEqual(started[dependent], finished["domain-core-specialist"])
+                self.assertLess(started[dependent], finished["web-research-specialist"])
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
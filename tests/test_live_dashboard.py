@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import sys
+import threading
 import unittest
 from pathlib import Path
 
@@ -11,6 +12,7 @@ if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
 from agents_inc.core.live_dashboard import LiveDashboard  # noqa: E402
+from agents_inc.core.progress_bus import ProgressEventBus  # noqa: E402
 
 
 @unittest.skipUnless(LiveDashboard.supported(), "rich not installed")
@@ -116,6 +118,40 @@ class LiveDashboardTests(unittest.TestCase):
         self.assertEqual(console.clear_calls, [])
         self.assertIsNone(dashboard._live)
 
+    def test_live_dashboard_applies_events_on_bus_thread(self) -> None:
+        dashboard = LiveDashboard()
+
+        class _FakeLive:
+            console = None
+            _alt_screen = True
+
+            def __init__(self) -> None:
+                self.updates = 0
+                self.threads = set()
+
+            def update(self, renderable, refresh: bool = False) -> None:
+                self.updates += 1
+                self.threads.add(threading.get_ident())
+
+            def stop(self) -> None:
+                return
+
+        live = _FakeLive()
+        dashboard._live = live
+        dashboard._bus = ProgressEventBus(dashboard._apply_event, render=dashboard._refresh)
+        dashboard._bus.start()
+        dashboard.handle_event({"event": "turn_started", "selected_groups": ["developer"]})
+        for index in range(50):
+            dashboard.handle_event(
+                {"event": "runtime_group_note", "group_id": "developer", "text": f"note {index}"}
+            )
+        dashboard.stop()
+
+        self.assertEqual(dashboard._groups["developer"].lines[-1], "note 49")
+        self.assertGreaterEqual(live.updates, 1)
+        self.assertNotIn(threading.get_ident(), live.threads)
+        self.assertEqual(dashboard.event_stats()["published"], 51)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
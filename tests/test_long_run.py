@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import subprocess
 import sys
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 import yaml
 
@@ -21,6 +23,18 @@ def run_cmd(cmd: list[str]) -> subprocess.CompletedProcess:
     return subprocess.run(cmd, capture_output=True, text=True)
 
 
+# These tests use the repo checkout as the fabric root; keep the catalog cache out of the tree.
+_CATALOG_CACHE_OFF = patch.dict(os.environ, {"AGENTS_INC_CATALOG_CACHE": "off"})
+
+
+def setUpModule() -> None:
+    _CATALOG_CACHE_OFF.start()
+
+
+def tearDownModule() -> None:
+    _CATALOG_CACHE_OFF.stop()
+
+
 class LongRunUnitTests(unittest.TestCase):
     def test_path_policy_allows_specialist_own_internal_write(self) -> None:
         from agents_inc.core.long_run import evaluate_access
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import random
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from agents_inc.core.agent_session_runner import (  # noqa: E402
+    AgentRunConfig,
+    AgentSessionRunner,
+)
+from agents_inc.core.backends.mock_model import (  # noqa: E402
+    OUTCOME_SUCCESS,
+    LatencyModel,
+    load_mock_model,
+    mock_session_role,
+    parse_mock_model,
+)
+from agents_inc.core.retry_policy import classify_agent_failure  # noqa: E402
+from agents_inc.core.util.errors import FabricError  # noqa: E402
+
+
+def _config(root: Path, *, role: str = "domain-core", timeout_sec: int = 0) -> AgentRunConfig:
+    work_dir = root / "work"
+    work_dir.mkdir(parents=True, exist_ok=True)
+    return AgentRunConfig(
+        project_root=root,
+        prompt=f"Role: {role}\n",
+        raw_log_path=root / "logs" / "raw.log",
+        redacted_log_path=root / "logs" / "redacted.log",
+        work_dir=work_dir,
+        timeout_sec=timeout_sec,
+        session_label="group-a/specialist",
+    )
+
+
+def _run_with_profile(profile: dict, config: AgentRunConfig):  # type: ignore[no-untyped-def]
+    with patch.dict("os.environ", {"AGENTS_INC_MOCK_PROFILE": json.dumps(profile)}):
+        return AgentSessionRunner(backend="mock").run(config)
+
+
+class MockModelTests(unittest.TestCase):
+    def test_draws_are_deterministic_per_seed_and_label(self) -> None:
+        profile = {
+            "default": {
+                "latency": {"distribution": "exponential", "mean_sec": 5, "max_sec": 30},
+                "failure_rate": 0.3,
+                "timeout_rate": 0.2,
+            },
+            "roles": {"head": {"latency": 1.5, "failure_rate": 0}},
+        }
+        first = parse_mock_model(profile, seed=11)
+        second = parse_mock_model(profile, seed=11)
+        labels = ["g/a", "g/b", "g/a", "g/c", "g/a"]
+        draws = [first.draw(label=label, role="domain-core") for label in labels]
+        # Another label order must not change what each label's n-th session draws.
+        replay = {label: [] for label in labels}
+        for label in reversed(labels):
+            replay[label].append(second.draw(label=label, role="domain-core"))
+        self.assertEqual([d for d, label in zip(draws, labels) if label == "g/a"], replay["g/a"])
+        self.assertTrue(all(0.0 <= d.latency_sec <= 30.0 for d in draws))
+        self.assertNotEqual(draws[0], draws[2])
+        other = parse_mock_model(profile, seed=12).draw(label="g/a", role="domain-core")
+        self.assertNotEqual(other, draws[0])
+
+        head = first.draw(label="g/head", role=mock_session_role("", "g/head"))
+        self.assertEqual(head.latency_sec, 1.5)
+        self.assertEqual(head.kind, OUTCOME_SUCCESS)
+        # Role overrides inherit the default's rates they do not set.
+        self.assertEqual(first.profile_for("head").timeout_rate, 0.2)
+
+    def test_latency_distributions_and_profile_validation(self) -> None:
+        rng = random.Random(3)
+        uniform = LatencyModel(distribution="uniform", min_sec=2.0, max_sec=4.0)
+        self.assertTrue(all(2.0 <= uniform.sample(rng) <= 4.0 for _ in range(200)))
+        normal = LatencyModel(distribution="normal", mean_sec=1.0, stddev_sec=5.0)
+        self.assertTrue(all(normal.sample(rng) >= 0.0 for _ in range(200)))
+        lognormal = LatencyModel(distribution="lognormal", median_sec=10.0, sigma=0.5)
+        samples = sorted(lognormal.sample(rng) for _ in range(501))
+        self.assertLess(abs(samples[250] - 10.0), 2.0)
+
+        with self.assertRaises(FabricError):
+            parse_mock_model({"default": {"failure_rate": 0.7, "timeout_rate": 0.6}})
+        with self.assertRaises(FabricError):
+            parse_mock_model({"default": {"latency": {"distribution": "pareto"}}})
+        with self.assertRaises(FabricError):
+            parse_mock_model({"roles": {"head": {"latency_ms": 5}}})
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "profile.yaml"
+            path.write_text("seed: 5\nroles:\n  head:\n    output_bytes: 2048\n", encoding="utf-8")
+            model = load_mock_model(str(path))
+        self.assertEqual(model.seed, 5)
+        self.assertEqual(model.profile_for("head").output_bytes, 2048)
+
+    def test_injected_outcomes_surface_as_runtime_failures(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            config = _config(root)
+            exit_result = _run_with_profile({"default": {"failure_rate": 1}}, config)
+            self.assertFalse(exit_result.success)
+            self.assertEqual(classify_agent_failure(exit_result), "exit")
+
+            parse_result = _run_with_profile({"default": {"parse_failure_rate": 1}}, config)
+            self.assertFalse(parse_result.success)
+            self.assertEqual(parse_result.return_code, 0)
+            self.assertEqual(classify_agent_failure(parse_result), "parse")
+            self.assertNotIn("BEGIN_HANDOFF_JSON", config.raw_log_path.read_text())
+
+            escalation = _run_with_profile({"default": {"escalation_rate": 1}}, config)
+            self.assertTrue(escalation.success)
+            request = json.loads((root / "work" / "ESCALATION_REQUEST.json").read_text())
+            self.assertEqual(request["type"], "custom")
+
+            slow = _config(root, timeout_sec=1)
+            started = time.monotonic()
+            timed_out = _run_with_profile({"default": {"latency": 30}}, slow)
+            self.assertLess(time.monotonic() - started, 10.0)
+            self.assertEqual(timed_out.return_code, 124)
+            self.assertEqual(classify_agent_failure(timed_out), "timeout")
+
+    def test_spawned_child_replays_output_and_is_killed_on_timeout(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            ok = _run_with_profile(
+                {"spawn_process": True, "default": {"latency": 0.05}}, _config(root)
+            )
+            self.assertTrue(ok.success, ok.error)
+            self.assertEqual(ok.parsed_handoff["status"], "COMPLETE")
+            self.assertIn("BEGIN_HANDOFF_JSON", (root / "logs" / "raw.log").read_text())
+            self.assertEqual(list((root / "logs").glob(".mock-output-*")), [])
+
+            started = time.monotonic()
+            killed = _run_with_profile(
+                {"spawn_process": True, "default": {"timeout_rate": 1}},
+                _config(root, timeout_sec=1),
+            )
+            self.assertLess(time.monotonic() - started, 10.0)
+            self.assertEqual(killed.return_code, 124)
+            self.assertIn("TIMEOUT", (root / "logs" / "raw.log").read_text())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
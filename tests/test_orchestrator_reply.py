@@ -424,6 +424,107 @@ class OrchestratorReplyTests(unittest.TestCase):
                 "light mode should not run specialist sessions",
             )
 
+            trace = json.loads(Path(result["trace_path"]).read_text(encoding="utf-8"))
+            span_events = [row for row in trace["traceEvents"] if row.get("ph") == "X"]
+            span_names = {str(row.get("name")) for row in span_events}
+            for name in ("turn", "cycle", "group", "head", "agent_session", "head_meeting"):
+                self.assertIn(name, span_names)
+            head_sessions = [
+                row
+                for row in span_events
+                if row["name"] == "agent_session" and row["args"]["label"].endswith("/head")
+            ]
+            cycle_spans = [row for row in span_events if row["name"] == "cycle"]
+            self.assertEqual(len(head_sessions), 3 * len(cycle_spans))
+            summary = json.loads(Path(result["trace_summary_path"]).read_text(encoding="utf-8"))
+            self.assertEqual(summary["critical_path"][0]["name"], "turn")
+            self.assertIn("group", [row["name"] for row in summary["critical_path"]])
+
+    def test_incremental_cycles_rerun_only_dirty_groups(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            fabric_root = Path(td) / "agent_group_fabric"
+            ensure_fabric_root_initialized(fabric_root)
+            project_id = "proj-incremental-cycles"
+            with patch.object(
+                sys,
+                "argv",
+                [
+                    "agents-inc new-project",
+                    "--fabric-root",
+                    str(fabric_root),
+                    "--project-id",
+                    project_id,
+                    "--groups",
+                    "literature-intelligence,developer,quality-assurance",
+                    "--force",
+                ],
+            ):
+                code = new_project_cli.main()
+            self.assertEqual(code, 0)
+
+            from agents_inc.core import agent_session_runner
+            from agents_inc.core import orchestrator_reply as reply_module
+
+            real_runtime = reply_module.run_layered_runtime
+            real_meeting = reply_module.run_head_meeting
+            runtime_configs: list = []
+            meeting_calls: list = []
+
+            def _recording_runtime(runtime_config):  # type: ignore[no-untyped-def]
+                runtime_configs.append(runtime_config)
+                return real_runtime(runtime_config)
+
+            def _meeting_rejects_developer_twice(meeting_config):  # type: ignore[no-untyped-def]
+                result = real_meeting(meeting_config)
+                meeting_calls.append(meeting_config.cycle_id)
+                if len(meeting_calls) <= 2:
+                    result = dict(result)
+                    result["all_satisfied"] = False
+                    result["decisions"] = {}
+                    result["matrix"] = {"all_satisfied": False, "unsatisfied_groups": ["developer"]}
+                return result
+
+            def _run(incremental: bool, output_name: str) -> list:
+                runtime_configs.clear()
+                meeting_calls.clear()
+                # Mock output embeds its start time; pin it so identical re-runs publish
+                # identical content even when cycles straddle a second boundary.
+                with patch.dict(os.environ, {"AGENTS_INC_AGENT_RUNNER": "mock"}), patch.object(
+                    reply_module, "run_layered_runtime", _recording_runtime
+                ), patch.object(
+                    reply_module, "run_head_meeting", _meeting_rejects_developer_twice
+                ), patch.object(agent_session_runner, "now_iso", lambda: "2026-01-01T00:00:00Z"):
+                    run_orchestrator_reply(
+                        OrchestratorReplyConfig(
+                            fabric_root=fabric_root,
+                            project_id=project_id,
+                            message=(
+                                "Build a reusable research orchestration package with clear "
+                                "evidence-backed gate checks."
+                            ),
+                            group="auto",
+                            output_dir=Path(td) / output_name,
+                            require_negotiation=False,
+                            incremental_cycles=incremental,
+                        )
+                    )
+                return [list(item.carried_groups) for item in runtime_configs]
+
+            # Cycle 1 publishes every group, so every consumer on the default edge ring
+            # re-runs in cycle 2; republishing identical content then dirties nobody.
+            carried = _run(True, "incremental-turn")
+            self.assertEqual(carried, [[], [], ["literature-intelligence", "quality-assurance"]])
+            cycle_three = Path(td) / "incremental-turn" / "cycles" / "cycle-0003"
+            head_sessions = json.loads(
+                (cycle_three / "layer3" / "group-head-sessions.json").read_text(encoding="utf-8")
+            )
+            self.assertEqual(head_sessions["literature-intelligence"]["status"], "CARRIED")
+            self.assertEqual(head_sessions["developer"]["status"], "COMPLETE")
+            wait_state = json.loads((cycle_three / "wait-state.json").read_text(encoding="utf-8"))
+            self.assertTrue(wait_state.get("all_groups_complete"))
+
+            self.assertEqual(_run(False, "full-turn"), [[], [], []])
+
     def test_blocked_payload_includes_timed_out_specialists(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             fabric_root = Path(td) / "agent_group_fabric"
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from agents_inc.core.progress_bus import ProgressEventBus  # noqa: E402
+
+
+class ProgressEventBusTests(unittest.TestCase):
+    def test_snapshots_merge_and_notes_drop_oldest_per_group(self) -> None:
+        delivered: list = []
+        bus = ProgressEventBus(delivered.append, max_notes_per_group=2)
+        bus.publish({"event": "runtime_group_started", "group_id": "developer"})
+        for index in range(3):
+            bus.publish({"event": "runtime_heartbeat", "completed_groups": index})
+        for index in range(4):
+            bus.publish(
+                {"event": "runtime_group_note", "group_id": "developer", "text": f"d{index}"}
+            )
+        bus.publish({"event": "runtime_group_note", "group_id": "quality-assurance", "text": "q0"})
+        bus.publish({"event": "runtime_group_done", "group_id": "developer", "status": "COMPLETE"})
+        bus.start()
+        bus.close()
+
+        self.assertEqual(
+            [(row["event"], row.get("text", row.get("completed_groups"))) for row in delivered],
+            [
+                ("runtime_group_started", None),
+                ("runtime_heartbeat", 2),
+                ("runtime_group_note", "d2"),
+                ("runtime_group_note", "d3"),
+                ("runtime_group_note", "q0"),
+                ("runtime_group_done", None),
+            ],
+        )
+        stats = bus.stats()
+        self.assertEqual(stats["published"], 10)
+        self.assertEqual(stats["merged"], 2)
+        self.assertEqual(stats["dropped"], 2)
+        self.assertEqual(stats["delivered"], 6)
+
+    def test_queue_bound_drops_notes_but_keeps_lifecycle_events(self) -> None:
+        delivered: list = []
+        bus = ProgressEventBus(delivered.append, max_pending=3)
+        bus.publish({"event": "runtime_group_note", "group_id": "a", "text": "a0"})
+        bus.publish({"event": "runtime_group_note", "group_id": "b", "text": "b0"})
+        bus.publish({"event": "cycle_started", "cycle": 1})
+        bus.publish({"event": "turn_completed"})
+        bus.publish({"event": "turn_blocked"})
+        bus.start()
+        bus.close()
+        self.assertEqual(
+            [row["event"] for row in delivered], ["cycle_started", "turn_completed", "turn_blocked"]
+        )
+        self.assertEqual(bus.stats()["dropped"], 2)
+
+    def test_queue_bound_holds_without_notes(self) -> None:
+        delivered: list = []
+        bus = ProgressEventBus(delivered.append, max_pending=4)
+        bus.publish({"event": "runtime_heartbeat", "completed_groups": 0})
+        for index in range(200):
+            group_id = "a" if index % 2 else "b"
+            bus.publish({"event": "runtime_group_progress", "group_id": group_id, "step": index})
+            self.assertLessEqual(bus.stats()["pending"], 4)
+        bus.publish({"event": "turn_completed"})
+        bus.start()
+        bus.close()
+        # Older events of groups with newer ones pending go first; order is kept.
+        self.assertEqual(
+            [(row["event"], row.get("step")) for row in delivered],
+            [
+                ("runtime_group_progress", 197),
+                ("runtime_group_progress", 198),
+                ("runtime_group_progress", 199),
+                ("turn_completed", None),
+            ],
+        )
+        stats = bus.stats()
+        self.assertEqual(stats["published"], 202)
+        self.assertEqual(stats["dropped"], 198)
+        self.assertEqual(stats["dropped_lifecycle"], 197)
+        self.assertEqual(stats["delivered"] + stats["dropped"], 202)
+
+    def test_slow_renderer_never_blocks_publishers_and_is_rate_limited(self) -> None:
+        delivered: list = []
+        renders: list = []
+        release = threading.Event()
+
+        def _slow_render() -> None:
+            renders.append(time.monotonic())
+            release.wait(0.05)
+
+        bus = ProgressEventBus(delivered.append, render=_slow_render, max_render_hz=10)
+        with bus:
+            started = time.monotonic()
+            for index in range(2000):
+                bus.publish({"event": "runtime_group_note", "group_id": "g", "text": str(index)})
+                if index % 200 == 0:
+                    time.sleep(0.02)
+            publish_elapsed = time.monotonic() - started
+            time.sleep(0.3)
+        self.assertLess(publish_elapsed, 1.0)
+        self.assertEqual(delivered[-1]["text"], "1999")
+        gaps = [later - earlier for earlier, later in zip(renders, renders[1:-1])]
+        self.assertTrue(all(gap >= 0.09 for gap in gaps), gaps)
+        stats = bus.stats()
+        self.assertEqual(stats["delivered"] + stats["dropped"], 2000)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
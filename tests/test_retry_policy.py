@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import random
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from agents_inc.core.retry_policy import (  # noqa: E402
+    RetryPolicy,
+    RetryScheduler,
+    classify_agent_failure,
+    parse_retry_policy_overrides,
+    resolve_retry_policies,
+)
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def test_classify_agent_failure(self) -> None:
+        def _result(error: str, code: int) -> SimpleNamespace:
+            return SimpleNamespace(error=error, return_code=code)
+
+        self.assertEqual(classify_agent_failure(_result("", 124)), "timeout")
+        self.assertEqual(classify_agent_failure(_result("session timeout", 0)), "timeout")
+        self.assertEqual(classify_agent_failure(_result("boom", 1)), "exit")
+        self.assertEqual(classify_agent_failure(_result("invalid handoff json", 0)), "parse")
+        self.assertEqual(classify_agent_failure(_result("gate rejected", 0)), "other")
+
+    def test_backoff_grows_exponentially_with_jitter_and_cap(self) -> None:
+        policy = RetryPolicy(base_delay_sec=2.0, max_delay_sec=10.0)
+        rng = random.Random(3)
+        for retry_index, ceiling in ((1, 2.0), (2, 4.0), (3, 8.0), (4, 10.0), (9, 10.0)):
+            delays = [policy.delay_for(retry_index, rng) for _ in range(50)]
+            self.assertTrue(all(ceiling / 2 <= value <= ceiling for value in delays))
+            self.assertGreater(len({round(value, 6) for value in delays}), 40)
+        self.assertEqual(RetryPolicy().delay_for(3, rng), 0.0)
+
+    def test_overrides_per_failure_class(self) -> None:
+        overrides = parse_retry_policy_overrides(
+            ["timeout:base_delay_sec=10,max_retries=4", "parse:max_retries=0"]
+        )
+        policies = resolve_retry_policies(5, overrides)
+        self.assertEqual(policies["timeout"].base_delay_sec, 10.0)
+        self.assertEqual(policies["exit"].base_delay_sec, 5.0)
+        self.assertEqual(policies["parse"].base_delay_sec, 0.0)
+
+        scheduler = RetryScheduler(policies, retry_attempts=2, rng=random.Random(1))
+        self.assertIsNotNone(scheduler.next_delay("timeout", 4))
+        self.assertIsNone(scheduler.next_delay("timeout", 5))
+        self.assertIsNone(scheduler.next_delay("exit", 3))
+        self.assertIsNone(scheduler.next_delay("parse", 1))
+
+        with self.assertRaises(ValueError):
+            parse_retry_policy_overrides(["flaky:max_retries=1"])
+        with self.assertRaises(ValueError):
+            parse_retry_policy_overrides(["timeout:delay=1"])
+        with self.assertRaises(ValueError):
+            parse_retry_policy_overrides(["timeout"])
+
+    def test_abort_wakes_parked_retries(self) -> None:
+        abort = threading.Event()
+        scheduler = RetryScheduler(
+            resolve_retry_policies(0),
+            retry_attempts=1,
+            abort_check=abort.is_set,
+            poll_sec=0.02,
+        )
+        outcome: list = []
+        worker = threading.Thread(target=lambda: outcome.append(scheduler.wait(30.0)))
+        started = time.monotonic()
+        worker.start()
+        time.sleep(0.05)
+        self.assertEqual(scheduler.stats()["waiting"], 1)
+        abort.set()
+        worker.join(timeout=2.0)
+        self.assertEqual(outcome, [False])
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(scheduler.stats()["aborted"], 1)
+        abort.clear()
+        self.assertTrue(scheduler.wait(0))
+
+    def test_abort_method_wakes_parked_retries_without_polling(self) -> None:
+        scheduler = RetryScheduler(resolve_retry_policies(0), retry_attempts=1, poll_sec=30.0)
+        outcome: list = []
+        workers = [
+            threading.Thread(target=lambda: outcome.append(scheduler.wait(30.0)))
+            for _ in range(3)
+        ]
+        started = time.monotonic()
+        for worker in workers:
+            worker.start()
+        deadline = time.monotonic() + 2.0
+        while scheduler.stats()["waiting"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        scheduler.abort()
+        for worker in workers:
+            worker.join(timeout=2.0)
+        self.assertEqual(outcome, [False, False, False])
+        self.assertLess(time.monotonic() - started, 2.0)
+        self.assertEqual(scheduler.stats()["aborted"], 3)
+        self.assertFalse(scheduler.wait(0))
+
+    def test_stats_count_granted_retries_per_failure_class(self) -> None:
+        scheduler = RetryScheduler(resolve_retry_policies(0), retry_attempts=1)
+        self.assertEqual(scheduler.next_delay("timeout", 1), 0.0)
+        self.assertEqual(scheduler.next_delay("parse", 1), 0.0)
+        self.assertIsNone(scheduler.next_delay("timeout", 2))
+        self.assertEqual(scheduler.next_delay("unknown", 1), 0.0)
+        self.assertEqual(
+            scheduler.stats()["by_class"],
+            {"timeout": 1, "exit": 0, "parse": 1, "other": 1},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
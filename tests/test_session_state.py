@@ -6,6 +6,7 @@ import shutil
 import sys
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
@@ -21,6 +22,7 @@ from agents_inc.core.config_state import (  # noqa: E402
     get_projects_root,
     set_projects_root,
 )
+from agents_inc.core.project_index_store import project_index_db_path  # noqa: E402
 from agents_inc.core.session_compaction import (  # noqa: E402
     compact_session,
     load_compacted,
@@ -39,6 +41,7 @@ from agents_inc.core.session_state import (  # noqa: E402
     resolve_state_project_root,
     set_index_project_status,
     sync_index_from_scan,
+    upsert_project_index_entry,
     write_checkpoint,
 )
 
@@ -439,6 +442,116 @@ class SessionStateTests(unittest.TestCase):
             assert row is not None
             self.assertEqual(row.get("status"), "inactive")
 
+    def test_project_index_imports_yaml_and_keeps_checkpoints_out_of_it(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            index_path = Path(td) / "projects-index.yaml"
+            roots = {name: Path(td) / name for name in ("proj-a", "proj-b")}
+            for root in roots.values():
+                root.mkdir()
+            index_path.write_text(
+                yaml.safe_dump(
+                    {
+                        "schema_version": "1.0",
+                        "projects": {
+                            "proj-a": {"project_root": str(roots["proj-a"]), "status": "active"}
+                        },
+                    }
+                ),
+                encoding="utf-8",
+            )
+            self.assertEqual(list(load_project_index(index_path)["projects"]), ["proj-a"])
+            self.assertTrue(project_index_db_path(index_path).exists())
+            # Old schemas are upgraded in the YAML copy on import.
+            self.assertEqual(yaml.safe_load(index_path.read_text())["schema_version"], "3.0")
+
+            def _upsert(project_id: str, checkpoint_id: str) -> None:
+                root = roots[project_id]
+                upsert_project_index_entry(
+                    index_path=index_path,
+                    project_id=project_id,
+                    project_root=root,
+                    fabric_root=root / "agent_group_fabric",
+                    checkpoint_id=checkpoint_id,
+                    checkpoint_path=root / f"{checkpoint_id}.yaml",
+                    updated_at="2026-01-01T00:00:00Z",
+                )
+
+            _upsert("proj-a", "cp-1")
+            exported = index_path.read_text(encoding="utf-8")
+            self.assertNotIn("cp-1", exported)
+            _upsert("proj-b", "cp-2")
+            # New projects refresh the YAML copy; checkpoint bookkeeping stays in the database.
+            mirrored = yaml.safe_load(index_path.read_text(encoding="utf-8"))["projects"]
+            self.assertEqual(sorted(mirrored), ["proj-a", "proj-b"])
+            self.assertEqual(mirrored["proj-a"]["last_checkpoint"], "cp-1")
+            _upsert("proj-b", "cp-3")
+            self.assertEqual(get_index_project(index_path, "proj-b")["last_checkpoint"], "cp-3")
+            self.assertEqual(
+                yaml.safe_load(index_path.read_text())["projects"]["proj-b"]["last_checkpoint"],
+                "cp-2",
+            )
+
+            # Edits made to the YAML by hand replace the database contents.
+            index_path.write_text(
+                yaml.safe_dump({"schema_version": "3.0", "projects": {"proj-c": {}}}),
+                encoding="utf-8",
+            )
+            self.assertEqual(list(load_project_index(index_path)["projects"]), ["proj-c"])
+
+    def test_project_index_concurrent_writers_keep_every_entry(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            index_path = Path(td) / "projects-index.yaml"
+
+            def _write(number: int) -> None:
+                root = Path(td) / f"proj-{number:02d}"
+                root.mkdir()
+                for checkpoint in range(3):
+                    upsert_project_index_entry(
+                        index_path=index_path,
+                        project_id=root.name,
+                        project_root=root,
+                        fabric_root=root / "agent_group_fabric",
+                        checkpoint_id=f"cp-{checkpoint}",
+                        checkpoint_path=root / f"cp-{checkpoint}.yaml",
+                        updated_at="2026-01-01T00:00:00Z",
+                    )
+                list_index_projects(index_path)
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(_write, range(16)))
+            rows = list_index_projects(index_path)
+            self.assertEqual(len(rows), 16)
+            self.assertTrue(all(row["last_checkpoint"] == "cp-2" for row in rows))
+            mirrored = yaml.safe_load(index_path.read_text(encoding="utf-8"))["projects"]
+            self.assertEqual(len(mirrored), 16)
+
+    def test_list_index_projects_caches_staleness_for_the_ttl(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_root = Path(td) / "proj-ttl"
+            project_root.mkdir()
+            index_path = Path(td) / "projects-index.yaml"
+            upsert_project_index_entry(
+                index_path=index_path,
+                project_id="proj-ttl",
+                project_root=project_root,
+                fabric_root=project_root / "agent_group_fabric",
+                checkpoint_id="latest",
+                checkpoint_path=project_root / "latest.yaml",
+                updated_at="2026-01-01T00:00:00Z",
+            )
+            with patch.dict(os.environ, {"AGENTS_INC_INDEX_STALE_TTL_SEC": "3600"}):
+                self.assertEqual(len(list_index_projects(index_path)), 1)
+                shutil.rmtree(project_root)
+                # Checked moments ago, so the removal is not noticed until the TTL expires...
+                self.assertEqual(len(list_index_projects(index_path)), 1)
+                # ...or the check is forced.
+                forced = mark_stale_index_entries(index_path)
+                self.assertEqual(forced["projects"]["proj-ttl"]["status"], "stale")
+                self.assertEqual(list_index_projects(index_path), [])
+            with patch.dict(os.environ, {"AGENTS_INC_INDEX_STALE_TTL_SEC": "0"}):
+                project_root.mkdir()
+                self.assertEqual(len(list_index_projects(index_path)), 1)
+
     def test_resolve_state_project_root_prefers_parent_project_root(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             project_root = Path(td) / "proj-root"
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from agents_inc.core.util.similarity import (  # noqa: E402
+    NearDuplicateIndex,
+    jaccard_matrix,
+    token_jaccard,
+)
+
+
+def _random_sets(rng: random.Random, count: int) -> list:
+    vocabulary = [f"t{index}" for index in range(60)]
+    return [set(rng.sample(vocabulary, rng.randint(0, 8))) for _ in range(count)]
+
+
+class SimilarityTests(unittest.TestCase):
+    def test_best_match_agrees_with_all_pairs_scan(self) -> None:
+        rng = random.Random(13)
+        entries = _random_sets(rng, 400)
+        index = NearDuplicateIndex()
+        for tokens in entries:
+            index.add(tokens)
+        for tokens in _random_sets(rng, 300) + [{"t1", "t2"}, set()]:
+            for threshold in (0.0, 0.5):
+                best_entry, best_similarity = -1, 0.0
+                for entry, other in enumerate(entries):
+                    similarity = token_jaccard(tokens, other) if tokens and other else 0.0
+                    if similarity > best_similarity:
+                        best_entry, best_similarity = entry, similarity
+                if best_similarity < threshold:
+                    best_entry, best_similarity = -1, 0.0
+                self.assertEqual(index.best_match(tokens, threshold), (best_entry, best_similarity))
+
+    def test_exact_threshold_and_ties_pick_earliest_entry(self) -> None:
+        index = NearDuplicateIndex()
+        index.add({"a", "b", "c", "d"})
+        index.add({"a", "b", "x", "y"})
+        self.assertEqual(index.best_match({"a", "b"}, threshold=0.5), (0, 0.5))
+        self.assertEqual(index.best_match({"a", "b", "q"}, threshold=0.5), (-1, 0.0))
+
+    def test_jaccard_matrix_matches_pairwise_scores(self) -> None:
+        rng = random.Random(7)
+        keys = [f"group-{index:02d}" for index in range(55)]
+        token_map = dict(zip(keys, _random_sets(rng, len(keys))))
+        token_map[keys[0]] = set()
+        token_map[keys[1]] = set()
+        matrix = jaccard_matrix(token_map, keys)
+        self.assertEqual(len(matrix), len(keys) ** 2)
+        for left in keys:
+            for right in keys:
+                expected = token_jaccard(token_map[left], token_map[right])
+                if left == right:
+                    expected = 1.0
+                self.assertEqual(matrix[(left, right)], expected)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
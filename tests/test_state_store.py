@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from agents_inc.core import state_store  # noqa: E402
+from agents_inc.core.session_compaction import compact_session, load_compacted  # noqa: E402
+from agents_inc.core.session_state import (  # noqa: E402
+    checkpoints_dir,
+    load_checkpoint,
+    write_checkpoint,
+)
+from agents_inc.core.state_store import SnapshotStore, state_compression  # noqa: E402
+
+
+def _payload(step: int) -> dict:
+    return {
+        "project_id": "proj-store",
+        "task": "long task " * 50,
+        "selected_groups": ["developer", "integration-delivery"],
+        "constraints": {"stage": f"step-{step}"},
+        "pending_actions": ["act"] if step % 2 else [],
+    }
+
+
+class SnapshotStoreTests(unittest.TestCase):
+    def test_snapshots_share_chunks_and_store_deltas(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            store = SnapshotStore(Path(td), "checkpoints", keep_last=0)
+            first = store.append("cp-1", _payload(1))
+            second = store.append("cp-2", _payload(2))
+            third = store.append("cp-3", {**_payload(3), "extra": {"k": 1}})
+            self.assertEqual(first["chunks_written"], 5)
+            # Only the stage and pending actions changed.
+            self.assertEqual(second["chunks_written"], 2)
+            # A new stage and the added key; the pending actions match the first snapshot.
+            self.assertEqual(third["chunks_written"], 2)
+
+            records = [json.loads(line) for line in store.log_path.read_text().splitlines()]
+            self.assertIn("tree", records[0])
+            self.assertEqual(records[1]["base"], "cp-1")
+            self.assertEqual(
+                sorted(key for key, _ in records[1]["set"]), ["constraints", "pending_actions"]
+            )
+            removed = store.append("cp-4", {"project_id": "proj-store"})
+            self.assertEqual(removed["chunks_written"], 0)
+            self.assertIn("task", json.loads(store.log_path.read_text().splitlines()[-1])["unset"])
+
+            self.assertEqual(store.load("cp-2"), _payload(2))
+            self.assertEqual(list(store.load("cp-3")), [*_payload(3), "extra"])
+            self.assertEqual(store.load("cp-4"), {"project_id": "proj-store"})
+            self.assertIsNone(store.load("cp-missing"))
+            self.assertTrue(all(p.name.endswith(".json.gz") for p in store.objects_dir.glob("*/*")))
+
+    def test_retention_gc_drops_old_snapshots_and_unreferenced_chunks(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            store = SnapshotStore(Path(td), "checkpoints", keep_last=3, compression="none")
+            for step in range(40):
+                store.append(f"cp-{step:03d}", _payload(step))
+                self.assertLessEqual(len(store.ids()), 3 + 8)
+            dropped = store.gc()
+            self.assertEqual(store.ids(), ["cp-037", "cp-038", "cp-039"])
+            self.assertIn("cp-036", dropped)
+            self.assertIsNone(store.load("cp-000"))
+            # The oldest survivor was rewritten as a keyframe and still resolves.
+            self.assertEqual(store.load("cp-037"), _payload(37))
+            chunks = {path.name.split(".")[0] for path in store.objects_dir.glob("*/*")}
+            # Shared task/groups/project chunks plus two stages' worth of changes.
+            self.assertLessEqual(len(chunks), 3 + 3 + 2)
+
+    def test_zstd_falls_back_to_gzip_without_zstandard(self) -> None:
+        with patch.object(state_store, "zstandard", None):
+            with patch.dict("os.environ", {"AGENTS_INC_STATE_COMPRESSION": "zstd"}):
+                self.assertEqual(state_compression(), "gzip")
+
+    def test_checkpoints_keep_one_full_copy_and_prune_legacy_files(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_root = Path(td) / "proj-store"
+            project_root.mkdir()
+            legacy_dir = checkpoints_dir(project_root)
+            legacy_dir.mkdir(parents=True)
+            for index in range(6):
+                (legacy_dir / f"20200101T000000Z-{index:06d}.yaml").write_text(
+                    yaml.safe_dump({"checkpoint_id": f"legacy-{index}"}), encoding="utf-8"
+                )
+            index_path = Path(td) / "projects-index.yaml"
+            payload = {**_payload(0), "fabric_root": str(project_root / "agent_group_fabric")}
+            with patch.dict("os.environ", {"AGENTS_INC_STATE_KEEP_LAST": "4"}):
+                written = [
+                    write_checkpoint(
+                        project_root=project_root,
+                        payload={**payload, "constraints": {"stage": str(step)}},
+                        project_index_path=index_path,
+                    )
+                    for step in range(20)
+                ]
+                compacts = [
+                    compact_session(project_root=project_root, payload={**payload, "n": step})
+                    for step in range(3)
+                ]
+            latest = written[-1]
+            remaining = sorted(path.name for path in legacy_dir.glob("*.yaml"))
+            self.assertEqual(len(remaining), 1 + 4)
+            self.assertIn(Path(latest["checkpoint_path"]).name, remaining)
+            self.assertEqual(
+                load_checkpoint(project_root)["checkpoint_id"], latest["checkpoint_id"]
+            )
+            older = load_checkpoint(project_root, str(written[-3]["checkpoint_id"]))
+            self.assertEqual(older["constraints"], {"stage": "17"})
+            self.assertEqual(
+                load_checkpoint(project_root, "20200101T000000Z-000005")["checkpoint_id"],
+                "legacy-5",
+            )
+            self.assertEqual(len(list(compacts[-1]["compact_path"].parent.glob("*.yaml"))), 1)
+            self.assertEqual(load_compacted(project_root, str(compacts[0]["compact_id"]))["n"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -12,7 +12,28 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from agents_inc.core.token_usage import write_turn_token_usage_report  # noqa: E402
+from agents_inc.core.token_ledger import (  # noqa: E402
+    attribute_session_file,
+    load_token_ledger,
+    record_turn_token_usage,
+    summarize_token_ledger,
+)
+from agents_inc.core.token_usage import (  # noqa: E402
+    TOKEN_USAGE_INDEX_NAME,
+    TokenUsageAggregator,
+    _extract_usage,
+    write_turn_token_usage_report,
+)
+
+
+def _token_line(total: int) -> str:
+    payload = {
+        "type": "token_count",
+        "input_tokens": total - 10,
+        "output_tokens": 10,
+        "total_token_usage": total,
+    }
+    return json.dumps({"type": "event_msg", "payload": payload})
 
 
 class TokenUsageReportTests(unittest.TestCase):
@@ -143,6 +164,142 @@ class TokenUsageReportTests(unittest.TestCase):
             self.assertEqual(report_payload.get("scanned_session_file_count"), 1)
             self.assertEqual(report_payload.get("sessions_with_usage"), 0)
 
+    def test_aggregator_parses_only_appended_lines(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            turn_dir = Path(td)
+            session = turn_dir / "layer4" / "developer" / "codex-home" / "sessions" / "s.jsonl"
+            session.parent.mkdir(parents=True, exist_ok=True)
+            session.write_text(_token_line(100) + "\n" + _token_line(90) + "\n", encoding="utf-8")
+
+            aggregator = TokenUsageAggregator(turn_dir)
+            self.assertEqual(aggregator.refresh()["total_token_usage"], 100)
+
+            with session.open("a", encoding="utf-8") as handle:
+                handle.write(_token_line(250) + "\n" + _token_line(400)[:20])
+            summary = aggregator.refresh()
+            self.assertEqual(summary["total_token_usage"], 250)
+            self.assertEqual(aggregator.rows()[0]["event_count"], 3)
+
+            with session.open("a", encoding="utf-8") as handle:
+                handle.write(_token_line(400)[20:])
+            self.assertEqual(aggregator.refresh()["total_token_usage"], 400)
+
+            result = write_turn_token_usage_report(turn_dir=turn_dir)
+            self.assertEqual(result["summary"]["total_token_usage"], 400)
+            index = json.loads((turn_dir / TOKEN_USAGE_INDEX_NAME).read_text(encoding="utf-8"))
+            row = index["files"][str(session.resolve())]
+            self.assertEqual(row["offset"], session.stat().st_size)
+            self.assertEqual(row["event_count"], 4)
+
+            # A rewritten session file is re-read from the start.
+            session.write_text(_token_line(30) + "\n", encoding="utf-8")
+            result = write_turn_token_usage_report(turn_dir=turn_dir)
+            self.assertEqual(result["summary"]["total_token_usage"], 30)
+
+    def test_carried_rollout_copies_are_counted_once(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            turn_dir = Path(td)
+            rollout = Path("sessions") / "2026" / "rollout-thread-1.jsonl"
+            home = Path("layer4") / "developer" / "codex-home"
+            prior = turn_dir / "cycles" / "cycle-0001" / home / rollout
+            resumed = turn_dir / "cycles" / "cycle-0002" / home / rollout
+            other = turn_dir / "cycles" / "cycle-0002" / home / "sessions" / "rollout-2.jsonl"
+            for path in (prior, resumed, other):
+                path.parent.mkdir(parents=True, exist_ok=True)
+            prior.write_text(_token_line(100) + "\n", encoding="utf-8")
+            # The resumed copy carries the prior events and appends its own.
+            resumed.write_text(_token_line(100) + "\n" + _token_line(160) + "\n", encoding="utf-8")
+            other.write_text(_token_line(40) + "\n", encoding="utf-8")
+
+            result = write_turn_token_usage_report(turn_dir=turn_dir)
+            self.assertEqual(result["summary"]["total_token_usage"], 200)
+            self.assertEqual(result["summary"]["sessions_with_usage"], 2)
+            self.assertEqual(
+                sorted(row["session_file"] for row in result["sessions"]),
+                sorted([str(resumed.resolve()), str(other.resolve())]),
+            )
+
+    def test_extract_usage_reads_nested_aliases_in_one_walk(self) -> None:
+        usage = _extract_usage(
+            {
+                "type": "token_count",
+                "info": {
+                    "total_token_usage": {"input_tokens": 70, "cached_input_tokens": 5, "total_tokens": 90},
+                    "last_token_usage": {"prompt_tokens": 12, "completion_tokens": 40},
+                },
+                "reasoning_tokens": 3,
+            }
+        )
+        self.assertEqual(
+            usage,
+            {
+                "input_tokens": 70,
+                "cached_input_tokens": 5,
+                "output_tokens": 40,
+                "reasoning_output_tokens": 3,
+                "total_token_usage": 110,
+            },
+        )
+
+
+class TokenLedgerTests(unittest.TestCase):
+    def test_ledger_attributes_sessions_and_ranks_agents(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            project_root = Path(td) / "project"
+            turn_dir = project_root / ".agents-inc" / "turns" / "20260301T000000Z"
+            cycle_dir = turn_dir / "cycles" / "cycle-0002"
+            plan = cycle_dir / "layer2" / "orchestrator-plan.json"
+            plan.parent.mkdir(parents=True, exist_ok=True)
+            plan.write_text(
+                json.dumps({"settings": {"specialist_model": "spec-model", "head_model": "head-model"}}),
+                encoding="utf-8",
+            )
+            sessions = {
+                cycle_dir / "layer4" / "developer" / "web-research-specialist": 900,
+                cycle_dir / "layer4" / "developer" / "integration-specialist": 200,
+                cycle_dir / "layer3" / "developer": 300,
+                cycle_dir / "layer4" / "quality-assurance" / "repro-qa-specialist": 500,
+            }
+            for agent_dir, total in sessions.items():
+                session = agent_dir / "codex-home" / "sessions" / "s.jsonl"
+                session.parent.mkdir(parents=True, exist_ok=True)
+                session.write_text(_token_line(total) + "\n", encoding="utf-8")
+
+            head_session = cycle_dir / "layer3" / "developer" / "codex-home" / "sessions" / "s.jsonl"
+            self.assertEqual(
+                attribute_session_file(turn_dir, head_session),
+                {"cycle": 2, "group_id": "developer", "agent_id": "head", "role": "head"},
+            )
+
+            report = write_turn_token_usage_report(turn_dir=turn_dir)
+            for _ in range(2):
+                # Re-recording a turn replaces its rows instead of double counting.
+                record_turn_token_usage(
+                    project_root=project_root,
+                    project_id="proj",
+                    turn_dir=turn_dir,
+                    sessions=report["sessions"],
+                    accepted_claims={"developer": 4, "quality-assurance": 0},
+                )
+            rows = load_token_ledger(project_root)
+            by_group = summarize_token_ledger(rows, by="group")
+            self.assertEqual([row["group"] for row in by_group], ["developer", "quality-assurance"])
+            self.assertEqual(by_group[0]["total_token_usage"], 1400)
+            self.assertEqual(by_group[0]["billable_tokens_per_claim"], 350.0)
+            self.assertIsNone(by_group[1]["billable_tokens_per_claim"])
+
+            top_agents = summarize_token_ledger(rows, by="agent", top=2)
+            self.assertEqual(
+                [row["agent"] for row in top_agents],
+                ["developer/web-research-specialist", "quality-assurance/repro-qa-specialist"],
+            )
+            by_model = {row["model"]: row["sessions"] for row in summarize_token_ledger(rows, by="model")}
+            self.assertEqual(by_model, {"spec-model": 3, "head-model": 1})
+
+            self.assertEqual(load_token_ledger(project_root, since="2999-01-01"), [])
+            only_qa = load_token_ledger(project_root, group_ids=["quality-assurance"])
+            self.assertEqual({row["group_id"] for row in only_qa}, {"quality-assurance"})
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from agents_inc.core.tracing import (  # noqa: E402
+    NULL_SPAN,
+    Tracer,
+    activate_tracer,
+    current_span,
+    trace_span,
+    traced,
+)
+
+
+class TracingTests(unittest.TestCase):
+    def test_spans_are_noops_without_an_active_tracer(self) -> None:
+        with trace_span("orphan") as span:
+            span.set(anything=1)
+        self.assertIs(span, NULL_SPAN)
+        self.assertIs(current_span(), NULL_SPAN)
+
+    def test_worker_spans_nest_under_the_submitting_span(self) -> None:
+        tracer = Tracer()
+
+        def _work(delay: float) -> str:
+            with trace_span("leaf", category="agent"):
+                time.sleep(delay)
+            return current_span().name  # type: ignore[union-attr]
+
+        with activate_tracer(tracer):
+            with trace_span("turn") as root:
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    futures = [
+                        pool.submit(traced(_work, "group", group_id=name), delay)
+                        for name, delay in (("fast", 0.01), ("slow", 0.08))
+                    ]
+                    self.assertEqual([f.result() for f in futures], ["group", "group"])
+        self.assertIs(current_span(), NULL_SPAN)
+
+        by_name = {}
+        for span in tracer.spans():
+            by_name.setdefault(span.name, []).append(span)
+        self.assertTrue(all(span.parent is root for span in by_name["group"]))
+        self.assertTrue(all(span.parent.name == "group" for span in by_name["leaf"]))
+
+        summary = tracer.summary(root)
+        path = [(row["name"], row["args"].get("group_id")) for row in summary["critical_path"]]
+        # The slow group bounds the turn; the fast one overlaps it and is off the path.
+        self.assertEqual(path, [("turn", None), ("group", "slow"), ("leaf", None)])
+        self.assertEqual(summary["by_category"]["group"]["count"], 2)
+        self.assertGreaterEqual(summary["by_category"]["agent"]["max_sec"], 0.08)
+
+    def test_loop_spans_close_with_their_parent_and_export_chrome_events(self) -> None:
+        tracer = Tracer()
+        with activate_tracer(tracer):
+            with trace_span("specialist") as parent:
+                attempt = NULL_SPAN
+                for index in (1, 2):
+                    attempt.end()
+                    attempt = trace_span("attempt", attempt=index)
+                    attempt.mark("first_output", since_start_sec=0.0)
+                # The last attempt is left open, as on an early return.
+            self.assertIs(current_span(), NULL_SPAN)
+        attempts = [span for span in tracer.spans() if span.name == "attempt"]
+        self.assertEqual(len(attempts), 2)
+        self.assertTrue(all(span.end_ns is not None for span in attempts))
+        self.assertLessEqual(attempts[1].end_ns, parent.end_ns)
+        self.assertLessEqual(attempts[0].end_ns, attempts[1].start_ns)
+
+        with tempfile.TemporaryDirectory() as td:
+            paths = tracer.write(Path(td), root=parent)
+            trace = json.loads(Path(paths["trace_path"]).read_text(encoding="utf-8"))
+            summary = json.loads(Path(paths["trace_summary_path"]).read_text(encoding="utf-8"))
+        phases = [row["ph"] for row in trace["traceEvents"]]
+        self.assertEqual(phases.count("X"), 3)
+        self.assertEqual(phases.count("i"), 2)
+        self.assertIn("M", phases)
+        complete = [row for row in trace["traceEvents"] if row["ph"] == "X"]
+        self.assertTrue(all(row["dur"] >= 0 and "span_id" in row["args"] for row in complete))
+        self.assertEqual(
+            [row["name"] for row in summary["critical_path"]], ["specialist", "attempt", "attempt"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)